@@ -11,18 +11,20 @@ AC#7: Agent Chat Endpoint
 AC#8: Error Handling and Logging
 - Errors are logged with full context
 - User receives helpful error messages
+
+Tracing:
+- GET /api/agent/traces lists recently sampled turn traces (admin only)
+- GET /api/agent/traces/{trace_id} returns a trace's span tree (admin only)
 """
 
 import logging
-import time
-from collections import defaultdict
-from functools import lru_cache
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
+from app.core.cancellation import run_while_connected
 from app.core.config import get_settings
-from app.core.security import get_current_user
+from app.core.security import get_current_user, require_admin
 from app.models.user import CurrentUser
 from app.models.agent import (
     AgentChatRequest,
@@ -30,70 +32,25 @@ from app.models.agent import (
     AgentCitation,
     AgentServiceStatus,
 )
+from app.services.ai.admission import LLMOverloaded
 from app.services.agent.executor import (
     ManufacturingAgent,
     get_manufacturing_agent,
     AgentError,
 )
 from app.services.agent.registry import get_tool_registry
+from app.services.agent.tracing import get_trace_buffer
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-@lru_cache()
-def _get_rate_limit_config():
-    """Get rate limit configuration from settings."""
-    settings = get_settings()
-    return (
-        settings.agent_rate_limit_requests,
-        settings.agent_rate_limit_window,
-    )
-
-
-# Simple in-memory rate limiter (per-user)
-_rate_limit_store: dict = defaultdict(list)
-
-
 def get_agent() -> ManufacturingAgent:
     """Dependency to get ManufacturingAgent instance."""
     return get_manufacturing_agent()
 
 
-def check_rate_limit(user_id: str) -> None:
-    """
-    Check if user has exceeded rate limit.
-
-    AC#7: Rate limiting (configurable via settings)
-
-    Args:
-        user_id: User identifier from JWT
-
-    Raises:
-        HTTPException 429: If rate limit exceeded
-    """
-    rate_limit_requests, rate_limit_window = _get_rate_limit_config()
-    current_time = time.time()
-    window_start = current_time - rate_limit_window
-
-    # Get user's requests and filter to current window
-    user_requests = _rate_limit_store[user_id]
-    user_requests = [t for t in user_requests if t > window_start]
-    _rate_limit_store[user_id] = user_requests
-
-    if len(user_requests) >= rate_limit_requests:
-        wait_time = max(1, int(user_requests[0] + rate_limit_window - current_time) + 1)
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail=f"Rate limit exceeded. Please wait {wait_time} seconds before trying again.",
-            headers={"Retry-After": str(wait_time)},
-        )
-
-    # Record this request
-    user_requests.append(current_time)
-
-
 @router.post(
     "/chat",
     response_model=AgentResponse,
@@ -125,6 +82,7 @@ def check_rate_limit(user_id: str) -> None:
 )
 async def chat(
     request: AgentChatRequest,
+    http_request: Request,
     current_user: CurrentUser = Depends(get_current_user),
     agent: ManufacturingAgent = Depends(get_agent),
 ) -> AgentResponse:
@@ -139,6 +97,7 @@ async def chat(
 
     Args:
         request: Chat request with message and optional context
+        http_request: Incoming request (watched for client disconnect)
         current_user: Authenticated user from JWT
         agent: ManufacturingAgent instance
 
@@ -146,12 +105,12 @@ async def chat(
         AgentResponse with content, citations, and metadata
 
     Raises:
-        HTTPException 429: If rate limit exceeded
-        HTTPException 503: If agent not configured
+        HTTPException 429: If rate limit exceeded (RateLimitMiddleware)
+        HTTPException 499: If the client disconnected (the turn is cancelled)
+        HTTPException 503: If agent not configured or LLM capacity is exhausted
         HTTPException 500: If unexpected error
     """
-    # Check rate limit
-    check_rate_limit(current_user.id)
+    # Rate limit is enforced by RateLimitMiddleware ("agent" class)
 
     # Check if agent is configured
     if not agent.is_configured:
@@ -171,11 +130,18 @@ async def chat(
 
         # Process message through agent
         # AC#5 (Story 5.8): Pass force_refresh to bypass cache
-        result = await agent.process_message(
-            message=request.message,
-            user_id=current_user.id,
-            chat_history=chat_history,
-            force_refresh=request.force_refresh,
+        # The turn (LLM calls, tool fan-out) is cancelled if the client leaves
+        result = await run_while_connected(
+            http_request,
+            agent.process_message(
+                message=request.message,
+                user_id=current_user.id,
+                chat_history=chat_history,
+                conversation_id=request.conversation_id,
+                force_refresh=request.force_refresh,
+                include_trace=request.include_trace,
+            ),
+            "agent.chat",
         )
 
         # Convert internal response to API response format
@@ -211,6 +177,16 @@ async def chat(
             error=result.error,
         )
 
+    except HTTPException:
+        raise
+    except LLMOverloaded as e:
+        # Shed by LLM admission control
+        logger.warning(f"Agent chat shed for user {current_user.id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="The assistant is busy right now. Please try again shortly.",
+            headers={"Retry-After": str(e.retry_after)},
+        )
     except AgentError as e:
         logger.error(
             f"Agent error for user {current_user.id}: {e.message}",
@@ -319,3 +295,66 @@ async def health_check(
         "configured": agent.is_configured,
         "initialized": agent.is_initialized,
     }
+
+
+@router.get(
+    "/traces",
+    summary="List recent agent traces",
+    description="""
+    List recently sampled agent turn traces, newest first.
+
+    Each summary includes total duration and time spent per span kind
+    (llm, tool, cache, data_source, db). Sampling is controlled by
+    TRACING_SAMPLE_RATE.
+
+    **Authentication:** Required (admin only)
+    """,
+)
+async def list_traces(
+    limit: int = Query(50, ge=1, le=500, description="Maximum traces to return"),
+    current_user: CurrentUser = Depends(require_admin),
+) -> dict:
+    """
+    List sampled trace summaries.
+
+    Args:
+        limit: Maximum traces to return
+        current_user: Authenticated admin user from JWT
+
+    Returns:
+        Dict with trace summaries
+    """
+    buffer = get_trace_buffer()
+    traces = [trace.summary() for trace in buffer.list(limit)]
+    return {"traces": traces, "buffered": len(buffer)}
+
+
+@router.get(
+    "/traces/{trace_id}",
+    summary="Get an agent trace",
+    description="Get the full span tree of a sampled agent turn. **Authentication:** Required (admin only)",
+)
+async def get_trace(
+    trace_id: str,
+    current_user: CurrentUser = Depends(require_admin),
+) -> dict:
+    """
+    Get a sampled trace by ID.
+
+    Args:
+        trace_id: Trace ID (also returned in AgentResponse.meta.trace_id)
+        current_user: Authenticated admin user from JWT
+
+    Returns:
+        Trace summary and nested spans
+
+    Raises:
+        HTTPException 404: If the trace was not sampled or has been evicted
+    """
+    trace = get_trace_buffer().get(trace_id)
+    if trace is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Trace {trace_id} not found",
+        )
+    return trace.to_dict()
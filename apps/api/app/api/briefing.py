@@ -5,6 +5,8 @@ REST endpoints for morning briefing generation, Q&A, and End of Day summary.
 
 Story 8.4:
 - AC#1: POST /api/v1/briefing/morning - Generate morning briefing
+- POST /api/v1/briefing/morning/stream - Same briefing, streamed section by
+  section as Server-Sent Events (see briefing/streaming.py)
 - AC#2: GET /api/v1/briefing/{briefing_id} - Retrieve briefing details
 - AC#5: POST /api/v1/briefing/{briefing_id}/qa - Q&A during pause
 
@@ -13,6 +15,10 @@ Story 9.10:
 - AC#2: Summary includes day's performance, wins, concerns, outlook
 - AC#3: Fallback when no morning briefing exists
 
+Story 9.11:
+- AC#4: GET /api/v1/briefing/eod/accuracy - Rolling prediction accuracy,
+  daily trend and Action Engine feedback
+
 References:
 - [Source: architecture/voice-briefing.md#BriefingService Architecture]
 - [Source: prd/prd-functional-requirements.md#FR31-FR34]
@@ -22,7 +28,8 @@ import logging
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from app.services.briefing.morning import (
@@ -37,8 +44,13 @@ from app.models.briefing import (
     EODSummaryResponse,
     EODRequest,
     MorningComparisonResult,
+    AccuracyMetrics,
 )
 from app.services.briefing.eod import get_eod_service
+from app.services.briefing.store import get_briefing_store
+from app.services.briefing.streaming import BriefingStream, stream_order
+from app.core.cancellation import run_while_connected
+from app.core.config import get_settings
 from app.core.security import get_current_user
 from app.models.user import CurrentUser, UserRole
 
@@ -93,6 +105,7 @@ class MorningBriefingResponse(BaseModel):
     completion_percentage: float = Field(..., description="Percentage of sections completed")
     timed_out: bool = Field(False, description="Whether generation timed out")
     tool_failures: List[str] = Field(default_factory=list, description="Failed areas")
+    cache_hit: bool = Field(False, description="Whether served from the pre-generated briefing store")
 
 
 class ProductionAreaSchema(BaseModel):
@@ -216,6 +229,25 @@ class EODSummaryResponseSchema(BaseModel):
     time_range_end: str = Field(..., description="End of day's time range (ISO)")
 
 
+class AccuracyReportResponse(BaseModel):
+    """
+    Response schema for briefing accuracy trends.
+
+    Story 9.11 AC#4: Accuracy tracked over time and fed back to the Action Engine
+    """
+    user_id: str = Field(..., description="User whose EOD comparisons are reported")
+    window_days: int = Field(..., description="Rolling window length in days")
+    overall: Optional[Dict[str, Any]] = Field(None, description="Rolling totals (null without data)")
+    by_area: Dict[str, Dict[str, Any]] = Field(default_factory=dict, description="Rolling totals per area")
+    by_concern_type: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict, description="Rolling totals per concern type"
+    )
+    trend: List[Dict[str, Any]] = Field(default_factory=list, description="Daily records, newest first")
+    feedback: Optional[Dict[str, Any]] = Field(
+        None, description="Action Engine feedback for the latest day (null without data)"
+    )
+
+
 # ============================================================================
 # In-memory briefing store (for demo/MVP - replace with Redis in production)
 # ============================================================================
@@ -272,7 +304,7 @@ async def get_production_areas():
 
 
 @router.post("/morning", response_model=MorningBriefingResponse)
-async def generate_morning_briefing(request: MorningBriefingRequest):
+async def generate_morning_briefing(request: MorningBriefingRequest, http_request: Request):
     """
     Generate a morning briefing covering all production areas.
 
@@ -282,18 +314,29 @@ async def generate_morning_briefing(request: MorningBriefingRequest):
     - Headline section with plant-wide overview
     - One section per production area
     - Each section has pause_point=True for Q&A opportunities
+
+    Briefings are served from the pre-generated store and only generated
+    when the underlying data has changed (BRIEFING_PREGENERATE_ENABLED).
+    Generation (tool fan-out, narrative LLM calls) is cancelled if the
+    client disconnects.
     """
     logger.info(f"Generating morning briefing for user {request.user_id}")
 
-    service = get_morning_briefing_service()
-
     try:
+        if get_settings().briefing_pregenerate_enabled:
+            work = get_briefing_store().plant_briefing(
+                user_id=request.user_id,
+                area_order=request.area_order,
+            )
+        else:
+            work = get_morning_briefing_service().generate_plant_briefing(
+                user_id=request.user_id,
+                area_order=request.area_order,
+                include_audio=request.include_audio,
+            )
+
         # Generate the briefing
-        briefing = await service.generate_plant_briefing(
-            user_id=request.user_id,
-            area_order=request.area_order,
-            include_audio=request.include_audio,
-        )
+        briefing = await run_while_connected(http_request, work, "briefing.morning")
 
         # Store for later retrieval
         _store_briefing(briefing)
@@ -322,8 +365,11 @@ async def generate_morning_briefing(request: MorningBriefingRequest):
             completion_percentage=briefing.metadata.completion_percentage,
             timed_out=briefing.metadata.timed_out,
             tool_failures=briefing.metadata.tool_failures,
+            cache_hit=briefing.metadata.cache_hit,
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Morning briefing generation failed: {e}", exc_info=True)
         raise HTTPException(
@@ -332,6 +378,57 @@ async def generate_morning_briefing(request: MorningBriefingRequest):
         )
 
 
+@router.post("/morning/stream")
+async def stream_morning_briefing(request: MorningBriefingRequest):
+    """
+    Stream a morning briefing as Server-Sent Events.
+
+    Same briefing as POST /morning, delivered progressively so the voice UI
+    can start reading the headline while area sections are still generating:
+    each section is sent, with its TTS stream URL and pause_point, as soon
+    as it is generated and the sections before it have been sent. Areas
+    rewritten by an LLM narrative pass after being sent arrive as
+    briefing.section_update events. The final briefing.complete event
+    carries the briefing_id (for Q&A) and time_to_first_audio_ms.
+
+    Generation stops if the client disconnects.
+    """
+    logger.info(f"Streaming morning briefing for user {request.user_id}")
+
+    service = get_morning_briefing_service()
+    stream = BriefingStream(
+        stream_order([area["id"] for area in service.order_areas(request.area_order)]),
+        include_audio=request.include_audio,
+    )
+
+    async def work() -> BriefingResponse:
+        if get_settings().briefing_pregenerate_enabled:
+            briefing = await get_briefing_store().plant_briefing(
+                user_id=request.user_id,
+                area_order=request.area_order,
+                on_section=stream.on_section,
+            )
+        else:
+            briefing = await service.generate_plant_briefing(
+                user_id=request.user_id,
+                area_order=request.area_order,
+                include_audio=request.include_audio,
+                on_section=stream.on_section,
+            )
+        # Store for Q&A and retrieval once complete
+        _store_briefing(briefing)
+        return briefing
+
+    return StreamingResponse(
+        stream.events(work()),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.get("/{briefing_id}", response_model=BriefingDetailsResponse)
 async def get_briefing(briefing_id: str):
     """
@@ -533,6 +630,7 @@ async def end_briefing(briefing_id: str):
 @router.post("/eod", response_model=EODSummaryResponseSchema)
 async def generate_eod_summary(
     request: EODSummaryRequest,
+    http_request: Request,
     current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -551,6 +649,8 @@ async def generate_eod_summary(
     - Tomorrow's outlook
 
     Requires: Plant Manager role (FR31)
+
+    Generation is cancelled if the client disconnects.
     """
     # AC#1: Validate user role - EOD summary is for Plant Managers only (FR31)
     # Note: In production with full RBAC, use CurrentUserWithRole and check user_role
@@ -575,10 +675,14 @@ async def generate_eod_summary(
 
     try:
         # Generate the EOD summary
-        summary = await service.generate_eod_summary(
-            user_id=request.user_id,
-            summary_date=summary_date,
-            include_audio=request.include_audio,
+        summary = await run_while_connected(
+            http_request,
+            service.generate_eod_summary(
+                user_id=request.user_id,
+                summary_date=summary_date,
+                include_audio=request.include_audio,
+            ),
+            "briefing.eod",
         )
 
         # Store for later retrieval (reuse briefing store)
@@ -630,9 +734,55 @@ async def generate_eod_summary(
             time_range_end=summary.time_range_end.isoformat() if summary.time_range_end else "",
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"EOD summary generation failed: {e}", exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate EOD summary: {str(e)}"
         )
+
+
+@router.get("/eod/accuracy", response_model=AccuracyReportResponse)
+async def get_eod_accuracy(
+    user_id: Optional[str] = Query(None, description="User ID (defaults to the caller)"),
+    window_days: int = Query(30, ge=1, le=90, description="Rolling window (7, 30 and 90 are precomputed)"),
+    days: int = Query(30, ge=1, le=90, description="Days of daily trend to return"),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """
+    Morning briefing prediction accuracy over time.
+
+    Story 9.11 AC#4:
+    - Rolling accuracy overall, by area and by concern type
+    - Daily accuracy trend
+    - Action Engine feedback for the latest day, with the user's rolling
+      false alarm rates by concern type
+
+    Accuracy is rolled up as EOD summaries are generated. Rollups are held
+    in memory by each API worker: they cover EOD summaries that worker
+    generated and start empty after a restart or deploy.
+    """
+    user_id = user_id or current_user.id
+    service = get_eod_service()
+
+    rollup = service.get_accuracy_rollup(user_id, window_days=window_days)
+    trend = await service.get_accuracy_trends(user_id, days=days)
+
+    feedback = None
+    if trend:
+        latest = trend[0]
+        feedback = service.get_action_engine_feedback(
+            AccuracyMetrics(
+                accuracy_percentage=latest["accuracy_percentage"],
+                total_predictions=latest["predictions"],
+                correct_predictions=latest["correct"],
+                false_positives=latest["false_positives"],
+                misses=latest["misses"],
+                escalated_count=latest["escalated"],
+            ),
+            user_id=user_id,
+        )
+
+    return AccuracyReportResponse(user_id=user_id, trend=trend, feedback=feedback, **rollup)
@@ -35,6 +35,25 @@ class CacheStatsResponse(BaseModel):
     misses: int = Field(..., description="Total cache misses")
     hit_rate_percent: float = Field(..., description="Hit rate as percentage")
     invalidations: int = Field(..., description="Total invalidations")
+    swr_enabled: bool = Field(False, description="Whether stale-while-revalidate is enabled")
+    stale_ttls: dict = Field(default_factory=dict, description="Stale grace period in seconds for each tier")
+    stale_hits: int = Field(0, description="Hits served from expired entries")
+    refreshes: int = Field(0, description="Completed background refreshes")
+    refresh_failures: int = Field(0, description="Failed background refreshes")
+    refreshes_in_flight: int = Field(0, description="Background refreshes currently running")
+    backend: str = Field("memory", description="Cache storage backend (memory or redis)")
+    coalesced: int = Field(0, description="Calls served by joining an identical in-flight execution")
+    evictions_lru: int = Field(0, description="Entries evicted because a tier was full")
+    evictions_ttl: int = Field(0, description="Entries evicted because they expired")
+    latency_saved_ms: float = Field(0.0, description="Estimated tool execution time saved by hits")
+    by_tool: Optional[dict] = Field(
+        None,
+        description="Per-tool hits, misses, evictions, bytes stored, execution time "
+        "histogram and recommended TTL (only with breakdown=true)",
+    )
+    by_tier: Optional[dict] = Field(
+        None, description="Per-tier analytics (only with breakdown=true)"
+    )
 
 
 class CacheInvalidateResponse(BaseModel):
@@ -56,11 +75,14 @@ class CacheInvalidateResponse(BaseModel):
     - Returns hits and misses count
     - Returns hit rate percentage
     - Returns entries by tier
+    - With breakdown=true, returns per-tool and per-tier analytics,
+      including latency saved and a recommended TTL per tool
 
     **Authentication:** Required (admin only)
     """,
 )
 async def get_cache_stats(
+    breakdown: bool = Query(False, description="Include per-tool and per-tier analytics"),
     current_user: CurrentUser = Depends(require_admin),
 ) -> CacheStatsResponse:
     """
@@ -71,13 +93,14 @@ async def get_cache_stats(
     - Admin-only access
 
     Args:
+        breakdown: Include per-tool and per-tier analytics
         current_user: Authenticated admin user from JWT
 
     Returns:
         CacheStatsResponse with cache statistics
     """
     cache = get_tool_cache()
-    stats = cache.get_stats()
+    stats = cache.get_stats(breakdown=breakdown)
 
     logger.info(f"Cache stats requested by user {current_user.id}")
 
@@ -146,7 +169,7 @@ async def invalidate_cache(
         )
 
     cache = get_tool_cache()
-    count = cache.invalidate(pattern=pattern, tier=tier, tool_name=tool_name)
+    count = await cache.ainvalidate(pattern=pattern, tier=tier, tool_name=tool_name)
 
     # Build descriptive message
     if tier:
@@ -193,7 +216,7 @@ async def clear_cache(
         CacheInvalidateResponse with total invalidation count
     """
     cache = get_tool_cache()
-    count = cache.invalidate_all()
+    count = await cache.ainvalidate_all()
 
     logger.warning(
         f"Full cache clear by user {current_user.id}: {count} entries"
@@ -24,14 +24,12 @@ Story 4.5 Integration:
 import logging
 import re
 import time
-from collections import defaultdict
 from datetime import datetime, timezone
-from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
-from app.core.config import get_settings
+from app.core.cancellation import run_while_connected
 from app.core.security import get_current_user
 from app.models.user import CurrentUser
 from app.models.chat import (
@@ -41,6 +39,7 @@ from app.models.chat import (
     TablesResponse,
     ChatServiceStatus,
 )
+from app.services.ai.admission import LLMOverloaded, LLMPriority, llm_request_context
 from app.services.ai.text_to_sql import (
     TextToSQLService,
     TextToSQLError,
@@ -63,20 +62,6 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@lru_cache()
-def _get_rate_limit_config():
-    """Get rate limit configuration from settings."""
-    settings = get_settings()
-    return (
-        getattr(settings, 'chat_rate_limit_requests', 10),
-        getattr(settings, 'chat_rate_limit_window', 60),
-    )
-
-
-# Simple in-memory rate limiter
-_rate_limit_store: dict = defaultdict(list)
-
-
 def get_service() -> TextToSQLService:
     """Dependency to get Text-to-SQL service instance."""
     return get_text_to_sql_service()
@@ -102,39 +87,6 @@ def _extract_source_table(sql: Optional[str]) -> Optional[str]:
     return None
 
 
-def check_rate_limit(user_id: str) -> None:
-    """
-    Check if user has exceeded rate limit.
-
-    AC#8: Rate limiting (configurable via settings, default 10 requests/minute per user)
-
-    Args:
-        user_id: User identifier from JWT
-
-    Raises:
-        HTTPException 429: If rate limit exceeded
-    """
-    rate_limit_requests, rate_limit_window = _get_rate_limit_config()
-    current_time = time.time()
-    window_start = current_time - rate_limit_window
-
-    # Get user's requests and filter to current window
-    user_requests = _rate_limit_store[user_id]
-    user_requests = [t for t in user_requests if t > window_start]
-    _rate_limit_store[user_id] = user_requests
-
-    if len(user_requests) >= rate_limit_requests:
-        wait_time = max(1, int(user_requests[0] + rate_limit_window - current_time) + 1)
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail=f"Rate limit exceeded. Please wait {wait_time} seconds before trying again.",
-            headers={"Retry-After": str(wait_time)},
-        )
-
-    # Record this request
-    user_requests.append(current_time)
-
-
 @router.post(
     "/query",
     response_model=QueryResponse,
@@ -175,6 +127,7 @@ def check_rate_limit(user_id: str) -> None:
 )
 async def query_data(
     query_input: QueryInput,
+    http_request: Request,
     use_agent: bool = Query(
         True,
         description="Route to ManufacturingAgent (Story 5.7) vs legacy Text-to-SQL"
@@ -212,6 +165,7 @@ async def query_data(
 
     Args:
         query_input: The question and optional context
+        http_request: Incoming request (watched for client disconnect)
         use_agent: Route to ManufacturingAgent (default) vs legacy Text-to-SQL
         enable_grounding: Enable Story 4.5 citation generation
         current_user: Authenticated user from JWT
@@ -223,28 +177,36 @@ async def query_data(
         QueryResponse with answer, SQL, data, and citations
 
     Raises:
-        HTTPException 429: If rate limit exceeded
-        HTTPException 503: If service not configured
+        HTTPException 429: If rate limit exceeded (RateLimitMiddleware)
+        HTTPException 499: If the client disconnected (processing is cancelled)
+        HTTPException 503: If service not configured or LLM capacity is exhausted
         HTTPException 500: If unexpected error
     """
-    # AC#8: Rate limiting
-    check_rate_limit(current_user.id)
+    # AC#8: Rate limiting is enforced by RateLimitMiddleware ("chat" class)
 
     # Story 5.7: Route to agent if enabled and agent is configured
     if use_agent and agent.is_configured:
-        return await _process_via_agent(
-            query_input=query_input,
-            current_user=current_user,
-            agent=agent,
+        return await run_while_connected(
+            http_request,
+            _process_via_agent(
+                query_input=query_input,
+                current_user=current_user,
+                agent=agent,
+            ),
+            "chat.agent",
         )
 
     # Fallback to legacy Text-to-SQL path
-    return await _process_via_text_to_sql(
-        query_input=query_input,
-        enable_grounding=enable_grounding,
-        current_user=current_user,
-        service=service,
-        cited_service=cited_service,
+    return await run_while_connected(
+        http_request,
+        _process_via_text_to_sql(
+            query_input=query_input,
+            enable_grounding=enable_grounding,
+            current_user=current_user,
+            service=service,
+            cited_service=cited_service,
+        ),
+        "chat.text_to_sql",
     )
 
 
@@ -341,9 +303,12 @@ async def _process_via_agent(
                 "agent_tool": agent_response.tool_used,
                 "follow_up_questions": agent_response.suggested_questions,
                 "grounding_score": _calculate_grounding_score(agent_response.citations),
+                "llm_queue": agent_response.meta.get("llm_queue"),
             },
         )
 
+    except LLMOverloaded as e:
+        raise _overloaded_exception(e)
     except AgentError as e:
         logger.error(f"Agent error for user {user_id}: {e}")
         raise HTTPException(
@@ -376,44 +341,47 @@ async def _process_via_text_to_sql(
         if query_input.context:
             context = query_input.context.model_dump(exclude_none=True)
 
-        # Execute query
-        result = await service.query(
-            question=query_input.question,
-            user_id=current_user.id,
-            context=context,
-        )
+        # Execute query (interactive priority for its LLM calls, including grounding)
+        with llm_request_context(LLMPriority.INTERACTIVE) as llm_stats:
+            result = await service.query(
+                question=query_input.question,
+                user_id=current_user.id,
+                context=context,
+            )
 
-        # Story 4.5: Enhance response with grounding validation and citations
-        if enable_grounding and not result.get("error"):
-            try:
-                # Extract source table from SQL
-                source_table = _extract_source_table(result.get("sql"))
-
-                # Process response through citation service
-                cited_result = await cited_service.process_chat_response(
-                    raw_response=result["answer"],
-                    query_text=query_input.question,
-                    user_id=current_user.id,
-                    sql=result.get("sql"),
-                    data=result.get("data", []),
-                    source_table=source_table,
-                    context=context,
-                )
-
-                # Update result with cited response
-                result["answer"] = cited_result["answer"]
-                result["citations"] = cited_result["citations"]
-
-                # Add Story 4.5 metadata
-                if "meta" not in result:
-                    result["meta"] = {}
-                result["meta"]["grounding_score"] = cited_result.get("grounding_score", 0.0)
-                result["meta"]["ungrounded_claims"] = cited_result.get("ungrounded_claims", [])
-                result["meta"]["citation_meta"] = cited_result.get("meta", {})
-
-            except Exception as e:
-                # Story 4.5 graceful degradation - continue without citations
-                logger.warning(f"Citation generation failed (graceful degradation): {e}")
+            # Story 4.5: Enhance response with grounding validation and citations
+            if enable_grounding and not result.get("error"):
+                try:
+                    # Extract source table from SQL
+                    source_table = _extract_source_table(result.get("sql"))
+
+                    # Process response through citation service
+                    cited_result = await cited_service.process_chat_response(
+                        raw_response=result["answer"],
+                        query_text=query_input.question,
+                        user_id=current_user.id,
+                        sql=result.get("sql"),
+                        data=result.get("data", []),
+                        source_table=source_table,
+                        context=context,
+                    )
+
+                    # Update result with cited response
+                    result["answer"] = cited_result["answer"]
+                    result["citations"] = cited_result["citations"]
+
+                    # Add Story 4.5 metadata
+                    if "meta" not in result:
+                        result["meta"] = {}
+                    result["meta"]["grounding_score"] = cited_result.get("grounding_score", 0.0)
+                    result["meta"]["ungrounded_claims"] = cited_result.get("ungrounded_claims", [])
+                    result["meta"]["citation_meta"] = cited_result.get("meta", {})
+
+                except Exception as e:
+                    # Story 4.5 graceful degradation - continue without citations
+                    logger.warning(f"Citation generation failed (graceful degradation): {e}")
+
+        result.setdefault("meta", {})["llm_queue"] = llm_stats.to_dict()
 
         # Log for analytics
         logger.info(
@@ -438,8 +406,11 @@ async def _process_via_text_to_sql(
             row_count=result.get("row_count", 0),
             error=result.get("error", False),
             suggestions=result.get("suggestions"),
+            meta=result.get("meta"),
         )
 
+    except LLMOverloaded as e:
+        raise _overloaded_exception(e)
     except TextToSQLError as e:
         logger.error(f"Text-to-SQL service error: {e}")
         raise HTTPException(
@@ -454,6 +425,15 @@ async def _process_via_text_to_sql(
         )
 
 
+def _overloaded_exception(error: LLMOverloaded) -> HTTPException:
+    """503 with Retry-After for a call shed by LLM admission control."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="The assistant is busy right now. Please try again shortly.",
+        headers={"Retry-After": str(error.retry_after)},
+    )
+
+
 def _transform_agent_citations(agent_citations: List[Dict[str, Any]]) -> List[Citation]:
     """
     Transform agent citations to QueryResponse Citation format.
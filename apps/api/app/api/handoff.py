@@ -25,8 +25,11 @@ References:
 - [Source: prd-non-functional-requirements.md#NFR24]
 """
 
+import asyncio
 import logging
-from typing import Optional, List
+import os
+import tempfile
+from typing import BinaryIO, Optional, List, Tuple, Union
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 import io
@@ -52,11 +55,13 @@ from app.models.handoff import (
     VoiceNoteList,
     VoiceNoteUploadResponse,
     VoiceNoteErrorCode,
+    VoiceNoteTranscriptionStatus,
     VOICE_NOTE_MAX_DURATION_SECONDS,
     VOICE_NOTE_MAX_COUNT,
 )
 from app.services.handoff import detect_current_shift, get_shift_time_range
 from app.services.briefing.handoff import get_handoff_synthesis_service
+from app.services.handoff.transcription import TranscriptionJob, get_voice_note_transcription_queue
 from app.core.config import get_settings
 from app.core.security import get_current_user
 from app.models.user import CurrentUser
@@ -891,7 +896,7 @@ def _delete_voice_note(note_id: str) -> bool:
 
 
 async def _transcribe_audio_with_elevenlabs(
-    audio_data: bytes,
+    audio_data: Union[bytes, BinaryIO],
     content_type: str = "audio/webm"
 ) -> Optional[str]:
     """
@@ -900,7 +905,7 @@ async def _transcribe_audio_with_elevenlabs(
     AC#2: Recording completion and transcription
 
     Args:
-        audio_data: Raw audio bytes
+        audio_data: Raw audio bytes, or an open audio file (streamed in chunks)
         content_type: MIME type of the audio
 
     Returns:
@@ -963,7 +968,7 @@ async def _upload_to_supabase_storage(
     user_id: str,
     handoff_id: str,
     note_id: str,
-    audio_data: bytes,
+    audio_data: Union[bytes, BinaryIO],
     content_type: str = "audio/webm"
 ) -> Optional[str]:
     """
@@ -977,7 +982,7 @@ async def _upload_to_supabase_storage(
         user_id: User ID
         handoff_id: Handoff ID
         note_id: Voice note ID
-        audio_data: Raw audio bytes
+        audio_data: Raw audio bytes, or an open audio file (streamed in chunks)
         content_type: MIME type
 
     Returns:
@@ -999,12 +1004,13 @@ async def _upload_to_supabase_storage(
     storage_path = f"{user_id}/{handoff_id}/{note_id}.{ext}"
 
     try:
-        # Upload to storage bucket
+        # Upload to storage bucket (blocking client, kept off the event loop)
         bucket = supabase.storage.from_("handoff-voice-notes")
-        result = bucket.upload(
+        await asyncio.to_thread(
+            bucket.upload,
             storage_path,
             audio_data,
-            {"content-type": content_type}
+            {"content-type": content_type},
         )
 
         logger.info(f"Uploaded voice note to storage: {storage_path}")
@@ -1042,6 +1048,91 @@ def _get_signed_url(storage_path: str) -> Optional[str]:
         return None
 
 
+async def _spool_upload(audio: UploadFile) -> Tuple[str, int]:
+    """
+    Copy an uploaded audio file to a temp file in chunks (Task 2.2).
+
+    Keeps at most one chunk of the upload in memory.
+
+    Returns:
+        Tuple of (temp file path, size in bytes)
+
+    Raises:
+        413: Upload exceeds VOICE_NOTE_MAX_UPLOAD_BYTES
+    """
+    settings = get_settings()
+    fd, spool_path = tempfile.mkstemp(prefix="voice-note-")
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as spool:
+            while True:
+                chunk = await audio.read(settings.voice_note_upload_chunk_bytes)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > settings.voice_note_max_upload_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail={
+                            "error": "Audio file too large",
+                            "code": VoiceNoteErrorCode.FILE_TOO_LARGE.value,
+                        }
+                    )
+                spool.write(chunk)
+    except BaseException:
+        _remove_spooled_audio(spool_path)
+        raise
+    return spool_path, size
+
+
+def _remove_spooled_audio(spool_path: str) -> None:
+    """Delete a spooled upload."""
+    try:
+        os.remove(spool_path)
+    except FileNotFoundError:
+        pass
+
+
+async def _transcribe_spooled_audio(spool_path: str, content_type: str) -> Optional[str]:
+    """Transcribe a spooled upload, streaming it to ElevenLabs."""
+    with open(spool_path, "rb") as audio_file:
+        return await _transcribe_audio_with_elevenlabs(audio_file, content_type)
+
+
+def _record_transcript(note_id: str, transcript: Optional[str]) -> None:
+    """Store a background transcription result on its voice note (AC#2, AC#4)."""
+    note = _get_voice_note_by_id(note_id)
+    if note is None:
+        # Deleted while transcribing
+        return
+    if not transcript:
+        logger.warning(f"Transcription failed for note {note_id}, keeping it without transcript")
+    note["transcript"] = transcript
+    note["transcription_status"] = (
+        VoiceNoteTranscriptionStatus.COMPLETED.value if transcript
+        else VoiceNoteTranscriptionStatus.FAILED.value
+    )
+    _save_voice_note(note)
+
+
+def _voice_note_from_record(record: dict) -> VoiceNote:
+    """Build the VoiceNote response for a stored note, with a signed URL."""
+    return VoiceNote(
+        id=UUID(record["id"]),
+        handoff_id=UUID(record["handoff_id"]),
+        user_id=UUID(record["user_id"]),
+        storage_path=record["storage_path"],
+        storage_url=_get_signed_url(record["storage_path"]),
+        transcript=record.get("transcript"),
+        transcription_status=record.get(
+            "transcription_status", VoiceNoteTranscriptionStatus.COMPLETED.value
+        ),
+        duration_seconds=record["duration_seconds"],
+        sequence_order=record["sequence_order"],
+        created_at=datetime.fromisoformat(record["created_at"]),
+    )
+
+
 @router.post("/{handoff_id}/voice-notes", response_model=VoiceNoteUploadResponse)
 async def upload_voice_note(
     handoff_id: UUID,
@@ -1057,16 +1148,17 @@ async def upload_voice_note(
 
     Process:
     1. Validate handoff ownership and note limits
-    2. Upload audio to Supabase Storage
-    3. Transcribe via ElevenLabs Scribe v2
+    2. Spool the upload to a temp file in chunks
+    3. Stream the audio to Supabase Storage
     4. Store record in handoff_voice_notes table
-    5. Return voice note with transcript
+    5. Queue transcription via ElevenLabs Scribe v2 and return once stored;
+       poll GET /{handoff_id}/voice-notes/{note_id} for the transcript
 
     Raises:
         400: Duration exceeds 60 seconds or limit reached
         403: User is not the owner of the handoff
         404: Handoff not found
-        413: File too large (handled by FastAPI)
+        413: File larger than VOICE_NOTE_MAX_UPLOAD_BYTES
     """
     user_id = current_user.id
 
@@ -1112,23 +1204,29 @@ async def upload_voice_note(
             }
         )
 
-    # Read audio data (Task 2.2)
-    audio_data = await audio.read()
+    # Spool audio data to disk in chunks (Task 2.2)
     content_type = audio.content_type or "audio/webm"
+    spool_path, _ = await _spool_upload(audio)
 
     # Generate note ID
     note_id = uuid4()
 
-    # Upload to storage (Task 2.3)
-    storage_path = await _upload_to_supabase_storage(
-        user_id=user_id,
-        handoff_id=str(handoff_id),
-        note_id=str(note_id),
-        audio_data=audio_data,
-        content_type=content_type,
-    )
+    # Stream to storage (Task 2.3)
+    try:
+        with open(spool_path, "rb") as audio_file:
+            storage_path = await _upload_to_supabase_storage(
+                user_id=user_id,
+                handoff_id=str(handoff_id),
+                note_id=str(note_id),
+                audio_data=audio_file,
+                content_type=content_type,
+            )
+    except BaseException:
+        _remove_spooled_audio(spool_path)
+        raise
 
     if not storage_path:
+        _remove_spooled_audio(spool_path)
         raise HTTPException(
             status_code=500,
             detail={
@@ -1138,13 +1236,6 @@ async def upload_voice_note(
             }
         )
 
-    # Transcribe audio (Task 2.4)
-    transcript = await _transcribe_audio_with_elevenlabs(audio_data, content_type)
-
-    # If transcription failed, still save the note (AC#4 graceful degradation)
-    if not transcript:
-        logger.warning(f"Transcription failed for note {note_id}, saving without transcript")
-
     # Calculate sequence order
     sequence_order = len(existing_notes)
 
@@ -1155,28 +1246,26 @@ async def upload_voice_note(
         "handoff_id": str(handoff_id),
         "user_id": user_id,
         "storage_path": storage_path,
-        "transcript": transcript,
+        "transcript": None,
+        "transcription_status": VoiceNoteTranscriptionStatus.PENDING.value,
         "duration_seconds": duration_seconds,
         "sequence_order": sequence_order,
         "created_at": now.isoformat(),
     }
     _save_voice_note(note_data)
 
-    # Get signed URL for immediate playback
-    storage_url = _get_signed_url(storage_path)
-
-    # Build response
-    voice_note = VoiceNote(
-        id=note_id,
-        handoff_id=handoff_id,
-        user_id=UUID(user_id),
-        storage_path=storage_path,
-        storage_url=storage_url,
-        transcript=transcript,
-        duration_seconds=duration_seconds,
-        sequence_order=sequence_order,
-        created_at=now,
-    )
+    # Transcribe in the background (Task 2.4); the note is kept either way (AC#4)
+    queued = get_voice_note_transcription_queue().submit(TranscriptionJob(
+        note_id=str(note_id),
+        transcribe=lambda: _transcribe_spooled_audio(spool_path, content_type),
+        on_complete=lambda transcript: _record_transcript(str(note_id), transcript),
+        cleanup=lambda: _remove_spooled_audio(spool_path),
+    ))
+    if not queued:
+        note_data["transcription_status"] = VoiceNoteTranscriptionStatus.FAILED.value
+
+    # Build response with a signed URL for immediate playback
+    voice_note = _voice_note_from_record(note_data)
 
     total_notes = len(existing_notes) + 1
     can_add_more = total_notes < VOICE_NOTE_MAX_COUNT
@@ -1186,8 +1275,8 @@ async def upload_voice_note(
         f"({total_notes}/{VOICE_NOTE_MAX_COUNT} notes)"
     )
 
-    message = "Voice note uploaded successfully"
-    if not transcript:
+    message = "Voice note uploaded successfully (transcription in progress)"
+    if not queued:
         message = "Voice note saved (transcription unavailable)"
 
     return VoiceNoteUploadResponse(
@@ -1237,24 +1326,64 @@ async def list_voice_notes(
     note_records = _get_voice_notes_for_handoff(str(handoff_id))
 
     # Convert to VoiceNote models with signed URLs
-    notes = []
-    for record in note_records:
-        storage_url = _get_signed_url(record["storage_path"])
-        notes.append(VoiceNote(
-            id=UUID(record["id"]),
-            handoff_id=handoff_id,
-            user_id=UUID(record["user_id"]),
-            storage_path=record["storage_path"],
-            storage_url=storage_url,
-            transcript=record.get("transcript"),
-            duration_seconds=record["duration_seconds"],
-            sequence_order=record["sequence_order"],
-            created_at=datetime.fromisoformat(record["created_at"]),
-        ))
+    notes = [_voice_note_from_record(record) for record in note_records]
 
     return VoiceNoteList.from_notes(notes)
 
 
+@router.get("/{handoff_id}/voice-notes/{note_id}", response_model=VoiceNote)
+async def get_voice_note(
+    handoff_id: UUID,
+    note_id: UUID,
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Get a voice note (Story 9.3 AC#2).
+
+    Clients poll this after upload until transcription_status is no
+    longer "pending".
+
+    Returns:
+        VoiceNote with transcript and transcription status
+
+    Raises:
+        403: User is not the owner
+        404: Handoff or note not found
+    """
+    user_id = current_user.id
+
+    handoff = _get_handoff_by_id(str(handoff_id))
+    if not handoff:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "Handoff not found",
+                "code": VoiceNoteErrorCode.HANDOFF_NOT_FOUND.value,
+            }
+        )
+
+    if handoff.get("user_id") != user_id:
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "error": "Access denied",
+                "code": VoiceNoteErrorCode.NOT_AUTHORIZED.value,
+            }
+        )
+
+    note = _get_voice_note_by_id(str(note_id))
+    if not note or note.get("handoff_id") != str(handoff_id):
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "Voice note not found",
+                "code": "not_found",
+            }
+        )
+
+    return _voice_note_from_record(note)
+
+
 @router.delete("/{handoff_id}/voice-notes/{note_id}", status_code=204)
 async def delete_voice_note(
     handoff_id: UUID,
@@ -1618,7 +1747,7 @@ async def get_qa_thread(
 
     # Get thread from Q&A service
     qa_service = get_handoff_qa_service()
-    thread = qa_service.get_thread(str(handoff_id))
+    thread = await qa_service.aget_thread(str(handoff_id))
 
     return thread
 
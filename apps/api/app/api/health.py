@@ -1,9 +1,11 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import Optional
 
+from app.core.config import get_settings
 from app.core.database import get_mssql_db
+from app.core.startup import get_startup_profile
 from app.services.scheduler import get_pipeline_status
 
 router = APIRouter()
@@ -97,3 +99,23 @@ async def api_health_check():
         HealthResponse: Health status including database connectivity.
     """
     return await health_check()
+
+
+@router.get("/health/startup")
+async def startup_report():
+    """
+    Startup profiling report (enabled with STARTUP_PROFILE=true).
+
+    Returns:
+        Import time per module, warm-up step timings and startup events
+        (ms since app import).
+
+    Raises:
+        HTTPException 404: If startup profiling is disabled
+    """
+    if not get_settings().startup_profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Startup profiling disabled. Set STARTUP_PROFILE=true.",
+        )
+    return get_startup_profile().report()
@@ -12,16 +12,19 @@ References:
 - [Source: architecture/voice-briefing.md#Voice Integration Architecture]
 """
 
+import asyncio
 import logging
 import json
 import base64
-from typing import Optional
+from typing import Optional, Tuple
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
+import httpx
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
 
-from app.core.config import get_settings
 from app.services.voice import get_stt_service, get_tts_service, STTErrorCode
+from app.services.voice.audio_cache import CachedAudio, audio_cache_key, get_tts_audio_cache
+from app.services.voice.elevenlabs import get_elevenlabs_client
 from app.models.voice import (
     STTRequest,
     STTResultSchema,
@@ -66,52 +69,120 @@ async def generate_tts(request: TTSRequest):
     )
 
 
+def _parse_range(range_header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range "bytes=" header into an inclusive (start, end).
+
+    Returns None for headers that should be answered with the full body
+    (multiple ranges, other units); raises ValueError for unsatisfiable ranges.
+    """
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, _, last = spec.strip().partition("-")
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length <= 0:
+            raise ValueError("empty suffix range")
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError("range not satisfiable")
+    return start, min(end, size - 1)
+
+
+def _cached_audio_response(audio: CachedAudio, key: str, range_header: Optional[str]) -> Response:
+    """Serve cached audio, honouring a single HTTP Range."""
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": f'"{key}"',
+        "Cache-Control": "private, max-age=86400",
+    }
+    byte_range = None
+    if range_header:
+        try:
+            byte_range = _parse_range(range_header, audio.size)
+        except ValueError:
+            audio.close()
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{audio.size}"})
+
+    start, end = byte_range or (0, audio.size - 1)
+
+    def body():
+        try:
+            yield from audio.iter_chunks(start, end)
+        finally:
+            audio.close()
+
+    headers["Content-Length"] = str(max(end - start + 1, 0))
+    if byte_range is None:
+        return StreamingResponse(body(), media_type="audio/mpeg", headers=headers)
+    headers["Content-Range"] = f"bytes {start}-{end}/{audio.size}"
+    return StreamingResponse(body(), status_code=206, media_type="audio/mpeg", headers=headers)
+
+
 @router.get("/tts/stream")
 async def stream_tts(
+    request: Request,
     voice_id: str = Query(..., description="ElevenLabs voice ID"),
     model_id: str = Query("eleven_flash_v2_5", description="Model ID"),
     text: str = Query(..., description="Text to synthesize"),
     stability: float = Query(0.5, ge=0.0, le=1.0),
     similarity_boost: float = Query(0.75, ge=0.0, le=1.0),
+    speed: float = Query(1.0, ge=0.7, le=1.2),
 ):
     """
     Stream TTS audio from ElevenLabs.
 
     This endpoint proxies the audio stream from ElevenLabs to the client.
     Used by the frontend BriefingPlayer component.
+
+    Audio is cached by content (text, voice, model, speed, voice settings):
+    - Hits are served from disk with HTTP Range support (seeking/resume)
+    - Misses stream from ElevenLabs and are cached once complete
+    - A Range request on a miss synthesizes the full audio first so the
+      range can be honoured
     """
-    settings = get_settings()
+    client = get_elevenlabs_client()
 
-    if not settings.elevenlabs_configured:
+    if not client.is_configured:
         raise HTTPException(status_code=503, detail="TTS service not configured")
 
-    # Import here to avoid circular dependency
-    import httpx
+    synthesis = dict(
+        text=text,
+        voice_id=voice_id,
+        model_id=model_id,
+        stability=stability,
+        similarity_boost=similarity_boost,
+        speed=speed,
+    )
+    cache = get_tts_audio_cache()
+    key = audio_cache_key(**synthesis)
+    range_header = request.headers.get("range")
+
+    audio = cache.open(key) if cache is not None else None
+    if audio is None and cache is not None and range_header:
+        try:
+            data = await client.synthesize(**synthesis)
+        except httpx.HTTPError as e:
+            logger.warning(f"TTS synthesis failed: {e}")
+            raise HTTPException(status_code=502, detail="TTS synthesis failed")
+        await asyncio.to_thread(cache.put, key, data)
+        audio = cache.open(key)
+
+    if audio is not None:
+        return _cached_audio_response(audio, key, range_header)
 
     async def stream_audio():
-        """Generator that streams audio from ElevenLabs."""
-        url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream"
-
-        headers = {
-            "xi-api-key": settings.elevenlabs_api_key,
-            "Content-Type": "application/json",
-            "Accept": "audio/mpeg",
-        }
-
-        payload = {
-            "text": text,
-            "model_id": model_id,
-            "voice_settings": {
-                "stability": stability,
-                "similarity_boost": similarity_boost,
-            }
-        }
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            async with client.stream("POST", url, json=payload, headers=headers) as response:
-                response.raise_for_status()
-                async for chunk in response.aiter_bytes():
-                    yield chunk
+        """Stream from ElevenLabs, caching the audio once it is complete."""
+        chunks = []
+        async for chunk in client.stream_audio(**synthesis):
+            chunks.append(chunk)
+            yield chunk
+        if cache is not None:
+            await asyncio.to_thread(cache.put, key, b"".join(chunks))
 
     return StreamingResponse(
         stream_audio(),
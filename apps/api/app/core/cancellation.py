@@ -0,0 +1,152 @@
+"""
+Cooperative Cancellation
+
+Work nobody is waiting for should stop instead of holding DB connections
+and LLM quota:
+
+- run_while_connected() runs an endpoint's work as a task and cancels it
+  when the client disconnects (the ASGI receive channel yields
+  http.disconnect). The cancellation reaches tool fan-out, async LLM
+  calls and admission queues through ordinary asyncio cancellation.
+- Work cancelled for a disconnect, and work abandoned at a deadline
+  (tool and SQL timeouts), is counted per operation.
+- SQL runs in threads asyncio cannot interrupt, so text-to-SQL
+  connections carry a server-side statement_timeout
+  (sql_statement_timeout_engine_args) and PostgreSQL stops the query
+  when the API stops waiting for it.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from fastapi import HTTPException, Request
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Non-standard status (nginx convention) for requests the client abandoned
+CLIENT_CLOSED_REQUEST = 499
+
+CLIENT_DISCONNECT = "client_disconnect"
+DEADLINE = "deadline"
+
+
+class CancellationStats:
+    """Thread-safe counts of cancelled work by operation and reason."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Dict[str, int]] = {}
+
+    def record(self, operation: str, reason: str) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(operation, {CLIENT_DISCONNECT: 0, DEADLINE: 0})
+            counts[reason] = counts.get(reason, 0) + 1
+
+    def count(self, operation: str, reason: str) -> int:
+        with self._lock:
+            return self._counts.get(operation, {}).get(reason, 0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            by_operation = {op: dict(counts) for op, counts in self._counts.items()}
+        totals = {CLIENT_DISCONNECT: 0, DEADLINE: 0}
+        for counts in by_operation.values():
+            for reason, value in counts.items():
+                totals[reason] = totals.get(reason, 0) + value
+        return {"total": totals, "by_operation": by_operation}
+
+
+async def wait_for_disconnect(receive: Callable[[], Awaitable[Dict[str, Any]]]) -> None:
+    """Return once the ASGI receive channel reports the client has gone."""
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def run_while_connected(request: Request, work: Awaitable[T], operation: str) -> T:
+    """
+    Await work, cancelling it if the client disconnects first.
+
+    Args:
+        request: The incoming request (its receive channel is watched)
+        work: Coroutine doing the endpoint's work
+        operation: Name used for cancellation counters
+
+    Returns:
+        The work's result
+
+    Raises:
+        HTTPException 499: If the client disconnected (nobody reads it;
+            it ends the request without a 500 in the logs)
+    """
+    if not get_settings().cancel_on_disconnect:
+        return await work
+
+    task = asyncio.ensure_future(work)
+    watcher = asyncio.ensure_future(wait_for_disconnect(request.receive))
+    try:
+        await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        task.cancel()
+        watcher.cancel()
+        raise
+
+    if task.done():
+        watcher.cancel()
+        return task.result()
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    get_cancellation_stats().record(operation, CLIENT_DISCONNECT)
+    logger.info(f"Client disconnected; cancelled {operation}")
+    raise HTTPException(status_code=CLIENT_CLOSED_REQUEST, detail="Client closed request")
+
+
+def sql_statement_timeout_engine_args(database_url: str, timeout_seconds: float) -> Dict[str, Any]:
+    """
+    SQLAlchemy engine args enforcing a server-side statement timeout.
+
+    Only PostgreSQL URLs are supported; other databases get no extra args.
+    """
+    if not database_url.startswith(("postgres://", "postgresql")):
+        return {}
+    timeout_ms = int(timeout_seconds * 1000)
+    return {"connect_args": {"options": f"-c statement_timeout={timeout_ms}"}}
+
+
+# Module-level singleton
+_cancellation_stats: Optional[CancellationStats] = None
+
+
+def get_cancellation_stats() -> CancellationStats:
+    """
+    Get the singleton CancellationStats instance.
+
+    Returns:
+        CancellationStats instance
+    """
+    global _cancellation_stats
+    if _cancellation_stats is None:
+        _cancellation_stats = CancellationStats()
+    return _cancellation_stats
+
+
+def reset_cancellation_stats() -> None:
+    """
+    Reset the singleton cancellation counters.
+
+    Primarily used for testing.
+    """
+    global _cancellation_stats
+    _cancellation_stats = None
@@ -74,6 +74,14 @@ class Settings(BaseSettings):
     agent_timeout_seconds: int = 60  # Agent execution timeout
     agent_rate_limit_requests: int = 10  # Rate limit requests per window
     agent_rate_limit_window: int = 60  # Rate limit window in seconds
+    agent_compact_tool_output: bool = True  # Send compact tool outputs to the LLM
+    agent_tool_output_token_budget: int = 600  # Default per-tool output token budget
+    agent_tool_manifest: bool = True  # Register tools from tools/manifest.json, importing lazily
+    agent_history_keep_turns: int = 6  # Recent user/assistant turns sent verbatim
+    agent_history_token_budget: int = 2000  # Max tokens of chat history per turn
+    agent_history_summary_max_tokens: int = 300  # Target length of the rolling summary
+    agent_history_summary_ttl_seconds: int = 86400  # Summary cache lifetime (24 hours)
+    agent_history_max_conversations: int = 1000  # Summaries kept in memory
 
     # Data Source Configuration (Story 5.2)
     data_source_type: str = "supabase"  # Data source type: "supabase" or "composite"
@@ -84,12 +92,94 @@ class Settings(BaseSettings):
     cache_live_ttl: int = 60  # Live tier TTL in seconds (1 minute)
     cache_daily_ttl: int = 900  # Daily tier TTL in seconds (15 minutes)
     cache_static_ttl: int = 3600  # Static tier TTL in seconds (1 hour)
+    cache_backend: str = "memory"  # Cache storage backend: "memory" or "redis"
+    cache_redis_url: str = ""  # Redis URL for the shared backend (redis://host:6379/0)
+    cache_redis_prefix: str = "tool_cache"  # Key/channel namespace in Redis
+    cache_redis_socket_timeout: float = 0.25  # Redis socket timeout in seconds
+
+    # Stale-While-Revalidate Configuration (soft TTL for tool cache)
+    cache_swr_enabled: bool = False  # Serve expired entries while refreshing in background
+    cache_live_stale_ttl: int = 30  # Grace period past live TTL in seconds
+    cache_daily_stale_ttl: int = 300  # Grace period past daily TTL in seconds (5 minutes)
+    cache_static_stale_ttl: int = 1800  # Grace period past static TTL in seconds (30 minutes)
+    cache_refresh_ahead_ratio: float = 0.8  # Fraction of TTL after which hot keys refresh early
+    cache_refresh_ahead_min_hits: int = 3  # Hits before a key counts as hot
+    cache_refresh_max_workers: int = 4  # Max concurrent background refreshes
+
+    # Rate Limiting (shared GCRA limiter middleware; per-class limits are
+    # agent_rate_limit_*, chat_rate_limit_* and rate_limit_default_*)
+    rate_limit_enabled: bool = True  # Enforce rate limits in RateLimitMiddleware
+    rate_limit_backend: str = "memory"  # State storage: "memory" (per worker) or "redis"
+    rate_limit_redis_url: str = ""  # Redis URL for shared limits (default: cache_redis_url)
+    rate_limit_redis_prefix: str = "rate_limit"  # Key namespace in Redis
+    rate_limit_max_keys: int = 10000  # Max tracked keys per window in memory
+    rate_limit_default_requests: int = 0  # Other /api requests per window (0 = unlimited)
+    rate_limit_default_window: int = 60  # Window in seconds for other /api requests
+    rate_limit_role_multipliers: str = "service_role=5"  # Per JWT role limit scaling
+
+    # Cancellation (stop work for disconnected clients and passed deadlines)
+    cancel_on_disconnect: bool = True  # Cancel chat/briefing work when the client disconnects
+
+    # Briefing Pre-generation (morning briefings materialized before shift start)
+    briefing_pregenerate_enabled: bool = True  # Serve morning briefings from the pre-generated store
+    briefing_pregenerate_time: str = "05:30"  # Daily pre-generation time (HH:MM, pipeline_timezone)
+    briefing_fingerprint_tables: str = "daily_summaries,safety_events"  # Changes here make stored briefings stale
+    briefing_data_plan_enabled: bool = True  # Fetch briefing data once plant-wide and slice it per area
+    briefing_narrative_mode: str = "template"  # Area narratives: template (no LLM), batched (one LLM call), or per_area
+    eod_reuse_morning_snapshot: bool = True  # EOD compares against the stored morning snapshot, re-querying only changed data
+    handoff_synthesis_cache_enabled: bool = True  # Reuse handoff synthesis tool results and sections until their data changes
+    handoff_synthesis_cache_ttl_seconds: int = 600  # Re-run a cached handoff tool after this long even without data changes
+    handoff_qa_persist_enabled: bool = False  # Insert Q&A entries into handoff_qa_entries (needs handoffs in shift_handoffs)
+    handoff_qa_cache_max_threads: int = 256  # Q&A threads kept in the per-worker LRU read cache
+    handoff_qa_cache_ttl_seconds: float = 30.0  # Reload a cached Q&A thread after this long (entries from other workers)
+    handoff_qa_flush_batch_size: int = 20  # Insert queued Q&A entries once this many are waiting
+    handoff_qa_flush_interval_seconds: float = 1.0  # ...or at least this often
+    handoff_qa_max_insert_attempts: int = 3  # Drop a Q&A entry after this many failed inserts
+    handoff_qa_max_pending: int = 1000  # Q&A entries queued at most; the oldest are dropped beyond this
+
+    # Handoff Voice Notes (chunked upload, background transcription)
+    voice_note_upload_chunk_bytes: int = 256 * 1024  # Uploads are spooled to disk in chunks of this size
+    voice_note_max_upload_bytes: int = 10 * 1024 * 1024  # Larger uploads are rejected (413)
+    voice_note_transcription_concurrency: int = 2  # Voice notes transcribed at once per API worker
+    voice_note_transcription_queue_size: int = 50  # Queued transcriptions before new notes skip transcription
+    voice_note_transcription_timeout_seconds: float = 60.0  # Per-note transcription timeout
+
+    # Agent Tracing Configuration (span-level timing of agent turns)
+    tracing_enabled: bool = True  # Record spans for agent turns
+    tracing_sample_rate: float = 0.1  # Fraction of turns kept in the trace buffer / exported
+    tracing_buffer_size: int = 200  # Sampled traces kept in memory for the admin endpoint
+    tracing_otlp_endpoint: str = ""  # OTLP/HTTP collector base URL (e.g. http://localhost:4318)
+    tracing_service_name: str = "tfn-aihub-api"  # service.name resource attribute for export
+
+    # Startup Budget (cold-start reduction)
+    startup_lazy_routers: bool = True  # Import routers on first request instead of at load
+    startup_warmup: bool = True  # Warm routers, tools and agent after startup
+    startup_profile: bool = False  # Record import timings, served at /health/startup
+
+    # LLM Response Cache (deterministic generation paths)
+    llm_cache_enabled: bool = True  # Cache low-temperature LLM responses by prompt hash
+    llm_cache_ttl_seconds: int = 3600  # Response lifetime (1 hour)
+    llm_cache_max_entries: int = 500  # In-memory tier size
+    llm_cache_max_temperature: float = 0.3  # Calls above this temperature are never cached
+    llm_cache_sqlite_path: str = ""  # Persistent SQLite tier file; empty disables it
+    llm_cache_sqlite_max_entries: int = 5000  # Persistent tier size
+
+    # LLM Admission Control (global scheduler for provider calls)
+    llm_admission_enabled: bool = True  # Bound and prioritize concurrent LLM calls
+    llm_max_concurrency: int = 8  # In-flight calls per provider
+    llm_max_queue_depth: int = 32  # Queued calls before interactive work is shed (503)
+    llm_batch_queue_depth: int = 8  # Queued calls before batch work is shed
+    llm_max_queue_wait_seconds: float = 10.0  # Longest wait for a slot before shedding
 
     # ElevenLabs TTS Configuration (Story 8.1)
     elevenlabs_api_key: str = ""  # ElevenLabs API key
     elevenlabs_model: str = "eleven_flash_v2_5"  # Flash v2.5 for low latency
     elevenlabs_voice_id: str = ""  # Default voice ID
     elevenlabs_timeout: int = 10  # Request timeout in seconds
+    tts_audio_cache_enabled: bool = True  # Cache synthesized audio on disk by content hash
+    tts_audio_cache_dir: str = ""  # Cache directory; empty uses <system temp>/tts_audio_cache
+    tts_audio_cache_max_bytes: int = 256 * 1024 * 1024  # Size budget before LRU eviction (256 MB)
+    tts_presynthesize_briefings: bool = False  # Synthesize pre-generated briefing audio into the cache
 
     @property
     def mssql_connection_string(self) -> str:
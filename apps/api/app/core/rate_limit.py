@@ -0,0 +1,466 @@
+"""
+Rate Limiting
+
+Shared request rate limiting applied as ASGI middleware, replacing the
+per-router lists of request timestamps:
+
+- GCRA (generic cell rate algorithm): each key stores a single
+  "theoretical arrival time", so a check is O(1) in time and memory.
+  A limit of N requests per window allows a burst of N, then one
+  request every window/N seconds
+- Idle keys are evicted: a key's state only matters for one window after
+  its last request, so entries expire after that window
+- Storage is "memory" (per worker) or "redis" (shared, so limits hold
+  across workers); a Redis outage falls back to per-worker limits. Redis
+  checks are blocking round trips, so the middleware runs them in a
+  worker thread rather than on the event loop
+- Limits are set per endpoint class (ENDPOINT_CLASSES) and scaled per JWT
+  role (RATE_LIMIT_ROLE_MULTIPLIERS)
+- Responses carry RateLimit-Limit, RateLimit-Remaining, RateLimit-Reset
+  and RateLimit-Policy headers; limited requests get 429 with Retry-After
+
+Requests are keyed by the verified JWT subject, or by client address
+when there is no valid token (such requests are rejected by auth anyway).
+"""
+
+import asyncio
+import json
+import logging
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from cachetools import TTLCache
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Rate:
+    """Allow `limit` requests per `window` seconds."""
+
+    limit: int
+    window: int
+
+    @property
+    def interval(self) -> float:
+        """Seconds between requests at the sustained rate."""
+        return self.window / self.limit
+
+    @property
+    def policy(self) -> str:
+        return f"{self.limit};w={self.window}"
+
+
+@dataclass
+class RateLimitResult:
+    """Outcome of a rate limit check."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float  # Seconds until the full limit is available again
+    retry_after: float = 0.0  # Seconds until a denied request would be allowed
+
+    def headers(self, rate: Rate) -> Dict[str, str]:
+        """Standard RateLimit-* response headers."""
+        headers = {
+            "RateLimit-Limit": str(self.limit),
+            "RateLimit-Remaining": str(self.remaining),
+            "RateLimit-Reset": str(math.ceil(self.reset_after)),
+            "RateLimit-Policy": rate.policy,
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(max(1, math.ceil(self.retry_after)))
+        return headers
+
+
+def gcra(tat: Optional[float], now: float, rate: Rate) -> Tuple[Optional[float], RateLimitResult]:
+    """
+    Apply one request to a key's GCRA state.
+
+    Args:
+        tat: Stored theoretical arrival time (None for a new key)
+        now: Current time in seconds
+        rate: Limit to enforce
+
+    Returns:
+        (new TAT to store, or None if the request is denied; result)
+    """
+    tat = max(tat or now, now)
+    new_tat = tat + rate.interval
+    allow_at = new_tat - rate.window
+    if now < allow_at:
+        return None, RateLimitResult(
+            allowed=False,
+            limit=rate.limit,
+            remaining=0,
+            reset_after=tat - now,
+            retry_after=allow_at - now,
+        )
+    remaining = int((now - allow_at) / rate.interval + 1e-9)
+    return new_tat, RateLimitResult(
+        allowed=True,
+        limit=rate.limit,
+        remaining=remaining,
+        reset_after=new_tat - now,
+    )
+
+
+class RateLimitStore(ABC):
+    """Storage for per-key GCRA state."""
+
+    name: str = "base"
+    shared: bool = False  # True when hit() makes network round trips
+
+    @abstractmethod
+    def hit(self, key: str, rate: Rate, now: float) -> RateLimitResult:
+        """Atomically apply one request for key."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop all state."""
+
+    def __len__(self) -> int:
+        return 0
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """
+    Per-worker store.
+
+    One TTLCache per window length, with the window as TTL, so idle keys
+    disappear once their state no longer matters. At max_keys the least
+    recently used key is dropped (that client starts with a full bucket).
+    """
+
+    name = "memory"
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._caches: Dict[int, TTLCache] = {}
+        self._lock = threading.Lock()
+
+    def _cache(self, window: int) -> TTLCache:
+        if window not in self._caches:
+            self._caches[window] = TTLCache(maxsize=self.max_keys, ttl=window)
+        return self._caches[window]
+
+    def hit(self, key: str, rate: Rate, now: float) -> RateLimitResult:
+        with self._lock:
+            cache = self._cache(rate.window)
+            new_tat, result = gcra(cache.get(key), now, rate)
+            if new_tat is not None:
+                cache[key] = new_tat
+            return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._caches.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(cache) for cache in self._caches.values())
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """
+    Shared store for multi-worker deployments.
+
+    Each key's TAT is updated in a WATCH/MULTI transaction and expires one
+    window after it is reached. If Redis fails, requests are checked
+    against a per-worker fallback store until it recovers.
+    """
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, client: Any, prefix: str = "rate_limit", max_keys: int = 10000):
+        self._client = client
+        self._prefix = prefix
+        self._fallback = MemoryRateLimitStore(max_keys)
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self._prefix}:{key}"
+
+    def hit(self, key: str, rate: Rate, now: float) -> RateLimitResult:
+        redis_key = self._redis_key(key)
+        outcome: Dict[str, RateLimitResult] = {}
+
+        def update(pipe) -> None:
+            stored = pipe.get(redis_key)
+            new_tat, outcome["result"] = gcra(float(stored) if stored else None, now, rate)
+            if new_tat is not None:
+                pipe.multi()
+                pipe.set(redis_key, repr(new_tat), px=max(1, math.ceil((new_tat - now) * 1000)))
+
+        try:
+            self._client.transaction(update, redis_key)
+            return outcome["result"]
+        except Exception as e:
+            logger.warning(f"Redis rate limit store unavailable ({e}), using per-worker limits")
+            return self._fallback.hit(key, rate, now)
+
+    def clear(self) -> None:
+        self._fallback.clear()
+        try:
+            keys = list(self._client.scan_iter(match=f"{self._prefix}:*"))
+            if keys:
+                self._client.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Failed to clear Redis rate limit store: {e}")
+
+
+def create_rate_limit_store() -> RateLimitStore:
+    """
+    Create the store selected by RATE_LIMIT_BACKEND.
+
+    - "memory" (default): MemoryRateLimitStore
+    - "redis": RedisRateLimitStore using RATE_LIMIT_REDIS_URL (or CACHE_REDIS_URL)
+
+    Falls back to memory if Redis is not configured or unreachable.
+
+    Returns:
+        RateLimitStore instance
+    """
+    settings = get_settings()
+    backend_type = settings.rate_limit_backend
+
+    if backend_type == "redis":
+        url = settings.rate_limit_redis_url or settings.cache_redis_url
+        if not url:
+            logger.warning("RATE_LIMIT_BACKEND=redis but no Redis URL is set, using memory")
+            return MemoryRateLimitStore(settings.rate_limit_max_keys)
+        try:
+            import redis
+
+            client = redis.Redis.from_url(
+                url,
+                socket_timeout=settings.cache_redis_socket_timeout,
+                socket_connect_timeout=settings.cache_redis_socket_timeout,
+            )
+            client.ping()
+        except Exception as e:
+            logger.warning(f"Redis rate limit store unavailable ({e}), using memory")
+            return MemoryRateLimitStore(settings.rate_limit_max_keys)
+        logger.info("Initialized RedisRateLimitStore")
+        return RedisRateLimitStore(
+            client,
+            prefix=settings.rate_limit_redis_prefix,
+            max_keys=settings.rate_limit_max_keys,
+        )
+
+    if backend_type != "memory":
+        logger.warning(f"Unknown rate limit backend: {backend_type}, defaulting to memory")
+    return MemoryRateLimitStore(settings.rate_limit_max_keys)
+
+
+@dataclass(frozen=True)
+class EndpointClass:
+    """Requests sharing a limit, configured by a pair of settings."""
+
+    name: str
+    path: str
+    method: Optional[str]
+    requests_setting: str
+    window_setting: str
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.method is not None and method != self.method:
+            return False
+        return path == self.path or path.startswith(self.path.rstrip("/") + "/")
+
+
+# First match wins; a class with 0 requests is unlimited
+ENDPOINT_CLASSES = (
+    EndpointClass("agent", "/api/agent/chat", "POST", "agent_rate_limit_requests", "agent_rate_limit_window"),
+    EndpointClass("chat", "/api/chat/query", "POST", "chat_rate_limit_requests", "chat_rate_limit_window"),
+    EndpointClass("default", "/api", None, "rate_limit_default_requests", "rate_limit_default_window"),
+)
+
+
+def parse_role_multipliers(value: str) -> Dict[str, float]:
+    """Parse "role=multiplier,..." (e.g. "service_role=5")."""
+    multipliers = {}
+    for item in value.split(","):
+        role, _, multiplier = item.partition("=")
+        if not role.strip():
+            continue
+        try:
+            multipliers[role.strip()] = float(multiplier)
+        except ValueError:
+            logger.warning(f"Ignoring invalid rate limit role multiplier: {item!r}")
+    return multipliers
+
+
+class RateLimiter:
+    """
+    Checks requests against per-endpoint-class, per-role limits.
+
+    Usage:
+        limiter = get_rate_limiter()
+        rate = limiter.rate_for("agent", role="authenticated")
+        result = limiter.hit("agent:user:123", rate)
+    """
+
+    def __init__(self, store: Optional[RateLimitStore] = None):
+        settings = get_settings()
+        self.enabled = settings.rate_limit_enabled
+        self.store = store if store is not None else create_rate_limit_store()
+        self.role_multipliers = parse_role_multipliers(settings.rate_limit_role_multipliers)
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def endpoint_class(self, method: str, path: str) -> Optional[EndpointClass]:
+        """Get the endpoint class of a request, if it is rate limited."""
+        for endpoint in ENDPOINT_CLASSES:
+            if endpoint.matches(method, path):
+                return endpoint if self.base_rate(endpoint) else None
+        return None
+
+    def base_rate(self, endpoint: EndpointClass) -> Optional[Rate]:
+        settings = get_settings()
+        limit = getattr(settings, endpoint.requests_setting)
+        window = getattr(settings, endpoint.window_setting)
+        if limit <= 0 or window <= 0:
+            return None
+        return Rate(limit=limit, window=window)
+
+    def rate_for(self, endpoint: EndpointClass, role: Optional[str] = None) -> Optional[Rate]:
+        """Limit for an endpoint class, scaled by the role's multiplier."""
+        rate = self.base_rate(endpoint)
+        multiplier = self.role_multipliers.get(role or "", 1.0)
+        if rate is None or multiplier == 1.0:
+            return rate
+        return Rate(limit=max(1, int(rate.limit * multiplier)), window=rate.window)
+
+    def hit(self, key: str, rate: Rate, now: Optional[float] = None) -> RateLimitResult:
+        """Record a request for key and check it against rate."""
+        result = self.store.hit(key, rate, time.time() if now is None else now)
+        endpoint = key.split(":", 1)[0]
+        counters = self._counters.setdefault(endpoint, {"allowed": 0, "limited": 0})
+        counters["allowed" if result.allowed else "limited"] += 1
+        return result
+
+    async def ahit(self, key: str, rate: Rate, now: Optional[float] = None) -> RateLimitResult:
+        """hit() for async callers; a shared store is checked in a worker thread."""
+        if self.store.shared:
+            return await asyncio.to_thread(self.hit, key, rate, now)
+        return self.hit(key, rate, now)
+
+    def reset(self) -> None:
+        """Drop all rate limit state (e.g. between tests)."""
+        self.store.clear()
+        self._counters.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.store.name,
+            "tracked_keys": len(self.store),
+            "by_endpoint": {name: dict(c) for name, c in self._counters.items()},
+        }
+
+
+async def _identify(scope: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+    """Get (identity, role) for a request: the JWT subject, or client address."""
+    from fastapi import HTTPException
+
+    from app.core import security
+
+    headers = dict(scope.get("headers") or [])
+    authorization = headers.get(b"authorization", b"").decode("latin-1")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            payload = await security.verify_supabase_jwt(token)
+            if payload.get("sub"):
+                return f"user:{payload['sub']}", payload.get("role")
+        except HTTPException:
+            pass
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}", None
+
+
+class RateLimitMiddleware:
+    """ASGI middleware enforcing RateLimiter limits with RateLimit-* headers."""
+
+    def __init__(self, app, limiter: Optional[RateLimiter] = None):
+        self.app = app
+        self._limiter = limiter
+
+    @property
+    def limiter(self) -> RateLimiter:
+        return self._limiter or get_rate_limiter()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        limiter = self.limiter
+        endpoint = limiter.endpoint_class(scope["method"], scope["path"]) if limiter.enabled else None
+        if endpoint is None:
+            await self.app(scope, receive, send)
+            return
+
+        identity, role = await _identify(scope)
+        rate = limiter.rate_for(endpoint, role)
+        result = await limiter.ahit(f"{endpoint.name}:{identity}", rate)
+        headers = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in result.headers(rate).items()
+        ]
+
+        if not result.allowed:
+            retry_after = max(1, math.ceil(result.retry_after))
+            body = json.dumps({
+                "detail": f"Rate limit exceeded. Please wait {retry_after} seconds before trying again."
+            }).encode()
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    *headers,
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": [*message.get("headers", []), *headers]}
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+# Module-level singleton
+_rate_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Get the singleton RateLimiter instance.
+
+    Returns:
+        RateLimiter instance
+    """
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter()
+    return _rate_limiter
+
+
+def reset_rate_limiter() -> None:
+    """
+    Reset the singleton rate limiter.
+
+    Primarily used for testing.
+    """
+    global _rate_limiter
+    _rate_limiter = None
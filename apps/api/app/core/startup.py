@@ -0,0 +1,268 @@
+"""
+Startup Budget (cold-start reduction)
+
+Importing every router pulls in langchain, langchain_openai, mem0, openai,
+tiktoken and the supabase client before the app can answer /health. To
+keep Railway cold starts and autoscaled replicas fast:
+
+- Routers are registered as LazyRouter entries and imported on first use:
+  LazyRouterMiddleware imports a router (in a worker thread) the first time
+  a request hits its prefix; OpenAPI/docs requests load every router
+- After the server is accepting traffic, a background warm-up imports the
+  remaining routers, discovers agent tools and initializes the agent
+- With STARTUP_PROFILE=true, import time per module (heavy dependencies
+  individually, then each router) and warm-up steps are recorded and
+  served at GET /health/startup
+
+STARTUP_LAZY_ROUTERS=false restores eager imports at module load.
+"""
+
+import asyncio
+import importlib
+import logging
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import FastAPI
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Baseline for startup timings (events are reported relative to app.main's imports)
+_PROCESS_BASELINE = time.perf_counter()
+
+# Third-party packages timed individually when profiling
+HEAVY_MODULES = (
+    "openai",
+    "langchain_core",
+    "langchain",
+    "langchain_openai",
+    "tiktoken",
+    "numpy",
+    "pandas",
+    "supabase",
+    "mem0",
+)
+
+# Paths that need every router registered
+FULL_SCHEMA_PATHS = ("/openapi.json", "/docs", "/redoc")
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+def _top_level_modules() -> set:
+    return {name.split(".", 1)[0] for name in list(sys.modules)}
+
+
+class StartupProfile:
+    """Import and warm-up timings for the startup report."""
+
+    def __init__(self):
+        self.detailed = get_settings().startup_profile
+        self.imports: List[Dict[str, Any]] = []
+        self.steps: List[Dict[str, Any]] = []
+        self.events: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def mark(self, event: str) -> None:
+        """Record an event time (ms since app import)."""
+        self.events[event] = _elapsed_ms(_PROCESS_BASELINE)
+
+    def timed_import(self, module: str) -> Any:
+        """Import a module, recording its time and the packages it pulled in."""
+        before = _top_level_modules() if self.detailed else set()
+        start = time.perf_counter()
+        imported = importlib.import_module(module)
+        entry: Dict[str, Any] = {"module": module, "import_ms": _elapsed_ms(start)}
+        if self.detailed:
+            entry["new_packages"] = sorted(_top_level_modules() - before)
+        with self._lock:
+            self.imports.append(entry)
+        return imported
+
+    def record_step(self, name: str, duration_ms: float, status: str, detail: Optional[str] = None) -> None:
+        with self._lock:
+            self.steps.append({
+                "step": name,
+                "duration_ms": duration_ms,
+                "status": status,
+                **({"detail": detail} if detail else {}),
+            })
+
+    def report(self) -> Dict[str, Any]:
+        """Build the startup profiling report."""
+        with self._lock:
+            imports = sorted(self.imports, key=lambda i: i["import_ms"], reverse=True)
+            steps = list(self.steps)
+        return {
+            "events_ms": dict(self.events),
+            "imports": imports,
+            "import_total_ms": round(sum(i["import_ms"] for i in imports), 2),
+            "warmup_steps": steps,
+        }
+
+
+@dataclass
+class LazyRouter:
+    """A router imported on first use."""
+
+    module: str
+    prefix: str = ""
+    tags: List[str] = field(default_factory=list)
+    attr: str = "router"
+
+    def matches(self, path: str) -> bool:
+        return bool(self.prefix) and (path == self.prefix or path.startswith(self.prefix + "/"))
+
+
+class LazyRouterLoader:
+    """
+    Registers LazyRouter entries with the app when first needed.
+
+    Imports run in a worker thread so the event loop keeps serving
+    (e.g. /health) while a heavy router loads. Routers sharing a prefix
+    are included together, in declaration order.
+    """
+
+    def __init__(self, app: FastAPI, routers: List[LazyRouter], profile: StartupProfile):
+        self.app = app
+        self.profile = profile
+        self._pending: List[LazyRouter] = list(routers)
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> List[LazyRouter]:
+        return list(self._pending)
+
+    def _include(self, routers: List[LazyRouter]) -> None:
+        """Import and include routers not yet registered."""
+        for entry in routers:
+            module = sys.modules.get(entry.module) or self.profile.timed_import(entry.module)
+            with self._lock:
+                if entry not in self._pending:
+                    continue
+                self.app.include_router(getattr(module, entry.attr), prefix=entry.prefix, tags=entry.tags)
+                self._pending.remove(entry)
+        self.app.openapi_schema = None
+
+    def load_all_sync(self) -> None:
+        """Include every pending router now (eager mode)."""
+        self._include(self.pending)
+
+    async def load_all(self) -> None:
+        """Include every pending router without blocking the event loop."""
+        if self._pending:
+            await asyncio.to_thread(self._include, self.pending)
+
+    async def ensure_loaded(self, path: str) -> None:
+        """Include the routers a request path needs."""
+        if not self._pending:
+            return
+        if path in FULL_SCHEMA_PATHS:
+            await self.load_all()
+            return
+        needed = [entry for entry in self.pending if entry.matches(path)]
+        if needed:
+            await asyncio.to_thread(self._include, needed)
+
+
+class LazyRouterMiddleware:
+    """ASGI middleware loading lazy routers before routing a request."""
+
+    def __init__(self, app, loader: LazyRouterLoader):
+        self.app = app
+        self.loader = loader
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] in ("http", "websocket"):
+            await self.loader.ensure_loaded(scope["path"])
+        await self.app(scope, receive, send)
+
+
+async def _run_step(profile: StartupProfile, name: str, func: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    try:
+        result = await asyncio.to_thread(func)
+        detail = None if result is None else str(result)
+        profile.record_step(name, _elapsed_ms(start), "ok", detail)
+    except Exception as e:
+        profile.record_step(name, _elapsed_ms(start), "error", str(e))
+        logger.warning(f"Startup warm-up step '{name}' failed: {e}")
+
+
+def _import_heavy_modules(profile: StartupProfile) -> str:
+    timed = 0
+    for module in HEAVY_MODULES:
+        if module in sys.modules:
+            continue
+        try:
+            profile.timed_import(module)
+            timed += 1
+        except ImportError:
+            pass
+    return f"{timed} modules"
+
+
+def _discover_tools() -> str:
+    from app.services.agent.registry import get_tool_registry
+
+    return f"{get_tool_registry().discover_tools()} tools"
+
+
+def _initialize_agent() -> str:
+    from app.services.agent.executor import get_manufacturing_agent
+
+    agent = get_manufacturing_agent()
+    if not agent.is_configured:
+        return "not configured"
+    if not agent.is_initialized:
+        agent.initialize()
+    return "initialized"
+
+
+async def run_warmup(loader: LazyRouterLoader, profile: StartupProfile) -> None:
+    """
+    Warm the app after it starts accepting traffic.
+
+    Steps run in worker threads, one after another; failures are logged
+    and recorded but never stop the app.
+    """
+    if profile.detailed:
+        await _run_step(profile, "heavy_imports", lambda: _import_heavy_modules(profile))
+    start = time.perf_counter()
+    await loader.load_all()
+    profile.record_step("routers", _elapsed_ms(start), "ok")
+    await _run_step(profile, "tool_registry", _discover_tools)
+    await _run_step(profile, "agent", _initialize_agent)
+    profile.mark("warmup_complete")
+
+    if profile.detailed:
+        report = profile.report()
+        slowest = ", ".join(f"{i['module']}={i['import_ms']}ms" for i in report["imports"][:5])
+        logger.info(
+            f"Startup profile: ready at {report['events_ms'].get('ready')}ms, "
+            f"warm at {report['events_ms'].get('warmup_complete')}ms; slowest imports: {slowest}"
+        )
+
+
+# Module-level singleton profile
+_startup_profile: Optional[StartupProfile] = None
+
+
+def get_startup_profile() -> StartupProfile:
+    """
+    Get the singleton StartupProfile instance.
+
+    Returns:
+        StartupProfile instance
+    """
+    global _startup_profile
+    if _startup_profile is None:
+        _startup_profile = StartupProfile()
+    return _startup_profile
@@ -1,17 +1,40 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api import health, assets, summaries, actions, auth, pipelines, production, oee, downtime, safety, financial, live_pulse, memory, chat, asset_history, citations, agent, cache, voice, briefing, preferences, handoff, admin
+from app.api import health
+from app.core.config import get_settings
 from app.core.database import initialize_database, shutdown_database
+from app.core.rate_limit import RateLimitMiddleware
+from app.core.startup import (
+    LazyRouter,
+    LazyRouterLoader,
+    LazyRouterMiddleware,
+    get_startup_profile,
+    run_warmup,
+)
 from app.services.scheduler import get_scheduler
-from app.services.pipelines.live_pulse import run_live_pulse_poll
 
 logger = logging.getLogger(__name__)
 
 
+async def run_live_pulse_poll():
+    """Run the Live Pulse poll, importing the pipeline (supabase client) on first use."""
+    from app.services.pipelines.live_pulse import run_live_pulse_poll as poll
+
+    return await poll()
+
+
+async def run_briefing_pregeneration():
+    """Pre-generate morning briefings, importing the briefing services on first use."""
+    from app.services.briefing.store import pregenerate_briefings
+
+    return await pregenerate_briefings()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup and shutdown events."""
@@ -21,14 +44,32 @@ async def lifespan(app: FastAPI):
     # Startup: Initialize and start the polling scheduler
     scheduler = get_scheduler()
     scheduler.set_poll_job(run_live_pulse_poll)
+    settings = get_settings()
+    if settings.briefing_pregenerate_enabled:
+        scheduler.add_daily_job(
+            "briefing_pregeneration",
+            run_briefing_pregeneration,
+            settings.briefing_pregenerate_time,
+            settings.pipeline_timezone,
+            name="Morning Briefing Pre-generation",
+        )
     try:
         await scheduler.start()
         logger.info("Live Pulse polling scheduler started")
     except Exception as e:
         logger.warning(f"Failed to start polling scheduler: {e}")
 
+    # Startup: Warm routers, tools and the agent once traffic is being served
+    warmup_task = None
+    if settings.startup_warmup:
+        warmup_task = asyncio.create_task(run_warmup(router_loader, startup_profile))
+    startup_profile.mark("ready")
+
     yield
 
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+
     # Shutdown: Stop the polling scheduler
     try:
         await scheduler.shutdown(wait=True)
@@ -36,6 +77,22 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Error shutting down scheduler: {e}")
 
+    # Shutdown: Insert handoff Q&A entries still queued for write-behind
+    from app.services.handoff.qa_store import close_handoff_qa_store
+
+    try:
+        await close_handoff_qa_store()
+    except Exception as e:
+        logger.warning(f"Error flushing handoff Q&A entries: {e}")
+
+    # Shutdown: Stop background voice note transcription
+    from app.services.handoff.transcription import close_voice_note_transcription_queue
+
+    try:
+        await close_voice_note_transcription_queue()
+    except Exception as e:
+        logger.warning(f"Error stopping voice note transcription: {e}")
+
     # Shutdown: Clean up database connections
     shutdown_database()
 
@@ -47,6 +104,10 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Rate limiting (see app/core/rate_limit.py); added before CORS so 429
+# responses still carry CORS headers
+app.add_middleware(RateLimitMiddleware)
+
 # CORS configuration
 app.add_middleware(
     CORSMiddleware,
@@ -57,42 +118,55 @@ app.add_middleware(
 )
 
 # Include routers
+# Health is always eager; the rest are imported on first use or by the
+# background warm-up (see app/core/startup.py)
 app.include_router(health.router, tags=["Health"])
-app.include_router(assets.router, prefix="/api/assets", tags=["Assets"])
-app.include_router(summaries.router, prefix="/api/summaries", tags=["Summaries"])
-app.include_router(actions.router, prefix="/api/actions", tags=["Actions"])
-# Story 3.2: Add /api/v1/actions alias for versioned API endpoint (AC#1)
-app.include_router(actions.router, prefix="/api/v1/actions", tags=["Actions V1"])
-app.include_router(auth.router, prefix="/api/auth", tags=["Auth"])
-app.include_router(pipelines.router, prefix="/api/pipelines", tags=["Pipelines"])
-app.include_router(production.router, prefix="/api/production", tags=["Production"])
-app.include_router(oee.router, prefix="/api/oee", tags=["OEE"])
-app.include_router(downtime.router, prefix="/api/v1/downtime", tags=["Downtime"])
-app.include_router(safety.router, prefix="/api/safety", tags=["Safety"])
-app.include_router(financial.router, prefix="/api/financial", tags=["Financial"])
-app.include_router(live_pulse.router, prefix="/api/live-pulse", tags=["Live Pulse"])
-# Story 4.1: Memory API for Mem0 vector memory integration
-app.include_router(memory.router, prefix="/api/memory", tags=["Memory"])
-# Story 4.2: Chat API for Text-to-SQL natural language queries
-app.include_router(chat.router, prefix="/api/chat", tags=["Chat"])
-# Story 4.4: Asset History Memory API for historical context
-app.include_router(asset_history.router, prefix="/api/assets", tags=["Asset History"])
-# Story 4.5: Citations API for cited response generation
-app.include_router(citations.router, prefix="/api/citations", tags=["Citations"])
-# Story 5.1: Agent API for LangChain agent-based queries
-app.include_router(agent.router, prefix="/api/agent", tags=["Agent"])
-# Story 5.8: Cache API for tool response cache management
-app.include_router(cache.router, prefix="/api/cache", tags=["Cache"])
-# Story 8.1/8.2: Voice API for TTS and STT features
-app.include_router(voice.router, prefix="/api/v1/voice", tags=["Voice"])
-# Story 8.4: Briefing API for morning briefings
-app.include_router(briefing.router, prefix="/api/v1/briefing", tags=["Briefing"])
-# Story 8.8: User Preferences API for onboarding and settings
-app.include_router(preferences.router, prefix="/api/v1/preferences", tags=["Preferences"])
-# Story 9.1: Shift Handoff API for handoff creation and management
-app.include_router(handoff.router, prefix="/api/v1/handoff", tags=["Handoff"])
-# Story 9.13: Admin API for asset assignment management
-app.include_router(admin.router, prefix="/api/v1/admin", tags=["Admin"])
+
+ROUTERS = [
+    LazyRouter("app.api.assets", "/api/assets", ["Assets"]),
+    LazyRouter("app.api.summaries", "/api/summaries", ["Summaries"]),
+    LazyRouter("app.api.actions", "/api/actions", ["Actions"]),
+    # Story 3.2: Add /api/v1/actions alias for versioned API endpoint (AC#1)
+    LazyRouter("app.api.actions", "/api/v1/actions", ["Actions V1"]),
+    LazyRouter("app.api.auth", "/api/auth", ["Auth"]),
+    LazyRouter("app.api.pipelines", "/api/pipelines", ["Pipelines"]),
+    LazyRouter("app.api.production", "/api/production", ["Production"]),
+    LazyRouter("app.api.oee", "/api/oee", ["OEE"]),
+    LazyRouter("app.api.downtime", "/api/v1/downtime", ["Downtime"]),
+    LazyRouter("app.api.safety", "/api/safety", ["Safety"]),
+    LazyRouter("app.api.financial", "/api/financial", ["Financial"]),
+    LazyRouter("app.api.live_pulse", "/api/live-pulse", ["Live Pulse"]),
+    # Story 4.1: Memory API for Mem0 vector memory integration
+    LazyRouter("app.api.memory", "/api/memory", ["Memory"]),
+    # Story 4.2: Chat API for Text-to-SQL natural language queries
+    LazyRouter("app.api.chat", "/api/chat", ["Chat"]),
+    # Story 4.4: Asset History Memory API for historical context
+    LazyRouter("app.api.asset_history", "/api/assets", ["Asset History"]),
+    # Story 4.5: Citations API for cited response generation
+    LazyRouter("app.api.citations", "/api/citations", ["Citations"]),
+    # Story 5.1: Agent API for LangChain agent-based queries
+    LazyRouter("app.api.agent", "/api/agent", ["Agent"]),
+    # Story 5.8: Cache API for tool response cache management
+    LazyRouter("app.api.cache", "/api/cache", ["Cache"]),
+    # Story 8.1/8.2: Voice API for TTS and STT features
+    LazyRouter("app.api.voice", "/api/v1/voice", ["Voice"]),
+    # Story 8.4: Briefing API for morning briefings
+    LazyRouter("app.api.briefing", "/api/v1/briefing", ["Briefing"]),
+    # Story 8.8: User Preferences API for onboarding and settings
+    LazyRouter("app.api.preferences", "/api/v1/preferences", ["Preferences"]),
+    # Story 9.1: Shift Handoff API for handoff creation and management
+    LazyRouter("app.api.handoff", "/api/v1/handoff", ["Handoff"]),
+    # Story 9.13: Admin API for asset assignment management
+    LazyRouter("app.api.admin", "/api/v1/admin", ["Admin"]),
+]
+
+startup_profile = get_startup_profile()
+router_loader = LazyRouterLoader(app, ROUTERS, startup_profile)
+if get_settings().startup_lazy_routers:
+    app.add_middleware(LazyRouterMiddleware, loader=router_loader)
+else:
+    router_loader.load_all_sync()
+startup_profile.mark("app_created")
 
 
 @app.get("/")
@@ -377,10 +377,19 @@ class AgentChatRequest(BaseModel):
         None,
         description="Previous messages in the conversation"
     )
+    conversation_id: Optional[str] = Field(
+        None,
+        max_length=100,
+        description="Client conversation id; older turns are summarized and cached under it"
+    )
     force_refresh: bool = Field(
         default=False,
         description="Bypass cache and fetch fresh data (Story 5.8 AC#5)"
     )
+    include_trace: bool = Field(
+        default=False,
+        description="Return the turn's span tree (LLM, tool, cache, data source timings) in meta.trace"
+    )
 
 
 class AgentResponse(BaseModel):
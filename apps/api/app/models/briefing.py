@@ -125,6 +125,16 @@ class BriefingSection(BaseModel):
         return self.status in (BriefingSectionStatus.FAILED, BriefingSectionStatus.TIMED_OUT)
 
 
+class BriefingNarrativeStats(BaseModel):
+    """LLM usage for a briefing's area narratives."""
+    mode: str = Field(..., description="Narrative mode: batched, per_area or template")
+    llm_calls: int = Field(0, description="LLM calls made for area narratives")
+    prompt_tokens: int = Field(0, description="Prompt tokens across those calls")
+    completion_tokens: int = Field(0, description="Completion tokens across those calls")
+    latency_ms: float = Field(0.0, description="LLM latency (slowest call when parallel)")
+    llm_areas: int = Field(0, description="Areas narrated by the LLM; others use templates")
+
+
 class BriefingResponseMetadata(BaseModel):
     """
     Metadata for briefing response.
@@ -137,6 +147,10 @@ class BriefingResponseMetadata(BaseModel):
     timed_out: bool = Field(False, description="Whether generation timed out")
     tool_failures: List[str] = Field(default_factory=list, description="Names of failed tools")
     cache_hit: bool = Field(False, description="Whether served from cache")
+    data_fingerprint: Optional[str] = Field(None, description="Source data version the briefing was built from")
+    data_round_trips: Optional[int] = Field(None, description="Data source round trips made to generate the briefing")
+    llm_queue_wait_ms: Optional[float] = Field(None, description="Time LLM calls spent queued for admission")
+    narrative: Optional[BriefingNarrativeStats] = Field(None, description="Area narrative generation stats")
 
 
 class BriefingResponse(BaseModel):
@@ -292,6 +292,14 @@ class HandoffSynthesisMetadata(BaseModel):
         False,
         description="True if background still loading remaining sections"
     )
+    data_version: Optional[str] = Field(
+        None,
+        description="Source-table versions the synthesis reflects"
+    )
+    reused_sections: List[str] = Field(
+        default_factory=list,
+        description="Section types reused from the previous synthesis of this shift"
+    )
 
 
 class HandoffSynthesisResponse(BaseModel):
@@ -439,6 +447,15 @@ VOICE_NOTE_MAX_DURATION_SECONDS = 60
 VOICE_NOTE_MAX_COUNT = 5
 
 
+class VoiceNoteTranscriptionStatus(str, Enum):
+    """
+    Background transcription state of a voice note (AC#2).
+    """
+    PENDING = "pending"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 class VoiceNoteCreate(BaseModel):
     """
     Input schema for uploading a voice note (Story 9.3 Task 3.1).
@@ -480,6 +497,10 @@ class VoiceNote(BaseModel):
         None,
         description="ElevenLabs Scribe transcription"
     )
+    transcription_status: VoiceNoteTranscriptionStatus = Field(
+        VoiceNoteTranscriptionStatus.COMPLETED,
+        description="Transcription state; poll the note until it is no longer pending"
+    )
     duration_seconds: int = Field(..., description="Duration in seconds")
     sequence_order: int = Field(..., description="Order within the handoff")
     created_at: datetime = Field(..., description="When the note was created")
@@ -557,6 +578,7 @@ class VoiceNoteErrorCode(str, Enum):
     LIMIT_EXCEEDED = "limit_exceeded"
     DURATION_TOO_LONG = "duration_too_long"
     UPLOAD_FAILED = "upload_failed"
+    FILE_TOO_LARGE = "file_too_large"
     TRANSCRIPTION_FAILED = "transcription_failed"
     HANDOFF_NOT_FOUND = "handoff_not_found"
     NOT_AUTHORIZED = "not_authorized"
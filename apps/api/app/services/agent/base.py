@@ -16,14 +16,17 @@ AC#5: Structured Response with Citations
 - Response follows the ToolResult schema
 """
 
+import functools
 import json
 import logging
 from abc import abstractmethod
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from langchain.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from app.services.agent.tracing import get_current_span, span
 
 
 def _utcnow() -> datetime:
@@ -115,6 +118,9 @@ class ToolResult(BaseModel):
         description="Error message if success is False"
     )
 
+    # Compact scratchpad encoding and token counts, set by tool_output
+    _agent_encoding: Optional[Tuple[str, int, int]] = PrivateAttr(default=None)
+
     def to_agent_response(self) -> str:
         """
         Convert ToolResult to string for agent consumption.
@@ -142,6 +148,22 @@ class ToolResult(BaseModel):
         return data_str
 
 
+def _trace_tool_run(func):
+    """Wrap a tool's _arun in a "tool" span when a trace is active."""
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        if get_current_span() is None:
+            return await func(self, *args, **kwargs)
+        with span(f"tool.{self.name}", "tool", tool=self.name) as tool_span:
+            result = await func(self, *args, **kwargs)
+            if isinstance(result, ToolResult) and not result.success:
+                tool_span.set_error(result.error_message or "tool returned an error")
+            return result
+
+    return wrapper
+
+
 class ManufacturingTool(BaseTool):
     """
     Base class for all manufacturing agent tools.
@@ -188,6 +210,20 @@ class ManufacturingTool(BaseTool):
         description="If True, return tool output directly without LLM processing"
     )
 
+    output_token_budget: Optional[int] = Field(
+        default=None,
+        description="Token budget for this tool's output in the agent prompt "
+        "(default: agent_tool_output_token_budget)"
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Trace each tool execution; wraps outside @cached_tool so cache
+        # lookups appear as children of the tool span
+        arun = cls.__dict__.get("_arun")
+        if arun is not None and not getattr(arun, "__isabstractmethod__", False):
+            cls._arun = _trace_tool_run(arun)
+
     @abstractmethod
     async def _arun(self, **kwargs) -> ToolResult:
         """
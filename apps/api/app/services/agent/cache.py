@@ -11,19 +11,55 @@ AC#5: Force Refresh Bypass - force_refresh parameter skips cache lookup
 AC#6: Cache Decorator Pattern - @cached_tool decorator for easy integration
 AC#7: Cache Statistics - Track hits, misses, and invalidations
 AC#8: Memory-Efficient - TTLCache with configurable max size and LRU eviction
+
+Stale-While-Revalidate (optional, cache_swr_enabled):
+- Entries past their tier TTL but within the tier stale TTL are returned
+  immediately with metadata.cache_stale=True while a background task refreshes them
+- Frequently hit keys are refreshed ahead of expiry
+- Background refreshes are bounded by cache_refresh_max_workers
+
+Cache Scopes:
+- Tools declare how widely a result may be shared: global or user
+- Plant-wide results are keyed on "global" rather than the caller, so
+  every user shares them; user-scoped results stay per caller
+
+Tag-Indexed Invalidation:
+- Entries are tagged (tool, asset, area, table) and indexed per tier, so
+  invalidate_tags() touches only the tagged entries
+- Pipelines publish DataChangedEvent on commit; entries citing the changed
+  table are evicted as soon as fresh data lands
+
+Analytics (see cache_analytics.py):
+- Per-tool and per-tier hits, misses, coalesced calls, LRU/TTL evictions
+  and bytes stored, reported by get_stats(breakdown=True)
+- Concurrent identical calls on a miss share one execution
+- Each entry records how long the tool took to compute it; hits add that
+  to latency saved, and recomputations feed per-tool TTL recommendations
+
+Storage is pluggable (see cache_backend.py): in-process TTLCache by default,
+or a shared Redis store selected with cache_backend="redis".
 """
 
+import asyncio
 import contextvars
 import hashlib
 import json
 import logging
+import time
 from datetime import datetime, timezone
 from functools import wraps
-from typing import Any, Callable, Dict, Optional
-
-from cachetools import TTLCache
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 
 from app.core.config import get_settings
+from app.services.agent.cache_analytics import CacheAnalytics, fingerprint, tool_from_key
+from app.services.agent.cache_backend import (
+    CacheBackend,
+    CacheEntry,
+    CacheTier,
+    create_cache_backend,
+)
+from app.services.agent.tracing import span
+from app.services.event_bus import DataChangedEvent, get_event_bus
 
 logger = logging.getLogger(__name__)
 
@@ -46,11 +82,83 @@ def get_force_refresh() -> bool:
     return _force_refresh_context.get()
 
 
+# Cache scopes, from widest to narrowest sharing
+# - global: result depends only on tool params (plant-wide data)
+# - user: result is specific to the caller (e.g. uses their memories)
+# Agent tools do not filter by the caller's role or supervisor
+# assignments, so no scope between the two is needed; a tool that starts
+# filtering by visibility must key on it (or declare "user").
+CACHE_SCOPES = ("global", "user")
+
+
+_cache_user_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "cache_user_id", default=None
+)
+
+
+def set_cache_scope_context(user_id: Optional[str]) -> None:
+    """
+    Set the caller's user ID in the current context.
+
+    Args:
+        user_id: Caller's user ID (keys user-scoped results)
+    """
+    _cache_user_id.set(user_id)
+
+
+def resolve_scope_identity(scope: str, user_id: Optional[str] = None) -> str:
+    """
+    Resolve the identity segment of a cache key for a tool's scope.
+
+    Args:
+        scope: Tool cache scope (global, user)
+        user_id: Explicit user ID (takes precedence over context)
+
+    Returns:
+        "global", or the caller's user ID ("anonymous" if unknown)
+    """
+    if scope == "global":
+        return "global"
+    return user_id or _cache_user_id.get() or "anonymous"
+
+
 def _utcnow() -> datetime:
     """Get current UTC time in a timezone-aware manner."""
     return datetime.now(timezone.utc)
 
 
+def _param_tags(params: Dict[str, Any]) -> List[str]:
+    """Build area/asset tags from tool parameters."""
+    tags = []
+    for name in ("area", "area_filter"):
+        if params.get(name):
+            tags.append(f"area:{str(params[name]).lower()}")
+    if params.get("asset_id"):
+        tags.append(f"asset:{params['asset_id']}")
+    return tags
+
+
+def _derive_tags(key: str, value: Dict[str, Any], tags: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """
+    Build the tag set for an entry.
+
+    - tool:<name> from the key prefix
+    - table:<name> and asset:<id> from the result's citations
+    - any caller-supplied tags (e.g. area:<name> from tool params)
+    """
+    derived = {f"tool:{tool_from_key(key)}"}
+    derived.update(tags or ())
+    for citation in value.get("citations") or []:
+        if not isinstance(citation, dict):
+            continue
+        for table in str(citation.get("table") or "").split(","):
+            if table.strip():
+                derived.add(f"table:{table.strip()}")
+        if citation.get("asset_id"):
+            derived.add(f"asset:{citation['asset_id']}")
+    return tuple(sorted(derived))
+
+
 def _get_cache_tiers() -> Dict[str, int]:
     """
     Get cache tier TTLs from settings.
@@ -70,6 +178,22 @@ def _get_cache_tiers() -> Dict[str, int]:
     }
 
 
+def _get_stale_ttls() -> Dict[str, int]:
+    """
+    Get per-tier stale grace periods from settings.
+
+    An entry older than its tier TTL but younger than TTL + stale TTL
+    may be served while it is refreshed in the background.
+    """
+    settings = get_settings()
+    return {
+        "live": settings.cache_live_stale_ttl,
+        "daily": settings.cache_daily_stale_ttl,
+        "static": settings.cache_static_stale_ttl,
+        "none": 0,
+    }
+
+
 class ToolCacheService:
     """
     Service for caching tool responses with tiered TTLs.
@@ -78,41 +202,89 @@ class ToolCacheService:
     - Uses cachetools TTLCache for in-memory storage
     - Configurable max size (default: 1000 entries per tier)
     - LRU eviction when cache is full
+
+    When stale-while-revalidate is enabled, each tier retains entries for
+    TTL + stale TTL; freshness is decided per entry on lookup.
+
+    With a shared backend, invalidations are published to all workers and
+    each worker cancels background refreshes of the invalidated keys.
     """
 
-    def __init__(self, max_size: Optional[int] = None):
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        swr_enabled: Optional[bool] = None,
+        backend: Optional[CacheBackend] = None,
+    ):
         """
         Initialize the cache service.
 
         Args:
             max_size: Maximum entries per tier (default from settings)
+            swr_enabled: Enable stale-while-revalidate (default from settings)
+            backend: Storage backend (default from cache_backend setting)
         """
         settings = get_settings()
         self.max_size = max_size or settings.cache_max_size
         self.enabled = settings.cache_enabled
+        self.swr_enabled = (
+            settings.cache_swr_enabled if swr_enabled is None else swr_enabled
+        )
+        self.refresh_ahead_ratio = settings.cache_refresh_ahead_ratio
+        self.refresh_ahead_min_hits = settings.cache_refresh_ahead_min_hits
+        self.refresh_max_workers = max(1, settings.cache_refresh_max_workers)
 
         # Get tier TTLs
         self._tiers = _get_cache_tiers()
+        self._stale_ttls = _get_stale_ttls() if self.swr_enabled else {}
+
+        # Per-tool analytics (evictions are reported by the tiers)
+        self._analytics = CacheAnalytics()
 
-        # Create separate TTLCache instances for each tier
+        # Create separate storage for each tier
         # AC#2: Each tier has its own cache with appropriate TTL
-        self._caches: Dict[str, TTLCache] = {}
+        self._backend = backend or create_cache_backend()
+        self._caches: Dict[str, CacheTier] = {}
         for tier, ttl in self._tiers.items():
             if ttl > 0:
-                self._caches[tier] = TTLCache(maxsize=self.max_size, ttl=ttl)
+                hard_ttl = ttl + max(0, self._stale_ttls.get(tier, 0))
+                self._caches[tier] = self._backend.create_tier(
+                    tier,
+                    maxsize=self.max_size,
+                    ttl=hard_ttl,
+                    on_evict=lambda key, reason, tier=tier: (
+                        self._analytics.record_eviction(key, tier, reason)
+                    ),
+                )
+
+        # Background refreshes in flight, keyed by (tier, key)
+        self._refreshing: Dict[Tuple[str, str], asyncio.Task] = {}
+        # Tool executions in flight on a miss, keyed by (tier, key)
+        self._in_flight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._backend.subscribe_invalidations(self._on_remote_invalidation)
 
         # AC#7: Statistics tracking
-        self._stats = {
-            "hits": 0,
-            "misses": 0,
-            "invalidations": 0,
-        }
+        self._stats = self._empty_stats()
 
         logger.info(
             f"ToolCacheService initialized: enabled={self.enabled}, "
-            f"max_size={self.max_size}, tiers={list(self._caches.keys())}"
+            f"max_size={self.max_size}, tiers={list(self._caches.keys())}, "
+            f"swr_enabled={self.swr_enabled}, backend={self._backend.name}"
         )
 
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        """Build a zeroed statistics dict."""
+        return {
+            "hits": 0,
+            "misses": 0,
+            "invalidations": 0,
+            "stale_hits": 0,
+            "refreshes": 0,
+            "refresh_failures": 0,
+        }
+
     def generate_key(
         self,
         tool_name: str,
@@ -127,9 +299,12 @@ class ToolCacheService:
         - Different users have separate cache entries
         - Different parameter values create separate entries
 
+        The identity segment may be a scope identity from
+        resolve_scope_identity() instead of a user ID.
+
         Args:
             tool_name: Name of the tool
-            user_id: User identifier
+            user_id: User identifier or scope identity
             params: Tool parameters
 
         Returns:
@@ -168,27 +343,91 @@ class ToolCacheService:
         Returns:
             Cached value dict or None if not found
         """
+        value, _ = self.lookup(key, tier)
+        return value
+
+    def lookup(self, key: str, tier: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Get cached value along with whether it should be refreshed.
+
+        Without stale-while-revalidate this behaves like get() and never
+        requests a refresh. With it enabled:
+        - Entries past the tier TTL (within the stale grace period) are
+          returned with metadata.cache_stale=True and flagged for refresh
+        - Fresh entries hit at least cache_refresh_ahead_min_hits times and
+          older than cache_refresh_ahead_ratio * TTL are flagged for refresh
+
+        Args:
+            key: Cache key
+            tier: Cache tier (live, daily, static)
+
+        Returns:
+            Tuple of (cached value dict or None, needs_refresh)
+        """
         if not self.enabled or tier == "none":
-            return None
+            return None, False
 
         cache = self._caches.get(tier)
         if cache is None:
-            return None
+            return None, False
 
         try:
-            value = cache.get(key)
-            if value is not None:
-                self._stats["hits"] += 1
-                logger.debug(f"Cache HIT: {key} (tier: {tier})")
-                return value
+            entry = cache.lookup(key)
+            if entry is not None:
+                return self._resolve_entry(key, tier, entry)
         except Exception as e:
             logger.warning(f"Cache get error for key {key}: {e}")
 
         self._stats["misses"] += 1
+        self._analytics.record_miss(key, tier)
         logger.debug(f"Cache MISS: {key} (tier: {tier})")
-        return None
+        return None, False
+
+    def _resolve_entry(
+        self,
+        key: str,
+        tier: str,
+        entry: CacheEntry,
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Classify a stored entry as fresh, hot or stale and record the hit."""
+        self._stats["hits"] += 1
+
+        if not self.swr_enabled:
+            self._analytics.record_hit(key, tier, entry.compute_ms)
+            logger.debug(f"Cache HIT: {key} (tier: {tier})")
+            return entry.value, False
+
+        ttl = self._tiers[tier]
+        age = time.time() - entry.stored_at
+        stale = age >= ttl
+        self._analytics.record_hit(key, tier, entry.compute_ms, stale=stale)
+
+        if stale:
+            self._stats["stale_hits"] += 1
+            logger.debug(f"Cache STALE HIT: {key} (tier: {tier}, age: {age:.1f}s)")
+            stale_value = dict(entry.value)
+            stale_value["metadata"] = dict(stale_value.get("metadata", {}))
+            stale_value["metadata"]["cache_stale"] = True
+            stale_value["metadata"]["cache_age_seconds"] = round(age, 1)
+            return stale_value, True
+
+        refresh_ahead = (
+            entry.hits >= self.refresh_ahead_min_hits
+            and age >= ttl * self.refresh_ahead_ratio
+        )
+        logger.debug(
+            f"Cache HIT: {key} (tier: {tier}, refresh_ahead: {refresh_ahead})"
+        )
+        return entry.value, refresh_ahead
 
-    def set(self, key: str, tier: str, value: Dict[str, Any]) -> None:
+    def set(
+        self,
+        key: str,
+        tier: str,
+        value: Dict[str, Any],
+        tags: Optional[Iterable[str]] = None,
+        compute_ms: Optional[float] = None,
+    ) -> None:
         """
         Store value in cache.
 
@@ -198,6 +437,10 @@ class ToolCacheService:
             key: Cache key
             tier: Cache tier
             value: Value to cache (dict)
+            tags: Extra tags to index the entry under (tool, table and
+                asset tags are derived automatically)
+            compute_ms: How long the tool took to produce the value; each
+                hit on the entry counts it as latency saved
         """
         if not self.enabled or tier == "none":
             return
@@ -215,11 +458,160 @@ class ToolCacheService:
             cached_value["metadata"]["cache_tier"] = tier
             cached_value["metadata"]["cache_key"] = key
 
-            cache[key] = cached_value
+            cache[key] = CacheEntry(
+                value=cached_value,
+                tags=_derive_tags(key, cached_value, tags),
+                compute_ms=compute_ms or 0.0,
+                size_bytes=len(json.dumps(cached_value, default=str)),
+            )
+            self._analytics.record_store(
+                key, tier, fingerprint(value.get("data")), compute_ms
+            )
             logger.debug(f"Cache SET: {key} (tier: {tier})")
         except Exception as e:
             logger.warning(f"Cache set error for key {key}: {e}")
 
+    async def _offload(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a cache operation for an async caller.
+
+        A shared backend answers over the network with a blocking client,
+        so its operations run in a worker thread to keep the event loop free.
+        """
+        if self._backend.shared:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    async def alookup(self, key: str, tier: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """lookup() for async callers; runs in a worker thread on a shared backend."""
+        return await self._offload(self.lookup, key, tier)
+
+    async def aset(
+        self,
+        key: str,
+        tier: str,
+        value: Dict[str, Any],
+        tags: Optional[Iterable[str]] = None,
+        compute_ms: Optional[float] = None,
+    ) -> None:
+        """set() for async callers; runs in a worker thread on a shared backend."""
+        await self._offload(self.set, key, tier, value, tags, compute_ms)
+
+    def schedule_refresh(
+        self,
+        key: str,
+        tier: str,
+        refresh: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+        tags: Optional[Iterable[str]] = None,
+    ) -> bool:
+        """
+        Refresh a cache entry in the background.
+
+        At most one refresh runs per key, and at most
+        cache_refresh_max_workers run at once; requests beyond that are
+        dropped (a later lookup will ask again).
+
+        Args:
+            key: Cache key to refresh
+            tier: Cache tier of the entry
+            refresh: Coroutine factory returning the new value, or None
+                to keep the current entry
+            tags: Extra tags for the refreshed entry
+
+        Returns:
+            True if a refresh task was started
+        """
+        if not self.swr_enabled:
+            return False
+
+        task_key = (tier, key)
+        if task_key in self._refreshing:
+            return False
+        if len(self._refreshing) >= self.refresh_max_workers:
+            logger.debug(f"Cache refresh pool full, skipping {key}")
+            return False
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+        self._loop = loop
+        task = loop.create_task(self._run_refresh(key, tier, refresh, tags))
+        self._refreshing[task_key] = task
+        task.add_done_callback(lambda t: self._refresh_done(task_key, t))
+        return True
+
+    def _refresh_done(self, task_key: Tuple[str, str], task: asyncio.Task) -> None:
+        """Forget a finished refresh unless a newer one replaced it."""
+        if self._refreshing.get(task_key) is task:
+            del self._refreshing[task_key]
+
+    async def _run_refresh(
+        self,
+        key: str,
+        tier: str,
+        refresh: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+        tags: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Run a background refresh and store its result."""
+        start = time.perf_counter()
+        try:
+            value = await refresh()
+        except Exception as e:
+            self._stats["refresh_failures"] += 1
+            logger.warning(f"Background cache refresh failed for {key}: {e}")
+            return
+
+        if value is None:
+            self._stats["refresh_failures"] += 1
+            return
+
+        compute_ms = (time.perf_counter() - start) * 1000
+        await self.aset(key, tier, value, tags=tags, compute_ms=compute_ms)
+        self._stats["refreshes"] += 1
+        logger.debug(f"Cache REFRESHED: {key} (tier: {tier})")
+
+    def in_flight(self, key: str, tier: str) -> Optional[asyncio.Future]:
+        """
+        Get the pending execution for a key, if one is running.
+
+        The future resolves to the result dict, or None if the execution
+        failed (callers then execute the tool themselves).
+        """
+        return self._in_flight.get((tier, key))
+
+    def begin_flight(self, key: str, tier: str) -> bool:
+        """
+        Register an execution for a key so concurrent misses can join it.
+
+        Returns:
+            True if registered; end_flight() must then be called
+        """
+        if not self.enabled or tier not in self._caches:
+            return False
+        flight_key = (tier, key)
+        if flight_key in self._in_flight:
+            return False
+        self._in_flight[flight_key] = asyncio.get_running_loop().create_future()
+        return True
+
+    def end_flight(self, key: str, tier: str, value: Optional[Dict[str, Any]]) -> None:
+        """Resolve a registered execution for any callers waiting on it."""
+        future = self._in_flight.pop((tier, key), None)
+        if future is not None and not future.done():
+            future.set_result(value)
+
+    def record_coalesced(self, key: str, tier: str) -> None:
+        """Record a call served by joining an identical in-flight execution."""
+        self._analytics.record_coalesced(key, tier)
+
+    async def wait_for_refreshes(self) -> None:
+        """Wait for all in-flight background refreshes to finish."""
+        tasks = list(self._refreshing.values())
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     def invalidate(
         self,
         pattern: Optional[str] = None,
@@ -232,7 +624,7 @@ class ToolCacheService:
         AC#4: Cache Invalidation on Events
         - Support invalidation by tier (clears entire tier)
         - Support invalidation by pattern (wildcard matching)
-        - Support invalidation by tool name
+        - Support invalidation by tool name (via the tag index)
         - Logs all invalidation events
 
         Args:
@@ -250,28 +642,19 @@ class ToolCacheService:
             count = len(self._caches[tier])
             self._caches[tier].clear()
             invalidated = count
+            self._notify_invalidation(tier, None)
             logger.info(f"Cache tier '{tier}' cleared: {count} entries")
 
         elif tool_name:
             # Clear entries for a specific tool
-            for cache in self._caches.values():
-                keys_to_delete = [
-                    k for k in list(cache.keys())
-                    if k.startswith(f"{tool_name}:")
-                ]
-                for key in keys_to_delete:
-                    try:
-                        del cache[key]
-                        invalidated += 1
-                    except KeyError:
-                        pass  # Already evicted
+            invalidated = self._invalidate_tagged([f"tool:{tool_name}"])
             logger.info(f"Cache entries for tool '{tool_name}' cleared: {invalidated}")
 
         elif pattern:
             # Clear entries matching pattern
             # Convert wildcard pattern to prefix match
             match_prefix = pattern.replace("*", "")
-            for cache in self._caches.values():
+            for cache_tier, cache in self._caches.items():
                 keys_to_delete = [
                     k for k in list(cache.keys())
                     if match_prefix in k
@@ -282,11 +665,81 @@ class ToolCacheService:
                         invalidated += 1
                     except KeyError:
                         pass
+                self._notify_invalidation(cache_tier, keys_to_delete)
             logger.info(f"Cache entries matching '{pattern}' cleared: {invalidated}")
 
         self._stats["invalidations"] += invalidated
         return invalidated
 
+    async def ainvalidate(
+        self,
+        pattern: Optional[str] = None,
+        tier: Optional[str] = None,
+        tool_name: Optional[str] = None,
+    ) -> int:
+        """invalidate() for async callers; runs in a worker thread on a shared backend."""
+        return await self._offload(self.invalidate, pattern, tier, tool_name)
+
+    def invalidate_tags(
+        self,
+        tags: Iterable[str],
+        tier: Optional[str] = None,
+    ) -> int:
+        """
+        Invalidate entries carrying any of the given tags.
+
+        Uses the per-tier tag index, so cost is proportional to the number
+        of tagged entries rather than the cache size.
+
+        Args:
+            tags: Tags such as "tool:oee_query", "table:daily_summaries",
+                "asset:<id>" or "area:grinding"
+            tier: Restrict invalidation to one tier
+
+        Returns:
+            Number of entries invalidated
+        """
+        tags = list(tags)
+        invalidated = self._invalidate_tagged(tags, tier)
+        self._stats["invalidations"] += invalidated
+        logger.info(f"Cache entries tagged {tags} cleared: {invalidated}")
+        return invalidated
+
+    async def ainvalidate_tags(self, tags: Iterable[str], tier: Optional[str] = None) -> int:
+        """invalidate_tags() for async callers; runs in a worker thread on a shared backend."""
+        return await self._offload(self.invalidate_tags, list(tags), tier)
+
+    def _invalidate_tagged(self, tags: List[str], tier: Optional[str] = None) -> int:
+        """Delete entries carrying any of the tags; does not update stats."""
+        invalidated = 0
+        for cache_tier, cache in self._caches.items():
+            if tier and cache_tier != tier:
+                continue
+            deleted = cache.delete_tagged(tags)
+            invalidated += len(deleted)
+            self._notify_invalidation(cache_tier, deleted)
+        return invalidated
+
+    def on_data_changed(self, event: DataChangedEvent) -> int:
+        """
+        Evict entries built from a table that just received fresh data.
+
+        Args:
+            event: Change published by a pipeline after commit
+
+        Returns:
+            Number of entries invalidated
+        """
+        count = self.invalidate_tags([f"table:{event.table}"])
+        logger.info(
+            f"Cache evicted {count} entries after {event.source} updated {event.table}"
+        )
+        return count
+
+    async def aon_data_changed(self, event: DataChangedEvent) -> int:
+        """on_data_changed() for the event bus; runs in a worker thread on a shared backend."""
+        return await self._offload(self.on_data_changed, event)
+
     def invalidate_all(self) -> int:
         """
         Clear all cache entries.
@@ -299,13 +752,69 @@ class ToolCacheService:
             count = len(cache)
             cache.clear()
             invalidated += count
+            self._notify_invalidation(tier, None)
             logger.debug(f"Cache tier '{tier}' cleared: {count} entries")
 
         self._stats["invalidations"] += invalidated
         logger.info(f"All caches cleared: {invalidated} total entries")
         return invalidated
 
-    def get_stats(self) -> Dict[str, Any]:
+    async def ainvalidate_all(self) -> int:
+        """invalidate_all() for async callers; runs in a worker thread on a shared backend."""
+        return await self._offload(self.invalidate_all)
+
+    def _notify_invalidation(self, tier: str, keys: Optional[List[str]]) -> None:
+        """Cancel local refreshes of invalidated keys and tell other workers."""
+        if keys is not None and not keys:
+            return
+        loop = self._loop
+        try:
+            asyncio.get_running_loop()
+            on_loop = True
+        except RuntimeError:
+            on_loop = False
+        if not on_loop and loop is not None and loop.is_running():
+            # Invalidating from a worker thread (see _offload)
+            loop.call_soon_threadsafe(self._cancel_refreshes, tier, keys)
+        else:
+            self._cancel_refreshes(tier, keys)
+        self._backend.publish_invalidation(tier, keys)
+
+    def _cancel_refreshes(self, tier: str, keys: Optional[List[str]]) -> None:
+        """
+        Cancel background refreshes so they cannot re-populate invalidated keys.
+
+        Args:
+            tier: Tier that was invalidated
+            keys: Invalidated keys, or None for the whole tier
+        """
+        for task_tier, task_key in list(self._refreshing):
+            if task_tier == tier and (keys is None or task_key in keys):
+                task = self._refreshing.pop((task_tier, task_key), None)
+                if task is not None:
+                    task.cancel()
+
+    def _on_remote_invalidation(self, tier: str, keys: Optional[List[str]]) -> None:
+        """
+        Handle an invalidation published by another worker.
+
+        Called from the backend's listener thread, so the cancellation is
+        handed to the event loop that owns the refresh tasks.
+        """
+        logger.debug(f"Remote cache invalidation: tier={tier}, keys={keys}")
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(self._cancel_refreshes, tier, keys)
+
+    def close(self) -> None:
+        """Cancel background refreshes and release backend resources."""
+        for task in self._refreshing.values():
+            task.cancel()
+        self._refreshing.clear()
+        self._backend.close()
+
+    def get_stats(self, breakdown: bool = False) -> Dict[str, Any]:
         """
         Get cache statistics.
 
@@ -315,6 +824,10 @@ class ToolCacheService:
         - Hit rate percentage
         - Entries by tier
 
+        Args:
+            breakdown: Include per-tool and per-tier analytics (reads the
+                size of every stored entry)
+
         Returns:
             Dict with cache statistics
         """
@@ -326,7 +839,7 @@ class ToolCacheService:
         total_requests = self._stats["hits"] + self._stats["misses"]
         hit_rate = (self._stats["hits"] / total_requests * 100) if total_requests > 0 else 0.0
 
-        return {
+        stats = {
             "enabled": self.enabled,
             "max_size_per_tier": self.max_size,
             "total_entries": sum(entries_by_tier.values()),
@@ -336,15 +849,32 @@ class ToolCacheService:
             "misses": self._stats["misses"],
             "hit_rate_percent": round(hit_rate, 2),
             "invalidations": self._stats["invalidations"],
+            "swr_enabled": self.swr_enabled,
+            "stale_ttls": {k: v for k, v in self._stale_ttls.items() if k in self._caches},
+            "stale_hits": self._stats["stale_hits"],
+            "refreshes": self._stats["refreshes"],
+            "refresh_failures": self._stats["refresh_failures"],
+            "refreshes_in_flight": len(self._refreshing),
+            "backend": self._backend.name,
+            **self._analytics.totals(),
         }
+        if breakdown:
+            stats.update(self._analytics.breakdown(stats["tier_ttls"], self._storage_usage()))
+        return stats
+
+    def _storage_usage(self) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """Count stored entries and bytes per (tool, tier)."""
+        usage: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        for tier, cache in self._caches.items():
+            for key, size in cache.entry_sizes().items():
+                entries, total = usage.get((tool_from_key(key), tier), (0, 0))
+                usage[(tool_from_key(key), tier)] = (entries + 1, total + size)
+        return usage
 
     def reset_stats(self) -> None:
         """Reset statistics counters (primarily for testing)."""
-        self._stats = {
-            "hits": 0,
-            "misses": 0,
-            "invalidations": 0,
-        }
+        self._stats = self._empty_stats()
+        self._analytics.reset()
 
 
 # Module-level singleton instance
@@ -361,9 +891,16 @@ def get_tool_cache() -> ToolCacheService:
     global _tool_cache
     if _tool_cache is None:
         _tool_cache = ToolCacheService()
+        get_event_bus().subscribe("*", _evict_on_data_change)
     return _tool_cache
 
 
+async def _evict_on_data_change(event: DataChangedEvent) -> None:
+    """Event bus handler forwarding data changes to the active cache."""
+    if _tool_cache is not None:
+        await _tool_cache.aon_data_changed(event)
+
+
 def reset_tool_cache() -> None:
     """
     Reset the singleton cache instance.
@@ -371,10 +908,12 @@ def reset_tool_cache() -> None:
     Primarily used for testing.
     """
     global _tool_cache
+    if _tool_cache is not None:
+        _tool_cache.close()
     _tool_cache = None
 
 
-def cached_tool(tier: str = "daily"):
+def cached_tool(tier: str = "daily", scope: str = "user"):
     """
     Decorator for caching tool responses.
 
@@ -383,18 +922,31 @@ def cached_tool(tier: str = "daily"):
     - Stores result in cache after execution
     - Adds cached_at timestamp to metadata
     - Supports force_refresh bypass
+    - Coalesces concurrent identical calls into one execution
+    - Serves stale entries and refreshes them in the background when
+      stale-while-revalidate is enabled
 
     Usage:
-        @cached_tool(tier="daily")
+        @cached_tool(tier="daily", scope="global")
         async def _arun(self, **kwargs) -> ToolResult:
             ...
 
     Args:
         tier: Cache tier - "live" (60s), "daily" (15min), "static" (1hr), "none"
+        scope: Who may share a result - "global" or "user"
+            (default "user", the narrowest)
 
     Returns:
         Decorated function
+
+    Raises:
+        ValueError: If scope is not one of CACHE_SCOPES
     """
+    if scope not in CACHE_SCOPES:
+        raise ValueError(
+            f"Invalid cache scope '{scope}'. Must be one of: {', '.join(CACHE_SCOPES)}"
+        )
+
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(self, *args, **kwargs):
@@ -408,33 +960,72 @@ def cached_tool(tier: str = "daily"):
             force_refresh = kwargs.pop("force_refresh", False) or get_force_refresh()
 
             # Generate cache key
-            # AC#3: Key includes tool_name, user_id, and hashed params
+            # AC#3: Key includes tool_name, scope identity, and hashed params
             tool_name = getattr(self, "name", func.__name__)
-            user_id = kwargs.get("user_id", "anonymous")
-            cache_key = cache.generate_key(tool_name, user_id, kwargs)
+            identity = resolve_scope_identity(scope, user_id=kwargs.get("user_id"))
+            cache_key = cache.generate_key(tool_name, identity, kwargs)
 
             # Check cache (unless force_refresh)
             if not force_refresh:
-                cached = cache.get(cache_key, tier)
+                with span("cache.lookup", "cache", tier=tier, scope=scope) as lookup_span:
+                    cached, needs_refresh = await cache.alookup(cache_key, tier)
+                    lookup_span.set_attribute("hit", cached is not None)
+                    if cached is not None:
+                        lookup_span.set_attribute(
+                            "stale", bool(cached.get("metadata", {}).get("cache_stale"))
+                        )
                 if cached is not None:
                     # AC#1: Return cached result with cached_at timestamp
                     logger.debug(f"Returning cached result for {tool_name}")
 
+                    if needs_refresh:
+                        async def _refresh() -> Optional[Dict[str, Any]]:
+                            fresh = await func(self, *args, **kwargs)
+                            # Keep serving the old entry rather than caching an error
+                            return fresh.model_dump() if fresh.success else None
+
+                        cache.schedule_refresh(
+                            cache_key, tier, _refresh, tags=_param_tags(kwargs)
+                        )
+
                     # Reconstruct ToolResult from cached dict
                     # The cached_at is already in metadata from cache.set()
                     return ToolResult(**cached)
 
-            # Execute tool
-            result = await func(self, *args, **kwargs)
+            # Join an identical execution already in flight
+            pending = cache.in_flight(cache_key, tier)
+            if pending is not None:
+                with span("cache.coalesce", "cache", tier=tier) as coalesce_span:
+                    shared = await asyncio.shield(pending)
+                    coalesce_span.set_attribute("shared", shared is not None)
+                if shared is not None:
+                    cache.record_coalesced(cache_key, tier)
+                    return ToolResult(**shared)
 
-            # Store in cache
-            # AC#1: The cache.set() adds cached_at timestamp
-            cache.set(cache_key, tier, result.model_dump())
+            # Execute tool
+            leader = cache.begin_flight(cache_key, tier)
+            value = None
+            try:
+                start = time.perf_counter()
+                result = await func(self, *args, **kwargs)
+                compute_ms = (time.perf_counter() - start) * 1000
+                value = result.model_dump()
+
+                # Store in cache
+                # AC#1: The cache.set() adds cached_at timestamp
+                await cache.aset(
+                    cache_key, tier, value,
+                    tags=_param_tags(kwargs), compute_ms=compute_ms,
+                )
+            finally:
+                if leader:
+                    cache.end_flight(cache_key, tier, value)
 
             return result
 
-        # Store tier info on the wrapper for introspection
+        # Store tier and scope info on the wrapper for introspection
         wrapper._cache_tier = tier
+        wrapper._cache_scope = scope
         return wrapper
 
     return decorator
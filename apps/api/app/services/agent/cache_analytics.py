@@ -0,0 +1,295 @@
+"""
+Tool Cache Analytics
+
+Per-tool and per-tier accounting for ToolCacheService:
+- Hits, misses, stale hits, coalesced calls, LRU and TTL evictions
+- Rolling histogram of the original execution time of cached results,
+  used to estimate latency saved by hits
+- Observed data change rate per tool, from comparing each recomputed
+  result with the previous one for the same key, and a TTL recommendation
+
+Counters are per worker process.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# Upper bounds (ms) of the execution time histogram buckets
+EXECUTION_TIME_BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Recent execution times kept per tool for the rolling histogram
+_EXECUTION_SAMPLES = 500
+
+# Keys whose last result fingerprint is remembered for change detection
+_FINGERPRINT_KEYS = 5000
+
+# Recomputations of a key needed before recommending a TTL
+_MIN_CHANGE_SAMPLES = 5
+
+# Bounds for recommended TTLs (seconds)
+_MIN_RECOMMENDED_TTL = 30
+_MAX_RECOMMENDED_TTL = 24 * 3600
+
+
+def tool_from_key(key: str) -> str:
+    """Extract the tool name from a {tool_name}:{identity}:{hash} key."""
+    return key.split(":", 1)[0]
+
+
+def fingerprint(data: Any) -> str:
+    """Stable hash of a tool result's data, for change detection."""
+    payload = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.md5(payload.encode()).hexdigest()
+
+
+@dataclass
+class _Counters:
+    hits: int = 0
+    misses: int = 0
+    stale_hits: int = 0
+    coalesced: int = 0
+    evictions_lru: int = 0
+    evictions_ttl: int = 0
+    latency_saved_ms: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate_percent": round(self.hits / total * 100, 2) if total else 0.0,
+            "stale_hits": self.stale_hits,
+            "coalesced": self.coalesced,
+            "evictions_lru": self.evictions_lru,
+            "evictions_ttl": self.evictions_ttl,
+            "latency_saved_ms": round(self.latency_saved_ms, 1),
+        }
+
+
+@dataclass
+class _ChangeStats:
+    observations: int = 0
+    changes: int = 0
+    observed_seconds: float = 0.0
+
+
+@dataclass
+class _ToolStats:
+    counters: _Counters = field(default_factory=_Counters)
+    execution_ms: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=_EXECUTION_SAMPLES)
+    )
+    changes: _ChangeStats = field(default_factory=_ChangeStats)
+    tier: Optional[str] = None
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _histogram(values: List[float]) -> Dict[str, int]:
+    buckets = {f"<={bound}ms": 0 for bound in EXECUTION_TIME_BUCKETS_MS}
+    buckets[f">{EXECUTION_TIME_BUCKETS_MS[-1]}ms"] = 0
+    for value in values:
+        for bound in EXECUTION_TIME_BUCKETS_MS:
+            if value <= bound:
+                buckets[f"<={bound}ms"] += 1
+                break
+        else:
+            buckets[f">{EXECUTION_TIME_BUCKETS_MS[-1]}ms"] += 1
+    return buckets
+
+
+def recommend_ttl(
+    changes: _ChangeStats,
+    current_ttl: Optional[int],
+) -> Tuple[Optional[int], str]:
+    """
+    Recommend a TTL from the observed change rate.
+
+    Each recomputation of a key is compared with the previous result for
+    that key. The mean interval between observed changes estimates how
+    long a cached result stays correct; the recommendation is half of it,
+    bounding expected staleness to about half a change interval.
+
+    Args:
+        changes: Change observations for a tool
+        current_ttl: TTL of the tool's tier in seconds
+
+    Returns:
+        Tuple of (recommended TTL seconds or None, reason)
+    """
+    if changes.observations < _MIN_CHANGE_SAMPLES:
+        return None, "insufficient data"
+
+    if changes.changes == 0:
+        # Data never changed across observed recomputations
+        floor = current_ttl or _MIN_RECOMMENDED_TTL
+        recommended = min(_MAX_RECOMMENDED_TTL, max(floor * 2, int(changes.observed_seconds)))
+        return recommended, "no changes observed; longer TTL is safe"
+
+    change_interval = changes.observed_seconds / changes.changes
+    recommended = int(max(_MIN_RECOMMENDED_TTL, min(_MAX_RECOMMENDED_TTL, change_interval / 2)))
+    if changes.changes == changes.observations:
+        return min(recommended, current_ttl or recommended), (
+            "data changed on every recomputation; change rate may be underestimated"
+        )
+    return recommended, f"data changes about every {int(change_interval)}s"
+
+
+class CacheAnalytics:
+    """Collects per-tool and per-tier cache analytics."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all counters and observations."""
+        self._tools: Dict[str, _ToolStats] = {}
+        self._tiers: Dict[str, _Counters] = {}
+        self._fingerprints: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+    def _tool(self, tool: str, tier: str) -> _ToolStats:
+        stats = self._tools.get(tool)
+        if stats is None:
+            stats = self._tools[tool] = _ToolStats()
+        stats.tier = tier
+        return stats
+
+    def _counters(self, key: str, tier: str) -> Tuple[_Counters, _Counters]:
+        tier_counters = self._tiers.setdefault(tier, _Counters())
+        return self._tool(tool_from_key(key), tier).counters, tier_counters
+
+    def record_hit(self, key: str, tier: str, compute_ms: float, stale: bool = False) -> None:
+        """Record a hit; the entry's original execution time counts as latency saved."""
+        for counters in self._counters(key, tier):
+            counters.hits += 1
+            counters.latency_saved_ms += compute_ms
+            if stale:
+                counters.stale_hits += 1
+
+    def record_miss(self, key: str, tier: str) -> None:
+        for counters in self._counters(key, tier):
+            counters.misses += 1
+
+    def record_coalesced(self, key: str, tier: str) -> None:
+        """Record a call that waited on an identical in-flight execution."""
+        for counters in self._counters(key, tier):
+            counters.coalesced += 1
+
+    def record_eviction(self, key: str, tier: str, reason: str) -> None:
+        """Record an eviction; reason is "lru" or "ttl"."""
+        for counters in self._counters(key, tier):
+            if reason == "lru":
+                counters.evictions_lru += 1
+            elif reason == "ttl":
+                counters.evictions_ttl += 1
+
+    def record_store(
+        self,
+        key: str,
+        tier: str,
+        data_fingerprint: str,
+        compute_ms: Optional[float] = None,
+    ) -> None:
+        """
+        Record a freshly computed result being cached.
+
+        Args:
+            key: Cache key
+            tier: Cache tier
+            data_fingerprint: fingerprint() of the result data
+            compute_ms: Tool execution time, if measured
+        """
+        stats = self._tool(tool_from_key(key), tier)
+        if compute_ms is not None:
+            stats.execution_ms.append(compute_ms)
+
+        now = time.time()
+        previous = self._fingerprints.pop(key, None)
+        if previous is not None:
+            previous_fingerprint, previous_at = previous
+            stats.changes.observations += 1
+            stats.changes.observed_seconds += now - previous_at
+            if previous_fingerprint != data_fingerprint:
+                stats.changes.changes += 1
+        self._fingerprints[key] = (data_fingerprint, now)
+        while len(self._fingerprints) > _FINGERPRINT_KEYS:
+            self._fingerprints.popitem(last=False)
+
+    def totals(self) -> Dict[str, Any]:
+        """Totals across tiers for the summary stats."""
+        totals = _Counters()
+        for counters in self._tiers.values():
+            totals.coalesced += counters.coalesced
+            totals.evictions_lru += counters.evictions_lru
+            totals.evictions_ttl += counters.evictions_ttl
+            totals.latency_saved_ms += counters.latency_saved_ms
+        return {
+            "coalesced": totals.coalesced,
+            "evictions_lru": totals.evictions_lru,
+            "evictions_ttl": totals.evictions_ttl,
+            "latency_saved_ms": round(totals.latency_saved_ms, 1),
+        }
+
+    def breakdown(
+        self,
+        tier_ttls: Dict[str, int],
+        storage: Dict[Tuple[str, str], Tuple[int, int]],
+    ) -> Dict[str, Any]:
+        """
+        Build the per-tool and per-tier breakdown.
+
+        Args:
+            tier_ttls: TTL in seconds per tier
+            storage: (tool, tier) -> (entries, bytes) currently stored
+
+        Returns:
+            Dict with "by_tool" and "by_tier"
+        """
+        by_tool: Dict[str, Any] = {}
+        tools = set(self._tools) | {tool for tool, _ in storage}
+        for tool in sorted(tools):
+            stats = self._tools.get(tool) or _ToolStats()
+            entries = sum(e for (t, _), (e, _b) in storage.items() if t == tool)
+            size = sum(b for (t, _), (_e, b) in storage.items() if t == tool)
+            samples = sorted(stats.execution_ms)
+            current_ttl = tier_ttls.get(stats.tier) if stats.tier else None
+            recommended, reason = recommend_ttl(stats.changes, current_ttl)
+
+            by_tool[tool] = {
+                **stats.counters.as_dict(),
+                "tier": stats.tier,
+                "entries": entries,
+                "bytes_stored": size,
+                "execution_time_ms": {
+                    "samples": len(samples),
+                    "p50": round(_percentile(samples, 50), 1) if samples else None,
+                    "p95": round(_percentile(samples, 95), 1) if samples else None,
+                    "histogram": _histogram(samples),
+                },
+                "data_changes": {
+                    "observations": stats.changes.observations,
+                    "changes": stats.changes.changes,
+                    "observed_seconds": round(stats.changes.observed_seconds, 1),
+                },
+                "current_ttl_seconds": current_ttl,
+                "recommended_ttl_seconds": recommended,
+                "recommendation_reason": reason,
+            }
+
+        by_tier: Dict[str, Any] = {}
+        for tier in sorted(set(self._tiers) | {tier for _, tier in storage}):
+            counters = self._tiers.get(tier) or _Counters()
+            by_tier[tier] = {
+                **counters.as_dict(),
+                "entries": sum(e for (_, t), (e, _b) in storage.items() if t == tier),
+                "bytes_stored": sum(b for (_, t), (_e, b) in storage.items() if t == tier),
+            }
+
+        return {"by_tool": by_tool, "by_tier": by_tier}
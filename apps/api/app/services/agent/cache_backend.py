@@ -0,0 +1,573 @@
+"""
+Tool Cache Storage Backends
+
+Pluggable storage for ToolCacheService tiers.
+
+- InMemoryCacheBackend: per-process cachetools TTLCache (default)
+- RedisCacheBackend: shared store so every uvicorn worker sees the same
+  entries, with invalidations published to all workers over pub/sub
+
+Each backend creates one CacheTier per cache tier. A CacheTier is a
+mutable mapping of cache key -> CacheEntry plus a lookup() method that
+records a hit and a secondary tag -> keys index maintained on write.
+Tiers report LRU and TTL evictions to an optional on_evict callback.
+Selected via the CACHE_BACKEND setting ("memory" or "redis").
+"""
+
+import json
+import logging
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from cachetools import TTLCache
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """Cached value plus the bookkeeping needed for soft-TTL decisions."""
+
+    value: Dict[str, Any]
+    stored_at: float = field(default_factory=time.time)
+    hits: int = 0
+    tags: Tuple[str, ...] = ()
+    compute_ms: float = 0.0
+    size_bytes: int = 0
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize datetimes as ISO strings and anything else via str()."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    return str(obj)
+
+
+# Invalidation message: {"origin": str, "tier": str, "keys": [str] | None}
+InvalidationHandler = Callable[[str, Optional[List[str]]], None]
+
+# Eviction callback: (key, reason) with reason "lru" or "ttl"
+EvictionHandler = Callable[[str, str], None]
+
+
+class CacheTier(MutableMapping, ABC):
+    """Storage for a single cache tier."""
+
+    ttl: int
+    on_evict: Optional[EvictionHandler] = None
+
+    @abstractmethod
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """Get an entry and record a hit on it, or None if absent."""
+
+    @abstractmethod
+    def keys_for_tag(self, tag: str) -> Set[str]:
+        """Get keys of entries stored with a tag (may include expired keys)."""
+
+    def delete_tagged(self, tags: Iterable[str]) -> List[str]:
+        """Delete entries stored with any of the tags; returns the deleted keys."""
+        keys: Set[str] = set()
+        for tag in tags:
+            keys |= self.keys_for_tag(tag)
+        deleted = []
+        for key in keys:
+            try:
+                del self[key]
+                deleted.append(key)
+            except KeyError:
+                pass  # Already evicted
+        return deleted
+
+    def entry_sizes(self) -> Dict[str, int]:
+        """Get the serialized size in bytes of each stored entry."""
+        sizes = {}
+        for key in list(self):
+            try:
+                sizes[key] = self[key].size_bytes
+            except KeyError:
+                pass  # Expired while iterating
+        return sizes
+
+    def _evicted(self, key: str, reason: str) -> None:
+        if self.on_evict is not None:
+            try:
+                self.on_evict(key, reason)
+            except Exception as e:
+                logger.warning(f"Cache eviction handler failed for {key}: {e}")
+
+
+class CacheBackend(ABC):
+    """Factory for cache tiers plus cross-worker invalidation hooks."""
+
+    name: str = "base"
+    shared: bool = False
+
+    @abstractmethod
+    def create_tier(
+        self,
+        tier: str,
+        maxsize: int,
+        ttl: int,
+        on_evict: Optional[EvictionHandler] = None,
+    ) -> CacheTier:
+        """
+        Create storage for a tier.
+
+        Args:
+            tier: Tier name (live, daily, static)
+            maxsize: Maximum entries to keep
+            ttl: Seconds an entry is retained
+            on_evict: Called with (key, "lru" | "ttl") when an entry is evicted
+        """
+
+    def publish_invalidation(self, tier: str, keys: Optional[List[str]]) -> None:
+        """Notify other workers that keys (or the whole tier if None) were invalidated."""
+
+    def subscribe_invalidations(self, handler: InvalidationHandler) -> None:
+        """Register a handler for invalidations published by other workers."""
+
+    def close(self) -> None:
+        """Release connections and background listeners."""
+
+
+# =============================================================================
+# In-memory backend
+# =============================================================================
+
+
+class _ObservedTTLCache(TTLCache):
+    """TTLCache that reports TTL expiry and LRU eviction."""
+
+    def __init__(self, maxsize: int, ttl: int, on_evict: EvictionHandler):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._on_evict = on_evict
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for key, _ in expired or ():
+            self._on_evict(key, "ttl")
+        return expired
+
+    def popitem(self):
+        # Cache.__setitem__ calls popitem() to make room: an LRU eviction
+        key, value = super().popitem()
+        self._on_evict(key, "lru")
+        return key, value
+
+
+class InMemoryCacheTier(CacheTier):
+    """
+    Per-process tier backed by a cachetools TTLCache (LRU + TTL).
+
+    The tag index is updated on every write and delete. Entries dropped
+    by TTL expiry or LRU eviction are pruned from the index lazily, once
+    it tracks more than twice maxsize keys.
+    """
+
+    def __init__(self, maxsize: int, ttl: int, on_evict: Optional[EvictionHandler] = None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.on_evict = on_evict
+        self._cache: TTLCache = _ObservedTTLCache(maxsize, ttl, self._evicted)
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._key_tags: Dict[str, Tuple[str, ...]] = {}
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        entry = self._cache.get(key)
+        if entry is not None:
+            entry.hits += 1
+        return entry
+
+    def keys_for_tag(self, tag: str) -> Set[str]:
+        return {k for k in self._tag_index.get(tag, ()) if k in self._cache}
+
+    def _untag(self, key: str) -> None:
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+
+    def _prune_index(self) -> None:
+        """Drop index references to entries the TTLCache has expired or evicted."""
+        for key in [k for k in self._key_tags if k not in self._cache]:
+            self._untag(key)
+
+    def __getitem__(self, key: str) -> CacheEntry:
+        return self._cache[key]
+
+    def __setitem__(self, key: str, entry: CacheEntry) -> None:
+        self._cache[key] = entry
+        self._untag(key)
+        if entry.tags:
+            self._key_tags[key] = entry.tags
+            for tag in entry.tags:
+                self._tag_index.setdefault(tag, set()).add(key)
+            if len(self._key_tags) > 2 * self.maxsize:
+                self._prune_index()
+
+    def __delitem__(self, key: str) -> None:
+        del self._cache[key]
+        self._untag(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._cache.keys()))
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        # Swap rather than TTLCache.clear(), which pops (and would report) every entry
+        self._cache = _ObservedTTLCache(self.maxsize, self.ttl, self._evicted)
+        self._tag_index.clear()
+        self._key_tags.clear()
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Default backend: each worker process keeps its own entries."""
+
+    name = "memory"
+    shared = False
+
+    def create_tier(
+        self,
+        tier: str,
+        maxsize: int,
+        ttl: int,
+        on_evict: Optional[EvictionHandler] = None,
+    ) -> CacheTier:
+        return InMemoryCacheTier(maxsize=maxsize, ttl=ttl, on_evict=on_evict)
+
+
+# =============================================================================
+# Redis backend
+# =============================================================================
+
+
+class RedisCacheTier(CacheTier):
+    """
+    Shared tier stored in Redis.
+
+    Each entry is a hash at {prefix}:{tier}:{key} with fields value (JSON
+    ToolResult payload), stored_at, hits, tags, compute_ms and size_bytes,
+    expiring after the tier TTL.
+    A sorted set at {prefix}:{tier}:index, scored by stored_at, tracks TTL
+    expiry; a second at {prefix}:{tier}:lru, scored by last access (write
+    or hit), bounds the tier to maxsize by evicting the least recently
+    used entries. Tags are sets at {prefix}:{tier}:tag:{tag} expiring with
+    the tier TTL; they may retain keys that were since evicted, which
+    invalidation simply skips.
+
+    Calls are blocking round trips on a synchronous client; async callers
+    go through ToolCacheService.alookup()/aset()/ainvalidate*(), which run
+    them in a worker thread. delete_tagged() invalidates in two pipelined
+    round trips however many entries carry the tags.
+
+    Evictions are reported by the worker that performs them: LRU when a
+    write overflows maxsize, TTL when an expired index member is pruned.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        prefix: str,
+        tier: str,
+        maxsize: int,
+        ttl: int,
+        on_evict: Optional[EvictionHandler] = None,
+    ):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.on_evict = on_evict
+        self._client = client
+        self._prefix = f"{prefix}:{tier}:"
+        self._index = f"{prefix}:{tier}:index"
+        self._lru = f"{prefix}:{tier}:lru"
+        self._tag_prefix = f"{prefix}:{tier}:tag:"
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self._prefix}{key}"
+
+    @staticmethod
+    def _decode(value: Any) -> str:
+        return value.decode() if isinstance(value, bytes) else value
+
+    def _prune(self) -> None:
+        """Drop index members whose entries have expired."""
+        cutoff = time.time() - self.ttl
+        expired = self._client.zrangebyscore(self._index, "-inf", cutoff)
+        if not expired:
+            return
+        pipe = self._client.pipeline()
+        pipe.zrem(self._index, *expired)
+        pipe.zrem(self._lru, *expired)
+        removed = pipe.execute()[0]
+        if removed:
+            for member in expired:
+                self._evicted(self._decode(member), "ttl")
+
+    def _read(self, key: str) -> Optional[CacheEntry]:
+        value, stored_at, hits, tags, compute_ms, size_bytes = self._client.hmget(
+            self._redis_key(key),
+            "value", "stored_at", "hits", "tags", "compute_ms", "size_bytes",
+        )
+        if value is None:
+            return None
+        return CacheEntry(
+            value=json.loads(value),
+            stored_at=float(stored_at),
+            hits=int(hits or 0),
+            tags=tuple(json.loads(tags)) if tags else (),
+            compute_ms=float(compute_ms or 0),
+            size_bytes=int(size_bytes or 0),
+        )
+
+    def keys_for_tag(self, tag: str) -> Set[str]:
+        return {self._decode(k) for k in self._client.smembers(f"{self._tag_prefix}{tag}")}
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        entry = self._read(key)
+        if entry is not None:
+            pipe = self._client.pipeline()
+            pipe.hincrby(self._redis_key(key), "hits", 1)
+            pipe.zadd(self._lru, {key: time.time()}, xx=True)
+            entry.hits = pipe.execute()[0]
+        return entry
+
+    def __getitem__(self, key: str) -> CacheEntry:
+        entry = self._read(key)
+        if entry is None:
+            raise KeyError(key)
+        return entry
+
+    def __setitem__(self, key: str, entry: CacheEntry) -> None:
+        redis_key = self._redis_key(key)
+        pipe = self._client.pipeline()
+        pipe.delete(redis_key)
+        pipe.hset(
+            redis_key,
+            mapping={
+                "value": json.dumps(entry.value, default=_json_default),
+                "stored_at": entry.stored_at,
+                "hits": entry.hits,
+                "tags": json.dumps(list(entry.tags)),
+                "compute_ms": entry.compute_ms,
+                "size_bytes": entry.size_bytes,
+            },
+        )
+        pipe.expire(redis_key, self.ttl)
+        pipe.zadd(self._index, {key: entry.stored_at})
+        pipe.zadd(self._lru, {key: entry.stored_at})
+        for tag in entry.tags:
+            pipe.sadd(f"{self._tag_prefix}{tag}", key)
+            pipe.expire(f"{self._tag_prefix}{tag}", self.ttl)
+        pipe.execute()
+
+        pipe.zcard(self._lru)
+        overflow = pipe.execute()[-1] - self.maxsize
+        if overflow > 0:
+            evicted = self._client.zpopmin(self._lru, overflow)
+            if evicted:
+                evicted_keys = [self._decode(member) for member, _ in evicted]
+                pipe = self._client.pipeline()
+                pipe.delete(*[self._redis_key(k) for k in evicted_keys])
+                pipe.zrem(self._index, *evicted_keys)
+                pipe.execute()
+                for evicted_key in evicted_keys:
+                    self._evicted(evicted_key, "lru")
+
+    def __delitem__(self, key: str) -> None:
+        tags = self._client.hget(self._redis_key(key), "tags")
+        pipe = self._client.pipeline()
+        pipe.delete(self._redis_key(key))
+        pipe.zrem(self._index, key)
+        pipe.zrem(self._lru, key)
+        for tag in json.loads(tags) if tags else []:
+            pipe.srem(f"{self._tag_prefix}{tag}", key)
+        deleted = pipe.execute()[0]
+        if not deleted:
+            raise KeyError(key)
+
+    def delete_tagged(self, tags: Iterable[str]) -> List[str]:
+        """
+        Delete entries stored with any of the tags, in two round trips.
+
+        The deleted keys stay members of their other tags' sets until
+        those expire, which later invalidations skip.
+        """
+        tag_sets = [f"{self._tag_prefix}{tag}" for tag in tags]
+        if not tag_sets:
+            return []
+        pipe = self._client.pipeline()
+        for tag_set in tag_sets:
+            pipe.smembers(tag_set)
+        keys = sorted({self._decode(k) for members in pipe.execute() for k in members})
+        if not keys:
+            return []
+
+        pipe = self._client.pipeline()
+        for key in keys:
+            pipe.delete(self._redis_key(key))
+        pipe.zrem(self._index, *keys)
+        pipe.zrem(self._lru, *keys)
+        pipe.delete(*tag_sets)
+        results = pipe.execute()
+        return [key for key, deleted in zip(keys, results) if deleted]
+
+    def __iter__(self) -> Iterator[str]:
+        self._prune()
+        return iter([self._decode(k) for k in self._client.zrange(self._index, 0, -1)])
+
+    def entry_sizes(self) -> Dict[str, int]:
+        keys = list(self)
+        pipe = self._client.pipeline()
+        for key in keys:
+            pipe.hget(self._redis_key(key), "size_bytes")
+        return {
+            key: int(size)
+            for key, size in zip(keys, pipe.execute())
+            if size is not None
+        }
+
+    def __len__(self) -> int:
+        self._prune()
+        return self._client.zcard(self._index)
+
+    def clear(self) -> None:
+        keys = [self._decode(k) for k in self._client.zrange(self._index, 0, -1)]
+        tag_sets = list(self._client.scan_iter(match=f"{self._tag_prefix}*"))
+        pipe = self._client.pipeline()
+        for key in keys:
+            pipe.delete(self._redis_key(key))
+        for tag_set in tag_sets:
+            pipe.delete(tag_set)
+        pipe.delete(self._index)
+        pipe.delete(self._lru)
+        pipe.execute()
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Shared backend for multi-worker deployments.
+
+    Entries live in Redis so a result cached by one worker is a hit for
+    all of them. Invalidations are published on {prefix}:invalidations so
+    every worker can drop work (e.g. in-flight background refreshes) that
+    would otherwise re-populate invalidated keys.
+    """
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, client: Any, prefix: str = "tool_cache"):
+        """
+        Args:
+            client: Synchronous redis-py compatible client
+            prefix: Namespace for all keys and the invalidation channel
+        """
+        self._client = client
+        self._prefix = prefix
+        self._channel = f"{prefix}:invalidations"
+        self._origin = uuid.uuid4().hex
+        self._handlers: List[InvalidationHandler] = []
+        self._pubsub = None
+        self._listener: Optional[threading.Thread] = None
+
+    def create_tier(
+        self,
+        tier: str,
+        maxsize: int,
+        ttl: int,
+        on_evict: Optional[EvictionHandler] = None,
+    ) -> CacheTier:
+        return RedisCacheTier(self._client, self._prefix, tier, maxsize, ttl, on_evict)
+
+    def publish_invalidation(self, tier: str, keys: Optional[List[str]]) -> None:
+        message = json.dumps({"origin": self._origin, "tier": tier, "keys": keys})
+        try:
+            self._client.publish(self._channel, message)
+        except Exception as e:
+            logger.warning(f"Failed to publish cache invalidation: {e}")
+
+    def subscribe_invalidations(self, handler: InvalidationHandler) -> None:
+        self._handlers.append(handler)
+        if self._listener is not None:
+            return
+        try:
+            self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(**{self._channel: self._on_message})
+            self._listener = self._pubsub.run_in_thread(sleep_time=0.5, daemon=True)
+        except Exception as e:
+            logger.warning(f"Failed to subscribe to cache invalidations: {e}")
+
+    def _on_message(self, message: Dict[str, Any]) -> None:
+        """Dispatch an invalidation published by another worker."""
+        try:
+            payload = json.loads(message["data"])
+        except (KeyError, TypeError, ValueError):
+            logger.warning(f"Ignoring malformed cache invalidation: {message!r}")
+            return
+        if payload.get("origin") == self._origin:
+            return
+        for handler in self._handlers:
+            try:
+                handler(payload.get("tier"), payload.get("keys"))
+            except Exception as e:
+                logger.warning(f"Cache invalidation handler failed: {e}")
+
+    def close(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+
+
+def create_cache_backend() -> CacheBackend:
+    """
+    Create the cache backend selected by settings.
+
+    - "memory" (default): InMemoryCacheBackend
+    - "redis": RedisCacheBackend using CACHE_REDIS_URL
+
+    Falls back to the in-memory backend if Redis is not configured or
+    unreachable, so a cache outage never blocks tool execution.
+
+    Returns:
+        CacheBackend instance
+    """
+    settings = get_settings()
+    backend_type = settings.cache_backend
+
+    if backend_type == "redis":
+        if not settings.cache_redis_url:
+            logger.warning("CACHE_BACKEND=redis but CACHE_REDIS_URL is not set, using memory")
+            return InMemoryCacheBackend()
+        try:
+            import redis
+
+            client = redis.Redis.from_url(
+                settings.cache_redis_url,
+                socket_timeout=settings.cache_redis_socket_timeout,
+                socket_connect_timeout=settings.cache_redis_socket_timeout,
+            )
+            client.ping()
+        except Exception as e:
+            logger.warning(f"Redis cache backend unavailable ({e}), using memory")
+            return InMemoryCacheBackend()
+        logger.info("Initialized RedisCacheBackend")
+        return RedisCacheBackend(client, prefix=settings.cache_redis_prefix)
+
+    if backend_type != "memory":
+        logger.warning(f"Unknown cache backend: {backend_type}, defaulting to memory")
+    return InMemoryCacheBackend()
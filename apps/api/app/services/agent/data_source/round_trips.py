@@ -0,0 +1,64 @@
+"""
+Data Source Round-Trip Counting
+
+Counts database round trips made within a block of work, e.g. one
+briefing, so orchestration changes can be compared by how many queries
+they issue rather than by wall time alone.
+
+- count_round_trips() opens a counter for the current context; asyncio
+  tasks started inside the block share it
+- SupabaseDataSource._execute calls record_round_trip() for every query
+- Nested counters also count towards their enclosing counters
+- Outside a counter, record_round_trip() is a no-op
+"""
+
+import contextvars
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+
+class RoundTripCounter:
+    """Round trips recorded within a count_round_trips() block."""
+
+    def __init__(self, parent: Optional["RoundTripCounter"] = None):
+        self.parent = parent
+        self.count = 0
+        self.by_table: Dict[str, int] = {}
+
+    def record(self, table: Optional[str]) -> None:
+        counter: Optional[RoundTripCounter] = self
+        while counter is not None:
+            counter.count += 1
+            key = table or "unknown"
+            counter.by_table[key] = counter.by_table.get(key, 0) + 1
+            counter = counter.parent
+
+
+_current_counter: contextvars.ContextVar[Optional[RoundTripCounter]] = contextvars.ContextVar(
+    "data_source_round_trips", default=None
+)
+
+
+@contextmanager
+def count_round_trips() -> Iterator[RoundTripCounter]:
+    """
+    Count data source round trips made within the block.
+
+    Usage:
+        with count_round_trips() as round_trips:
+            await generate_briefing()
+        logger.info(f"{round_trips.count} round trips")
+    """
+    counter = RoundTripCounter(parent=_current_counter.get())
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+
+
+def record_round_trip(table: Optional[str] = None) -> None:
+    """Record one round trip against the active counter(s), if any."""
+    counter = _current_counter.get()
+    if counter is not None:
+        counter.record(table)
@@ -12,6 +12,10 @@ AC#4: Asset Data Methods
 AC#5: OEE Data Methods
 AC#6: Downtime Data Methods
 AC#7: Live Data Methods
+
+Every public method is traced as a "data_source" span and every query
+round trip (_execute) as a nested "db" span when an agent trace is active.
+Round trips are also counted for any enclosing count_round_trips() block.
 """
 
 import logging
@@ -37,6 +41,8 @@ from app.services.agent.data_source.exceptions import (
     DataSourceConnectionError,
     DataSourceQueryError,
 )
+from app.services.agent.tracing import span, trace_methods
+from app.services.agent.data_source.round_trips import record_round_trip
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +52,7 @@ def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+@trace_methods("data_source", prefix="supabase")
 class SupabaseDataSource:
     """
     Supabase implementation of the DataSource protocol.
@@ -88,6 +95,18 @@ class SupabaseDataSource:
                 )
         return self._client
 
+    def _execute(self, query: Any) -> Any:
+        """Execute a query builder, timing the round trip as a "db" span."""
+        path = getattr(query, "path", None)
+        table = path.strip("/") if isinstance(path, str) else None
+        record_round_trip(table)
+        with span("supabase.execute", "db", table=table) as db_span:
+            result = query.execute()
+            rows = getattr(result, "data", None)
+            if isinstance(rows, list):
+                db_span.set_attribute("row_count", len(rows))
+            return result
+
     def _create_result(
         self,
         data: Any,
@@ -235,12 +254,11 @@ class SupabaseDataSource:
         AC#4: Asset Data Methods
         """
         try:
-            result = (
+            result = self._execute(
                 self.client.table("assets")
                 .select("*")
                 .eq("id", asset_id)
                 .limit(1)
-                .execute()
             )
 
             asset = None
@@ -269,22 +287,20 @@ class SupabaseDataSource:
         """
         try:
             # Try exact case-insensitive match first
-            result = (
+            result = self._execute(
                 self.client.table("assets")
                 .select("*")
                 .ilike("name", name)
                 .limit(1)
-                .execute()
             )
 
             if not result.data:
                 # Try partial match with wildcards
-                result = (
+                result = self._execute(
                     self.client.table("assets")
                     .select("*")
                     .ilike("name", f"%{name}%")
                     .limit(1)
-                    .execute()
                 )
 
             asset = None
@@ -312,12 +328,11 @@ class SupabaseDataSource:
         AC#4: Asset Data Methods
         """
         try:
-            result = (
+            result = self._execute(
                 self.client.table("assets")
                 .select("*")
                 .ilike("area", area)
                 .order("name")
-                .execute()
             )
 
             assets = [self._parse_asset(row) for row in (result.data or [])]
@@ -343,12 +358,11 @@ class SupabaseDataSource:
         AC#4: Fuzzy name matching support
         """
         try:
-            result = (
+            result = self._execute(
                 self.client.table("assets")
                 .select("*")
                 .ilike("name", f"%{name}%")
                 .limit(limit)
-                .execute()
             )
 
             assets = [self._parse_asset(row) for row in (result.data or [])]
@@ -372,11 +386,10 @@ class SupabaseDataSource:
         Get all assets in the system.
         """
         try:
-            result = (
+            result = self._execute(
                 self.client.table("assets")
                 .select("*")
                 .order("name")
-                .execute()
             )
 
             assets = [self._parse_asset(row) for row in (result.data or [])]
@@ -411,14 +424,13 @@ class SupabaseDataSource:
         AC#5: OEE Data Methods - includes availability, performance, quality breakdown
         """
         try:
-            result = (
+            result = self._execute(
                 self.client.table("daily_summaries")
                 .select("*")
                 .eq("asset_id", asset_id)
                 .gte("report_date", start_date.isoformat())
                 .lte("report_date", end_date.isoformat())
                 .order("report_date", desc=True)
-                .execute()
             )
 
             metrics = [self._parse_oee_metrics(row) for row in (result.data or [])]
@@ -465,14 +477,13 @@ class SupabaseDataSource:
             asset_ids = [asset.id for asset in assets_result.data]
 
             # Get OEE data for all assets in area
-            result = (
+            result = self._execute(
                 self.client.table("daily_summaries")
                 .select("*, assets!inner(name, area)")
                 .in_("asset_id", asset_ids)
                 .gte("report_date", start_date.isoformat())
                 .lte("report_date", end_date.isoformat())
                 .order("report_date", desc=True)
-                .execute()
             )
 
             metrics = [self._parse_oee_metrics(row) for row in (result.data or [])]
@@ -512,7 +523,7 @@ class SupabaseDataSource:
         """
         try:
             # Downtime data is in daily_summaries (downtime_minutes field)
-            result = (
+            result = self._execute(
                 self.client.table("daily_summaries")
                 .select("id, asset_id, report_date, downtime_minutes, financial_loss_dollars")
                 .eq("asset_id", asset_id)
@@ -520,7 +531,6 @@ class SupabaseDataSource:
                 .lte("report_date", end_date.isoformat())
                 .gt("downtime_minutes", 0)  # Only records with downtime
                 .order("report_date", desc=True)
-                .execute()
             )
 
             events = []
@@ -582,7 +592,7 @@ class SupabaseDataSource:
             asset_ids = [asset.id for asset in assets_result.data]
             asset_names = {asset.id: asset.name for asset in assets_result.data}
 
-            result = (
+            result = self._execute(
                 self.client.table("daily_summaries")
                 .select("id, asset_id, report_date, downtime_minutes, financial_loss_dollars")
                 .in_("asset_id", asset_ids)
@@ -590,7 +600,6 @@ class SupabaseDataSource:
                 .lte("report_date", end_date.isoformat())
                 .gt("downtime_minutes", 0)
                 .order("downtime_minutes", desc=True)
-                .execute()
             )
 
             events = []
@@ -638,13 +647,12 @@ class SupabaseDataSource:
         AC#7: Includes data freshness timestamp
         """
         try:
-            result = (
+            result = self._execute(
                 self.client.table("live_snapshots")
                 .select("*, assets!inner(name, area)")
                 .eq("asset_id", asset_id)
                 .order("snapshot_timestamp", desc=True)
                 .limit(1)
-                .execute()
             )
 
             status = None
@@ -691,13 +699,12 @@ class SupabaseDataSource:
             # Using a subquery approach via multiple calls (Supabase limitation)
             snapshots = []
             for asset in assets_result.data:
-                result = (
+                result = self._execute(
                     self.client.table("live_snapshots")
                     .select("*, assets!inner(name, area)")
                     .eq("asset_id", asset.id)
                     .order("snapshot_timestamp", desc=True)
                     .limit(1)
-                    .execute()
                 )
                 if result.data and len(result.data) > 0:
                     snapshots.append(self._parse_production_status(result.data[0]))
@@ -730,11 +737,10 @@ class SupabaseDataSource:
         try:
             # Fetch all snapshots ordered by timestamp descending
             # This allows us to deduplicate to get the latest per asset
-            result = (
+            result = self._execute(
                 self.client.table("live_snapshots")
                 .select("*, assets!inner(name, area)")
                 .order("snapshot_timestamp", desc=True)
-                .execute()
             )
 
             if not result.data:
@@ -778,14 +784,13 @@ class SupabaseDataSource:
         try:
             today = date.today()
 
-            result = (
+            result = self._execute(
                 self.client.table("shift_targets")
                 .select("*")
                 .eq("asset_id", asset_id)
                 .lte("effective_date", today.isoformat())
                 .order("effective_date", desc=True)
                 .limit(1)
-                .execute()
             )
 
             target = None
@@ -824,12 +829,11 @@ class SupabaseDataSource:
 
             # Fetch all shift targets ordered by effective_date descending
             # This allows us to deduplicate to get the latest per asset
-            result = (
+            result = self._execute(
                 self.client.table("shift_targets")
                 .select("*")
                 .lte("effective_date", today.isoformat())
                 .order("effective_date", desc=True)
-                .execute()
             )
 
             if not result.data:
@@ -935,7 +939,7 @@ class SupabaseDataSource:
             if not include_resolved:
                 query = query.eq("is_resolved", False)
 
-            result = query.order("event_timestamp", desc=True).execute()
+            result = self._execute(query.order("event_timestamp", desc=True))
 
             events = [self._parse_safety_event(row) for row in (result.data or [])]
 
@@ -1073,7 +1077,7 @@ class SupabaseDataSource:
                 .order("report_date", desc=True)
             )
 
-            result = query.execute()
+            result = self._execute(query)
 
             metrics = [self._parse_financial_metrics(row) for row in (result.data or [])]
 
@@ -1157,7 +1161,7 @@ class SupabaseDataSource:
                 .order("report_date", desc=True)
             )
 
-            result = query.execute()
+            result = self._execute(query)
 
             metrics = [self._parse_financial_metrics(row) for row in (result.data or [])]
 
@@ -1263,7 +1267,7 @@ class SupabaseDataSource:
                 .order("report_date", desc=False)  # Chronological order
             )
 
-            result = query.execute()
+            result = self._execute(query)
 
             # Transform data to include metric value with standard key name
             transformed_data = []
@@ -18,6 +18,12 @@ AC#6: Graceful Handling of Unknown Intents
 - Agent responds honestly when no tool matches
 - Suggests what types of questions it can answer
 - Never fabricates data or capabilities
+
+Each turn is traced (see tracing.py): LLM calls per iteration, tools,
+cache lookups and data source queries are recorded as nested spans.
+
+Chat history is bounded per turn (see history.py): recent turns are sent
+verbatim and older turns as a cached rolling summary.
 """
 
 import logging
@@ -27,13 +33,24 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from langchain.agents import AgentExecutor, create_openai_functions_agent
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel, Field
 
+from app.services.ai.admission import (
+    LLMOverloaded,
+    LLMPriority,
+    get_llm_admission,
+    llm_request_context,
+    provider_name,
+)
 from app.services.agent.base import Citation, ToolResult
+from app.services.agent.history import get_history_manager, llm_summarizer
 from app.services.agent.registry import get_tool_registry
+from app.services.agent.tool_output import compact_intermediate_steps, tool_output_savings
+from app.services.agent.tracing import AgentTraceCallbackHandler, Trace, start_trace
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +83,9 @@ class AgentConfig:
         self.max_iterations = int(os.getenv("AGENT_MAX_ITERATIONS", "5"))
         self.verbose = os.getenv("AGENT_VERBOSE", "false").lower() == "true"
         self.timeout_seconds = int(os.getenv("AGENT_TIMEOUT_SECONDS", "60"))
+        self.compact_tool_output = (
+            os.getenv("AGENT_COMPACT_TOOL_OUTPUT", "true").lower() == "true"
+        )
 
     @property
     def is_configured(self) -> bool:
@@ -159,7 +179,9 @@ class ManufacturingAgent:
         """
         self.config = config or AgentConfig()
         self._executor: Optional[AgentExecutor] = None
+        self._llm: Optional[ChatOpenAI] = None
         self._initialized: bool = False
+        self._tool_output_budgets: Dict[str, Optional[int]] = {}
 
     def initialize(self) -> bool:
         """
@@ -180,6 +202,7 @@ class ManufacturingAgent:
         try:
             # Get LLM client
             llm = self._create_llm()
+            self._llm = llm
 
             # Get registered tools
             registry = get_tool_registry()
@@ -238,8 +261,41 @@ class ManufacturingAgent:
             MessagesPlaceholder(variable_name="agent_scratchpad"),
         ])
 
-        # Create OpenAI Functions agent
-        return create_openai_functions_agent(llm, tools, prompt)
+        # Create OpenAI Functions agent; each planning step (one LLM call)
+        # holds an interactive admission slot
+        agent = self._with_admission(create_openai_functions_agent(llm, tools, prompt), llm)
+        if not self.config.compact_tool_output:
+            return agent
+
+        # Feed the scratchpad compact tool outputs; intermediate_steps keep
+        # the full ToolResults for citation extraction
+        self._tool_output_budgets = {
+            tool.name: getattr(tool, "output_token_budget", None) for tool in tools
+        }
+
+        def compact_scratchpad(inputs: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                **inputs,
+                "intermediate_steps": compact_intermediate_steps(
+                    inputs.get("intermediate_steps", []), self._tool_output_budgets
+                ),
+            }
+
+        return RunnableLambda(compact_scratchpad) | agent
+
+    def _with_admission(self, agent, llm: ChatOpenAI):
+        """Run each agent step under LLM admission control."""
+        admission = get_llm_admission()
+        provider = provider_name(llm)
+
+        def plan(inputs: Dict[str, Any], config: RunnableConfig):
+            return agent.invoke(inputs, config=config)
+
+        async def aplan(inputs: Dict[str, Any], config: RunnableConfig):
+            async with admission.admit("agent.chat", provider, LLMPriority.INTERACTIVE):
+                return await agent.ainvoke(inputs, config=config)
+
+        return RunnableLambda(plan, afunc=aplan, name="admitted_agent")
 
     def _build_tool_descriptions(self, tools: list) -> str:
         """Build formatted tool descriptions for the system prompt."""
@@ -257,7 +313,9 @@ class ManufacturingAgent:
         message: str,
         user_id: str,
         chat_history: Optional[List[Dict[str, str]]] = None,
+        conversation_id: Optional[str] = None,
         force_refresh: bool = False,
+        include_trace: bool = False,
     ) -> AgentResponse:
         """
         Process a user message and return an agent response.
@@ -270,19 +328,52 @@ class ManufacturingAgent:
             message: User's natural language message
             user_id: User identifier for logging
             chat_history: Optional conversation history
+            conversation_id: Client conversation id for the cached history summary
             force_refresh: Bypass cache and fetch fresh data (Story 5.8 AC#5)
+            include_trace: Return the turn's span tree in meta["trace"]
 
         Returns:
             AgentResponse with content, citations, and metadata
+            (meta["llm_queue"] reports LLM admission queue wait)
+
+        Raises:
+            LLMOverloaded: If admission control sheds the turn's LLM calls
         """
         # Story 5.8: Set force_refresh in context for cache decorator to access
-        from app.services.agent.cache import set_force_refresh
+        from app.services.agent.cache import set_cache_scope_context, set_force_refresh
         set_force_refresh(force_refresh)
+        set_cache_scope_context(user_id)
 
         # Story 7.1: Set user_id in context for memory recall tool
         from app.services.agent.tools.memory_recall import set_current_user_id
         set_current_user_id(user_id)
 
+        with start_trace("agent.turn", user_id=user_id) as trace, \
+                llm_request_context(LLMPriority.INTERACTIVE) as llm_stats:
+            response = await self._run_turn(
+                message, user_id, chat_history, conversation_id, trace
+            )
+            response.meta["llm_queue"] = llm_stats.to_dict()
+            if trace is not None:
+                trace.root.set_attribute("tool_used", response.tool_used)
+                if response.error:
+                    trace.root.set_error(response.error)
+
+        if trace is not None:
+            response.meta["trace_id"] = trace.trace_id
+            if include_trace:
+                response.meta["trace"] = trace.to_dict()
+        return response
+
+    async def _run_turn(
+        self,
+        message: str,
+        user_id: str,
+        chat_history: Optional[List[Dict[str, str]]],
+        conversation_id: Optional[str],
+        trace: Optional[Trace],
+    ) -> AgentResponse:
+        """Run the agent for one message inside the turn's trace."""
         start_time = time.time()
 
         # Ensure agent is initialized
@@ -294,17 +385,55 @@ class ManufacturingAgent:
                 )
 
         try:
-            # Convert chat history to LangChain format
-            lc_chat_history = self._convert_chat_history(chat_history)
-
-            # Invoke the agent
-            result = await self._executor.ainvoke({
-                "input": message,
-                "chat_history": lc_chat_history,
-            })
+            # Bound the history: recent turns verbatim, older turns summarized
+            history_manager = get_history_manager()
+            window = history_manager.prepare(chat_history, user_id, conversation_id)
+            lc_chat_history = self._convert_chat_history(window.messages)
+
+            # Invoke the agent, recording each LLM call (iteration) as a span
+            callbacks = []
+            trace_handler = None
+            if trace is not None:
+                trace_handler = AgentTraceCallbackHandler(trace.root)
+                callbacks.append(trace_handler)
+
+            result = await self._executor.ainvoke(
+                {
+                    "input": message,
+                    "chat_history": lc_chat_history,
+                },
+                config={"callbacks": callbacks},
+            )
+            if trace_handler is not None:
+                trace.root.set_attribute("iterations", trace_handler.iterations)
 
             # Extract and format response
             response = self._format_response(result, start_time)
+            response.meta["history"] = window.stats
+            if trace is not None:
+                trace.root.set_attribute("history_tokens_trimmed", window.stats["tokens_trimmed"])
+
+            # Fold turns leaving the window into the summary, off the request path
+            if conversation_id and self._llm is not None:
+                history_manager.schedule_summary(
+                    user_id,
+                    conversation_id,
+                    list(chat_history or []) + [
+                        {"role": "user", "content": message},
+                        {"role": "assistant", "content": response.content},
+                    ],
+                    llm_summarizer(self._llm),
+                )
+
+            if self.config.compact_tool_output:
+                savings = tool_output_savings(
+                    result.get("intermediate_steps", []), self._tool_output_budgets
+                )
+                response.meta["tool_output_tokens"] = savings
+                if trace is not None:
+                    trace.root.set_attribute(
+                        "prompt_tokens_saved", savings["prompt_tokens_saved"]
+                    )
 
             logger.info(
                 f"Agent processed message for user {user_id}: "
@@ -314,6 +443,9 @@ class ManufacturingAgent:
 
             return response
 
+        except LLMOverloaded:
+            # Shed by admission control; the API answers 503 with Retry-After
+            raise
         except Exception as e:
             logger.error(f"Agent error processing message for user {user_id}: {e}")
             return self._create_error_response(str(e), start_time)
@@ -335,6 +467,8 @@ class ManufacturingAgent:
                 messages.append(HumanMessage(content=content))
             elif role == "assistant":
                 messages.append(AIMessage(content=content))
+            elif role == "system":
+                messages.append(SystemMessage(content=content))
 
         return messages
 
@@ -0,0 +1,365 @@
+"""
+Chat History Window
+
+Bounds the chat history sent to the agent on each turn:
+
+- The last agent_history_keep_turns turns are sent verbatim
+- Older turns are folded into a running summary, generated in the
+  background after each turn and cached per conversation
+- The window (summary + recent turns) is held to
+  agent_history_token_budget, dropping the oldest verbatim messages first
+- Tokens trimmed are reported per turn and in aggregate
+
+Summaries are keyed by user and conversation id and remember how many
+leading messages they cover plus a fingerprint of those messages, so an
+edited or unrelated history never picks up a stale summary.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from cachetools import TTLCache
+
+from app.core.config import get_settings
+from app.services.agent.tool_output import count_tokens
+
+logger = logging.getLogger(__name__)
+
+# Summarizer signature: (previous summary, messages to fold in) -> new summary
+Summarizer = Callable[[str, List[Dict[str, str]]], Awaitable[str]]
+
+SUMMARY_PROMPT = """You maintain a running summary of a conversation between a plant manager and a manufacturing assistant.
+Fold the new messages into the existing summary. Keep assets, metrics, time ranges, decisions and open questions the user may refer back to; drop pleasantries.
+Reply with the updated summary only, in under {max_words} words."""
+
+SUMMARY_PREFIX = "Summary of earlier conversation:"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _normalize(chat_history: Optional[List[Dict[str, str]]]) -> List[Dict[str, str]]:
+    """Keep user/assistant messages only, as role/content dicts."""
+    messages = []
+    for msg in chat_history or []:
+        role = msg.get("role", "").lower()
+        if role in ("user", "assistant"):
+            messages.append({"role": role, "content": msg.get("content", "")})
+    return messages
+
+
+def _fingerprint(messages: List[Dict[str, str]]) -> str:
+    payload = json.dumps([(m["role"], m["content"]) for m in messages], separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _message_tokens(message: Dict[str, str]) -> int:
+    # +4 approximates the per-message role/formatting overhead
+    return count_tokens(message["content"]) + 4
+
+
+@dataclass
+class ConversationSummary:
+    """Running summary of a conversation's older messages."""
+
+    text: str
+    covered: int  # Number of leading history messages folded into the summary
+    fingerprint: str  # Fingerprint of those messages
+    updated_at: datetime = field(default_factory=_utcnow)
+
+
+@dataclass
+class HistoryWindow:
+    """Chat history prepared for one agent turn."""
+
+    messages: List[Dict[str, str]]
+    stats: Dict[str, Any]
+
+
+def llm_summarizer(llm: Any, max_tokens: Optional[int] = None) -> Summarizer:
+    """
+    Build a Summarizer backed by a LangChain chat model.
+
+    Args:
+        llm: Chat model with ainvoke()
+        max_tokens: Target summary length (default: agent_history_summary_max_tokens)
+    """
+    from langchain_core.messages import HumanMessage, SystemMessage
+
+    from app.services.ai.admission import LLMPriority, get_llm_admission, provider_name
+
+    max_tokens = max_tokens or get_settings().agent_history_summary_max_tokens
+
+    async def summarize(previous: str, messages: List[Dict[str, str]]) -> str:
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+        # Background work: queued behind interactive calls
+        async with get_llm_admission().admit(
+            "agent.history_summary", provider_name(llm), LLMPriority.BATCH
+        ):
+            response = await llm.ainvoke([
+                SystemMessage(content=SUMMARY_PROMPT.format(max_words=int(max_tokens * 0.75))),
+                HumanMessage(
+                    content=f"Existing summary:\n{previous or '(none)'}\n\nNew messages:\n{transcript}"
+                ),
+            ])
+        return str(getattr(response, "content", response)).strip()
+
+    return summarize
+
+
+class ChatHistoryManager:
+    """
+    Token-bounded chat history with cached rolling summaries.
+
+    Usage:
+        manager = get_history_manager()
+        window = manager.prepare(chat_history, user_id, conversation_id)
+        ... run the turn with window.messages ...
+        manager.schedule_summary(user_id, conversation_id, history, summarizer)
+    """
+
+    def __init__(self):
+        settings = get_settings()
+        self.keep_turns = settings.agent_history_keep_turns
+        self.token_budget = settings.agent_history_token_budget
+        self._summaries: TTLCache = TTLCache(
+            maxsize=settings.agent_history_max_conversations,
+            ttl=settings.agent_history_summary_ttl_seconds,
+        )
+        self._pending: Dict[str, asyncio.Task] = {}
+        self._stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        return {
+            "turns": 0,
+            "tokens_in": 0,
+            "tokens_sent": 0,
+            "tokens_trimmed": 0,
+            "messages_trimmed": 0,
+            "summaries_used": 0,
+            "summaries_generated": 0,
+            "summary_failures": 0,
+        }
+
+    @staticmethod
+    def _key(user_id: str, conversation_id: str) -> str:
+        return f"{user_id}:{conversation_id}"
+
+    def _cutoff(self, message_count: int) -> int:
+        """Index of the first message kept verbatim."""
+        return max(0, message_count - self.keep_turns * 2)
+
+    def get_summary(
+        self,
+        user_id: str,
+        conversation_id: Optional[str],
+        messages: List[Dict[str, str]],
+    ) -> Optional[ConversationSummary]:
+        """
+        Get the cached summary if it matches this history.
+
+        Args:
+            user_id: Conversation owner
+            conversation_id: Client conversation id
+            messages: Normalized chat history
+
+        Returns:
+            ConversationSummary or None if absent or stale
+        """
+        if not conversation_id:
+            return None
+        summary = self._summaries.get(self._key(user_id, conversation_id))
+        if summary is None or summary.covered > len(messages):
+            return None
+        if _fingerprint(messages[: summary.covered]) != summary.fingerprint:
+            return None
+        return summary
+
+    def prepare(
+        self,
+        chat_history: Optional[List[Dict[str, str]]],
+        user_id: str,
+        conversation_id: Optional[str] = None,
+    ) -> HistoryWindow:
+        """
+        Build the history window for a turn.
+
+        Args:
+            chat_history: Client-supplied history (role/content dicts)
+            user_id: Conversation owner
+            conversation_id: Client conversation id for summary lookup
+
+        Returns:
+            HistoryWindow with messages (summary first, as a system
+            message) and per-turn stats
+        """
+        messages = _normalize(chat_history)
+        tokens_in = sum(_message_tokens(m) for m in messages)
+
+        cutoff = self._cutoff(len(messages))
+        recent = messages[cutoff:]
+        summary = self.get_summary(user_id, conversation_id, messages)
+        if summary is not None and summary.covered > cutoff:
+            # Summary already covers part of the window; don't repeat it
+            recent = messages[summary.covered:]
+
+        summary_message = None
+        summary_tokens = 0
+        if summary is not None and summary.text:
+            summary_message = {"role": "system", "content": f"{SUMMARY_PREFIX}\n{summary.text}"}
+            summary_tokens = _message_tokens(summary_message)
+
+        # Fit the budget, dropping the oldest verbatim messages first
+        recent_tokens = [_message_tokens(m) for m in recent]
+        while len(recent) > 1 and summary_tokens + sum(recent_tokens) > self.token_budget:
+            recent = recent[1:]
+            recent_tokens = recent_tokens[1:]
+
+        window = ([summary_message] if summary_message else []) + recent
+        tokens_sent = summary_tokens + sum(recent_tokens)
+        stats = {
+            "messages_in": len(messages),
+            "messages_sent": len(recent),
+            "messages_summarized": summary.covered if summary_message else 0,
+            "summary_used": summary_message is not None,
+            "tokens_in": tokens_in,
+            "tokens_sent": tokens_sent,
+            "tokens_trimmed": max(0, tokens_in - tokens_sent),
+        }
+
+        self._stats["turns"] += 1
+        self._stats["tokens_in"] += tokens_in
+        self._stats["tokens_sent"] += tokens_sent
+        self._stats["tokens_trimmed"] += stats["tokens_trimmed"]
+        self._stats["messages_trimmed"] += len(messages) - len(recent)
+        if summary_message:
+            self._stats["summaries_used"] += 1
+
+        return HistoryWindow(messages=window, stats=stats)
+
+    def schedule_summary(
+        self,
+        user_id: str,
+        conversation_id: Optional[str],
+        chat_history: List[Dict[str, str]],
+        summarizer: Summarizer,
+    ) -> bool:
+        """
+        Fold messages that left the verbatim window into the summary.
+
+        Runs in the background so the turn's response is not delayed.
+        Only one summary update per conversation runs at a time; a later
+        turn catches up on anything skipped.
+
+        Args:
+            user_id: Conversation owner
+            conversation_id: Client conversation id
+            chat_history: History including the turn just completed
+            summarizer: Summary generator
+
+        Returns:
+            True if a summary task was started
+        """
+        if not conversation_id:
+            return False
+
+        key = self._key(user_id, conversation_id)
+        if key in self._pending:
+            return False
+
+        messages = _normalize(chat_history)
+        cutoff = self._cutoff(len(messages))
+        summary = self.get_summary(user_id, conversation_id, messages)
+        start = summary.covered if summary else 0
+        if cutoff <= start:
+            return False
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+        previous = summary.text if summary else ""
+        task = loop.create_task(
+            self._run_summary(key, previous, messages[:cutoff], start, summarizer)
+        )
+        self._pending[key] = task
+        task.add_done_callback(lambda t: self._summary_done(key, t))
+        return True
+
+    def _summary_done(self, key: str, task: asyncio.Task) -> None:
+        if self._pending.get(key) is task:
+            del self._pending[key]
+
+    async def _run_summary(
+        self,
+        key: str,
+        previous: str,
+        covered: List[Dict[str, str]],
+        start: int,
+        summarizer: Summarizer,
+    ) -> None:
+        """Generate and store an updated summary."""
+        try:
+            text = await summarizer(previous, covered[start:])
+        except Exception as e:
+            self._stats["summary_failures"] += 1
+            logger.warning(f"Chat history summary failed for {key}: {e}")
+            return
+
+        self._summaries[key] = ConversationSummary(
+            text=text,
+            covered=len(covered),
+            fingerprint=_fingerprint(covered),
+        )
+        self._stats["summaries_generated"] += 1
+
+    async def wait_pending(self) -> None:
+        """Wait for in-flight summary updates (primarily for testing)."""
+        if self._pending:
+            await asyncio.gather(*self._pending.values(), return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get aggregate history trimming statistics."""
+        return {**self._stats, "conversations": len(self._summaries)}
+
+    def clear(self) -> None:
+        """Drop all cached summaries."""
+        self._summaries.clear()
+
+
+# Module-level singleton instance
+_history_manager: Optional[ChatHistoryManager] = None
+
+
+def get_history_manager() -> ChatHistoryManager:
+    """
+    Get the singleton ChatHistoryManager instance.
+
+    Returns:
+        ChatHistoryManager instance
+    """
+    global _history_manager
+    if _history_manager is None:
+        _history_manager = ChatHistoryManager()
+    return _history_manager
+
+
+def reset_history_manager() -> None:
+    """
+    Reset the singleton history manager.
+
+    Primarily used for testing.
+    """
+    global _history_manager
+    if _history_manager is not None:
+        for task in _history_manager._pending.values():
+            task.cancel()
+    _history_manager = None
@@ -0,0 +1,190 @@
+"""
+Tool Manifest
+
+A generated, versioned index of the agent tools (tools/manifest.json) so
+the registry can register tools without importing every tool module:
+
+- Each entry records the tool name, module, class, cache tier/scope,
+  description and JSON args schema - everything the LLM needs to choose
+  a tool
+- The registry registers a LazyTool per entry; the tool's module is only
+  imported the first time the agent actually runs that tool (or when
+  code asks for the concrete tool via ToolRegistry.load_tool)
+- build_manifest() produces the manifest by scanning the tools package
+  (the original discovery path); a test fails if the committed manifest
+  drifts from the code
+
+Regenerate after adding or changing a tool:
+    python -m app.services.agent.manifest
+"""
+
+import importlib
+import inspect
+import json
+import logging
+import pkgutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from langchain_core.utils.function_calling import convert_to_openai_function
+from pydantic import PrivateAttr
+
+from app.services.agent.base import ManufacturingTool, ToolResult
+
+logger = logging.getLogger(__name__)
+
+# Bump when the entry format changes; mismatched manifests are ignored
+MANIFEST_VERSION = 1
+
+TOOLS_PACKAGE = "app.services.agent.tools"
+
+TOOL_MANIFEST_PATH = Path(__file__).parent / "tools" / "manifest.json"
+
+
+class ToolManifestError(Exception):
+    """Raised when the tool manifest is missing, unreadable or outdated."""
+    pass
+
+
+def _manifest_entry(tool_class: type) -> Dict[str, Any]:
+    """Describe a ManufacturingTool class as a manifest entry."""
+    tool = tool_class()
+    arun = tool_class._arun
+    return {
+        "name": tool.name,
+        "module": tool_class.__module__,
+        "class": tool_class.__name__,
+        "cache_tier": getattr(arun, "_cache_tier", None),
+        "cache_scope": getattr(arun, "_cache_scope", None),
+        "citations_required": tool.citations_required,
+        "output_token_budget": tool.output_token_budget,
+        "description": tool.description,
+        # The parameters as bound for the LLM, so lazy and concrete tools match
+        "args_schema": convert_to_openai_function(tool)["parameters"],
+    }
+
+
+def scan_tool_classes() -> List[type]:
+    """
+    Import every module in the tools package and collect ManufacturingTool classes.
+
+    Returns:
+        Tool classes defined in the tools package, in module order
+    """
+    import app.services.agent.tools as tools_package
+
+    classes = []
+    for _, module_name, is_pkg in pkgutil.iter_modules(tools_package.__path__):
+        if is_pkg:
+            continue
+        module = importlib.import_module(f"{TOOLS_PACKAGE}.{module_name}")
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            if (
+                inspect.isclass(attr)
+                and issubclass(attr, ManufacturingTool)
+                and attr is not ManufacturingTool
+                and attr.__module__ == module.__name__
+            ):
+                classes.append(attr)
+    return classes
+
+
+def build_manifest() -> Dict[str, Any]:
+    """
+    Build the tool manifest from the tool classes in the tools package.
+
+    Returns:
+        Manifest dict with version and tool entries sorted by name
+    """
+    entries = [_manifest_entry(tool_class) for tool_class in scan_tool_classes()]
+    return {
+        "version": MANIFEST_VERSION,
+        "tools": sorted(entries, key=lambda entry: entry["name"]),
+    }
+
+
+def write_manifest(path: Path = TOOL_MANIFEST_PATH) -> Dict[str, Any]:
+    """Regenerate the manifest file from code."""
+    manifest = build_manifest()
+    path.write_text(json.dumps(manifest, indent=2) + "\n")
+    return manifest
+
+
+def load_manifest(path: Path = TOOL_MANIFEST_PATH) -> Dict[str, Any]:
+    """
+    Read the tool manifest.
+
+    Raises:
+        ToolManifestError: If the file is missing, invalid or has another version
+    """
+    try:
+        manifest = json.loads(Path(path).read_text())
+    except (OSError, ValueError) as e:
+        raise ToolManifestError(f"Cannot read tool manifest {path}: {e}")
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ToolManifestError(
+            f"Tool manifest version {manifest.get('version')} != {MANIFEST_VERSION}"
+        )
+    return manifest
+
+
+class LazyTool(ManufacturingTool):
+    """
+    Manifest-backed stand-in for a ManufacturingTool.
+
+    Exposes the name, description and JSON args schema the agent needs to
+    bind tools; the tool's module is imported and the concrete tool
+    instantiated on the first run.
+    """
+
+    name: str
+    description: str
+    args_schema: Dict[str, Any]
+
+    module: str
+    class_name: str
+    cache_tier: Optional[str] = None
+
+    _tool: Optional[ManufacturingTool] = PrivateAttr(default=None)
+    _load_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @classmethod
+    def from_entry(cls, entry: Dict[str, Any]) -> "LazyTool":
+        return cls(
+            name=entry["name"],
+            description=entry["description"],
+            args_schema=entry["args_schema"],
+            module=entry["module"],
+            class_name=entry["class"],
+            cache_tier=entry.get("cache_tier"),
+            citations_required=entry.get("citations_required", True),
+            output_token_budget=entry.get("output_token_budget"),
+        )
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._tool is not None
+
+    def load(self) -> ManufacturingTool:
+        """Import the tool module and instantiate the concrete tool (once)."""
+        with self._load_lock:
+            if self._tool is None:
+                tool_class = getattr(importlib.import_module(self.module), self.class_name)
+                self._tool = tool_class()
+                logger.info(f"Loaded tool {self.name} from {self.module}")
+            return self._tool
+
+    async def _arun(self, **kwargs) -> ToolResult:
+        tool = self.load()
+        # Validate against the tool's own args model, as BaseTool.arun would
+        tool_input = tool._parse_input(kwargs, None)
+        # This proxy's "tool" span stands in for the concrete tool's
+        arun = type(tool)._arun
+        return await getattr(arun, "__wrapped__", arun)(tool, **tool_input)
+
+
+if __name__ == "__main__":
+    manifest = write_manifest()
+    print(f"Wrote {len(manifest['tools'])} tools to {TOOL_MANIFEST_PATH}")
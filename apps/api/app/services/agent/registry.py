@@ -2,7 +2,9 @@
 Tool Registry (Story 5.1)
 
 Auto-discovery and registration of ManufacturingTool classes.
-Scans the tools directory on startup and registers all found tools.
+Registers tools from the generated tool manifest (see manifest.py), so
+tool modules are imported only when a tool first runs; without a
+manifest, scans the tools directory and registers all found tools.
 
 AC#3: Tool Auto-Discovery and Registration
 - All ManufacturingTool subclasses are discovered
@@ -14,9 +16,18 @@ import importlib
 import inspect
 import logging
 import pkgutil
+import threading
+from pathlib import Path
 from typing import Dict, List, Optional
 
+from app.core.config import get_settings
 from app.services.agent.base import ManufacturingTool
+from app.services.agent.manifest import (
+    TOOL_MANIFEST_PATH,
+    LazyTool,
+    ToolManifestError,
+    load_manifest,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,24 +46,45 @@ class ToolRegistry:
         tools = registry.get_tools()
     """
 
-    def __init__(self):
+    def __init__(self, manifest_path: Optional[Path] = None):
+        """
+        Args:
+            manifest_path: Tool manifest to register lazy tools from
+                (default: scan the tools directory)
+        """
+        self.manifest_path = manifest_path
         self._tools: Dict[str, ManufacturingTool] = {}
         self._discovered: bool = False
+        # Discovery may run in the startup warm-up thread and a request at once
+        self._discover_lock = threading.RLock()
 
     def discover_tools(self) -> int:
         """
-        Scan the tools directory and register all ManufacturingTool subclasses.
+        Register all ManufacturingTool subclasses.
 
         AC#3: When the tool registry scans the tools directory,
         all ManufacturingTool subclasses are discovered.
 
+        With a manifest, registration is a lookup that imports no tool
+        modules; if the manifest cannot be read, falls back to scanning.
+
         Returns:
             Number of tools discovered and registered
         """
+        with self._discover_lock:
+            return self._discover_tools()
+
+    def _discover_tools(self) -> int:
         if self._discovered:
             logger.debug("Tools already discovered, skipping scan")
             return len(self._tools)
 
+        if self.manifest_path is not None:
+            try:
+                return self._register_from_manifest()
+            except ToolManifestError as e:
+                logger.warning(f"{e}; scanning the tools directory instead")
+
         discovered_count = 0
 
         try:
@@ -105,6 +137,14 @@ class ToolRegistry:
 
         return discovered_count
 
+    def _register_from_manifest(self) -> int:
+        manifest = load_manifest(self.manifest_path)
+        for entry in manifest["tools"]:
+            self.register_tool(LazyTool.from_entry(entry))
+        self._discovered = True
+        logger.info(f"Tool discovery complete: {len(manifest['tools'])} tools registered from manifest")
+        return len(manifest["tools"])
+
     def register_tool(self, tool: ManufacturingTool) -> None:
         """
         Register a tool with the registry.
@@ -144,6 +184,24 @@ class ToolRegistry:
         self._ensure_discovered()
         return self._tools.get(name)
 
+    def load_tool(self, name: str) -> Optional[ManufacturingTool]:
+        """
+        Get the concrete tool instance, importing its module if needed.
+
+        Unlike get_tool, never returns a manifest LazyTool; use this when
+        calling tool-specific methods rather than running the tool.
+
+        Args:
+            name: Tool name to retrieve
+
+        Returns:
+            ManufacturingTool instance or None if not found
+        """
+        tool = self.get_tool(name)
+        if isinstance(tool, LazyTool):
+            return tool.load()
+        return tool
+
     def get_tools(self) -> List[ManufacturingTool]:
         """
         Get all registered tools.
@@ -220,7 +278,8 @@ def get_tool_registry() -> ToolRegistry:
     """
     global _registry
     if _registry is None:
-        _registry = ToolRegistry()
+        use_manifest = get_settings().agent_tool_manifest
+        _registry = ToolRegistry(manifest_path=TOOL_MANIFEST_PATH if use_manifest else None)
     return _registry
 
 
@@ -0,0 +1,323 @@
+"""
+Compact Tool Output Encoding
+
+Token-budgeted serialization of ToolResult payloads for the agent
+scratchpad. Full payloads (per-asset breakdowns, every citation, Decimal
+strings) are resent to the LLM on every agent iteration; this encoder
+keeps only what the model needs to answer:
+
+- Lists of records render as compact pipe-delimited tables
+- Identifiers, audit timestamps and raw series the model does not need
+  are dropped, as are empty values
+- Numerics (including Decimal strings) are rounded
+- Citations are reduced to their display text; full citation data stays
+  on the ToolResult, which the executor still reads for the response
+- Output is held to a per-tool token budget (tiktoken), trimming table
+  rows first and truncating as a last resort
+"""
+
+import json
+import logging
+import math
+import re
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.agents import AgentAction
+
+from app.core.config import get_settings
+from app.services.agent.base import ToolResult
+
+logger = logging.getLogger(__name__)
+
+# Keys never useful to the model
+_DROP_KEYS = frozenset({
+    "id",
+    "citations",
+    "created_at",
+    "updated_at",
+    "source_id",
+    "data_points",
+    "cache_key",
+    "cached_at",
+})
+
+_UUID_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
+)
+_LONG_DECIMAL_RE = re.compile(r"^-?\d+\.\d{3,}$")
+
+# Row limits tried, in order, when a rendering exceeds its budget
+_ROW_LIMITS = (20, 10, 5, 3, 1)
+
+# Maximum citation display texts kept inline
+_MAX_INLINE_CITATIONS = 5
+
+_DECIMALS = 2
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the cl100k_base encoding once; None if tiktoken is unavailable."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken unavailable, estimating tokens from length: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count tokens with tiktoken (cl100k_base).
+
+    Falls back to ~4 characters per token if the encoding cannot be loaded.
+    """
+    encoding = _get_encoding()
+    if encoding is None:
+        return math.ceil(len(text) / 4)
+    return len(encoding.encode(text))
+
+
+def _truncate_to_tokens(text: str, budget: int) -> str:
+    """Cut text to at most budget tokens."""
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[: budget * 4]
+    return encoding.decode(encoding.encode(text)[:budget])
+
+
+def _compact_scalar(value: Any) -> Any:
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, float):
+        rounded = round(value, _DECIMALS)
+        return int(rounded) if rounded.is_integer() else rounded
+    if isinstance(value, Decimal):
+        return _compact_scalar(float(value))
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, str) and _LONG_DECIMAL_RE.match(value):
+        try:
+            return _compact_scalar(float(Decimal(value)))
+        except InvalidOperation:
+            return value
+    return value
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def compact_value(value: Any) -> Any:
+    """
+    Drop unneeded fields and round numerics, recursively.
+
+    Args:
+        value: Tool output data (dicts, lists, scalars)
+
+    Returns:
+        Compacted copy
+    """
+    if isinstance(value, dict):
+        compacted = {}
+        for key, item in value.items():
+            key = str(key)
+            if key in _DROP_KEYS:
+                continue
+            if key.endswith("_id") and isinstance(item, str) and _UUID_RE.match(item):
+                continue
+            item = compact_value(item)
+            if not _is_empty(item):
+                compacted[key] = item
+        return compacted
+    if isinstance(value, (list, tuple)):
+        return [compact_value(item) for item in value if not _is_empty(item)]
+    return _compact_scalar(value)
+
+
+def _format_scalar(value: Any) -> str:
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"), default=str)
+    return str(value).replace("\n", " ")
+
+
+def _is_table(items: List[Any]) -> bool:
+    return len(items) >= 2 and all(isinstance(item, dict) for item in items)
+
+
+def _render_table(items: List[Dict[str, Any]], pad: str, max_rows: Optional[int]) -> List[str]:
+    columns: List[str] = []
+    for item in items:
+        for key in item:
+            if key not in columns:
+                columns.append(key)
+    shown = items if max_rows is None else items[:max_rows]
+    lines = [pad + "|".join(columns)]
+    for item in shown:
+        lines.append(pad + "|".join(_format_scalar(item.get(col, "")) for col in columns))
+    if len(shown) < len(items):
+        lines.append(f"{pad}... {len(items) - len(shown)} more rows")
+    return lines
+
+
+def _render(value: Any, indent: int, max_rows: Optional[int]) -> List[str]:
+    pad = "  " * indent
+    lines: List[str] = []
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, dict):
+                lines.append(f"{pad}{key}:")
+                lines.extend(_render(item, indent + 1, max_rows))
+            elif isinstance(item, list) and _is_table(item):
+                lines.append(f"{pad}{key} ({len(item)} rows):")
+                lines.extend(_render_table(item, pad + "  ", max_rows))
+            elif isinstance(item, list) and any(isinstance(i, (dict, list)) for i in item):
+                lines.append(f"{pad}{key}:")
+                lines.extend(_render(item, indent + 1, max_rows))
+            elif isinstance(item, list):
+                lines.append(f"{pad}{key}: {', '.join(_format_scalar(i) for i in item)}")
+            else:
+                lines.append(f"{pad}{key}: {_format_scalar(item)}")
+    elif isinstance(value, list):
+        if _is_table(value):
+            lines.extend(_render_table(value, pad, max_rows))
+        else:
+            shown = value if max_rows is None else value[:max_rows]
+            for item in shown:
+                if isinstance(item, (dict, list)):
+                    nested = _render(item, indent + 1, max_rows)
+                    if nested:
+                        lines.append(f"{pad}- {nested[0].strip()}")
+                        lines.extend(nested[1:])
+                else:
+                    lines.append(f"{pad}- {_format_scalar(item)}")
+            if len(shown) < len(value):
+                lines.append(f"{pad}... {len(value) - len(shown)} more items")
+    else:
+        lines.append(f"{pad}{_format_scalar(value)}")
+    return lines
+
+
+def _citation_line(result: ToolResult) -> str:
+    texts: List[str] = []
+    for citation in result.citations:
+        text = citation.to_display_text()
+        if text not in texts:
+            texts.append(text)
+    if not texts:
+        return ""
+    extra = len(texts) - _MAX_INLINE_CITATIONS
+    line = "Data sources: " + " ".join(texts[:_MAX_INLINE_CITATIONS])
+    if extra > 0:
+        line += f" (+{extra} more)"
+    return line
+
+
+def encode_tool_output(result: ToolResult, token_budget: Optional[int] = None) -> str:
+    """
+    Encode a ToolResult for the agent scratchpad within a token budget.
+
+    Args:
+        result: Tool result
+        token_budget: Maximum tokens (default: agent_tool_output_token_budget)
+
+    Returns:
+        Compact text representation
+    """
+    if not result.success:
+        return f"Error: {result.error_message}"
+
+    budget = token_budget or get_settings().agent_tool_output_token_budget
+    data = compact_value(result.data)
+    citation_line = _citation_line(result)
+    budget_for_data = max(1, budget - count_tokens(citation_line))
+
+    text = ""
+    for max_rows in (None,) + _ROW_LIMITS:
+        text = "\n".join(_render(data, 0, max_rows))
+        if count_tokens(text) <= budget_for_data:
+            break
+    else:
+        text = _truncate_to_tokens(text, budget_for_data) + "\n... [truncated]"
+
+    return f"{text}\n\n{citation_line}" if citation_line else text
+
+
+def encode_with_stats(result: ToolResult, token_budget: Optional[int] = None) -> Tuple[str, int, int]:
+    """
+    Encode a ToolResult once, remembering the encoding on the result.
+
+    The scratchpad is rebuilt on every agent iteration, so the encoding
+    and its token counts are memoized on the ToolResult.
+
+    Returns:
+        Tuple of (compact text, full tokens, compact tokens) where full
+        tokens measures to_agent_response()
+    """
+    cached = result._agent_encoding
+    if cached is None:
+        text = encode_tool_output(result, token_budget)
+        cached = (text, count_tokens(result.to_agent_response()), count_tokens(text))
+        result._agent_encoding = cached
+    return cached
+
+
+def compact_intermediate_steps(
+    steps: Sequence[Tuple[AgentAction, Any]],
+    budgets: Optional[Dict[str, Optional[int]]] = None,
+) -> List[Tuple[AgentAction, Any]]:
+    """
+    Replace ToolResult observations with their compact encoding.
+
+    Args:
+        steps: Agent (action, observation) pairs
+        budgets: Per-tool token budgets by tool name
+
+    Returns:
+        Steps with ToolResult observations encoded as strings
+    """
+    budgets = budgets or {}
+    compacted = []
+    for action, observation in steps:
+        if isinstance(observation, ToolResult):
+            observation = encode_with_stats(observation, budgets.get(action.tool))[0]
+        compacted.append((action, observation))
+    return compacted
+
+
+def tool_output_savings(
+    steps: Sequence[Tuple[Any, Any]],
+    budgets: Optional[Dict[str, Optional[int]]] = None,
+) -> Dict[str, int]:
+    """
+    Report prompt tokens saved by compact encoding over one agent turn.
+
+    Each step's output is resent with every later LLM call, so a step's
+    saving counts once per subsequent iteration.
+
+    Returns:
+        Dict with full_tokens, compact_tokens and prompt_tokens_saved
+    """
+    budgets = budgets or {}
+    outputs = full_total = compact_total = prompt_saved = 0
+    step_count = len(steps)
+    for position, (action, observation) in enumerate(steps):
+        if not isinstance(observation, ToolResult):
+            continue
+        _, full, compact = encode_with_stats(observation, budgets.get(getattr(action, "tool", None)))
+        outputs += 1
+        full_total += full
+        compact_total += compact
+        prompt_saved += (full - compact) * (step_count - position)
+    return {
+        "tool_outputs": outputs,
+        "full_tokens": full_total,
+        "compact_tokens": compact_total,
+        "prompt_tokens_saved": max(0, prompt_saved),
+    }
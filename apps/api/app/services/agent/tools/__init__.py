@@ -2,14 +2,15 @@
 Agent Tools Module (Story 5.1)
 
 This package contains all ManufacturingTool implementations.
-Tools are automatically discovered and registered with the agent
-on startup via the ToolRegistry.
+Tools are registered with the agent via the ToolRegistry from the
+generated manifest.json, which lets tool modules import lazily.
 
 To create a new tool:
 1. Create a new file in this directory (e.g., my_tool.py)
 2. Define a class extending ManufacturingTool
 3. Implement the async _arun() method
-4. The tool will be auto-discovered on next startup
+4. Regenerate the manifest: python -m app.services.agent.manifest
+   (a test fails while the manifest is out of date)
 
 Example:
     from app.services.agent.base import ManufacturingTool, ToolResult
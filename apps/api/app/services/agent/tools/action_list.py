@@ -97,7 +97,7 @@ class ActionListTool(ManufacturingTool):
     args_schema: Type[BaseModel] = ActionListInput
     citations_required: bool = True
 
-    @cached_tool(tier="daily")
+    @cached_tool(tier="daily", scope="global")
     async def _arun(
         self,
         area_filter: Optional[str] = None,
@@ -94,7 +94,7 @@ class AlertCheckTool(ManufacturingTool):
 
     # Story 5.8 / 7.4 AC#6: Apply caching with live tier (60 second TTL)
     # Alert data should be very fresh
-    @cached_tool(tier="live")
+    @cached_tool(tier="live", scope="global")
     async def _arun(
         self,
         severity_filter: Optional[str] = None,
@@ -111,7 +111,7 @@ class AssetLookupTool(ManufacturingTool):
 
     # Story 5.8: Apply caching with static tier (1 hour TTL)
     # Asset metadata changes rarely, so static tier is appropriate
-    @cached_tool(tier="static")
+    @cached_tool(tier="static", scope="global")
     async def _arun(
         self,
         asset_name: str,
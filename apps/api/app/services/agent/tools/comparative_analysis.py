@@ -104,7 +104,7 @@ class ComparativeAnalysisTool(ManufacturingTool):
     args_schema: Type[BaseModel] = ComparativeAnalysisInput
     citations_required: bool = True
 
-    @cached_tool(tier="daily")
+    @cached_tool(tier="daily", scope="global")
     async def _arun(
         self,
         subjects: List[str],
@@ -163,7 +163,7 @@ class CostOfLossTool(ManufacturingTool):
     citations_required: bool = True
 
     # Story 5.8 / 6.3 AC#6: Apply caching with daily tier (15-minute TTL)
-    @cached_tool(tier="daily")
+    @cached_tool(tier="daily", scope="global")
     async def _arun(
         self,
         time_range: str = "yesterday",
@@ -216,7 +216,7 @@ class DowntimeAnalysisTool(ManufacturingTool):
 
     # Story 5.8: Apply caching with daily tier (15 minute TTL)
     # Downtime data is T-1 (yesterday) based, so daily tier is appropriate
-    @cached_tool(tier="daily")
+    @cached_tool(tier="daily", scope="global")
     async def _arun(
         self,
         scope: str,
@@ -134,7 +134,7 @@ class FinancialImpactTool(ManufacturingTool):
     citations_required: bool = True
 
     # Story 5.8 / 6.2 AC#6: Apply caching with daily tier (15-minute TTL)
-    @cached_tool(tier="daily")
+    @cached_tool(tier="daily", scope="global")
     async def _arun(
         self,
         time_range: str = "yesterday",
@@ -182,7 +182,7 @@ class OEEQueryTool(ManufacturingTool):
 
     # Story 5.8: Apply caching with daily tier (15 minute TTL)
     # OEE data is T-1 (yesterday) based, so daily tier is appropriate
-    @cached_tool(tier="daily")
+    @cached_tool(tier="daily", scope="global")
     async def _arun(
         self,
         scope: str,
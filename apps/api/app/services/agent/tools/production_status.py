@@ -174,7 +174,7 @@ class ProductionStatusTool(ManufacturingTool):
 
     # Story 5.8: Apply caching with live tier (60 second TTL)
     # Production status is real-time data, so live tier is appropriate
-    @cached_tool(tier="live")
+    @cached_tool(tier="live", scope="global")
     async def _arun(
         self,
         area: Optional[str] = None,
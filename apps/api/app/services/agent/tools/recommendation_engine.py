@@ -118,7 +118,7 @@ class RecommendationEngineTool(ManufacturingTool):
         """Get the current user ID from context."""
         return get_current_user_id()
 
-    @cached_tool(tier="daily")  # AC#6: 15-minute cache (daily tier = 900s)
+    @cached_tool(tier="daily", scope="user")  # AC#6: 15-minute cache; uses per-user memories
     async def _arun(
         self,
         subject: str,
@@ -96,7 +96,7 @@ class SafetyEventsTool(ManufacturingTool):
 
     # Story 5.8 / 6.1 AC#6: Apply caching with live tier (60 second TTL)
     # Safety data should be fresh
-    @cached_tool(tier="live")
+    @cached_tool(tier="live", scope="global")
     async def _arun(
         self,
         time_range: str = "today",
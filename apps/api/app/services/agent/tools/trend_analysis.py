@@ -98,7 +98,7 @@ class TrendAnalysisTool(ManufacturingTool):
     citations_required: bool = True
 
     # Story 5.8 / 6.4 AC#7: Apply caching with daily tier (15 minute TTL)
-    @cached_tool(tier="daily")
+    @cached_tool(tier="daily", scope="global")
     async def _arun(
         self,
         asset_id: Optional[str] = None,
@@ -0,0 +1,511 @@
+"""
+Agent Turn Tracing
+
+Lightweight span tracing for agent turns, so a slow chat answer can be
+attributed to the LLM, a specific tool, the cache or the database.
+
+- start_trace() opens the root span for an agent turn
+- span() / @traced open nested spans under the current span (contextvar)
+- Outside a trace, span() is a no-op, so instrumented code such as the
+  data source costs nothing when called from pipelines
+- Sampled traces (tracing_sample_rate) are kept in an in-memory ring buffer
+  for the admin endpoint and optionally exported to an OTLP/HTTP collector
+
+Span kinds: agent, llm, tool, cache, data_source, db, internal
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import logging
+import random
+import secrets
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Union
+from uuid import UUID
+
+import httpx
+from langchain_core.callbacks import AsyncCallbackHandler
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace."""
+
+    name: str
+    kind: str
+    trace_id: str
+    span_id: str = field(default_factory=lambda: secrets.token_hex(8))
+    parent_id: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    start_time_ns: int = field(default_factory=time.time_ns)
+    duration_ms: Optional[float] = None
+    status: str = "ok"
+    error: Optional[str] = None
+    children: List["Span"] = field(default_factory=list)
+    _start: float = field(default_factory=time.perf_counter, repr=False)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, error: Union[BaseException, str]) -> None:
+        self.status = "error"
+        self.error = str(error) or type(error).__name__
+
+    def end(self) -> None:
+        if self.duration_ms is None:
+            self.duration_ms = round((time.perf_counter() - self._start) * 1000, 2)
+
+    def iter_spans(self) -> Iterator["Span"]:
+        """Yield this span and all descendants, depth first."""
+        yield self
+        for child in self.children:
+            yield from child.iter_spans()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "span_id": self.span_id,
+            "start_time": datetime.fromtimestamp(
+                self.start_time_ns / 1e9, tz=timezone.utc
+            ).isoformat(),
+            "duration_ms": self.duration_ms,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+class _NoopSpan:
+    """Stand-in returned when no trace is active."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_error(self, error: Union[BaseException, str]) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+@dataclass
+class Trace:
+    """A completed (or in-progress) agent turn trace."""
+
+    root: Span
+    sampled: bool = False
+
+    @property
+    def trace_id(self) -> str:
+        return self.root.trace_id
+
+    def summary(self) -> Dict[str, Any]:
+        spans = list(self.root.iter_spans())
+        time_by_kind: Dict[str, float] = {}
+        _accumulate_time(self.root, frozenset(), time_by_kind)
+        return {
+            "trace_id": self.trace_id,
+            "name": self.root.name,
+            "start_time": datetime.fromtimestamp(
+                self.root.start_time_ns / 1e9, tz=timezone.utc
+            ).isoformat(),
+            "duration_ms": self.root.duration_ms,
+            "status": self.root.status,
+            "span_count": len(spans),
+            "time_by_kind_ms": time_by_kind,
+            "attributes": self.root.attributes,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**self.summary(), "root": self.root.to_dict()}
+
+
+def _accumulate_time(span: Span, outer_kinds: frozenset, totals: Dict[str, float]) -> None:
+    """Sum span time per kind, skipping spans nested in a span of the same kind."""
+    for child in span.children:
+        if child.kind not in outer_kinds and child.duration_ms is not None:
+            totals[child.kind] = round(totals.get(child.kind, 0.0) + child.duration_ms, 2)
+        _accumulate_time(child, outer_kinds | {child.kind}, totals)
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "trace_span", default=None
+)
+
+
+def get_current_span() -> Optional[Span]:
+    """Get the active span, or None outside a trace."""
+    return _current_span.get()
+
+
+def start_span(
+    name: str,
+    kind: str = "internal",
+    parent: Optional[Span] = None,
+    **attributes: Any,
+) -> Union[Span, _NoopSpan]:
+    """
+    Start a span without making it current; the caller must end() it.
+
+    Used where start and end happen in different callbacks (LLM calls).
+
+    Args:
+        name: Span name
+        kind: Span kind
+        parent: Parent span (default: the current span)
+        **attributes: Initial span attributes
+
+    Returns:
+        The new Span, or NOOP_SPAN if no trace is active
+    """
+    parent = parent or _current_span.get()
+    if parent is None:
+        return NOOP_SPAN
+    span = Span(
+        name=name,
+        kind=kind,
+        trace_id=parent.trace_id,
+        parent_id=parent.span_id,
+        attributes=dict(attributes),
+    )
+    parent.children.append(span)
+    return span
+
+
+@contextmanager
+def span(name: str, kind: str = "internal", **attributes: Any) -> Iterator[Union[Span, _NoopSpan]]:
+    """
+    Open a nested span under the current span for the duration of a block.
+
+    Exceptions raised in the block mark the span as failed and propagate.
+    """
+    current = start_span(name, kind, **attributes)
+    if current is NOOP_SPAN:
+        yield current
+        return
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.set_error(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        current.end()
+
+
+def traced(name: Optional[str] = None, kind: str = "internal") -> Callable:
+    """
+    Decorator wrapping an async function in a span.
+
+    Args:
+        name: Span name (default: the function's qualified name)
+        kind: Span kind
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return await func(*args, **kwargs)
+            with span(span_name, kind):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def trace_methods(kind: str, prefix: Optional[str] = None) -> Callable[[type], type]:
+    """
+    Class decorator tracing every public async method defined on the class.
+
+    Args:
+        kind: Span kind for the methods
+        prefix: Span name prefix (default: the class name)
+    """
+
+    def decorator(cls: type) -> type:
+        span_prefix = prefix or cls.__name__
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or not inspect.iscoroutinefunction(value):
+                continue
+            setattr(cls, attr, traced(f"{span_prefix}.{attr}", kind)(value))
+        return cls
+
+    return decorator
+
+
+@contextmanager
+def start_trace(name: str, **attributes: Any) -> Iterator[Optional[Trace]]:
+    """
+    Open the root span of a trace for the duration of a block.
+
+    On exit the trace is sampled into the ring buffer and, if an OTLP
+    endpoint is configured, exported in the background.
+
+    Yields:
+        The Trace, or None if tracing is disabled
+    """
+    settings = get_settings()
+    if not settings.tracing_enabled:
+        yield None
+        return
+
+    root = Span(name=name, kind="agent", trace_id=uuid.uuid4().hex, attributes=dict(attributes))
+    trace = Trace(root=root, sampled=random.random() < settings.tracing_sample_rate)
+    token = _current_span.set(root)
+    try:
+        yield trace
+    except BaseException as e:
+        root.set_error(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        root.end()
+        if trace.sampled:
+            get_trace_buffer().add(trace)
+            _schedule_export(trace)
+
+
+class TraceBuffer:
+    """Ring buffer of recently sampled traces."""
+
+    def __init__(self, maxsize: int):
+        self._traces: Deque[Trace] = deque(maxlen=max(1, maxsize))
+
+    def add(self, trace: Trace) -> None:
+        self._traces.append(trace)
+
+    def list(self, limit: int = 50) -> List[Trace]:
+        """Most recent traces first."""
+        return list(reversed(self._traces))[:limit]
+
+    def get(self, trace_id: str) -> Optional[Trace]:
+        for trace in self._traces:
+            if trace.trace_id == trace_id:
+                return trace
+        return None
+
+    def __len__(self) -> int:
+        return len(self._traces)
+
+
+# =============================================================================
+# LangChain callbacks (LLM calls per agent iteration)
+# =============================================================================
+
+
+class AgentTraceCallbackHandler(AsyncCallbackHandler):
+    """
+    Records each LLM call of an agent run as an "llm" span.
+
+    LangChain reports start and end through separate callbacks, so spans
+    are started explicitly under the turn's root span and matched by run_id.
+    Each LLM call is one agent iteration.
+    """
+
+    def __init__(self, parent: Span):
+        self._parent = parent
+        self._spans: Dict[UUID, Span] = {}
+        self.iterations = 0
+
+    def _start(self, run_id: UUID, serialized: Optional[Dict[str, Any]], **kwargs: Any) -> None:
+        self.iterations += 1
+        params = kwargs.get("invocation_params") or {}
+        model = params.get("model") or params.get("model_name")
+        self._spans[run_id] = start_span(
+            "llm.call", "llm", parent=self._parent,
+            iteration=self.iterations, model=model,
+        )
+
+    async def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs) -> None:
+        self._start(run_id, serialized, **kwargs)
+
+    async def on_llm_start(self, serialized, prompts, *, run_id, **kwargs) -> None:
+        self._start(run_id, serialized, **kwargs)
+
+    async def on_llm_end(self, response, *, run_id, **kwargs) -> None:
+        llm_span = self._spans.pop(run_id, None)
+        if llm_span is None:
+            return
+        usage = (getattr(response, "llm_output", None) or {}).get("token_usage") or {}
+        for key in ("prompt_tokens", "completion_tokens", "total_tokens"):
+            if key in usage:
+                llm_span.set_attribute(key, usage[key])
+        llm_span.end()
+
+    async def on_llm_error(self, error, *, run_id, **kwargs) -> None:
+        llm_span = self._spans.pop(run_id, None)
+        if llm_span is None:
+            return
+        llm_span.set_error(error)
+        llm_span.end()
+
+
+# =============================================================================
+# OTLP export
+# =============================================================================
+
+
+# OTLP span kinds: INTERNAL=1, CLIENT=3
+_OTLP_CLIENT_KINDS = {"llm", "db"}
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {"key": key, "value": _otlp_value(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+class OTLPExporter:
+    """Exports traces to an OTLP/HTTP collector using the JSON encoding."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str,
+        timeout: float = 2.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Args:
+            endpoint: Collector base URL (spans are POSTed to /v1/traces)
+            service_name: Value of the service.name resource attribute
+            timeout: Request timeout in seconds
+            transport: Optional httpx transport (for testing)
+        """
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.service_name = service_name
+        self.timeout = timeout
+        self._transport = transport
+
+    def encode(self, traces: List[Trace]) -> Dict[str, Any]:
+        """Build an ExportTraceServiceRequest payload."""
+        spans = []
+        for trace in traces:
+            for span in trace.root.iter_spans():
+                start_ns = span.start_time_ns
+                end_ns = start_ns + int((span.duration_ms or 0) * 1e6)
+                otlp_span = {
+                    "traceId": span.trace_id,
+                    "spanId": span.span_id,
+                    "name": span.name,
+                    "kind": 3 if span.kind in _OTLP_CLIENT_KINDS else 1,
+                    "startTimeUnixNano": str(start_ns),
+                    "endTimeUnixNano": str(end_ns),
+                    "attributes": _otlp_attributes({"span.kind": span.kind, **span.attributes}),
+                    "status": {"code": 2, "message": span.error or ""}
+                    if span.status == "error" else {"code": 1},
+                }
+                if span.parent_id:
+                    otlp_span["parentSpanId"] = span.parent_id
+                spans.append(otlp_span)
+        return {
+            "resourceSpans": [{
+                "resource": {
+                    "attributes": _otlp_attributes({"service.name": self.service_name}),
+                },
+                "scopeSpans": [{
+                    "scope": {"name": "app.services.agent.tracing"},
+                    "spans": spans,
+                }],
+            }]
+        }
+
+    async def export(self, traces: List[Trace]) -> bool:
+        """
+        POST traces to the collector.
+
+        Returns:
+            True if the collector accepted them; failures are logged, not raised
+        """
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout, transport=self._transport) as client:
+                response = await client.post(self.url, json=self.encode(traces))
+                response.raise_for_status()
+            return True
+        except Exception as e:
+            logger.warning(f"OTLP trace export to {self.url} failed: {e}")
+            return False
+
+
+# Background export tasks (referenced so they are not garbage collected)
+_export_tasks: set = set()
+
+
+def _schedule_export(trace: Trace) -> None:
+    exporter = get_trace_exporter()
+    if exporter is None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(exporter.export([trace]))
+    _export_tasks.add(task)
+    task.add_done_callback(_export_tasks.discard)
+
+
+# Module-level singletons
+_trace_buffer: Optional[TraceBuffer] = None
+_trace_exporter: Optional[OTLPExporter] = None
+
+
+def get_trace_buffer() -> TraceBuffer:
+    """Get the singleton TraceBuffer instance."""
+    global _trace_buffer
+    if _trace_buffer is None:
+        _trace_buffer = TraceBuffer(get_settings().tracing_buffer_size)
+    return _trace_buffer
+
+
+def get_trace_exporter() -> Optional[OTLPExporter]:
+    """Get the OTLP exporter, or None if no endpoint is configured."""
+    global _trace_exporter
+    settings = get_settings()
+    if not settings.tracing_otlp_endpoint:
+        return None
+    if _trace_exporter is None:
+        _trace_exporter = OTLPExporter(
+            settings.tracing_otlp_endpoint,
+            service_name=settings.tracing_service_name,
+        )
+    return _trace_exporter
+
+
+def reset_tracing() -> None:
+    """Reset the trace buffer and exporter (primarily for testing)."""
+    global _trace_buffer, _trace_exporter
+    _trace_buffer = None
+    _trace_exporter = None
@@ -0,0 +1,350 @@
+"""
+LLM Admission Control
+
+A global scheduler for LLM provider calls, so burst traffic (e.g. at
+shift change) queues inside the API instead of turning into provider
+429s and cascading timeouts:
+
+- Concurrency is bounded per provider (LLM_MAX_CONCURRENCY in-flight calls)
+- Waiting calls are served by priority: interactive work (agent chat,
+  chat queries and the grounding they trigger) before batch work
+  (briefings, summaries, handoff synthesis, background history summaries)
+- Calls beyond the queue-depth limit, or that wait longer than
+  LLM_MAX_QUEUE_WAIT_SECONDS, are shed at once with LLMOverloaded, which
+  the API maps to 503 with Retry-After; batch work has a shallower queue
+  so it is shed first
+- Queue wait is accumulated per request (llm_request_context) and reported
+  in response metadata
+
+Priority comes from the request context: endpoints serving a user set
+INTERACTIVE; anything else (scheduled jobs, background tasks) is BATCH.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from app.core.config import get_settings
+from app.services.ai.llm_client import LLMClientError
+
+logger = logging.getLogger(__name__)
+
+
+class LLMPriority(IntEnum):
+    """Scheduling priority; lower values are served first."""
+
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+class LLMOverloaded(LLMClientError):
+    """Raised when an LLM call is shed instead of queued."""
+
+    def __init__(self, message: str, retry_after: int, provider: str):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.provider = provider
+
+
+def provider_name(client: Any) -> str:
+    """Provider a chat model talks to (e.g. "openai" for langchain_openai)."""
+    package = type(client).__module__.split(".", 1)[0]
+    if package.startswith("langchain_") and package != "langchain_core":
+        return package[len("langchain_"):]
+    return "default"
+
+
+@dataclass
+class LLMRequestStats:
+    """LLM queueing observed while serving one request."""
+
+    priority: LLMPriority
+    queue_wait_ms: float = 0.0
+    admissions: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "priority": self.priority.name.lower(),
+            "queue_wait_ms": round(self.queue_wait_ms, 2),
+            "admissions": self.admissions,
+        }
+
+
+_request_stats: ContextVar[Optional[LLMRequestStats]] = ContextVar("llm_request_stats", default=None)
+
+
+@contextmanager
+def llm_request_context(priority: LLMPriority) -> Iterator[LLMRequestStats]:
+    """
+    Set the LLM priority for work done while serving a request.
+
+    Yields:
+        LLMRequestStats accumulating queue wait for the request's LLM calls
+    """
+    stats = LLMRequestStats(priority=priority)
+    token = _request_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _request_stats.reset(token)
+
+
+def current_llm_priority() -> LLMPriority:
+    """Priority of the current request, or BATCH outside a request context."""
+    stats = _request_stats.get()
+    return stats.priority if stats is not None else LLMPriority.BATCH
+
+
+class ProviderQueue:
+    """Bounded concurrency with a priority queue for one provider."""
+
+    def __init__(
+        self,
+        provider: str,
+        max_concurrency: int,
+        max_queue_depth: int,
+        batch_queue_depth: int,
+        max_queue_wait: float,
+    ):
+        self.provider = provider
+        self.max_concurrency = max_concurrency
+        self.max_queue_depth = max_queue_depth
+        self.batch_queue_depth = batch_queue_depth
+        self.max_queue_wait = max_queue_wait
+        self.active = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._avg_hold_seconds = 1.0
+        self.counters = {"admitted": 0, "shed": 0, "wait_timeouts": 0}
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    def queued_by_priority(self) -> Dict[str, int]:
+        counts = {priority.name.lower(): 0 for priority in LLMPriority}
+        for priority, _, waiter in self._waiters:
+            if not waiter.done():
+                counts[LLMPriority(priority).name.lower()] += 1
+        return counts
+
+    def retry_after(self) -> int:
+        """Seconds until a shed caller is likely to be admitted."""
+        rounds = (self.queued + self.active) / max(1, self.max_concurrency)
+        return max(1, math.ceil(rounds * self._avg_hold_seconds))
+
+    def try_acquire(self) -> bool:
+        """Take a slot only if one is free and nobody is waiting."""
+        if self.active < self.max_concurrency and not self.queued:
+            self.active += 1
+            return True
+        return False
+
+    def _shed(self, reason: str) -> LLMOverloaded:
+        self.counters["shed"] += 1
+        retry_after = self.retry_after()
+        return LLMOverloaded(
+            f"LLM provider '{self.provider}' is {reason}; retry in {retry_after}s",
+            retry_after=retry_after,
+            provider=self.provider,
+        )
+
+    async def acquire(self, priority: LLMPriority) -> float:
+        """
+        Wait for a slot.
+
+        Returns:
+            Seconds spent queued
+
+        Raises:
+            LLMOverloaded: If the queue is full or the wait limit passes
+        """
+        if self.try_acquire():
+            self.counters["admitted"] += 1
+            return 0.0
+
+        depth = self.max_queue_depth if priority == LLMPriority.INTERACTIVE else self.batch_queue_depth
+        if self.queued >= depth:
+            raise self._shed("at capacity")
+
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), waiter))
+        start = loop.time()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=self.max_queue_wait)
+        except asyncio.TimeoutError:
+            if not self._abandon(waiter):
+                self.counters["admitted"] += 1
+                return loop.time() - start
+            self.counters["wait_timeouts"] += 1
+            raise self._shed("saturated")
+        except asyncio.CancelledError:
+            if not self._abandon(waiter):
+                self.release()
+            raise
+        self.counters["admitted"] += 1
+        return loop.time() - start
+
+    def _abandon(self, waiter: asyncio.Future) -> bool:
+        """Withdraw a waiter; False if it had already been granted a slot."""
+        if waiter.done():
+            return waiter.cancelled()
+        waiter.cancel()
+        return True
+
+    def release(self, held_seconds: Optional[float] = None) -> None:
+        """Free a slot, handing it to the highest-priority waiter."""
+        if held_seconds is not None:
+            self._avg_hold_seconds = 0.8 * self._avg_hold_seconds + 0.2 * held_seconds
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "active": self.active,
+            "max_concurrency": self.max_concurrency,
+            "queued": self.queued_by_priority(),
+            "avg_hold_ms": round(self._avg_hold_seconds * 1000, 2),
+            **self.counters,
+        }
+
+
+class LLMAdmissionController:
+    """
+    Admits LLM calls per provider.
+
+    Usage:
+        async with get_llm_admission().admit("briefing.narrative", provider_name(llm)):
+            response = await llm.ainvoke(messages)
+    """
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        max_concurrency: Optional[int] = None,
+        max_queue_depth: Optional[int] = None,
+        batch_queue_depth: Optional[int] = None,
+        max_queue_wait: Optional[float] = None,
+    ):
+        settings = get_settings()
+        self.enabled = settings.llm_admission_enabled if enabled is None else enabled
+        self.max_concurrency = max_concurrency or settings.llm_max_concurrency
+        self.max_queue_depth = max_queue_depth or settings.llm_max_queue_depth
+        self.batch_queue_depth = batch_queue_depth or settings.llm_batch_queue_depth
+        self.max_queue_wait = max_queue_wait or settings.llm_max_queue_wait_seconds
+        self._queues: Dict[str, ProviderQueue] = {}
+        self._by_caller: Dict[str, Dict[str, float]] = {}
+
+    def queue(self, provider: str) -> ProviderQueue:
+        if provider not in self._queues:
+            self._queues[provider] = ProviderQueue(
+                provider,
+                self.max_concurrency,
+                self.max_queue_depth,
+                self.batch_queue_depth,
+                self.max_queue_wait,
+            )
+        return self._queues[provider]
+
+    def _caller_stats(self, caller: str) -> Dict[str, float]:
+        if caller not in self._by_caller:
+            self._by_caller[caller] = {"admitted": 0, "shed": 0, "queue_wait_ms": 0.0}
+        return self._by_caller[caller]
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        caller: str,
+        provider: str = "default",
+        priority: Optional[LLMPriority] = None,
+    ) -> AsyncIterator[float]:
+        """
+        Hold a provider slot for the duration of an LLM call.
+
+        Args:
+            caller: Name used for per-caller statistics
+            provider: Provider queue to use (see provider_name)
+            priority: Override the request context's priority
+
+        Yields:
+            Seconds the call spent queued
+
+        Raises:
+            LLMOverloaded: If the call is shed
+        """
+        if not self.enabled:
+            yield 0.0
+            return
+
+        priority = current_llm_priority() if priority is None else priority
+        queue = self.queue(provider)
+        caller_stats = self._caller_stats(caller)
+        try:
+            waited = await queue.acquire(priority)
+        except LLMOverloaded:
+            caller_stats["shed"] += 1
+            logger.warning(f"Shed {priority.name.lower()} LLM call from {caller} ({provider})")
+            raise
+
+        caller_stats["admitted"] += 1
+        caller_stats["queue_wait_ms"] += waited * 1000
+        request_stats = _request_stats.get()
+        if request_stats is not None:
+            request_stats.queue_wait_ms += waited * 1000
+            request_stats.admissions += 1
+
+        start = time.monotonic()
+        try:
+            yield waited
+        finally:
+            queue.release(time.monotonic() - start)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "providers": {name: queue.get_stats() for name, queue in self._queues.items()},
+            "by_caller": {
+                caller: {**stats, "queue_wait_ms": round(stats["queue_wait_ms"], 2)}
+                for caller, stats in self._by_caller.items()
+            },
+        }
+
+
+# Module-level singleton
+_llm_admission: Optional[LLMAdmissionController] = None
+
+
+def get_llm_admission() -> LLMAdmissionController:
+    """
+    Get the singleton LLMAdmissionController instance.
+
+    Returns:
+        LLMAdmissionController instance
+    """
+    global _llm_admission
+    if _llm_admission is None:
+        _llm_admission = LLMAdmissionController()
+    return _llm_admission
+
+
+def reset_llm_admission() -> None:
+    """
+    Reset the singleton admission controller.
+
+    Primarily used for testing.
+    """
+    global _llm_admission
+    _llm_admission = None
@@ -0,0 +1,336 @@
+"""
+Deadline-Aware LLM Invocation
+
+Wraps chat model calls with a per-call deadline instead of relying on the
+client's single static timeout:
+
+- Hedging: if the primary call has not answered after the model's
+  observed p95 latency, a second identical request is fired; the first
+  answer wins and the loser is cancelled
+- Fallback: when the deadline approaches (LLM_FALLBACK_RESERVE_SECONDS
+  before it) a request to the faster LLM_FALLBACK_MODEL is started; it is
+  also started immediately if every in-flight request has failed
+- Deadline: when it passes, all in-flight requests are cancelled and
+  LLMDeadlineExceeded is raised so callers can use their template fallback
+- Latency percentiles and hedge/fallback outcomes are recorded per model
+- Hedges are opportunistic: one is only fired if admission control (see
+  admission.py) has a free provider slot, so hedging never adds load
+  while calls are queueing
+
+Any object with an async ainvoke(messages) works as a model, so tests use
+a local fake chat model.
+"""
+
+import asyncio
+import logging
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+from app.services.ai.admission import get_llm_admission, provider_name
+from app.services.ai.llm_client import (
+    LLMClientError,
+    LLMConfig,
+    get_llm_client,
+    get_llm_config,
+)
+
+logger = logging.getLogger(__name__)
+
+# Latency samples kept per model
+LATENCY_WINDOW = 200
+
+# Samples required before the observed percentile drives the hedge delay
+MIN_HEDGE_SAMPLES = 20
+
+
+class LLMDeadlineExceeded(LLMClientError):
+    """Raised when no LLM response arrives before the call's deadline."""
+    pass
+
+
+def model_name(client: Any) -> str:
+    """Best-effort model identifier for a chat model."""
+    name = getattr(client, "model_name", None) or getattr(client, "model", None)
+    return name if isinstance(name, str) else type(client).__name__
+
+
+class LLMLatencyTracker:
+    """
+    Rolling per-model latency samples and invocation outcome counters.
+
+    Only successful responses are sampled; cancelled hedge losers are not,
+    so percentiles describe the latency actually served.
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def _model_counters(self, model: str) -> Dict[str, int]:
+        if model not in self._counters:
+            self._counters[model] = {
+                "calls": 0,
+                "errors": 0,
+                "hedges_fired": 0,
+                "hedges_skipped": 0,
+                "hedge_wins": 0,
+                "fallbacks_fired": 0,
+                "fallback_wins": 0,
+                "deadline_exceeded": 0,
+            }
+        return self._counters[model]
+
+    def record_latency(self, model: str, latency_ms: float) -> None:
+        if model not in self._samples:
+            self._samples[model] = deque(maxlen=self.window)
+        self._samples[model].append(latency_ms)
+
+    def increment(self, model: str, counter: str) -> None:
+        self._model_counters(model)[counter] += 1
+
+    def sample_count(self, model: str) -> int:
+        return len(self._samples.get(model, ()))
+
+    def percentile(self, model: str, p: float) -> Optional[float]:
+        """Get the p-th latency percentile in ms (nearest rank), or None."""
+        samples = self._samples.get(model)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        rank = max(1, math.ceil(p / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-model latency percentiles and outcome counters."""
+        stats = {}
+        for model in set(self._samples) | set(self._counters):
+            stats[model] = {
+                **self._model_counters(model),
+                "samples": self.sample_count(model),
+                "p50_ms": self.percentile(model, 50),
+                "p95_ms": self.percentile(model, 95),
+                "p99_ms": self.percentile(model, 99),
+            }
+        return stats
+
+    def reset(self) -> None:
+        self._samples.clear()
+        self._counters.clear()
+
+
+@dataclass
+class _Attempt:
+    role: str  # "primary", "hedge" or "fallback"
+    model: str
+    started_at: float
+
+
+class HedgedLLMInvoker:
+    """
+    Invoke a chat model with hedging, fallback and a hard deadline.
+
+    Usage:
+        invoker = get_llm_invoker()
+        response = await invoker.ainvoke(messages, deadline=7.0)
+    """
+
+    def __init__(
+        self,
+        primary: Any,
+        fallback: Optional[Any] = None,
+        tracker: Optional[LLMLatencyTracker] = None,
+        default_deadline: float = 30.0,
+        hedge_enabled: bool = True,
+        hedge_percentile: float = 95.0,
+        hedge_default_delay_ms: int = 3000,
+        hedge_min_delay_ms: int = 250,
+        fallback_reserve_seconds: float = 2.0,
+    ):
+        self.primary = primary
+        self.fallback = fallback
+        self.tracker = tracker or get_llm_latency_tracker()
+        self.default_deadline = default_deadline
+        self.hedge_enabled = hedge_enabled
+        self.hedge_percentile = hedge_percentile
+        self.hedge_default_delay_ms = hedge_default_delay_ms
+        self.hedge_min_delay_ms = hedge_min_delay_ms
+        self.fallback_reserve_seconds = fallback_reserve_seconds
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait before hedging the primary request."""
+        model = model_name(self.primary)
+        delay_ms = self.hedge_default_delay_ms
+        if self.tracker.sample_count(model) >= MIN_HEDGE_SAMPLES:
+            delay_ms = self.tracker.percentile(model, self.hedge_percentile)
+        return max(delay_ms, self.hedge_min_delay_ms) / 1000
+
+    async def ainvoke(self, messages: List[Any], deadline: Optional[float] = None) -> Any:
+        """
+        Invoke the model, returning the first successful response.
+
+        Args:
+            messages: Prompt messages passed to ainvoke()
+            deadline: Seconds allowed for the call (default: client timeout)
+
+        Returns:
+            The winning response; AIMessage responses carry
+            response_metadata["llm_invocation"] with the winning model and role
+
+        Raises:
+            LLMDeadlineExceeded: If nothing answered in time
+            Exception: The last error if every request failed
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        deadline_at = start + (deadline if deadline is not None else self.default_deadline)
+        hedge_at = start + self.hedge_delay() if self.hedge_enabled else None
+        fallback_at = None
+        if self.fallback is not None:
+            fallback_at = max(start, deadline_at - self.fallback_reserve_seconds)
+
+        tasks: Dict[asyncio.Task, _Attempt] = {}
+        last_error: Optional[BaseException] = None
+
+        def launch(role: str, client: Any) -> None:
+            model = model_name(client)
+            slot = None
+            if role == "hedge":
+                admission = get_llm_admission()
+                slot = admission.queue(provider_name(client)) if admission.enabled else None
+                if slot is not None and not slot.try_acquire():
+                    self.tracker.increment(model, "hedges_skipped")
+                    return
+                self.tracker.increment(model, "hedges_fired")
+            elif role == "fallback":
+                self.tracker.increment(model, "fallbacks_fired")
+            self.tracker.increment(model, "calls")
+            task = loop.create_task(client.ainvoke(messages))
+            if slot is not None:
+                task.add_done_callback(lambda _: slot.release())
+            tasks[task] = _Attempt(role=role, model=model, started_at=loop.time())
+
+        launch("primary", self.primary)
+        try:
+            while True:
+                now = loop.time()
+                if hedge_at is not None and now >= hedge_at:
+                    hedge_at = None
+                    if now < (fallback_at or deadline_at):
+                        launch("hedge", self.primary)
+                if fallback_at is not None and now >= fallback_at:
+                    fallback_at = None
+                    launch("fallback", self.fallback)
+
+                if not tasks:
+                    if fallback_at is not None:
+                        # Everything failed early; don't wait for the reserve
+                        fallback_at = now
+                        continue
+                    raise last_error
+
+                if now >= deadline_at:
+                    self.tracker.increment(model_name(self.primary), "deadline_exceeded")
+                    raise LLMDeadlineExceeded(
+                        f"No LLM response within {deadline_at - start:.1f}s"
+                    )
+
+                next_event = min(t for t in (hedge_at, fallback_at, deadline_at) if t is not None)
+                done, _ = await asyncio.wait(
+                    set(tasks), timeout=next_event - now, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    attempt = tasks.pop(task)
+                    if task.cancelled():
+                        continue
+                    error = task.exception()
+                    if error is not None:
+                        last_error = error
+                        self.tracker.increment(attempt.model, "errors")
+                        logger.warning(f"LLM {attempt.role} request to {attempt.model} failed: {error}")
+                        continue
+                    return self._finish(task.result(), attempt, loop.time())
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _finish(self, response: Any, attempt: _Attempt, finished_at: float) -> Any:
+        latency_ms = (finished_at - attempt.started_at) * 1000
+        self.tracker.record_latency(attempt.model, latency_ms)
+        if attempt.role == "hedge":
+            self.tracker.increment(attempt.model, "hedge_wins")
+        elif attempt.role == "fallback":
+            self.tracker.increment(attempt.model, "fallback_wins")
+        metadata = getattr(response, "response_metadata", None)
+        if isinstance(metadata, dict):
+            metadata["llm_invocation"] = {
+                "model": attempt.model,
+                "role": attempt.role,
+                "latency_ms": round(latency_ms, 2),
+            }
+        return response
+
+
+# Module-level singleton tracker
+_latency_tracker: Optional[LLMLatencyTracker] = None
+
+
+def get_llm_latency_tracker() -> LLMLatencyTracker:
+    """
+    Get the singleton LLMLatencyTracker instance.
+
+    Returns:
+        LLMLatencyTracker instance
+    """
+    global _latency_tracker
+    if _latency_tracker is None:
+        _latency_tracker = LLMLatencyTracker()
+    return _latency_tracker
+
+
+def reset_llm_latency_tracker() -> None:
+    """
+    Reset the singleton latency tracker.
+
+    Primarily used for testing.
+    """
+    global _latency_tracker
+    _latency_tracker = None
+
+
+def get_llm_invoker(
+    primary: Optional[Any] = None,
+    config: Optional[LLMConfig] = None,
+) -> HedgedLLMInvoker:
+    """
+    Build a HedgedLLMInvoker from LLM configuration.
+
+    Args:
+        primary: Chat model to use (default: get_llm_client(config))
+        config: Optional config override. Uses environment if not provided.
+
+    Returns:
+        HedgedLLMInvoker with the configured fallback model, if any
+    """
+    config = config or get_llm_config()
+    primary = primary or get_llm_client(config)
+
+    fallback = None
+    if config.fallback_model and config.fallback_model != model_name(primary):
+        try:
+            fallback = get_llm_client(config, model=config.fallback_model)
+        except LLMClientError as e:
+            logger.warning(f"LLM fallback model unavailable: {e}")
+
+    return HedgedLLMInvoker(
+        primary=primary,
+        fallback=fallback,
+        default_deadline=float(config.timeout_seconds),
+        hedge_enabled=config.hedge_enabled,
+        hedge_percentile=config.hedge_percentile,
+        hedge_default_delay_ms=config.hedge_default_delay_ms,
+        hedge_min_delay_ms=config.hedge_min_delay_ms,
+        fallback_reserve_seconds=config.fallback_reserve_seconds,
+    )
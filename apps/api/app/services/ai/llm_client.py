@@ -1,15 +1,24 @@
 """
 LLM Client Factory
 
-Provides LangChain-based LLM client factory supporting OpenAI and Anthropic.
+Provides LangChain-based LLM client factory supporting OpenAI and Anthropic,
+and a shared response cache for deterministic (low-temperature) calls.
 
 Story: 3.5 - Smart Summary Generator
 AC: #1 - LLM Integration Setup
 """
 
+import hashlib
+import json
 import logging
 import os
-from typing import Optional, Tuple, Union
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from cachetools import TTLCache
 
 from langchain_openai import ChatOpenAI
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -37,6 +46,13 @@ class LLMConfig:
         self.token_usage_alert_threshold = int(
             os.getenv("TOKEN_USAGE_ALERT_THRESHOLD", "100000")
         )
+        # Deadline-aware invocation (see invocation.py)
+        self.fallback_model = os.getenv("LLM_FALLBACK_MODEL", "")
+        self.hedge_enabled = os.getenv("LLM_HEDGE_ENABLED", "true").lower() == "true"
+        self.hedge_percentile = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+        self.hedge_default_delay_ms = int(os.getenv("LLM_HEDGE_DEFAULT_DELAY_MS", "3000"))
+        self.hedge_min_delay_ms = int(os.getenv("LLM_HEDGE_MIN_DELAY_MS", "250"))
+        self.fallback_reserve_seconds = float(os.getenv("LLM_FALLBACK_RESERVE_SECONDS", "2"))
 
     @property
     def is_configured(self) -> bool:
@@ -65,7 +81,10 @@ def get_llm_config() -> LLMConfig:
     return LLMConfig()
 
 
-def get_llm_client(config: Optional[LLMConfig] = None) -> BaseChatModel:
+def get_llm_client(
+    config: Optional[LLMConfig] = None,
+    model: Optional[str] = None,
+) -> BaseChatModel:
     """
     Factory for LLM client based on configuration.
 
@@ -73,6 +92,7 @@ def get_llm_client(config: Optional[LLMConfig] = None) -> BaseChatModel:
 
     Args:
         config: Optional config override. Uses environment if not provided.
+        model: Optional model override (e.g. the fallback model)
 
     Returns:
         LangChain chat model instance
@@ -92,7 +112,7 @@ def get_llm_client(config: Optional[LLMConfig] = None) -> BaseChatModel:
     try:
         if config.provider == "openai":
             return ChatOpenAI(
-                model=config.get_model_name(),
+                model=model or config.get_model_name(),
                 temperature=config.temperature,
                 max_tokens=config.max_tokens,
                 timeout=config.timeout_seconds,
@@ -103,7 +123,7 @@ def get_llm_client(config: Optional[LLMConfig] = None) -> BaseChatModel:
             try:
                 from langchain_anthropic import ChatAnthropic
                 return ChatAnthropic(
-                    model=config.get_model_name(),
+                    model=model or config.get_model_name(),
                     temperature=config.temperature,
                     max_tokens=config.max_tokens,
                     timeout=float(config.timeout_seconds),
@@ -198,7 +218,370 @@ def estimate_tokens(text: str) -> int:
         # Use cl100k_base encoding (GPT-4 default)
         encoding = tiktoken.get_encoding("cl100k_base")
         return len(encoding.encode(text))
-    except ImportError:
+    except Exception:
+        # tiktoken missing, or its encoding file could not be downloaded
         # Fallback: rough estimate based on word count
         words = len(text.split())
         return int(words * 1.3)
+
+
+# =============================================================================
+# LLM Response Cache
+# =============================================================================
+#
+# Deterministic generation paths (briefing narratives, smart summaries, claim
+# extraction, text-to-SQL) frequently send the exact same prompt again, e.g.
+# re-generating a briefing for an unchanged day. Responses are cached by
+# model, temperature and a hash of the prompt messages in an in-memory TTL
+# tier, optionally backed by a persistent SQLite tier.
+
+
+@dataclass
+class CachedLLMResponse:
+    """A cached LLM completion."""
+
+    text: str
+    prompt_tokens: int
+    completion_tokens: int
+    created_at: float
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def to_message(self, tier: str):
+        """Rebuild an AIMessage; token usage is zero since no call was made."""
+        from langchain_core.messages import AIMessage
+
+        usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        return AIMessage(
+            content=self.text,
+            response_metadata={"llm_cache": tier, "token_usage": usage, "usage": usage},
+        )
+
+
+def _message_parts(message: Any) -> Tuple[str, str]:
+    if isinstance(message, dict):
+        return str(message.get("role", "")), str(message.get("content", ""))
+    return str(getattr(message, "type", "")), str(getattr(message, "content", message))
+
+
+def _response_text(response: Any) -> str:
+    """Extract completion text from an AIMessage or LLMResult."""
+    generations = getattr(response, "generations", None)
+    if generations:
+        return generations[0][0].text
+    content = getattr(response, "content", None)
+    if isinstance(content, str):
+        return content
+    return ""
+
+
+def _invocation_role(response: Any) -> Optional[str]:
+    """Which request of a hedged invocation answered (primary, hedge or fallback)."""
+    metadata = getattr(response, "response_metadata", None)
+    if isinstance(metadata, dict):
+        return (metadata.get("llm_invocation") or {}).get("role")
+    return None
+
+
+def _response_usage(response: Any) -> Tuple[Optional[int], Optional[int]]:
+    """Extract (prompt, completion) token usage from a response, if reported."""
+    for holder in (
+        getattr(response, "response_metadata", None),
+        getattr(response, "llm_output", None),
+    ):
+        if isinstance(holder, dict):
+            usage = holder.get("token_usage") or holder.get("usage")
+            if isinstance(usage, dict) and "prompt_tokens" in usage:
+                return usage.get("prompt_tokens"), usage.get("completion_tokens", 0)
+    usage = getattr(response, "usage_metadata", None)
+    if isinstance(usage, dict) and "input_tokens" in usage:
+        return usage.get("input_tokens"), usage.get("output_tokens", 0)
+    return None, None
+
+
+class SQLiteLLMCacheStore:
+    """
+    Persistent LLM response tier backed by SQLite.
+
+    Entries survive restarts; expired rows are skipped on read and pruned
+    on write, and the table is held to max_entries (oldest first).
+    """
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, text TEXT NOT NULL, "
+                "prompt_tokens INTEGER NOT NULL, completion_tokens INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS llm_cache_created ON llm_cache (created_at)"
+            )
+
+    def get(self, key: str) -> Optional[CachedLLMResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, prompt_tokens, completion_tokens, created_at "
+                "FROM llm_cache WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedLLMResponse(*row)
+
+    def set(self, key: str, entry: CachedLLMResponse, ttl: int) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (key, entry.text, entry.prompt_tokens, entry.completion_tokens,
+                 entry.created_at, now + ttl),
+            )
+            self._conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                "SELECT key FROM llm_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class LLMResponseCache:
+    """
+    Two-tier cache of LLM responses keyed by model, temperature and prompt.
+
+    Only calls at or below llm_cache_max_temperature are cached; clients
+    whose model or temperature cannot be determined are never cached.
+    Hits, misses and tokens saved are tracked per caller.
+    """
+
+    def __init__(self):
+        from app.core.config import get_settings
+
+        settings = get_settings()
+        self.enabled = settings.llm_cache_enabled
+        self.ttl = settings.llm_cache_ttl_seconds
+        self.max_temperature = settings.llm_cache_max_temperature
+        self._memory: TTLCache = TTLCache(
+            maxsize=settings.llm_cache_max_entries, ttl=self.ttl
+        )
+        self._disk: Optional[SQLiteLLMCacheStore] = None
+        if self.enabled and settings.llm_cache_sqlite_path:
+            try:
+                self._disk = SQLiteLLMCacheStore(
+                    settings.llm_cache_sqlite_path, settings.llm_cache_sqlite_max_entries
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache SQLite tier unavailable: {e}")
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _caller_stats(self, caller: str) -> Dict[str, int]:
+        if caller not in self._stats:
+            self._stats[caller] = {
+                "hits": 0,
+                "memory_hits": 0,
+                "disk_hits": 0,
+                "misses": 0,
+                "uncacheable": 0,
+                "tokens_saved": 0,
+            }
+        return self._stats[caller]
+
+    def make_key(self, client: Any, messages: List[Any]) -> Optional[str]:
+        """
+        Build the cache key for a call.
+
+        Returns:
+            Key string, or None if the call should not be cached
+        """
+        if not self.enabled:
+            return None
+        model = getattr(client, "model_name", None) or getattr(client, "model", None)
+        temperature = getattr(client, "temperature", None)
+        if not isinstance(model, str) or not isinstance(temperature, (int, float)):
+            return None
+        if temperature > self.max_temperature:
+            return None
+        payload = json.dumps(
+            [model, round(float(temperature), 3), [_message_parts(m) for m in messages]],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, caller: str) -> Optional[Tuple[CachedLLMResponse, str]]:
+        """
+        Look up a response, promoting disk hits to memory.
+
+        Returns:
+            Tuple of (entry, tier) or None on a miss
+        """
+        stats = self._caller_stats(caller)
+        entry, tier = self._memory.get(key), "memory"
+        if entry is None and self._disk is not None:
+            try:
+                entry, tier = self._disk.get(key), "disk"
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache SQLite read failed: {e}")
+                entry = None
+            if entry is not None:
+                self._memory[key] = entry
+        if entry is None:
+            stats["misses"] += 1
+            return None
+        stats["hits"] += 1
+        stats[f"{tier}_hits"] += 1
+        stats["tokens_saved"] += entry.total_tokens
+        return entry, tier
+
+    def set(self, key: str, entry: CachedLLMResponse) -> None:
+        """Store a response in both tiers."""
+        self._memory[key] = entry
+        if self._disk is not None:
+            try:
+                self._disk.set(key, entry, self.ttl)
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache SQLite write failed: {e}")
+
+    def record_uncacheable(self, caller: str) -> None:
+        self._caller_stats(caller)["uncacheable"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-caller and total cache statistics."""
+        totals = {"hits": 0, "misses": 0, "tokens_saved": 0}
+        for stats in self._stats.values():
+            for name in totals:
+                totals[name] += stats[name]
+        lookups = totals["hits"] + totals["misses"]
+        return {
+            **totals,
+            "hit_rate": round(totals["hits"] / lookups * 100, 2) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "disk_entries": len(self._disk) if self._disk is not None else 0,
+            "by_caller": {caller: dict(stats) for caller, stats in self._stats.items()},
+        }
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def close(self) -> None:
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
+
+# Module-level singleton instance
+_llm_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """
+    Get the singleton LLMResponseCache instance.
+
+    Returns:
+        LLMResponseCache instance
+    """
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = LLMResponseCache()
+    return _llm_cache
+
+
+def reset_llm_cache() -> None:
+    """
+    Reset the singleton LLM cache.
+
+    Primarily used for testing.
+    """
+    global _llm_cache
+    if _llm_cache is not None:
+        _llm_cache.close()
+    _llm_cache = None
+
+
+async def cached_llm_call(
+    caller: str,
+    client: Any,
+    messages: List[Any],
+    call: Optional[Callable[[], Awaitable[Any]]] = None,
+    validate: Optional[Callable[[str], bool]] = None,
+) -> Any:
+    """
+    Invoke an LLM through the shared response cache.
+
+    Args:
+        caller: Name used for per-caller statistics (e.g. "briefing.narrative")
+        client: LangChain chat model; its model and temperature form the key
+        messages: Prompt messages (BaseMessage objects or role/content dicts)
+        call: Coroutine factory performing the call (default: client.ainvoke(messages))
+        validate: Predicate on the response text; failing responses are not cached
+
+    Responses from a fallback model (see HedgedLLMInvoker) are returned
+    but not cached: the key names the primary model.
+
+    Returns:
+        The LLM response, or an AIMessage rebuilt from the cache on a hit
+        (response_metadata["llm_cache"] names the tier)
+
+    Raises:
+        LLMOverloaded: If admission control sheds the call (cache misses only)
+    """
+    # Import here to avoid circular dependency
+    from app.services.ai.admission import get_llm_admission, provider_name
+
+    cache = get_llm_cache()
+    call = call or (lambda: client.ainvoke(messages))
+
+    async def invoke() -> Any:
+        # Cache hits never wait for (or take) a provider slot
+        async with get_llm_admission().admit(caller, provider_name(client)):
+            return await call()
+
+    key = cache.make_key(client, messages)
+    if key is None:
+        cache.record_uncacheable(caller)
+        return await invoke()
+
+    hit = cache.get(key, caller)
+    if hit is not None:
+        entry, tier = hit
+        logger.debug(f"LLM cache {tier} hit for {caller}")
+        return entry.to_message(tier)
+
+    response = await invoke()
+    if _invocation_role(response) == "fallback":
+        logger.debug(f"LLM response for {caller} came from the fallback model; not cached")
+        return response
+    text = _response_text(response)
+    if text and (validate is None or validate(text)):
+        prompt_tokens, completion_tokens = _response_usage(response)
+        if prompt_tokens is None:
+            prompt_tokens = estimate_tokens(" ".join(_message_parts(m)[1] for m in messages))
+            completion_tokens = estimate_tokens(text)
+        cache.set(key, CachedLLMResponse(
+            text=text,
+            prompt_tokens=int(prompt_tokens or 0),
+            completion_tokens=int(completion_tokens or 0),
+            created_at=time.time(),
+        ))
+    return response
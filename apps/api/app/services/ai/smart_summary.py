@@ -32,11 +32,13 @@ from tenacity import (
 
 from app.core.config import get_settings
 from app.services.ai.llm_client import (
+    cached_llm_call,
     get_llm_client,
     get_llm_config,
     LLMClientError,
     estimate_tokens,
 )
+from app.services.ai.invocation import get_llm_invoker
 from app.services.ai.context_builder import (
     ContextBuilder,
     SummaryContext,
@@ -327,10 +329,18 @@ class SmartSummaryService:
 
         try:
             # AC#4: Generation completes within 30 seconds (timeout in config)
-            response = await client.ainvoke([
+            messages = [
                 SystemMessage(content=system_prompt),
                 HumanMessage(content=data_prompt),
-            ])
+            ]
+            # Deadline defaults to LLM_TIMEOUT_SECONDS
+            invoker = get_llm_invoker(primary=client)
+            response = await cached_llm_call(
+                "smart_summary",
+                client,
+                messages,
+                call=lambda: invoker.ainvoke(messages),
+            )
 
             duration_ms = int((time.time() - start_time) * 1000)
 
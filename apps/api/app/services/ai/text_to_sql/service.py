@@ -23,7 +23,10 @@ from langchain_openai import ChatOpenAI
 from langchain_core.prompts import PromptTemplate
 from langchain_core.messages import HumanMessage
 
+from app.core.cancellation import DEADLINE, get_cancellation_stats, sql_statement_timeout_engine_args
 from app.core.config import get_settings
+from app.services.ai.admission import LLMOverloaded
+from app.services.ai.llm_client import cached_llm_call
 from app.services.ai.text_to_sql.query_validator import (
     QueryValidator,
     QueryValidationError,
@@ -152,8 +155,13 @@ class TextToSQLService:
 
         try:
             # AC#1: Create SQLDatabase wrapper with table whitelist
+            # Server-side statement_timeout: the query thread can't be
+            # cancelled, so PostgreSQL stops it when we stop waiting
             self._db = SQLDatabase.from_uri(
                 settings.supabase_db_url,
+                engine_args=sql_statement_timeout_engine_args(
+                    settings.supabase_db_url, self.query_timeout
+                ),
                 include_tables=self.ALLOWED_TABLES,
                 sample_rows_in_table_info=3,
             )
@@ -301,6 +309,10 @@ class TextToSQLService:
                 question
             )
 
+        except LLMOverloaded:
+            # Shed by admission control; the API answers 503 with Retry-After
+            raise
+
         except Exception as e:
             logger.exception(f"Unexpected error in Text-to-SQL: {e}")
             return self._error_response(
@@ -333,9 +345,12 @@ class TextToSQLService:
             full_prompt = f"{system_prompt}{context_str}\n\nQuestion: {question}"
 
             # Use the LLM to generate SQL
-            response = await asyncio.to_thread(
-                self._llm.invoke,
-                [HumanMessage(content=full_prompt)]
+            messages = [HumanMessage(content=full_prompt)]
+            response = await cached_llm_call(
+                "text_to_sql",
+                self._llm,
+                messages,
+                validate=lambda text: bool(self._clean_sql_response(text.strip())),
             )
 
             # Extract SQL from response
@@ -349,7 +364,7 @@ class TextToSQLService:
 
             return sql
 
-        except LLMGenerationError:
+        except (LLMGenerationError, LLMOverloaded):
             raise
         except Exception as e:
             logger.error(f"SQL generation failed: {e}")
@@ -393,7 +408,8 @@ class TextToSQLService:
         Execute SQL query with timeout.
 
         AC#3: Executes queries with timeout
-        AC#5: Query execution has 30-second timeout
+        AC#5: Query execution has 30-second timeout (also enforced
+        server-side by statement_timeout, which ends the abandoned thread)
         """
         try:
             # Execute with timeout
@@ -406,10 +422,16 @@ class TextToSQLService:
             return self._parse_query_result(result, sql)
 
         except asyncio.TimeoutError:
+            get_cancellation_stats().record("text_to_sql.execute", DEADLINE)
             raise QueryTimeoutError(
                 f"Query execution exceeded {self.query_timeout} second timeout"
             )
         except Exception as e:
+            if "statement timeout" in str(e):
+                get_cancellation_stats().record("text_to_sql.execute", DEADLINE)
+                raise QueryTimeoutError(
+                    f"Query execution exceeded {self.query_timeout} second timeout"
+                )
             logger.error(f"Query execution failed: {e}")
             raise QueryExecutionError(f"Query execution failed: {e}")
 
@@ -0,0 +1,288 @@
+"""
+Briefing Accuracy Rollups (Story 9.11 AC#4)
+
+Rolling morning-vs-actual accuracy, maintained incrementally as each EOD
+comparison is stored, so trend and Action Engine feedback queries are
+lookups instead of scans over the full history:
+
+- Series per user: overall, per area and per concern type
+- Rolling 7/30/90-day window totals are updated when a day is added and
+  when days age out of a window (amortized O(1) per day), and read in
+  constant time
+- Daily buckets are kept for the longest window only; re-storing a day
+  (EOD regenerated) replaces that day's contribution
+
+Accuracy uses the EOD definition: correct predictions over predictions
+plus misses. Misses (unexpected issues) carry no area or concern type,
+so area and concern-type series count flagged concerns only.
+
+Rollups are held in memory and not persisted: each API worker rolls up
+the EOD summaries it generated, and windows start empty after a restart
+or deploy. GET /api/v1/briefing/eod/accuracy reads them.
+"""
+
+import logging
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.models.briefing import ConcernOutcome, EODComparisonResult
+from app.services.briefing.morning_snapshot import plant_today
+
+logger = logging.getLogger(__name__)
+
+# Rolling windows maintained incrementally (days)
+ROLLUP_WINDOWS = (7, 30, 90)
+RETENTION_DAYS = max(ROLLUP_WINDOWS)
+
+OVERALL = "overall"
+AREA = "area"
+CONCERN_TYPE = "concern_type"
+
+SeriesKey = Tuple[str, str]  # (dimension, value)
+
+
+@dataclass
+class AccuracyCounts:
+    """Additive accuracy counters for a day or a window."""
+
+    days: int = 0
+    predictions: int = 0
+    correct: int = 0
+    false_positives: int = 0
+    misses: int = 0
+    escalated: int = 0
+    daily_accuracy_sum: float = 0.0
+
+    def add(self, other: "AccuracyCounts", sign: int = 1) -> None:
+        self.days += sign * other.days
+        self.predictions += sign * other.predictions
+        self.correct += sign * other.correct
+        self.false_positives += sign * other.false_positives
+        self.misses += sign * other.misses
+        self.escalated += sign * other.escalated
+        self.daily_accuracy_sum += sign * other.daily_accuracy_sum
+
+    @property
+    def accuracy_percentage(self) -> Optional[float]:
+        """Pooled accuracy over the counted days (None without data)."""
+        if self.days <= 0:
+            return None
+        outcomes = self.predictions + self.misses
+        if outcomes <= 0:
+            return 100.0
+        return round(max(0.0, min(100.0, self.correct / outcomes * 100)), 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **asdict(self),
+            "accuracy_percentage": self.accuracy_percentage,
+            "mean_daily_accuracy": (
+                round(self.daily_accuracy_sum / self.days, 1) if self.days > 0 else None
+            ),
+            "false_positive_rate": (
+                round(self.false_positives / self.predictions, 3) if self.predictions else None
+            ),
+        }
+
+
+def _counts_for(comparisons, misses: int = 0, daily_accuracy: Optional[float] = None) -> AccuracyCounts:
+    """Counters for one day's comparisons (a subset for area/type series)."""
+    correct = sum(
+        1 for c in comparisons
+        if c.outcome in (ConcernOutcome.MATERIALIZED, ConcernOutcome.ESCALATED)
+    )
+    predictions = len(comparisons)
+    if daily_accuracy is None:
+        outcomes = predictions + misses
+        daily_accuracy = correct / outcomes * 100 if outcomes else 100.0
+    return AccuracyCounts(
+        days=1,
+        predictions=predictions,
+        correct=correct,
+        false_positives=sum(1 for c in comparisons if c.outcome == ConcernOutcome.AVERTED),
+        misses=misses,
+        escalated=sum(1 for c in comparisons if c.outcome == ConcernOutcome.ESCALATED),
+        daily_accuracy_sum=daily_accuracy,
+    )
+
+
+class _Series:
+    """Daily buckets plus incrementally maintained rolling window totals."""
+
+    def __init__(self):
+        self.days: Dict[date, AccuracyCounts] = {}
+        self.windows: Dict[int, AccuracyCounts] = {w: AccuracyCounts() for w in ROLLUP_WINDOWS}
+        self.as_of: Optional[date] = None
+
+    def advance(self, as_of: date) -> None:
+        """Move the window end forward, dropping days that age out."""
+        if self.as_of is None:
+            self.as_of = as_of
+            return
+        if as_of <= self.as_of:
+            return
+        step = (as_of - self.as_of).days
+        for window, totals in self.windows.items():
+            # Days in (old_end - window, new_end - window] leave this window
+            first_leaving = self.as_of - timedelta(days=window - 1)
+            for offset in range(min(step, window)):
+                counts = self.days.get(first_leaving + timedelta(days=offset))
+                if counts is not None:
+                    totals.add(counts, -1)
+        self.as_of = as_of
+        cutoff = as_of - timedelta(days=RETENTION_DAYS)
+        for day in [d for d in self.days if d <= cutoff]:
+            del self.days[day]
+
+    def apply(self, day: date, counts: AccuracyCounts, sign: int = 1) -> None:
+        """Add (or with sign=-1, remove) one day's counters."""
+        self.advance(day)
+        if day <= self.as_of - timedelta(days=RETENTION_DAYS):
+            return
+        bucket = self.days.setdefault(day, AccuracyCounts())
+        bucket.add(counts, sign)
+        if bucket.days <= 0:
+            del self.days[day]
+        for window, totals in self.windows.items():
+            if day > self.as_of - timedelta(days=window):
+                totals.add(counts, sign)
+
+    def window(self, days: int) -> AccuracyCounts:
+        """Totals for the last `days` days ending at as_of."""
+        if days in self.windows:
+            return self.windows[days]
+        totals = AccuracyCounts()
+        start = self.as_of - timedelta(days=days)
+        for day, counts in self.days.items():
+            if day > start:
+                totals.add(counts)
+        return totals
+
+
+class AccuracyRollups:
+    """
+    Rolling accuracy per user, area and concern type.
+
+    Usage:
+        rollups = get_accuracy_rollups()
+        rollups.record(user_id, summary_date, comparison_result)
+        rollups.rollup(user_id, window_days=30)
+    """
+
+    def __init__(self):
+        self._series: Dict[str, Dict[SeriesKey, _Series]] = {}
+        # Per user and day, the contribution to each series, so a re-stored
+        # day replaces the old one
+        self._entries: Dict[str, Dict[date, Dict[SeriesKey, AccuracyCounts]]] = {}
+
+    def record(self, user_id: str, summary_date: date, result: EODComparisonResult) -> None:
+        """Fold one day's comparison into every affected series."""
+        metrics = result.accuracy_metrics
+        contributions: Dict[SeriesKey, AccuracyCounts] = {
+            (OVERALL, OVERALL): _counts_for(
+                result.comparisons,
+                misses=metrics.misses,
+                daily_accuracy=metrics.accuracy_percentage,
+            ),
+        }
+        by_area: Dict[str, list] = {}
+        by_type: Dict[str, list] = {}
+        for comparison in result.comparisons:
+            if comparison.area:
+                by_area.setdefault(comparison.area, []).append(comparison)
+            by_type.setdefault(comparison.issue_type, []).append(comparison)
+        for area, comparisons in by_area.items():
+            contributions[(AREA, area)] = _counts_for(comparisons)
+        for issue_type, comparisons in by_type.items():
+            contributions[(CONCERN_TYPE, issue_type)] = _counts_for(comparisons)
+
+        series = self._series.setdefault(user_id, {})
+        entries = self._entries.setdefault(user_id, {})
+        for key, counts in entries.pop(summary_date, {}).items():
+            series[key].apply(summary_date, counts, -1)
+        for key, counts in contributions.items():
+            series.setdefault(key, _Series()).apply(summary_date, counts)
+        entries[summary_date] = contributions
+        for day in [d for d in entries if (summary_date - d).days >= RETENTION_DAYS]:
+            del entries[day]
+
+    def rollup(
+        self,
+        user_id: str,
+        window_days: int = 30,
+        as_of: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        """
+        Rolling accuracy for a user: overall, by area and by concern type.
+
+        Args:
+            user_id: User ID
+            window_days: Window length (7, 30 and 90 are precomputed)
+            as_of: Window end date (default: today's plant date)
+
+        Returns:
+            Dict with window_days, overall, by_area and by_concern_type
+        """
+        result: Dict[str, Any] = {
+            "window_days": window_days,
+            "overall": None,
+            "by_area": {},
+            "by_concern_type": {},
+        }
+        for (dimension, value), series in self._series.get(user_id, {}).items():
+            series.advance(as_of or plant_today())
+            counts = series.window(window_days)
+            if counts.days <= 0:
+                continue
+            if dimension == OVERALL:
+                result["overall"] = counts.to_dict()
+            elif dimension == AREA:
+                result["by_area"][value] = counts.to_dict()
+            else:
+                result["by_concern_type"][value] = counts.to_dict()
+        return result
+
+    def daily(self, user_id: str, days: int = 30, as_of: Optional[date] = None) -> List[Dict[str, Any]]:
+        """A user's stored daily records, newest first (at most RETENTION_DAYS)."""
+        series = self._series.get(user_id, {}).get((OVERALL, OVERALL))
+        if series is None:
+            return []
+        series.advance(as_of or plant_today())
+        start = series.as_of - timedelta(days=days)
+        return [
+            {"date": day.isoformat(), **counts.to_dict()}
+            for day, counts in sorted(series.days.items(), reverse=True)
+            if day > start
+        ]
+
+    def clear(self) -> None:
+        self._series.clear()
+        self._entries.clear()
+
+
+# Module-level singleton
+_accuracy_rollups: Optional[AccuracyRollups] = None
+
+
+def get_accuracy_rollups() -> AccuracyRollups:
+    """
+    Get the singleton AccuracyRollups instance.
+
+    Returns:
+        AccuracyRollups instance
+    """
+    global _accuracy_rollups
+    if _accuracy_rollups is None:
+        _accuracy_rollups = AccuracyRollups()
+    return _accuracy_rollups
+
+
+def reset_accuracy_rollups() -> None:
+    """
+    Reset the singleton AccuracyRollups.
+
+    Primarily used for testing.
+    """
+    global _accuracy_rollups
+    _accuracy_rollups = None
@@ -0,0 +1,282 @@
+"""
+Briefing Data Plan
+
+Multi-area briefings used to run four tools per production area
+(production status, OEE, downtime, safety), so a 7-area briefing made 28
+tool invocations, each with its own round trips over overlapping data.
+The data plan fetches plant-wide data once per briefing:
+
+- latest live snapshots and shift targets (production status)
+- daily summaries for the report date (OEE and downtime reasons)
+- safety events since the start of the report date
+
+and partitions the rows in memory by production area using the
+asset-to-area map. Each area's narrative is then built from its
+partition, in the same data shapes the per-area tools produced.
+
+The plan fetches lazily on the first area that asks for data, and
+concurrent areas share that single fetch.
+"""
+
+import asyncio
+import contextvars
+import logging
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.models.briefing import BriefingCitation, ToolResultData
+from app.services.agent.data_source.round_trips import count_round_trips
+
+logger = logging.getLogger(__name__)
+
+
+class BriefingDataPlan:
+    """
+    Plant-wide briefing data fetched once and partitioned by area.
+
+    Usage:
+        plan = BriefingDataPlan(asset_area_map, area_names)
+        results = await plan.area_results("packing")
+        results["oee_data"].data["oee_percentage"]
+    """
+
+    def __init__(
+        self,
+        asset_area_map: Dict[str, str],
+        area_names: Dict[str, str],
+        data_source=None,
+        report_date: Optional[date] = None,
+    ):
+        """
+        Initialize the plan.
+
+        Args:
+            asset_area_map: Lowercase asset name -> area ID
+            area_names: Area ID -> display name (used to map the
+                assets.area column when an asset name is not in the map)
+            data_source: Optional DataSource (for testing)
+            report_date: Day the daily summaries cover (default: yesterday)
+        """
+        self._asset_area_map = asset_area_map
+        self._area_lookup = {}
+        for area_id, name in area_names.items():
+            self._area_lookup[area_id.lower()] = area_id
+            self._area_lookup[name.lower()] = area_id
+            self._area_lookup[name.lower().replace(" ", "_")] = area_id
+        self._data_source = data_source
+        self.report_date = report_date or (date.today() - timedelta(days=1))
+        self._lock = asyncio.Lock()
+        self._fetched = False
+        self._partitions: Dict[str, Dict[str, List[Any]]] = {}
+        self._targets: Dict[str, Any] = {}
+        self._results: Dict[str, Any] = {}
+        self.round_trips: Optional[int] = None
+
+    def _get_data_source(self):
+        if self._data_source is None:
+            from app.services.agent.data_source import get_data_source
+
+            self._data_source = get_data_source()
+        return self._data_source
+
+    def resolve_area(self, asset_name: Optional[str], area: Optional[str]) -> Optional[str]:
+        """Map an asset to its production area ID (asset name first, then assets.area)."""
+        if asset_name and asset_name.lower() in self._asset_area_map:
+            return self._asset_area_map[asset_name.lower()]
+        if area:
+            return self._area_lookup.get(area.lower())
+        return None
+
+    async def fetch(self) -> None:
+        """Fetch plant-wide data once; later calls return immediately."""
+        if self._fetched:
+            return
+        async with self._lock:
+            if self._fetched:
+                return
+
+            with count_round_trips() as round_trips:
+                try:
+                    data_source = self._get_data_source()
+                except Exception as e:
+                    results = [e] * 4
+                else:
+                    results = await asyncio.gather(
+                        data_source.get_all_live_snapshots(),
+                        data_source.get_all_shift_targets(),
+                        data_source.get_trend_data(self.report_date, self.report_date, metric="oee"),
+                        data_source.get_safety_events(
+                            asset_id=None,
+                            start_date=self.report_date,
+                            end_date=date.today(),
+                            include_resolved=True,
+                        ),
+                        return_exceptions=True,
+                    )
+            self.round_trips = round_trips.count
+
+            snapshots, targets, summaries, safety = results
+            self._results = dict(zip(("snapshots", "targets", "summaries", "safety"), results))
+
+            if not isinstance(targets, Exception):
+                self._targets = {t.asset_id: t for t in (targets.data or [])}
+            if not isinstance(snapshots, Exception):
+                self._partition("snapshots", snapshots.data or [], lambda s: (s.asset_name, s.area))
+            if not isinstance(summaries, Exception):
+                self._partition(
+                    "summaries", summaries.data or [], lambda r: (r.get("asset_name"), r.get("area"))
+                )
+            if not isinstance(safety, Exception):
+                self._partition("safety", safety.data or [], lambda e: (e.asset_name, e.area))
+
+            self._fetched = True
+            logger.info(
+                f"Briefing data plan fetched in {self.round_trips} round trips "
+                f"({sum(isinstance(r, Exception) for r in results)} failed)"
+            )
+
+    def _partition(self, kind: str, rows: List[Any], key) -> None:
+        for row in rows:
+            area_id = self.resolve_area(*key(row))
+            if area_id is not None:
+                self._partitions.setdefault(area_id, {}).setdefault(kind, []).append(row)
+
+    async def area_results(self, area_id: str) -> Dict[str, ToolResultData]:
+        """
+        Tool-shaped results for one area, keyed by tool name.
+
+        Fetches the plant-wide data on first use.
+        """
+        await self.fetch()
+        partition = self._partitions.get(area_id, {})
+        return {
+            "production_status": self._production_status(partition.get("snapshots", [])),
+            "oee_data": self._oee(partition.get("summaries", [])),
+            "downtime_analysis": self._downtime(partition.get("summaries", [])),
+            "safety_events": self._safety(partition.get("safety", [])),
+        }
+
+    def _failed(self, tool_name: str, source: str) -> Optional[ToolResultData]:
+        result = self._results.get(source)
+        if isinstance(result, Exception):
+            return ToolResultData(tool_name=tool_name, success=False, error_message=str(result))
+        return None
+
+    def _citations(self, *sources: str) -> List[BriefingCitation]:
+        citations = []
+        for source in sources:
+            result = self._results.get(source)
+            if result is not None and not isinstance(result, Exception):
+                citations.append(BriefingCitation(
+                    source=result.source_name,
+                    table=result.table_name,
+                    timestamp=result.query_timestamp,
+                ))
+        return citations
+
+    def _production_status(self, snapshots: List[Any]) -> ToolResultData:
+        """Area production summary (ProductionStatusTool semantics)."""
+        failed = self._failed("production_status", "snapshots")
+        if failed:
+            return failed
+
+        from app.services.agent.tools.production_status import ProductionStatusTool
+
+        tool = ProductionStatusTool()
+        assets = [a for a in (tool._process_snapshot(s, self._targets) for s in snapshots) if a]
+        assets.sort(key=lambda a: a.variance_percent)
+        data: Dict[str, Any] = {"summary": {}}
+        if assets:
+            data = {
+                "summary": tool._calculate_summary(assets).model_dump(),
+                "assets": [a.model_dump() for a in assets],
+            }
+        return ToolResultData(
+            tool_name="production_status",
+            data=data,
+            citations=self._citations("snapshots", "targets"),
+        )
+
+    def _oee(self, summaries: List[Dict[str, Any]]) -> ToolResultData:
+        """Area OEE as the average of per-asset OEE (OEEQueryTool area semantics)."""
+        failed = self._failed("oee_data", "summaries")
+        if failed:
+            return failed
+
+        by_asset: Dict[str, List[float]] = {}
+        for row in summaries:
+            if row.get("value") is not None:
+                by_asset.setdefault(row["asset_id"], []).append(float(row["value"]))
+        data: Dict[str, Any] = {}
+        if by_asset:
+            asset_averages = [sum(values) / len(values) for values in by_asset.values()]
+            data = {
+                "oee_percentage": round(sum(asset_averages) / len(asset_averages), 1),
+                "asset_count": len(asset_averages),
+                "report_date": self.report_date.isoformat(),
+            }
+        return ToolResultData(tool_name="oee_data", data=data, citations=self._citations("summaries"))
+
+    def _downtime(self, summaries: List[Dict[str, Any]]) -> ToolResultData:
+        """Area downtime reasons ranked by total minutes."""
+        failed = self._failed("downtime_analysis", "summaries")
+        if failed:
+            return failed
+
+        minutes_by_reason: Dict[str, float] = {}
+        for row in summaries:
+            for reason, minutes in (row.get("downtime_reasons") or {}).items():
+                if isinstance(minutes, (int, float)):
+                    minutes_by_reason[reason] = minutes_by_reason.get(reason, 0) + minutes
+        top_reasons = [
+            {"reason": reason, "duration_minutes": round(minutes)}
+            for reason, minutes in sorted(minutes_by_reason.items(), key=lambda item: -item[1])
+        ]
+        return ToolResultData(
+            tool_name="downtime_analysis",
+            data={
+                "top_reasons": top_reasons,
+                "total_downtime_minutes": round(sum(minutes_by_reason.values())),
+            },
+            citations=self._citations("summaries"),
+        )
+
+    def _safety(self, events: List[Any]) -> ToolResultData:
+        """Area safety events (open and resolved)."""
+        failed = self._failed("safety_events", "safety")
+        if failed:
+            return failed
+
+        return ToolResultData(
+            tool_name="safety_events",
+            data={
+                "total_events": len(events),
+                "open_events": len([e for e in events if not e.is_resolved]),
+                "events": [
+                    {"asset_name": e.asset_name, "severity": e.severity, "reason_code": e.reason_code}
+                    for e in events
+                ],
+            },
+            citations=self._citations("safety"),
+        )
+
+
+_current_plan: contextvars.ContextVar[Optional[BriefingDataPlan]] = contextvars.ContextVar(
+    "briefing_data_plan", default=None
+)
+
+
+@contextmanager
+def use_data_plan(plan: Optional[BriefingDataPlan]) -> Iterator[Optional[BriefingDataPlan]]:
+    """Make a plan the data source for area sections generated within the block."""
+    token = _current_plan.set(plan)
+    try:
+        yield plan
+    finally:
+        _current_plan.reset(token)
+
+
+def current_data_plan() -> Optional[BriefingDataPlan]:
+    """The active data plan, or None when areas should query their tools."""
+    return _current_plan.get()
@@ -55,6 +55,7 @@ else:
                 except asyncio.CancelledError:
                     pass
 
+from app.core.cancellation import DEADLINE, get_cancellation_stats
 from app.models.briefing import (
     BriefingSection,
     BriefingSectionStatus,
@@ -71,6 +72,14 @@ from app.models.briefing import (
     AccuracyMetrics,
     EODComparisonResult,
 )
+from app.core.config import get_settings
+from app.services.briefing.accuracy_rollups import get_accuracy_rollups
+from app.services.briefing.morning_snapshot import (
+    MorningConcern,
+    MorningSnapshot,
+    get_morning_snapshot_store,
+    plant_today,
+)
 from app.services.briefing.service import (
     BriefingService,
     get_briefing_service,
@@ -104,27 +113,10 @@ DEFAULT_DAY_START_HOUR = 6
 # Timeouts for Story 9.11 comparison operations
 EOD_ACCURACY_CALCULATION_TIMEOUT = 2
 
-
-class MorningConcern:
-    """A concern flagged in the morning briefing."""
-
-    def __init__(
-        self,
-        concern_id: str,
-        description: str,
-        issue_type: str,
-        severity: str = "medium",
-        asset_id: Optional[str] = None,
-        asset_name: Optional[str] = None,
-        area: Optional[str] = None,
-    ):
-        self.concern_id = concern_id
-        self.description = description
-        self.issue_type = issue_type
-        self.severity = severity
-        self.asset_id = asset_id
-        self.asset_name = asset_name
-        self.area = area
+# Rolling Action Engine feedback (Story 9.11 AC#4)
+FEEDBACK_WINDOW_DAYS = 30
+FEEDBACK_MIN_PREDICTIONS = 5
+FEEDBACK_FALSE_POSITIVE_RATE = 0.5
 
 
 class MorningBriefingRecord:
@@ -138,6 +130,7 @@ class MorningBriefingRecord:
         wins: List[str],
         sections: List[Dict[str, Any]],
         structured_concerns: Optional[List[MorningConcern]] = None,
+        snapshot: Optional[MorningSnapshot] = None,
     ):
         self.id = id
         self.generated_at = generated_at
@@ -145,6 +138,8 @@ class MorningBriefingRecord:
         self.wins = wins
         self.sections = sections
         self.structured_concerns = structured_concerns or []
+        # Structured morning state (tool results) when the briefing stored one
+        self.snapshot = snapshot
 
 
 class EODService:
@@ -206,7 +201,7 @@ class EODService:
 
         Args:
             user_id: User requesting the EOD summary
-            summary_date: Date to generate summary for (defaults to today)
+            summary_date: Date to generate summary for (defaults to today, plant time)
             include_audio: Whether to include TTS audio URL
 
         Returns:
@@ -217,7 +212,7 @@ class EODService:
 
         # Determine date and time range
         if summary_date is None:
-            summary_date = datetime.now().date()
+            summary_date = plant_today()
 
         # Time range: 06:00 AM to current time (or end of day)
         time_range_start = datetime.combine(
@@ -246,10 +241,12 @@ class EODService:
                 # Step 1: Find morning briefing (if exists)
                 morning_briefing = await self._find_morning_briefing(summary_date)
 
-                # Step 2: Orchestrate tools for day's data
+                # Step 2: Orchestrate tools for day's data (reusing
+                # unchanged morning results)
                 briefing_data = await self._orchestrate_eod_tools(
                     time_range_start,
-                    time_range_end
+                    time_range_end,
+                    morning_briefing.snapshot if morning_briefing else None,
                 )
 
                 # Track failed tools
@@ -310,6 +307,7 @@ class EODService:
                 )
 
         except asyncio.TimeoutError:
+            get_cancellation_stats().record("eod.generate", DEADLINE)
             logger.warning(
                 f"EOD summary {summary_id} timed out after {EOD_TOTAL_TIMEOUT_SECONDS}s"
             )
@@ -373,12 +371,28 @@ class EODService:
 
         AC#3: Returns None if no briefing was generated today.
 
+        Prefers the structured snapshot stored when the morning briefing
+        was generated (tool results and concerns, no text parsing).
+
         Args:
             summary_date: Date to find morning briefing for
 
         Returns:
             MorningBriefingRecord if found, None otherwise
         """
+        if get_settings().eod_reuse_morning_snapshot:
+            snapshot = get_morning_snapshot_store().get(summary_date)
+            if snapshot is not None:
+                return MorningBriefingRecord(
+                    id=snapshot.briefing_id,
+                    generated_at=snapshot.generated_at,
+                    concerns=[c.description for c in snapshot.concerns],
+                    wins=list(snapshot.wins),
+                    sections=list(snapshot.sections),
+                    structured_concerns=snapshot.concerns,
+                    snapshot=snapshot,
+                )
+
         try:
             async with async_timeout(EOD_MORNING_LOOKUP_TIMEOUT):
                 # For MVP, check the in-memory briefing store
@@ -429,6 +443,7 @@ class EODService:
         self,
         start_time: datetime,
         end_time: datetime,
+        morning_snapshot: Optional[MorningSnapshot] = None,
     ) -> BriefingData:
         """
         Orchestrate tool execution for EOD data.
@@ -436,9 +451,14 @@ class EODService:
         AC#1: Tool Orchestration for EOD context
         Uses the same tools as morning briefing with EOD-specific filtering.
 
+        With a morning snapshot, results whose source tables have not
+        changed since morning are reused; live tools and tools whose data
+        changed are re-queried.
+
         Args:
             start_time: Day start time (06:00 AM)
             end_time: Current time
+            morning_snapshot: Optional structured morning state to reuse
 
         Returns:
             BriefingData with results from all tools
@@ -452,47 +472,61 @@ class EODService:
         from app.services.agent.tools.safety_events import SafetyEventsTool
         from app.services.agent.tools.action_list import ActionListTool
 
-        # Define tools to run in parallel
-        tool_tasks = [
-            self._run_tool_with_timeout(
+        # Tool calls by result name (run in parallel)
+        tool_calls = {
+            "production_status": lambda: self._run_tool_with_timeout(
                 "production_status",
                 self._get_production_status,
                 ProductionStatusTool(),
                 start_time,
                 end_time
             ),
-            self._run_tool_with_timeout(
+            "oee_data": lambda: self._run_tool_with_timeout(
                 "oee_data",
                 self._get_oee_data,
                 OEEQueryTool()
             ),
-            self._run_tool_with_timeout(
+            "safety_events": lambda: self._run_tool_with_timeout(
                 "safety_events",
                 self._get_safety_events,
                 SafetyEventsTool()
             ),
-            self._run_tool_with_timeout(
+            "downtime_analysis": lambda: self._run_tool_with_timeout(
                 "downtime_analysis",
                 self._get_downtime_analysis,
                 DowntimeAnalysisTool()
             ),
-            self._run_tool_with_timeout(
+            "action_list": lambda: self._run_tool_with_timeout(
                 "action_list",
                 self._get_action_list,
                 ActionListTool()
             ),
-        ]
+        }
+
+        tool_names = list(tool_calls)
+        if morning_snapshot is not None:
+            stale = get_morning_snapshot_store().stale_tools(morning_snapshot)
+            reused = [name for name in tool_names if name not in stale]
+            for name in reused:
+                setattr(
+                    briefing_data,
+                    name,
+                    getattr(morning_snapshot.tool_results, name).model_copy(deep=True),
+                )
+            tool_names = [name for name in tool_names if name in stale]
+            logger.info(
+                f"EOD reusing morning results for {reused or 'no tools'}; "
+                f"querying {tool_names}"
+            )
 
         try:
             async with async_timeout(EOD_TOOL_ORCHESTRATION_TIMEOUT):
-                results = await asyncio.gather(*tool_tasks, return_exceptions=True)
+                results = await asyncio.gather(
+                    *[tool_calls[name]() for name in tool_names],
+                    return_exceptions=True,
+                )
 
                 # Map results to briefing data
-                tool_names = [
-                    "production_status", "oee_data", "safety_events",
-                    "downtime_analysis", "action_list"
-                ]
-
                 for name, result in zip(tool_names, results):
                     if isinstance(result, Exception):
                         logger.error(f"Tool {name} raised exception: {result}")
@@ -507,6 +541,7 @@ class EODService:
                         logger.warning(f"Unexpected result type from {name}: {type(result)}")
 
         except asyncio.TimeoutError:
+            get_cancellation_stats().record("eod.tools", DEADLINE)
             logger.warning("Tool orchestration timed out")
 
         return briefing_data
@@ -527,6 +562,7 @@ class EODService:
                 return await tool_func(*args)
 
         except asyncio.TimeoutError:
+            get_cancellation_stats().record(f"eod.tool.{tool_name}", DEADLINE)
             logger.warning(f"Tool {tool_name} timed out after {PER_TOOL_TIMEOUT_SECONDS}s")
             return ToolResultData(
                 tool_name=tool_name,
@@ -806,6 +842,7 @@ class EODService:
                 return sections
 
         except asyncio.TimeoutError:
+            get_cancellation_stats().record("eod.narrative", DEADLINE)
             logger.warning("EOD narrative generation timed out")
             return self._create_fallback_sections(briefing_data)
 
@@ -1206,13 +1243,13 @@ class EODService:
 
         Args:
             user_id: User ID to retrieve morning briefing for
-            summary_date: Date to compare (defaults to today)
+            summary_date: Date to compare (defaults to today, plant time)
 
         Returns:
             EODComparisonResult with comparisons and metrics
         """
         if summary_date is None:
-            summary_date = datetime.now().date()
+            summary_date = plant_today()
 
         logger.info(
             f"Comparing morning briefing to actual outcomes for user {user_id}, "
@@ -1243,7 +1280,8 @@ class EODService:
 
         briefing_data = await self._orchestrate_eod_tools(
             time_range_start,
-            time_range_end
+            time_range_end,
+            morning_briefing.snapshot,
         )
 
         # Step 3: Extract structured concerns from morning briefing
@@ -1848,7 +1886,9 @@ class EODService:
         Store accuracy metrics for trend tracking (Story 9.11 AC#4 Task 5.1).
 
         Stores daily accuracy metrics to enable trend analysis and
-        Action Engine tuning feedback.
+        Action Engine tuning feedback. Rolling 7/30/90-day accuracy per
+        user, area and concern type is updated incrementally here, so
+        trend and feedback queries never rescan the history.
 
         Args:
             user_id: User ID
@@ -1860,13 +1900,11 @@ class EODService:
             True if stored successfully, False otherwise
 
         Note:
-            MVP implementation logs metrics only. Production implementation
-            should insert into briefing_accuracy_metrics table using the
+            Rollups are in memory per API worker, not persisted. Production implementation
+            should also insert into briefing_accuracy_metrics table using the
             migration in supabase/migrations/20260117_002_briefing_accuracy.sql
         """
         try:
-            # MVP: Log metrics for observability
-            # TODO: Production - Insert into briefing_accuracy_metrics table
             logger.info(
                 f"Storing accuracy metrics for user {user_id}, date={summary_date}: "
                 f"accuracy={comparison_result.accuracy_metrics.accuracy_percentage}%, "
@@ -1875,8 +1913,7 @@ class EODService:
                 f"misses={comparison_result.accuracy_metrics.misses}"
             )
 
-            # In production, this would insert into briefing_accuracy_metrics table
-            # See Dev Notes for table schema
+            get_accuracy_rollups().record(user_id, summary_date, comparison_result)
 
             return True
 
@@ -1894,46 +1931,50 @@ class EODService:
 
         Args:
             user_id: User ID
-            days: Number of days to include in trend
+            days: Number of days to include in trend (up to 90)
 
         Returns:
-            List of daily accuracy records for trend analysis
-
-        Note:
-            MVP implementation returns empty list. Production implementation
-            should query briefing_accuracy_metrics table ordered by date DESC.
+            List of daily accuracy records for trend analysis, newest first
         """
         try:
-            # MVP: Return empty list - trends require database storage
-            # TODO: Production - Query briefing_accuracy_metrics table
-            logger.info(
-                f"Querying accuracy trends for user {user_id}, days={days}"
-            )
-
-            # Production query would be:
-            # SELECT * FROM briefing_accuracy_metrics
-            # WHERE user_id = {user_id}
-            # ORDER BY date DESC
-            # LIMIT {days}
-
-            return []
+            return get_accuracy_rollups().daily(user_id, days=days)
 
         except Exception as e:
             logger.error(f"Failed to query accuracy trends: {e}")
             return []
 
+    def get_accuracy_rollup(
+        self,
+        user_id: str,
+        window_days: int = 30,
+    ) -> Dict[str, Any]:
+        """
+        Rolling accuracy for a user: overall, by area and by concern type.
+
+        Args:
+            user_id: User ID
+            window_days: Window length (7, 30 and 90 days are precomputed)
+
+        Returns:
+            Dict with window_days, overall, by_area and by_concern_type
+        """
+        return get_accuracy_rollups().rollup(user_id, window_days=window_days)
+
     def get_action_engine_feedback(
         self,
-        accuracy_metrics: AccuracyMetrics
+        accuracy_metrics: AccuracyMetrics,
+        user_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Generate feedback for Action Engine tuning (Story 9.11 AC#4 Task 5.3).
 
         Based on accuracy metrics, provides recommendations for
-        adjusting prediction weights.
+        adjusting prediction weights. With a user_id, the user's rolling
+        30-day rollup adds per-concern-type adjustments.
 
         Args:
             accuracy_metrics: The calculated accuracy metrics
+            user_id: Optional user whose rolling accuracy to include
 
         Returns:
             Feedback dictionary for Action Engine tuning
@@ -1972,6 +2013,22 @@ class EODService:
                 "Prediction accuracy is good - maintain current parameters"
             )
 
+        # Concern types that are mostly false alarms over the rolling window
+        if user_id:
+            rolling = get_accuracy_rollups().rollup(user_id, window_days=FEEDBACK_WINDOW_DAYS)
+            feedback["rolling"] = rolling
+            for issue_type, counts in rolling["by_concern_type"].items():
+                if (
+                    counts["predictions"] >= FEEDBACK_MIN_PREDICTIONS
+                    and counts["false_positive_rate"] > FEEDBACK_FALSE_POSITIVE_RATE
+                ):
+                    feedback["recommendations"].append(
+                        f"{issue_type.capitalize()} concerns were false alarms "
+                        f"{round(counts['false_positive_rate'] * 100)}% of the time over "
+                        f"{FEEDBACK_WINDOW_DAYS} days - consider raising {issue_type} thresholds"
+                    )
+                    feedback["weight_adjustments"][f"{issue_type}_sensitivity"] = -0.1
+
         return feedback
 
 
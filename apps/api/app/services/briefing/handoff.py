@@ -22,7 +22,7 @@ import asyncio
 import logging
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 
 from app.models.handoff import (
     HandoffSynthesisCitation,
@@ -34,6 +34,11 @@ from app.models.handoff import (
     HandoffToolResultData,
     ShiftTimeRange,
 )
+from app.services.briefing.handoff_cache import (
+    HandoffSynthesisCache,
+    get_handoff_synthesis_cache,
+    sections_for_tools,
+)
 from app.services.handoff import get_shift_time_range
 from app.services.agent.tools.production_status import ProductionStatusTool
 from app.services.agent.tools.downtime_analysis import DowntimeAnalysisTool
@@ -64,6 +69,10 @@ class HandoffSynthesisService:
     - AC#5: Filters by supervisor's assigned assets
     - AC#7: Auto-detects shift time range (last 8 hours)
 
+    With a HandoffSynthesisCache, repeated syntheses of the same shift and
+    scope re-run only the tools whose data changed and regenerate only the
+    sections that read them.
+
     This is NOT a ManufacturingTool - it's an orchestration layer.
 
     Usage:
@@ -74,9 +83,14 @@ class HandoffSynthesisService:
         )
     """
 
-    def __init__(self):
-        """Initialize the handoff synthesis service."""
-        pass
+    def __init__(self, cache: Optional[HandoffSynthesisCache] = None):
+        """
+        Initialize the handoff synthesis service.
+
+        Args:
+            cache: Optional synthesis cache (None synthesizes from scratch every time)
+        """
+        self._cache = cache
 
     async def synthesize_shift_data(
         self,
@@ -112,6 +126,16 @@ class HandoffSynthesisService:
         # AC#7: Detect shift time range
         shift_info = get_shift_time_range()
 
+        # Re-run only tools whose data changed since the last synthesis of this shift
+        cache_key = cached = None
+        stale_tools: Optional[Set[str]] = None
+        table_versions: Dict[str, int] = {}
+        if self._cache is not None:
+            cache_key = self._cache.key_for(shift_info, supervisor_assignments)
+            cached = self._cache.get(cache_key)
+            stale_tools = self._cache.stale_tools(cache_key)
+            table_versions = self._cache.table_versions.snapshot()
+
         sections: List[HandoffSection] = []
         tool_failures: List[str] = []
         timed_out = False
@@ -125,10 +149,16 @@ class HandoffSynthesisService:
                 data = await self._orchestrate_tools(
                     supervisor_assignments,
                     shift_info,
+                    tools=stale_tools,
+                    previous=cached.synthesis_data if cached else None,
                 )
 
                 # AC#2: Generate narrative sections
-                sects = await self._generate_narrative_sections(data)
+                sects = await self._generate_narrative_sections(
+                    data,
+                    cached_sections=cached.sections if cached else None,
+                    regenerate=sections_for_tools(stale_tools) if cached else None,
+                )
                 return data, sects
 
             synthesis_data, sections = await asyncio.wait_for(
@@ -139,6 +169,9 @@ class HandoffSynthesisService:
             # Track failed tools (AC#3)
             tool_failures = synthesis_data.failed_tools
 
+            if self._cache is not None:
+                self._cache.store(cache_key, synthesis_data, sections, stale_tools, table_versions)
+
         except asyncio.TimeoutError:
             logger.warning(
                 f"Handoff synthesis {synthesis_id} timed out after "
@@ -196,6 +229,11 @@ class HandoffSynthesisService:
                 # loading. Setting True would mislead frontend into polling for data
                 # that will never arrive.
                 background_loading=False,
+                data_version=self._cache.data_version(table_versions) if self._cache is not None else None,
+                reused_sections=[
+                    s.section_type for s in sections
+                    if cached and s.section_type not in sections_for_tools(stale_tools)
+                ],
             ),
         )
 
@@ -203,6 +241,8 @@ class HandoffSynthesisService:
         self,
         supervisor_assignments: Optional[List[str]],
         shift_info: ShiftTimeRange,
+        tools: Optional[Set[str]] = None,
+        previous: Optional[HandoffSynthesisData] = None,
     ) -> HandoffSynthesisData:
         """
         Orchestrate tool execution for handoff data.
@@ -217,6 +257,8 @@ class HandoffSynthesisService:
         Args:
             supervisor_assignments: Asset IDs to filter by
             shift_info: Shift time range for queries
+            tools: Tools to run (default: all four)
+            previous: Earlier results reused for the tools not run
 
         Returns:
             HandoffSynthesisData with results from all tools
@@ -228,38 +270,26 @@ class HandoffSynthesisService:
         # In production, this would look up the supervisor_assignments table
         area_filter = None
 
-        # AC#1: Run all four tools in parallel
-        tool_tasks = [
-            self._run_tool_with_timeout(
-                "production_status",
-                self._get_production_status,
-                area_filter,
-            ),
-            self._run_tool_with_timeout(
-                "downtime_analysis",
-                self._get_downtime_analysis,
-                area_filter,
-                shift_info,
-            ),
-            self._run_tool_with_timeout(
-                "safety_events",
-                self._get_safety_events,
-                area_filter,
-                shift_info,
-            ),
-            self._run_tool_with_timeout(
-                "alert_check",
-                self._get_alert_check,
-                area_filter,
-            ),
-        ]
-
-        # Run all tools in parallel (AC#1)
-        results = await asyncio.gather(*tool_tasks, return_exceptions=True)
+        # AC#1: The four tools and their arguments
+        tool_calls = {
+            "production_status": (self._get_production_status, area_filter),
+            "downtime_analysis": (self._get_downtime_analysis, area_filter, shift_info),
+            "safety_events": (self._get_safety_events, area_filter, shift_info),
+            "alert_check": (self._get_alert_check, area_filter),
+        }
+
+        tool_names = [name for name in tool_calls if tools is None or name in tools]
+        for name in tool_calls:
+            if name not in tool_names and previous is not None:
+                setattr(synthesis_data, name, getattr(previous, name))
+
+        # Run the tools in parallel (AC#1)
+        results = await asyncio.gather(
+            *(self._run_tool_with_timeout(name, *tool_calls[name]) for name in tool_names),
+            return_exceptions=True,
+        )
 
         # Map results to synthesis data
-        tool_names = ["production_status", "downtime_analysis", "safety_events", "alert_check"]
-
         for name, result in zip(tool_names, results):
             if isinstance(result, Exception):
                 logger.error(f"Tool {name} raised exception: {result}")
@@ -429,6 +459,8 @@ class HandoffSynthesisService:
     async def _generate_narrative_sections(
         self,
         synthesis_data: HandoffSynthesisData,
+        cached_sections: Optional[Dict[str, HandoffSection]] = None,
+        regenerate: Optional[Set[str]] = None,
     ) -> List[HandoffSection]:
         """
         Generate narrative sections from synthesis data.
@@ -441,20 +473,31 @@ class HandoffSynthesisService:
 
         AC#3: Graceful Degradation
         - Missing sections noted with "[Data unavailable]" placeholder
-        """
-        sections = []
-
-        # Section 1: Shift Performance Overview
-        sections.append(self._generate_overview_section(synthesis_data))
 
-        # Section 2: Issues Encountered and Status
-        sections.append(self._generate_issues_section(synthesis_data))
-
-        # Section 3: Ongoing Concerns (Unresolved Alerts)
-        sections.append(self._generate_concerns_section(synthesis_data))
+        Args:
+            synthesis_data: Tool results
+            cached_sections: Sections of the previous synthesis, by section type
+            regenerate: Section types to regenerate; the others are taken from
+                cached_sections (default: regenerate all)
+        """
+        generators = [
+            # Section 1: Shift Performance Overview
+            ("overview", self._generate_overview_section),
+            # Section 2: Issues Encountered and Status
+            ("issues", self._generate_issues_section),
+            # Section 3: Ongoing Concerns (Unresolved Alerts)
+            ("concerns", self._generate_concerns_section),
+            # Section 4: Recommended Focus for Incoming Shift
+            ("focus", self._generate_focus_section),
+        ]
 
-        # Section 4: Recommended Focus for Incoming Shift
-        sections.append(self._generate_focus_section(synthesis_data))
+        sections = []
+        for section_type, generate in generators:
+            cached = (cached_sections or {}).get(section_type)
+            if cached is not None and regenerate is not None and section_type not in regenerate:
+                sections.append(cached.model_copy(deep=True))
+            else:
+                sections.append(generate(synthesis_data))
 
         return sections
 
@@ -777,5 +820,5 @@ def get_handoff_synthesis_service() -> HandoffSynthesisService:
     """
     global _handoff_synthesis_service
     if _handoff_synthesis_service is None:
-        _handoff_synthesis_service = HandoffSynthesisService()
+        _handoff_synthesis_service = HandoffSynthesisService(cache=get_handoff_synthesis_cache())
     return _handoff_synthesis_service
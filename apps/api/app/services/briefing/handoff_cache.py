@@ -0,0 +1,198 @@
+"""
+Handoff Synthesis Cache (Story 9.2)
+
+Outgoing supervisors refresh the handoff screen repeatedly while drafting.
+Each synthesis is kept per (shift date, shift type, supervisor asset scope)
+together with a data-version stamp: per-table versions bumped by the
+DataChangedEvents Live Pulse and the Morning Report publish after each
+committed write. The next synthesis for the same shift:
+
+- Reuses tool results whose source tables are unchanged
+- Re-runs tools whose tables changed, that failed, or whose results are
+  older than HANDOFF_SYNTHESIS_CACHE_TTL_SECONDS
+- Regenerates only the narrative sections that read a re-run tool
+
+Each API worker caches the syntheses it served.
+"""
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core.config import get_settings
+from app.models.handoff import HandoffSection, HandoffSynthesisData, ShiftTimeRange
+from app.services.event_bus import TOOL_SOURCE_TABLES, TableVersions
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow() -> datetime:
+    """Get current UTC time in a timezone-aware manner."""
+    return datetime.now(timezone.utc)
+
+
+# Tools a handoff synthesis runs (source tables in TOOL_SOURCE_TABLES)
+HANDOFF_TOOLS = ("production_status", "downtime_analysis", "safety_events", "alert_check")
+
+# Tools each narrative section is generated from
+SECTION_TOOLS: Dict[str, Tuple[str, ...]] = {
+    "overview": ("production_status",),
+    "issues": ("downtime_analysis",),
+    "concerns": ("safety_events", "alert_check"),
+    "focus": ("safety_events", "alert_check", "production_status", "downtime_analysis"),
+}
+
+# Shifts cached per worker (three shifts a day across supervisor scopes)
+MAX_CACHED_SHIFTS = 64
+
+CacheKey = Tuple[date, str, Tuple[str, ...]]
+
+
+@dataclass
+class CachedSynthesis:
+    """Tool results and sections of the last synthesis for one shift and scope."""
+
+    synthesis_data: HandoffSynthesisData
+    sections: Dict[str, HandoffSection]
+    table_versions: Dict[str, int]
+    tool_fetched_at: Dict[str, datetime] = field(default_factory=dict)
+
+
+def sections_for_tools(tools: Iterable[str]) -> Set[str]:
+    """Section types that read any of the given tools."""
+    tools = set(tools)
+    return {section for section, inputs in SECTION_TOOLS.items() if tools.intersection(inputs)}
+
+
+class HandoffSynthesisCache:
+    """
+    Handoff syntheses keyed by shift and supervisor scope.
+
+    Usage:
+        cache = get_handoff_synthesis_cache()
+        key = cache.key_for(shift_info, supervisor_assignments)
+        stale = cache.stale_tools(key)
+    """
+
+    def __init__(self, ttl_seconds: Optional[int] = None):
+        if ttl_seconds is None:
+            ttl_seconds = get_settings().handoff_synthesis_cache_ttl_seconds
+        self._ttl = timedelta(seconds=ttl_seconds)
+        self.table_versions = TableVersions()
+        self._entries: "OrderedDict[CacheKey, CachedSynthesis]" = OrderedDict()
+        self._counters = {"hits": 0, "partial_hits": 0, "misses": 0}
+
+    def data_version(self, versions: Optional[Dict[str, int]] = None) -> str:
+        """Data-version stamp over the handoff source tables (default: current versions)."""
+        tables = sorted({t for tool in HANDOFF_TOOLS for t in TOOL_SOURCE_TABLES[tool]})
+        return self.table_versions.stamp(tables, versions)
+
+    @staticmethod
+    def key_for(shift_info: ShiftTimeRange, supervisor_assignments: Optional[List[str]]) -> CacheKey:
+        """Cache key for a shift and the supervisor's asset scope."""
+        shift_type = getattr(shift_info.shift_type, "value", shift_info.shift_type)
+        return shift_info.shift_date, shift_type, tuple(sorted(supervisor_assignments or []))
+
+    def get(self, key: CacheKey) -> Optional[CachedSynthesis]:
+        """The cached synthesis for a shift and scope, if any."""
+        return self._entries.get(key)
+
+    def stale_tools(self, key: CacheKey) -> Set[str]:
+        """
+        Tools to re-run for a shift and scope: every tool without a cached
+        synthesis, otherwise tools that failed, outlived the TTL, or read a
+        table that changed since they ran.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._counters["misses"] += 1
+            return set(HANDOFF_TOOLS)
+
+        now = _utcnow()
+        stale = self.table_versions.changed_tools(entry.table_versions, HANDOFF_TOOLS)
+        for tool_name in HANDOFF_TOOLS:
+            result = getattr(entry.synthesis_data, tool_name)
+            fetched_at = entry.tool_fetched_at.get(tool_name)
+            if (
+                result is None
+                or not result.success
+                or fetched_at is None
+                or now - fetched_at >= self._ttl
+            ):
+                stale.add(tool_name)
+
+        self._counters["partial_hits" if stale else "hits"] += 1
+        return stale
+
+    def store(
+        self,
+        key: CacheKey,
+        synthesis_data: HandoffSynthesisData,
+        sections: List[HandoffSection],
+        refreshed_tools: Iterable[str],
+        table_versions: Dict[str, int],
+    ) -> None:
+        """
+        Store a synthesis.
+
+        Args:
+            key: Shift and scope key
+            synthesis_data: Tool results the sections were generated from
+            sections: Generated narrative sections
+            refreshed_tools: Tools run for this synthesis (others were reused)
+            table_versions: Table versions taken before the tools ran
+        """
+        previous = self._entries.pop(key, None)
+        fetched_at = dict(previous.tool_fetched_at) if previous else {}
+        now = _utcnow()
+        for tool_name in refreshed_tools:
+            fetched_at[tool_name] = now
+
+        self._entries[key] = CachedSynthesis(
+            synthesis_data=synthesis_data,
+            sections={s.section_type: s for s in sections},
+            table_versions=dict(table_versions),
+            tool_fetched_at=fetched_at,
+        )
+        while len(self._entries) > MAX_CACHED_SHIFTS:
+            self._entries.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {**self._counters, "entries": len(self._entries)}
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Module-level singleton
+_handoff_synthesis_cache: Optional[HandoffSynthesisCache] = None
+
+
+def get_handoff_synthesis_cache() -> Optional[HandoffSynthesisCache]:
+    """
+    Get the singleton HandoffSynthesisCache instance.
+
+    Returns:
+        HandoffSynthesisCache instance, or None when caching is disabled
+    """
+    global _handoff_synthesis_cache
+    if not get_settings().handoff_synthesis_cache_enabled:
+        return None
+    if _handoff_synthesis_cache is None:
+        _handoff_synthesis_cache = HandoffSynthesisCache()
+        _handoff_synthesis_cache.table_versions.subscribe()
+    return _handoff_synthesis_cache
+
+
+def reset_handoff_synthesis_cache() -> None:
+    """
+    Reset the singleton HandoffSynthesisCache.
+
+    Primarily used for testing.
+    """
+    global _handoff_synthesis_cache
+    if _handoff_synthesis_cache is not None:
+        _handoff_synthesis_cache.table_versions.unsubscribe()
+    _handoff_synthesis_cache = None
@@ -26,10 +26,12 @@ References:
 
 import logging
 import asyncio
+import contextvars
 import sys
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any, Set
+from typing import Optional, List, Dict, Any, Callable, Iterator, Set, Tuple
 
 # Python 3.11+ has asyncio.timeout, earlier versions need async_timeout
 if sys.version_info >= (3, 11):
@@ -49,6 +51,8 @@ else:
             except asyncio.CancelledError:
                 raise asyncio.TimeoutError()
 
+from app.core.cancellation import DEADLINE, get_cancellation_stats
+from app.core.config import get_settings
 from app.models.briefing import (
     BriefingResponse,
     BriefingSection,
@@ -58,6 +62,7 @@ from app.models.briefing import (
     ToolResultData,
     BriefingCitation,
     BriefingScope,
+    BriefingNarrativeStats,
 )
 from app.models.user import CurrentUserWithRole, UserRole, UserPreferences
 from app.services.briefing.service import (
@@ -66,7 +71,10 @@ from app.services.briefing.service import (
     TOTAL_TIMEOUT_SECONDS,
     PER_TOOL_TIMEOUT_SECONDS,
 )
-from app.services.briefing.narrative import get_narrative_generator
+from app.services.briefing.narrative import AreaNarrativeResult, get_narrative_generator
+from app.services.briefing.data_plan import BriefingDataPlan, current_data_plan, use_data_plan
+from app.services.briefing.morning_snapshot import capture_tool_results, get_morning_snapshot_store
+from app.services.agent.data_source.round_trips import count_round_trips
 
 logger = logging.getLogger(__name__)
 
@@ -135,6 +143,42 @@ DEFAULT_AREA_ORDER = ["packing", "rychigers", "grinding", "powder", "roasting",
 # Timeout for area briefing generation
 AREA_TIMEOUT_SECONDS = 4
 
+# Area narrative modes (briefing_narrative_mode)
+NARRATIVE_MODE_BATCHED = "batched"
+NARRATIVE_MODE_PER_AREA = "per_area"
+NARRATIVE_MODE_TEMPLATE = "template"
+
+# (area_id, area_name, template narrative) for areas generated in the current briefing
+_area_facts: contextvars.ContextVar[Optional[List[Tuple[str, str, str]]]] = contextvars.ContextVar(
+    "briefing_area_facts", default=None
+)
+
+
+# Called with each section once generated, and again once its text is final
+# (progressive delivery)
+SectionCallback = Callable[[BriefingSection], None]
+
+
+def _notify_section(on_section: Optional[SectionCallback], section: BriefingSection) -> None:
+    """Report a section to a progressive delivery listener, if any."""
+    if on_section is None:
+        return
+    try:
+        on_section(section)
+    except Exception as e:
+        logger.warning(f"Section listener failed for {section.area_id or section.section_type}: {e}")
+
+
+@contextmanager
+def _collect_area_facts() -> Iterator[List[Tuple[str, str, str]]]:
+    """Collect area facts for the LLM narrative pass of one briefing."""
+    facts: List[Tuple[str, str, str]] = []
+    token = _area_facts.set(facts)
+    try:
+        yield facts
+    finally:
+        _area_facts.reset(token)
+
 
 class AreaBriefingData:
     """Data for a single production area briefing."""
@@ -279,6 +323,20 @@ class MorningBriefingService:
                     self._asset_area_map[asset_name.lower()] = area["id"]
         return self._asset_area_map
 
+    def _create_data_plan(self) -> Optional[BriefingDataPlan]:
+        """
+        Create a fetch-once data plan for a multi-area briefing.
+
+        Returns None when disabled, in which case each area queries its
+        own tools.
+        """
+        if not get_settings().briefing_data_plan_enabled:
+            return None
+        return BriefingDataPlan(
+            self._get_asset_area_map(),
+            {area["id"]: area["name"] for area in PRODUCTION_AREAS},
+        )
+
     def get_supervisor_areas(
         self,
         assigned_asset_ids: List[str],
@@ -419,46 +477,62 @@ class MorningBriefingService:
         sections: List[BriefingSection] = []
         tool_failures: List[str] = []
         timed_out = False
+        narrative_stats: Optional[BriefingNarrativeStats] = None
+
+        # Fetch plant-wide data once and slice it per area; collect area
+        # facts for one LLM narrative pass over all areas, and the headline's
+        # plant-wide tool results for the EOD comparison
+        with count_round_trips() as round_trips, \
+                use_data_plan(self._create_data_plan()) as data_plan, \
+                _collect_area_facts() as area_facts, \
+                capture_tool_results() as tool_results:
+            try:
+                # Total 30-second timeout (NFR8)
+                async with async_timeout(TOTAL_TIMEOUT_SECONDS):
+                    # AC#1: Skip plant-wide headline for supervisors - go straight to their areas
+                    # No headline section generated
+
+                    # Generate area sections in parallel for performance
+                    area_tasks = [
+                        self._generate_area_section(
+                            area,
+                            detail_level=detail_level,
+                        )
+                        for area in supervisor_areas
+                    ]
+
+                    area_results = await asyncio.gather(*area_tasks, return_exceptions=True)
+
+                    # Process results
+                    for i, result in enumerate(area_results):
+                        if isinstance(result, Exception):
+                            logger.error(f"Area {supervisor_areas[i]['name']} failed: {result}")
+                            tool_failures.append(supervisor_areas[i]["id"])
+                            sections.append(self._create_error_section(supervisor_areas[i]))
+                        elif isinstance(result, BriefingSection):
+                            sections.append(result)
+                        else:
+                            logger.warning(f"Unexpected result for {supervisor_areas[i]['name']}: {type(result)}")
+
+                    narrative_stats = await self._apply_area_narratives(sections, area_facts, detail_level)
+
+            except asyncio.TimeoutError:
+                get_cancellation_stats().record("briefing.supervisor", DEADLINE)
+                logger.warning(f"Supervisor briefing {briefing_id} timed out after {TOTAL_TIMEOUT_SECONDS}s")
+                timed_out = True
+                for section in sections:
+                    if section.status == BriefingSectionStatus.PENDING:
+                        section.status = BriefingSectionStatus.TIMED_OUT
+                        section.error_message = "Generation timed out"
+
+            except Exception as e:
+                logger.error(f"Supervisor briefing generation failed: {e}", exc_info=True)
+                return self._create_error_response(briefing_id, user.id, str(e))
 
-        try:
-            # Total 30-second timeout (NFR8)
-            async with async_timeout(TOTAL_TIMEOUT_SECONDS):
-                # AC#1: Skip plant-wide headline for supervisors - go straight to their areas
-                # No headline section generated
-
-                # Generate area sections in parallel for performance
-                area_tasks = [
-                    self._generate_area_section(
-                        area,
-                        detail_level=detail_level,
-                    )
-                    for area in supervisor_areas
-                ]
-
-                area_results = await asyncio.gather(*area_tasks, return_exceptions=True)
-
-                # Process results
-                for i, result in enumerate(area_results):
-                    if isinstance(result, Exception):
-                        logger.error(f"Area {supervisor_areas[i]['name']} failed: {result}")
-                        tool_failures.append(supervisor_areas[i]["id"])
-                        sections.append(self._create_error_section(supervisor_areas[i]))
-                    elif isinstance(result, BriefingSection):
-                        sections.append(result)
-                    else:
-                        logger.warning(f"Unexpected result for {supervisor_areas[i]['name']}: {type(result)}")
-
-        except asyncio.TimeoutError:
-            logger.warning(f"Supervisor briefing {briefing_id} timed out after {TOTAL_TIMEOUT_SECONDS}s")
-            timed_out = True
-            for section in sections:
-                if section.status == BriefingSectionStatus.PENDING:
-                    section.status = BriefingSectionStatus.TIMED_OUT
-                    section.error_message = "Generation timed out"
-
-        except Exception as e:
-            logger.error(f"Supervisor briefing generation failed: {e}", exc_info=True)
-            return self._create_error_response(briefing_id, user.id, str(e))
+        logger.info(
+            f"Briefing {briefing_id} made {round_trips.count} data round trips "
+            f"({'data plan' if data_plan is not None else 'per-area tools'})"
+        )
 
         # Calculate completion
         completed_count = len([s for s in sections if s.is_complete])
@@ -490,6 +564,8 @@ class MorningBriefingService:
                 timed_out=timed_out,
                 tool_failures=tool_failures,
                 cache_hit=False,
+                data_round_trips=round_trips.count,
+                narrative=narrative_stats,
             ),
         )
 
@@ -538,6 +614,7 @@ class MorningBriefingService:
         user_id: str,
         area_order: Optional[List[str]] = None,
         include_audio: bool = True,
+        on_section: Optional[SectionCallback] = None,
     ) -> BriefingResponse:
         """
         Generate a complete morning briefing covering all production areas.
@@ -549,6 +626,9 @@ class MorningBriefingService:
             user_id: User requesting the briefing
             area_order: Optional list of area IDs in preferred order
             include_audio: Whether to generate TTS audio
+            on_section: Optional callback receiving each section as soon as
+                it is generated (in completion order), and again with its final
+                text (narrated areas change; other repeats are unchanged)
 
         Returns:
             BriefingResponse with sections for each area
@@ -564,46 +644,74 @@ class MorningBriefingService:
         sections: List[BriefingSection] = []
         tool_failures: List[str] = []
         timed_out = False
+        narrative_stats: Optional[BriefingNarrativeStats] = None
+
+        # Fetch plant-wide data once and slice it per area; collect area
+        # facts for one LLM narrative pass over all areas, and the headline's
+        # plant-wide tool results for the EOD comparison
+        with count_round_trips() as round_trips, \
+                use_data_plan(self._create_data_plan()) as data_plan, \
+                _collect_area_facts() as area_facts, \
+                capture_tool_results() as tool_results:
+            try:
+                # Total 30-second timeout (NFR8)
+                async with async_timeout(TOTAL_TIMEOUT_SECONDS):
+                    # Generate headline section first
+                    headline_section = await self._generate_headline_section(user_id)
+                    sections.append(headline_section)
+                    _notify_section(on_section, headline_section)
+
+                    # Areas are reported with their template text as each finishes;
+                    # an LLM narrative pass re-reports the areas it rewrites
+                    async def area_section(area: Dict[str, Any]) -> BriefingSection:
+                        section = await self._generate_area_section(area)
+                        _notify_section(on_section, section)
+                        return section
+
+                    # Generate area sections in parallel for performance
+                    area_tasks = [
+                        area_section(area)
+                        for area in areas
+                    ]
+
+                    area_results = await asyncio.gather(*area_tasks, return_exceptions=True)
+
+                    # Process results
+                    for i, result in enumerate(area_results):
+                        if isinstance(result, Exception):
+                            logger.error(f"Area {areas[i]['name']} failed: {result}")
+                            tool_failures.append(areas[i]["id"])
+                            # Create partial section for failed area
+                            sections.append(self._create_error_section(areas[i]))
+                        elif isinstance(result, BriefingSection):
+                            sections.append(result)
+                        else:
+                            logger.warning(f"Unexpected result for {areas[i]['name']}: {type(result)}")
+
+                    narrative_stats = await self._apply_area_narratives(sections, area_facts)
+
+            except asyncio.TimeoutError:
+                get_cancellation_stats().record("briefing.morning", DEADLINE)
+                logger.warning(f"Morning briefing {briefing_id} timed out after {TOTAL_TIMEOUT_SECONDS}s")
+                timed_out = True
+                # Mark pending sections as timed out
+                for section in sections:
+                    if section.status == BriefingSectionStatus.PENDING:
+                        section.status = BriefingSectionStatus.TIMED_OUT
+                        section.error_message = "Generation timed out"
+
+            except Exception as e:
+                logger.error(f"Morning briefing generation failed: {e}", exc_info=True)
+                return self._create_error_response(briefing_id, user_id, str(e))
+
+        # Report final sections: narrated areas (an update), failed or timed-out areas
+        for section in sections:
+            _notify_section(on_section, section)
 
-        try:
-            # Total 30-second timeout (NFR8)
-            async with async_timeout(TOTAL_TIMEOUT_SECONDS):
-                # Generate headline section first
-                headline_section = await self._generate_headline_section(user_id)
-                sections.append(headline_section)
-
-                # Generate area sections in parallel for performance
-                area_tasks = [
-                    self._generate_area_section(area)
-                    for area in areas
-                ]
-
-                area_results = await asyncio.gather(*area_tasks, return_exceptions=True)
-
-                # Process results
-                for i, result in enumerate(area_results):
-                    if isinstance(result, Exception):
-                        logger.error(f"Area {areas[i]['name']} failed: {result}")
-                        tool_failures.append(areas[i]["id"])
-                        # Create partial section for failed area
-                        sections.append(self._create_error_section(areas[i]))
-                    elif isinstance(result, BriefingSection):
-                        sections.append(result)
-                    else:
-                        logger.warning(f"Unexpected result for {areas[i]['name']}: {type(result)}")
-
-        except asyncio.TimeoutError:
-            logger.warning(f"Morning briefing {briefing_id} timed out after {TOTAL_TIMEOUT_SECONDS}s")
-            timed_out = True
-            # Mark pending sections as timed out
-            for section in sections:
-                if section.status == BriefingSectionStatus.PENDING:
-                    section.status = BriefingSectionStatus.TIMED_OUT
-                    section.error_message = "Generation timed out"
-
-        except Exception as e:
-            logger.error(f"Morning briefing generation failed: {e}", exc_info=True)
-            return self._create_error_response(briefing_id, user_id, str(e))
+        logger.info(
+            f"Briefing {briefing_id} made {round_trips.count} data round trips "
+            f"({'data plan' if data_plan is not None else 'per-area tools'})"
+        )
 
         # Calculate completion
         completed_count = len([s for s in sections if s.is_complete])
@@ -619,7 +727,7 @@ class MorningBriefingService:
         duration_estimate_seconds = max(int(total_chars / 12.5), 75)  # Min 75s for full briefing
 
         # Build response
-        return BriefingResponse(
+        briefing = BriefingResponse(
             id=briefing_id,
             title=self._get_briefing_title(),
             scope=BriefingScope.PLANT_WIDE.value,
@@ -634,8 +742,115 @@ class MorningBriefingService:
                 timed_out=timed_out,
                 tool_failures=tool_failures,
                 cache_hit=False,
+                data_round_trips=round_trips.count,
+                narrative=narrative_stats,
             ),
         )
+        if tool_results and get_settings().eod_reuse_morning_snapshot:
+            try:
+                get_morning_snapshot_store().record_briefing(briefing, tool_results[0])
+            except Exception as e:
+                logger.warning(f"Morning snapshot for briefing {briefing_id} not stored: {e}")
+        return briefing
+
+    async def generate_area_sections(
+        self,
+        detail_level: str = "detailed",
+    ) -> List[BriefingSection]:
+        """
+        Generate a section for every production area at one detail level.
+
+        Used to pre-generate per-area briefings (see briefing/store.py);
+        areas are returned in the default order, failed areas as error
+        sections.
+
+        Args:
+            detail_level: "summary" or "detailed" (FR37)
+
+        Returns:
+            One BriefingSection per production area
+        """
+        areas = self.order_areas()
+        with use_data_plan(self._create_data_plan()), _collect_area_facts() as area_facts:
+            results = await asyncio.gather(
+                *[self._generate_area_section(area, detail_level=detail_level) for area in areas],
+                return_exceptions=True,
+            )
+
+            sections: List[BriefingSection] = []
+            for area, result in zip(areas, results):
+                if isinstance(result, BriefingSection):
+                    sections.append(result)
+                else:
+                    logger.error(f"Area {area['name']} failed: {result}")
+                    sections.append(self._create_error_section(area))
+
+            await self._apply_area_narratives(sections, area_facts, detail_level)
+        return sections
+
+    async def _apply_area_narratives(
+        self,
+        sections: List[BriefingSection],
+        area_facts: List[Tuple[str, str, str]],
+        detail_level: str = "detailed",
+    ) -> BriefingNarrativeStats:
+        """
+        Replace template area narratives with LLM narratives.
+
+        Batched mode writes every area in one structured LLM call;
+        per_area mode makes one call per area. Areas the LLM does not
+        return (no client, deadline, unparseable output) keep their
+        template narrative.
+
+        Args:
+            sections: Briefing sections; complete area sections are updated in place
+            area_facts: (area_id, area_name, template narrative) per generated area
+            detail_level: "summary" or "detailed" (FR37)
+
+        Returns:
+            BriefingNarrativeStats for the briefing metadata
+        """
+        mode = get_settings().briefing_narrative_mode
+        complete = {
+            s.area_id for s in sections
+            if s.section_type == "area" and s.status == BriefingSectionStatus.COMPLETE
+        }
+        areas = [facts for facts in area_facts if facts[0] in complete]
+        if mode not in (NARRATIVE_MODE_BATCHED, NARRATIVE_MODE_PER_AREA) or not areas:
+            return BriefingNarrativeStats(mode=mode)
+
+        generator = self._get_narrative_generator()
+        result = AreaNarrativeResult()
+        try:
+            if mode == NARRATIVE_MODE_BATCHED:
+                result = await generator.generate_area_narratives(areas, detail_level=detail_level)
+            else:
+                for area_result in await asyncio.gather(*[
+                    generator.generate_area_narratives([facts], detail_level=detail_level)
+                    for facts in areas
+                ]):
+                    result.merge(area_result)
+        except Exception as e:
+            logger.warning(f"Area narrative generation failed, using templates: {e}")
+
+        for section in sections:
+            narrative = result.narratives.get(section.area_id)
+            if narrative and section.area_id in complete:
+                section.content = narrative
+
+        logger.info(
+            f"Area narratives ({mode}): {len(result.narratives)}/{len(areas)} areas from "
+            f"{result.llm_calls} LLM calls, {result.prompt_tokens + result.completion_tokens} tokens, "
+            f"{result.latency_ms:.0f}ms"
+        )
+        return BriefingNarrativeStats(
+            mode=mode,
+            llm_calls=result.llm_calls,
+            prompt_tokens=result.prompt_tokens,
+            completion_tokens=result.completion_tokens,
+            latency_ms=result.latency_ms,
+            llm_areas=len(result.narratives),
+        )
 
     async def _generate_headline_section(self, user_id: str) -> BriefingSection:
         """
@@ -719,6 +934,9 @@ class MorningBriefingService:
                     area_data,
                     detail_level=detail_level,
                 )
+                facts = _area_facts.get()
+                if facts is not None:
+                    facts.append((area_id, area_name, content))
 
                 return BriefingSection(
                     section_type="area",
@@ -731,6 +949,7 @@ class MorningBriefingService:
                 )
 
         except asyncio.TimeoutError:
+            get_cancellation_stats().record("briefing.area", DEADLINE)
             logger.warning(f"Area {area_name} section timed out")
             return BriefingSection(
                 section_type="area",
@@ -762,7 +981,8 @@ class MorningBriefingService:
         """
         Get briefing data for a specific area.
 
-        Queries tools scoped to the area's assets.
+        Slices the active data plan when there is one, otherwise queries
+        tools scoped to the area's assets.
         """
         area_def = next((a for a in PRODUCTION_AREAS if a["id"] == area_id), None)
         if not area_def:
@@ -775,6 +995,15 @@ class MorningBriefingService:
             assets=assets,
         )
 
+        plan = current_data_plan()
+        if plan is not None:
+            results = await plan.area_results(area_id)
+            area_data.production_status = results["production_status"]
+            area_data.oee_data = results["oee_data"]
+            area_data.downtime_analysis = results["downtime_analysis"]
+            area_data.safety_events = results["safety_events"]
+            return area_data
+
         # Import tools here to avoid circular imports
         from app.services.agent.tools.production_status import ProductionStatusTool
         from app.services.agent.tools.oee_query import OEEQueryTool
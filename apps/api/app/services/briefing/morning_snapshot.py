@@ -0,0 +1,313 @@
+"""
+Morning Briefing Snapshots
+
+Persists what the morning briefing knew, in structured form, so the End
+of Day summary compares against it instead of re-deriving it:
+
+- The plant-wide tool results behind the morning headline (production,
+  OEE, safety, downtime, action list), captured as the briefing is built
+- Concerns and wins derived from those results (issue type, severity,
+  asset, area), so the EOD comparison needs no narrative text parsing
+- Source-table versions at capture, bumped by DataChangedEvents: EOD
+  re-queries the live tools (production, safety) and only those other
+  tools whose tables changed since morning
+
+Snapshots are keyed by plant date: the latest briefing generated before
+noon plant time (PIPELINE_TIMEZONE). They are held in the memory of the
+API worker that generated the briefing and are lost on restart; an EOD
+summary served by another worker, or after a restart, falls back to the
+text-parsing comparison (morning briefings themselves are only kept in
+process in this tree, see app.api.briefing._active_briefings).
+"""
+
+import contextvars
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Dict, Iterator, List, Optional, Set
+from zoneinfo import ZoneInfo
+
+from app.core.config import get_settings
+from app.models.briefing import BriefingData, BriefingResponse
+from app.services.event_bus import TableVersions
+
+logger = logging.getLogger(__name__)
+
+# Plant-wide briefing tools (source tables in event_bus.TOOL_SOURCE_TABLES)
+SNAPSHOT_TOOLS = ("production_status", "oee_data", "downtime_analysis", "safety_events", "action_list")
+
+# Tools that describe the day as it happens: always re-queried at EOD
+LIVE_TOOLS = ("production_status", "safety_events")
+
+# Briefings generated from noon onwards are not morning briefings
+MORNING_CUTOFF_HOUR = 12
+
+# Days of snapshots kept per worker
+SNAPSHOT_RETENTION_DAYS = 7
+
+# Downtime reasons at or above this many minutes are flagged as concerns
+DOWNTIME_CONCERN_MINUTES = 30
+
+MAX_CONCERNS_PER_TYPE = 3
+
+
+def _utcnow() -> datetime:
+    """Get current UTC time in a timezone-aware manner."""
+    return datetime.now(timezone.utc)
+
+
+def plant_time(moment: datetime) -> datetime:
+    """A timestamp in plant-local time (naive timestamps are taken as UTC)."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(ZoneInfo(get_settings().pipeline_timezone))
+
+
+def plant_today() -> date:
+    """Today's plant-local date."""
+    return plant_time(_utcnow()).date()
+
+
+class MorningConcern:
+    """A concern flagged in the morning briefing."""
+
+    def __init__(
+        self,
+        concern_id: str,
+        description: str,
+        issue_type: str,
+        severity: str = "medium",
+        asset_id: Optional[str] = None,
+        asset_name: Optional[str] = None,
+        area: Optional[str] = None,
+    ):
+        self.concern_id = concern_id
+        self.description = description
+        self.issue_type = issue_type
+        self.severity = severity
+        self.asset_id = asset_id
+        self.asset_name = asset_name
+        self.area = area
+
+
+@dataclass
+class MorningSnapshot:
+    """Structured state of one morning briefing."""
+
+    briefing_id: str
+    generated_at: datetime
+    tool_results: BriefingData
+    concerns: List[MorningConcern] = field(default_factory=list)
+    wins: List[str] = field(default_factory=list)
+    sections: List[Dict[str, str]] = field(default_factory=list)
+    table_versions: Dict[str, int] = field(default_factory=dict)
+
+
+# Plant-wide tool results of the briefing being generated
+_captured_tool_results: contextvars.ContextVar[Optional[List[BriefingData]]] = contextvars.ContextVar(
+    "briefing_captured_tool_results", default=None
+)
+
+
+@contextmanager
+def capture_tool_results() -> Iterator[List[BriefingData]]:
+    """Collect the plant-wide tool results gathered while generating one briefing."""
+    captured: List[BriefingData] = []
+    token = _captured_tool_results.set(captured)
+    try:
+        yield captured
+    finally:
+        _captured_tool_results.reset(token)
+
+
+def record_tool_results(briefing_data: BriefingData) -> None:
+    """Report plant-wide tool results to the active capture, if any."""
+    captured = _captured_tool_results.get()
+    if captured is not None:
+        captured.append(briefing_data)
+
+
+def derive_concerns(briefing_data: BriefingData) -> List[MorningConcern]:
+    """
+    Concerns the morning data flags, one per asset, event or downtime reason.
+
+    Args:
+        briefing_data: Plant-wide tool results
+
+    Returns:
+        MorningConcern list with issue type, severity and asset/area set
+    """
+    concerns: List[MorningConcern] = []
+
+    def add(description: str, issue_type: str, severity: str, **location) -> None:
+        concerns.append(MorningConcern(
+            concern_id=f"mc-{len(concerns) + 1}",
+            description=description,
+            issue_type=issue_type,
+            severity=severity,
+            **location,
+        ))
+
+    production = briefing_data.production_status
+    if production and production.success:
+        behind = [
+            asset for asset in (production.data or {}).get("assets", [])
+            if asset.get("status") == "behind"
+        ]
+        for asset in behind[:MAX_CONCERNS_PER_TYPE]:
+            variance = asset.get("variance_percent", 0) or 0
+            add(
+                f"{asset.get('asset_name')} behind target ({abs(variance):.1f}%)",
+                "production",
+                "high" if variance < -10 else "medium",
+                asset_name=asset.get("asset_name"),
+                area=asset.get("area"),
+            )
+
+    safety = briefing_data.safety_events
+    if safety and safety.success:
+        for event in (safety.data or {}).get("events", [])[:MAX_CONCERNS_PER_TYPE]:
+            description = event.get("description") or event.get("reason_code") or "Safety event"
+            add(
+                f"Safety: {description}",
+                "safety",
+                event.get("severity") or "medium",
+                asset_id=event.get("asset_id"),
+                asset_name=event.get("asset_name"),
+                area=event.get("area"),
+            )
+
+    downtime = briefing_data.downtime_analysis
+    if downtime and downtime.success:
+        reasons = [
+            reason for reason in (downtime.data or {}).get("top_reasons", [])
+            if (reason.get("duration_minutes") or 0) >= DOWNTIME_CONCERN_MINUTES
+        ]
+        for reason in reasons[:MAX_CONCERNS_PER_TYPE]:
+            minutes = reason.get("duration_minutes") or 0
+            add(
+                f"{reason.get('reason')} downtime ({minutes} minutes)",
+                "downtime",
+                "high" if minutes > 60 else "medium",
+            )
+
+    return concerns
+
+
+def derive_wins(briefing_data: BriefingData) -> List[str]:
+    """Wins the morning data reports."""
+    wins: List[str] = []
+    production = briefing_data.production_status
+    if production and production.success:
+        summary = (production.data or {}).get("summary", {})
+        if (summary.get("total_variance_percent") or 0) > 0:
+            wins.append(f"Production ahead of target by {summary['total_variance_percent']}%")
+        if summary.get("ahead_count"):
+            wins.append(f"{summary['ahead_count']} assets ahead of target")
+    safety = briefing_data.safety_events
+    if safety and safety.success and (safety.data or {}).get("total_events", 0) == 0:
+        wins.append("No safety incidents")
+    return wins
+
+
+class MorningSnapshotStore:
+    """
+    Morning snapshots keyed by plant date.
+
+    Usage:
+        store = get_morning_snapshot_store()
+        snapshot = store.get(summary_date)
+        stale = store.stale_tools(snapshot)
+    """
+
+    def __init__(self):
+        self.table_versions = TableVersions()
+        self._snapshots: Dict[date, MorningSnapshot] = {}
+
+    def record_briefing(self, briefing: BriefingResponse, tool_results: BriefingData) -> Optional[MorningSnapshot]:
+        """
+        Store the snapshot of a morning briefing.
+
+        Args:
+            briefing: The generated morning briefing
+            tool_results: Plant-wide tool results it was built from
+
+        Returns:
+            The stored MorningSnapshot, or None if the briefing is not a morning one
+        """
+        generated_at = briefing.metadata.generated_at
+        local_time = plant_time(generated_at)
+        if local_time.hour >= MORNING_CUTOFF_HOUR:
+            return None
+        plant_date = local_time.date()
+
+        snapshot = MorningSnapshot(
+            briefing_id=briefing.id,
+            generated_at=generated_at,
+            tool_results=tool_results.model_copy(deep=True),
+            concerns=derive_concerns(tool_results),
+            wins=derive_wins(tool_results),
+            sections=[
+                {"type": s.section_type, "title": s.title, "content": s.content}
+                for s in briefing.sections
+            ],
+            table_versions=self.table_versions.snapshot(),
+        )
+        self._snapshots[plant_date] = snapshot
+        for day in sorted(self._snapshots)[:-SNAPSHOT_RETENTION_DAYS]:
+            del self._snapshots[day]
+        logger.info(
+            f"Morning snapshot stored for {plant_date}: "
+            f"{len(snapshot.concerns)} concerns, {len(snapshot.wins)} wins"
+        )
+        return snapshot
+
+    def get(self, summary_date: date) -> Optional[MorningSnapshot]:
+        """The morning snapshot for a plant date, if one was generated."""
+        return self._snapshots.get(summary_date)
+
+    def stale_tools(self, snapshot: MorningSnapshot) -> Set[str]:
+        """
+        Tools to re-query at EOD: live tools, tools that failed in the
+        morning, and tools reading a table that changed since the snapshot.
+        """
+        stale = set(LIVE_TOOLS) | self.table_versions.changed_tools(snapshot.table_versions, SNAPSHOT_TOOLS)
+        for tool_name in SNAPSHOT_TOOLS:
+            result = getattr(snapshot.tool_results, tool_name)
+            if result is None or not result.success:
+                stale.add(tool_name)
+        return stale
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+
+
+# Module-level singleton
+_morning_snapshot_store: Optional[MorningSnapshotStore] = None
+
+
+def get_morning_snapshot_store() -> MorningSnapshotStore:
+    """
+    Get the singleton MorningSnapshotStore instance.
+
+    Returns:
+        MorningSnapshotStore instance
+    """
+    global _morning_snapshot_store
+    if _morning_snapshot_store is None:
+        _morning_snapshot_store = MorningSnapshotStore()
+        _morning_snapshot_store.table_versions.subscribe()
+    return _morning_snapshot_store
+
+
+def reset_morning_snapshot_store() -> None:
+    """
+    Reset the singleton MorningSnapshotStore.
+
+    Primarily used for testing.
+    """
+    global _morning_snapshot_store
+    if _morning_snapshot_store is not None:
+        _morning_snapshot_store.table_versions.unsubscribe()
+    _morning_snapshot_store = None
@@ -15,13 +15,21 @@ Story 8.6: Voice Number Formatting Integration
 - All numeric metrics formatted for natural speech before TTS
 - Uses formatters module for consistent number formatting
 
+Area narratives (morning briefings) are written for all areas in one
+LLM call with JSON-schema'd output; areas missing from the response
+keep their template narrative.
+
 References:
 - [Source: architecture/voice-briefing.md#BriefingService Architecture]
 """
 
 import logging
 import json
-from typing import Optional, List, Dict, Any
+import time
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Tuple
+
+from pydantic import BaseModel, Field, ValidationError
 
 from app.models.briefing import (
     BriefingSection,
@@ -39,6 +47,10 @@ from app.services.briefing.formatters import (
 
 logger = logging.getLogger(__name__)
 
+# LLM deadline, inside the briefing service's 8s NARRATIVE_TIMEOUT_SECONDS so
+# the fallback model can still answer before templates take over
+NARRATIVE_LLM_DEADLINE_SECONDS = 7.0
+
 
 # Narrative generation prompt template
 NARRATIVE_PROMPT = """You are a manufacturing briefing narrator. Transform the following data into natural, conversational briefing sections optimized for voice delivery.
@@ -79,6 +91,80 @@ Respond with ONLY the JSON, no additional text.
 """
 
 
+class AreaNarrative(BaseModel):
+    """One area's section in the batched area narrative response."""
+    area_id: str = Field(..., description="Area ID exactly as given")
+    content: str = Field(..., description="Spoken narrative for the area")
+
+
+class AreaNarratives(BaseModel):
+    """Structured output of the batched area narrative call."""
+    sections: List[AreaNarrative] = Field(..., description="One entry per area")
+
+
+# Area narrative prompt template (all areas in one call)
+AREA_NARRATIVES_PROMPT = """You are a manufacturing briefing narrator. Rewrite the facts for each production area below as a natural, conversational briefing section optimized for voice delivery.
+
+AREAS:
+{areas}
+
+Respond with ONLY JSON matching this JSON schema, with exactly one section per area:
+{schema}
+
+Guidelines:
+- {length}
+- Keep every number and [Source: table_name] citation from the facts; do not add numbers
+- Lead with safety when an area reports safety events
+- Use encouraging tone for areas ahead of target, constructive tone otherwise
+"""
+
+AREA_NARRATIVE_LENGTH = {
+    "summary": "1-2 sentences per area (under 30 words), headline metrics only",
+    "detailed": "2-3 sentences per area (under 60 words)",
+}
+
+
+@dataclass
+class AreaNarrativeResult:
+    """Area narratives returned by the LLM, and what producing them cost."""
+    narratives: Dict[str, str] = field(default_factory=dict)
+    llm_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency_ms: float = 0.0
+
+    def merge(self, other: "AreaNarrativeResult") -> None:
+        """Add another call's narratives and usage (latency is the slowest call)."""
+        self.narratives.update(other.narratives)
+        self.llm_calls += other.llm_calls
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.latency_ms = max(self.latency_ms, other.latency_ms)
+
+
+def parse_area_narratives(text: str, area_ids: List[str]) -> Optional[Dict[str, str]]:
+    """
+    Parse a batched area narrative response.
+
+    Returns:
+        Area ID -> narrative for the requested areas, or None if the
+        response does not match the AreaNarratives schema
+    """
+    start_idx = text.find('{')
+    end_idx = text.rfind('}') + 1
+    if start_idx < 0 or end_idx <= start_idx:
+        return None
+    try:
+        parsed = AreaNarratives.model_validate_json(text[start_idx:end_idx])
+    except ValidationError:
+        return None
+    return {
+        section.area_id: section.content.strip()
+        for section in parsed.sections
+        if section.area_id in area_ids and section.content.strip()
+    }
+
+
 class NarrativeGenerator:
     """
     LLM-powered narrative generator for briefings.
@@ -243,8 +329,20 @@ RECOMMENDED ACTIONS:
         prompt = NARRATIVE_PROMPT.format(data=data_summary)
 
         try:
-            # Call LLM
-            response = await llm.agenerate(messages=[{"role": "user", "content": prompt}])
+            # Call LLM (cached: an unchanged day yields the same prompt;
+            # hedged with model fallback within the deadline)
+            from langchain_core.messages import HumanMessage
+            from app.services.ai.invocation import get_llm_invoker
+            from app.services.ai.llm_client import cached_llm_call
+            messages = [HumanMessage(content=prompt)]
+            invoker = get_llm_invoker(primary=llm)
+            response = await cached_llm_call(
+                "briefing.narrative",
+                llm,
+                messages,
+                call=lambda: invoker.ainvoke(messages, deadline=NARRATIVE_LLM_DEADLINE_SECONDS),
+                validate=lambda text: "{" in text and "}" in text,
+            )
 
             # Parse response
             if hasattr(response, 'generations') and response.generations:
@@ -290,6 +388,76 @@ RECOMMENDED ACTIONS:
             logger.warning(f"LLM generation error: {e}")
             return None
 
+    async def generate_area_narratives(
+        self,
+        areas: List[Tuple[str, str, str]],
+        detail_level: str = "detailed",
+    ) -> AreaNarrativeResult:
+        """
+        Write narratives for several areas in one LLM call.
+
+        FR37: detail_level sets the narrative length.
+
+        Args:
+            areas: (area_id, area_name, facts) per area; facts are the
+                template narrative, with citations
+            detail_level: "summary" or "detailed"
+
+        Returns:
+            AreaNarrativeResult; narratives is empty (or partial) when the
+            LLM is unavailable or its response does not parse
+        """
+        result = AreaNarrativeResult()
+        llm = self._get_llm_client()
+        if not llm or not areas:
+            return result
+
+        from app.services.ai.llm_client import estimate_tokens
+
+        area_ids = [area_id for area_id, _, _ in areas]
+        prompt = AREA_NARRATIVES_PROMPT.format(
+            areas="\n".join(f"- {area_id} ({name}): {facts}" for area_id, name, facts in areas),
+            schema=json.dumps(AreaNarratives.model_json_schema()),
+            length=AREA_NARRATIVE_LENGTH.get(detail_level, AREA_NARRATIVE_LENGTH["detailed"]),
+        )
+        result.llm_calls = 1
+        result.prompt_tokens = estimate_tokens(prompt)
+        start = time.perf_counter()
+
+        try:
+            from langchain_core.messages import HumanMessage
+            from app.services.ai.invocation import get_llm_invoker
+            from app.services.ai.llm_client import cached_llm_call
+            messages = [HumanMessage(content=prompt)]
+            invoker = get_llm_invoker(primary=llm)
+            response = await cached_llm_call(
+                "briefing.area_narratives",
+                llm,
+                messages,
+                call=lambda: invoker.ainvoke(messages, deadline=NARRATIVE_LLM_DEADLINE_SECONDS),
+                validate=lambda text: parse_area_narratives(text, area_ids) is not None,
+            )
+        except Exception as e:
+            logger.warning(f"Area narrative generation failed: {e}")
+            return result
+        finally:
+            result.latency_ms = round((time.perf_counter() - start) * 1000, 2)
+
+        text = response.content if hasattr(response, "content") else str(response)
+        usage = (getattr(response, "response_metadata", None) or {}).get("token_usage") or {}
+        result.prompt_tokens = usage.get("prompt_tokens", result.prompt_tokens)
+        result.completion_tokens = usage.get("completion_tokens", estimate_tokens(text))
+
+        narratives = parse_area_narratives(text, area_ids)
+        if narratives is None:
+            logger.warning("Area narrative response did not match the schema")
+            return result
+        missing = set(area_ids) - set(narratives)
+        if missing:
+            logger.warning(f"Area narrative response missing areas: {sorted(missing)}")
+        result.narratives = narratives
+        return result
+
     def _generate_with_template(
         self,
         briefing_data: BriefingData,
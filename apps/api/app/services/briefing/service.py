@@ -19,6 +19,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any, Tuple
 
+from app.core.cancellation import DEADLINE, get_cancellation_stats
 from app.models.briefing import (
     BriefingResponse,
     BriefingSection,
@@ -30,6 +31,8 @@ from app.models.briefing import (
     BriefingScope,
     BriefingRequest,
 )
+from app.services.ai.admission import LLMPriority, llm_request_context
+from app.services.briefing.morning_snapshot import record_tool_results
 from app.services.briefing.narrative import get_narrative_generator
 from app.services.agent.tools.production_status import ProductionStatusTool
 from app.services.agent.tools.safety_events import SafetyEventsTool
@@ -112,31 +115,37 @@ class BriefingService:
         tool_failures: List[str] = []
         timed_out = False
 
-        try:
-            # AC#3: Overall 30-second timeout
-            async with asyncio.timeout(TOTAL_TIMEOUT_SECONDS):
-                # AC#1: Orchestrate tools
-                briefing_data = await self._orchestrate_tools(area_id)
-
-                # Track failed tools
-                tool_failures = briefing_data.failed_tools
-
-                # Generate narrative sections
-                sections = await self._generate_narrative_sections(briefing_data)
-
-        except asyncio.TimeoutError:
-            logger.warning(f"Briefing {briefing_id} timed out after {TOTAL_TIMEOUT_SECONDS}s")
-            timed_out = True
-            # Mark any incomplete sections as timed out
-            for section in sections:
-                if section.status == BriefingSectionStatus.PENDING:
-                    section.status = BriefingSectionStatus.TIMED_OUT
-                    section.error_message = "Generation timed out"
-
-        except Exception as e:
-            logger.error(f"Briefing generation failed: {e}", exc_info=True)
-            # Return minimal error response
-            return self._create_error_response(briefing_id, user_id, str(e))
+        # Briefings are batch work for LLM admission control
+        with llm_request_context(LLMPriority.BATCH) as llm_stats:
+            try:
+                # AC#3: Overall 30-second timeout
+                async with asyncio.timeout(TOTAL_TIMEOUT_SECONDS):
+                    # AC#1: Orchestrate tools
+                    briefing_data = await self._orchestrate_tools(area_id)
+                    if area_id is None:
+                        # Morning briefings keep plant-wide results for EOD comparison
+                        record_tool_results(briefing_data)
+
+                    # Track failed tools
+                    tool_failures = briefing_data.failed_tools
+
+                    # Generate narrative sections
+                    sections = await self._generate_narrative_sections(briefing_data)
+
+            except asyncio.TimeoutError:
+                get_cancellation_stats().record("briefing.generate", DEADLINE)
+                logger.warning(f"Briefing {briefing_id} timed out after {TOTAL_TIMEOUT_SECONDS}s")
+                timed_out = True
+                # Mark any incomplete sections as timed out
+                for section in sections:
+                    if section.status == BriefingSectionStatus.PENDING:
+                        section.status = BriefingSectionStatus.TIMED_OUT
+                        section.error_message = "Generation timed out"
+
+            except Exception as e:
+                logger.error(f"Briefing generation failed: {e}", exc_info=True)
+                # Return minimal error response
+                return self._create_error_response(briefing_id, user_id, str(e))
 
         # Calculate completion
         completed_count = len([s for s in sections if s.is_complete])
@@ -167,6 +176,7 @@ class BriefingService:
                 timed_out=timed_out,
                 tool_failures=tool_failures,
                 cache_hit=False,
+                llm_queue_wait_ms=round(llm_stats.queue_wait_ms, 2),
             ),
         )
 
@@ -236,6 +246,7 @@ class BriefingService:
                 return await tool_func(*args)
 
         except asyncio.TimeoutError:
+            get_cancellation_stats().record(f"briefing.tool.{tool_name}", DEADLINE)
             logger.warning(f"Tool {tool_name} timed out after {PER_TOOL_TIMEOUT_SECONDS}s")
             return ToolResultData(
                 tool_name=tool_name,
@@ -0,0 +1,448 @@
+"""
+Pre-generated Morning Briefing Store
+
+Morning briefings are materialized ahead of shift start instead of being
+built on every request, so the 06:00 rush is served from memory:
+
+- pregenerate_briefings() runs after the Morning Report pipeline succeeds
+  and daily at BRIEFING_PREGENERATE_TIME (pipeline timezone). It
+  materializes the plant-wide briefing (headline plus every area at
+  "detailed" level) and every area at "summary" level.
+- Requests are composed from the stored sections: a Plant Manager's area
+  order (FR36), or a supervisor's assigned assets and detail level
+  (FR15, FR37, FR39), is applied at read time, so assignment changes are
+  still reflected immediately (Story 8.5 AC#4).
+- Each materialization carries a data fingerprint: the plant-local date
+  plus a version per source table, bumped by DataChangedEvents from the
+  pipelines. A stale fingerprint regenerates once; concurrent requests
+  wait for that generation instead of starting their own. Live Pulse's
+  15-minute live_snapshots polls are not fingerprinted by default, or
+  the 05:30 briefing would be stale before the 06:00 requests.
+
+The store is per API worker; workers that miss the scheduled run
+materialize on their first request.
+"""
+
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+from zoneinfo import ZoneInfo
+
+from app.core.config import get_settings
+from app.models.briefing import (
+    BriefingNarrativeStats,
+    BriefingResponse,
+    BriefingResponseMetadata,
+    BriefingScope,
+    BriefingSection,
+    BriefingSectionStatus,
+)
+from app.services.agent.data_source.round_trips import count_round_trips
+from app.services.event_bus import TableVersions
+
+logger = logging.getLogger(__name__)
+
+# User ID recorded on materialized (not yet personalized) briefings
+PREGENERATED_USER_ID = "pregenerated"
+
+PLANT_KEY = "plant"
+
+
+def _utcnow() -> datetime:
+    """Get current UTC time in a timezone-aware manner."""
+    return datetime.now(timezone.utc)
+
+
+@dataclass
+class MaterializedBriefing:
+    """Briefing sections generated once for a data fingerprint."""
+
+    fingerprint: str
+    title: str
+    scope: str
+    sections: List[BriefingSection]
+    generated_at: datetime
+    generation_duration_ms: Optional[int] = None
+    timed_out: bool = False
+    tool_failures: List[str] = field(default_factory=list)
+    data_round_trips: Optional[int] = None
+    narrative: Optional[BriefingNarrativeStats] = None
+
+    @property
+    def cacheable(self) -> bool:
+        """Failed generations are served once, never stored."""
+        return self.scope != "error"
+
+    def area_sections(self) -> Dict[str, BriefingSection]:
+        """Area sections keyed by area ID."""
+        return {s.area_id: s for s in self.sections if s.area_id}
+
+
+class BriefingStore:
+    """
+    Materialized morning briefings keyed by data fingerprint.
+
+    Usage:
+        store = get_briefing_store()
+
+        # Plant Manager (all areas, preferred order)
+        briefing = await store.plant_briefing(user_id, area_order)
+
+        # Supervisor (assigned areas, preferred order and detail level)
+        briefing = await store.supervisor_briefing(user, preferences)
+    """
+
+    def __init__(self, service=None, tables: Optional[Sequence[str]] = None):
+        """
+        Initialize the store.
+
+        Args:
+            service: Optional MorningBriefingService (for testing)
+            tables: Source tables whose changes make briefings stale
+                (default: BRIEFING_FINGERPRINT_TABLES)
+        """
+        if tables is None:
+            tables = [
+                t.strip() for t in get_settings().briefing_fingerprint_tables.split(",") if t.strip()
+            ]
+        self._service = service
+        self.table_versions = TableVersions(tables)
+        self._entries: Dict[str, MaterializedBriefing] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._counters = {"hits": 0, "misses": 0, "generations": 0, "pregenerations": 0}
+
+    @property
+    def service(self):
+        """The MorningBriefingService used to generate briefings (lazy)."""
+        if self._service is None:
+            from app.services.briefing.morning import get_morning_briefing_service
+
+            self._service = get_morning_briefing_service()
+        return self._service
+
+    def fingerprint(self) -> str:
+        """
+        Current data fingerprint.
+
+        The plant-local date rolls briefings over at midnight even when no
+        pipeline has published yet.
+        """
+        today = datetime.now(ZoneInfo(get_settings().pipeline_timezone)).date()
+        return f"{today.isoformat()}|{self.table_versions.stamp()}"
+
+    async def plant_briefing(
+        self,
+        user_id: str,
+        area_order: Optional[List[str]] = None,
+        on_section: Optional[Callable[[BriefingSection], None]] = None,
+    ) -> BriefingResponse:
+        """
+        Plant-wide morning briefing in the user's preferred area order.
+
+        Story 8.4 AC#1: headline plus all 7 production areas (FR36).
+
+        Args:
+            user_id: User requesting the briefing
+            area_order: Optional list of area IDs in preferred order
+            on_section: Optional callback receiving sections as their text
+                becomes final, when this request generates the briefing
+        """
+        async def generate() -> MaterializedBriefing:
+            return await self._generate_plant(on_section)
+
+        materialized, cache_hit = await self._get(PLANT_KEY, generate)
+
+        if not materialized.cacheable:
+            return self._compose(materialized, materialized.sections, user_id, cache_hit=False)
+
+        by_area = materialized.area_sections()
+        sections = [s for s in materialized.sections if not s.area_id]
+        sections += [
+            by_area[area["id"]] for area in self.service.order_areas(area_order) if area["id"] in by_area
+        ]
+        return self._compose(materialized, sections, user_id, cache_hit=cache_hit)
+
+    async def supervisor_briefing(self, user, preferences=None) -> BriefingResponse:
+        """
+        Morning briefing scoped to a supervisor's assigned assets.
+
+        Story 8.5:
+        - AC#1: Only areas with assigned assets (FR15)
+        - AC#2: Areas in the user's preferred order (FR39)
+        - AC#3: No assets assigned → error message, no briefing
+        - AC#4: Assignments are read per request, never stored
+
+        Args:
+            user: CurrentUserWithRole with assigned_asset_ids populated
+            preferences: Optional UserPreferences for area order and detail level
+        """
+        service = self.service
+        if not user.has_assigned_assets:
+            return service._create_no_assets_response(str(uuid.uuid4()), user.id)
+
+        area_order = None
+        detail_level = "detailed"
+        if preferences:
+            area_order = preferences.area_order or None
+            detail_level = preferences.detail_level
+
+        areas = service.filter_areas_by_supervisor_assets(
+            service.order_areas(area_order),
+            user.assigned_asset_ids,
+        )
+        if not areas:
+            return service._create_no_assets_response(str(uuid.uuid4()), user.id)
+
+        materialized, cache_hit = await self._area_sections(detail_level)
+        if not materialized.cacheable:
+            return self._compose(materialized, materialized.sections, user.id, cache_hit=False)
+
+        by_area = materialized.area_sections()
+        sections = [by_area[area["id"]] for area in areas if area["id"] in by_area]
+        return self._compose(
+            materialized,
+            sections,
+            user.id,
+            cache_hit=cache_hit,
+            title=service._get_supervisor_briefing_title(),
+            scope=BriefingScope.SUPERVISOR.value,
+            min_duration_seconds=30,
+        )
+
+    async def pregenerate(self) -> Dict[str, bool]:
+        """
+        Materialize every stored briefing whose fingerprint is stale.
+
+        Returns:
+            Dict of materialization key -> whether it was regenerated
+        """
+        self._counters["pregenerations"] += 1
+        results = {}
+        for detail_level in ("detailed", "summary"):
+            key = self._area_key(detail_level)
+            _, fresh = await self._area_sections(detail_level, count=False)
+            results[key] = not fresh
+        return results
+
+    def stored_sections(self) -> List[BriefingSection]:
+        """Every section of the current materializations."""
+        return [section for entry in self._entries.values() for section in entry.sections]
+
+    def invalidate(self) -> None:
+        """Drop every materialization."""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Store counters and the fingerprint of each materialization."""
+        lookups = self._counters["hits"] + self._counters["misses"]
+        return {
+            **self._counters,
+            "hit_rate": round(self._counters["hits"] / lookups, 4) if lookups else 0.0,
+            "fingerprint": self.fingerprint(),
+            "entries": {
+                key: {
+                    "fingerprint": entry.fingerprint,
+                    "generated_at": entry.generated_at.isoformat(),
+                    "sections": len(entry.sections),
+                }
+                for key, entry in self._entries.items()
+            },
+        }
+
+    @staticmethod
+    def _area_key(detail_level: str) -> str:
+        return PLANT_KEY if detail_level == "detailed" else f"areas:{detail_level}"
+
+    async def _area_sections(self, detail_level: str, count: bool = True):
+        """Area sections at a detail level ("detailed" ones come with the plant briefing)."""
+        if detail_level == "detailed":
+            return await self._get(PLANT_KEY, self._generate_plant, count=count)
+
+        async def generate() -> MaterializedBriefing:
+            return await self._generate_areas(detail_level)
+
+        return await self._get(self._area_key(detail_level), generate, count=count)
+
+    async def _get(
+        self,
+        key: str,
+        generate: Callable[[], Awaitable[MaterializedBriefing]],
+        count: bool = True,
+    ):
+        """
+        Get a materialization for the current fingerprint, generating it at most once.
+
+        Returns:
+            Tuple of (MaterializedBriefing, whether it was already stored)
+        """
+        fingerprint = self.fingerprint()
+        entry = self._entries.get(key)
+        if entry is not None and entry.fingerprint == fingerprint:
+            if count:
+                self._counters["hits"] += 1
+            return entry, True
+
+        if count:
+            self._counters["misses"] += 1
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.fingerprint == fingerprint:
+                # Generated by a concurrent request while we waited
+                return entry, True
+
+            logger.info(f"Generating briefing materialization {key} for {fingerprint}")
+            entry = await generate()
+            # Stamp the fingerprint read before generation: data that changed
+            # meanwhile makes the entry stale again
+            entry.fingerprint = fingerprint
+            self._counters["generations"] += 1
+            if entry.cacheable:
+                self._entries[key] = entry
+            return entry, False
+
+    async def _generate_plant(
+        self,
+        on_section: Optional[Callable[[BriefingSection], None]] = None,
+    ) -> MaterializedBriefing:
+        briefing = await self.service.generate_plant_briefing(
+            user_id=PREGENERATED_USER_ID,
+            on_section=on_section,
+        )
+        return MaterializedBriefing(
+            fingerprint="",
+            title=briefing.title,
+            scope=briefing.scope,
+            sections=briefing.sections,
+            generated_at=briefing.metadata.generated_at,
+            generation_duration_ms=briefing.metadata.generation_duration_ms,
+            timed_out=briefing.metadata.timed_out,
+            tool_failures=list(briefing.metadata.tool_failures),
+            data_round_trips=briefing.metadata.data_round_trips,
+            narrative=briefing.metadata.narrative,
+        )
+
+    async def _generate_areas(self, detail_level: str) -> MaterializedBriefing:
+        start_time = _utcnow()
+        with count_round_trips() as round_trips:
+            sections = await self.service.generate_area_sections(detail_level=detail_level)
+        return MaterializedBriefing(
+            fingerprint="",
+            title="",
+            scope=BriefingScope.SUPERVISOR.value,
+            sections=sections,
+            generated_at=start_time,
+            generation_duration_ms=int((_utcnow() - start_time).total_seconds() * 1000),
+            tool_failures=[s.area_id for s in sections if s.status == BriefingSectionStatus.FAILED],
+            data_round_trips=round_trips.count,
+        )
+
+    def _compose(
+        self,
+        materialized: MaterializedBriefing,
+        sections: List[BriefingSection],
+        user_id: str,
+        cache_hit: bool,
+        title: Optional[str] = None,
+        scope: Optional[str] = None,
+        min_duration_seconds: int = 75,
+    ) -> BriefingResponse:
+        """Build a user's briefing from stored sections (copied, so Q&A state stays per briefing)."""
+        sections = [s.model_copy(deep=True) for s in sections]
+        area_ids = {s.area_id for s in sections}
+
+        completed_count = len([s for s in sections if s.is_complete])
+        total_count = len(sections) if sections else 1
+        total_chars = sum(len(s.content) for s in sections)
+
+        return BriefingResponse(
+            id=str(uuid.uuid4()),
+            title=title or materialized.title,
+            scope=scope or materialized.scope,
+            user_id=user_id,
+            sections=sections,
+            audio_stream_url=None,
+            total_duration_estimate=(
+                max(int(total_chars / 12.5), min_duration_seconds) if materialized.cacheable else 0
+            ),
+            metadata=BriefingResponseMetadata(
+                generated_at=materialized.generated_at,
+                generation_duration_ms=materialized.generation_duration_ms,
+                completion_percentage=(completed_count / total_count) * 100,
+                timed_out=materialized.timed_out,
+                tool_failures=[
+                    f for f in materialized.tool_failures if f in area_ids or not materialized.cacheable
+                ],
+                cache_hit=cache_hit,
+                data_fingerprint=materialized.fingerprint,
+                data_round_trips=materialized.data_round_trips,
+                narrative=materialized.narrative,
+            ),
+        )
+
+
+async def pregenerate_briefings() -> Optional[Dict[str, bool]]:
+    """
+    Materialize morning briefings ahead of shift start.
+
+    Called after the Morning Report pipeline and by the daily scheduler
+    job. With TTS_PRESYNTHESIZE_BRIEFINGS, section audio is synthesized
+    into the TTS audio cache too, so first playback is served from disk.
+    Failures are logged and never propagate to the caller.
+    """
+    settings = get_settings()
+    if not settings.briefing_pregenerate_enabled:
+        return None
+    try:
+        store = get_briefing_store()
+        results = await store.pregenerate()
+        logger.info(f"Morning briefings pre-generated: {results}")
+    except Exception as e:
+        logger.error(f"Morning briefing pre-generation failed: {e}")
+        return None
+
+    if settings.tts_presynthesize_briefings:
+        try:
+            from app.services.voice import get_tts_service
+
+            sections = [
+                {"title": s.title, "content": s.content} for s in store.stored_sections()
+            ]
+            synthesized = await get_tts_service().presynthesize_sections(sections)
+            logger.info(f"Briefing audio pre-synthesized for {synthesized} section(s)")
+        except Exception as e:
+            logger.error(f"Briefing audio pre-synthesis failed: {e}")
+    return results
+
+
+# Module-level singleton
+_briefing_store: Optional[BriefingStore] = None
+
+
+def get_briefing_store() -> BriefingStore:
+    """
+    Get the singleton BriefingStore instance.
+
+    Returns:
+        BriefingStore instance
+    """
+    global _briefing_store
+    if _briefing_store is None:
+        _briefing_store = BriefingStore()
+        _briefing_store.table_versions.subscribe()
+    return _briefing_store
+
+
+def reset_briefing_store() -> None:
+    """
+    Reset the singleton BriefingStore.
+
+    Primarily used for testing.
+    """
+    global _briefing_store
+    if _briefing_store is not None:
+        _briefing_store.table_versions.unsubscribe()
+    _briefing_store = None
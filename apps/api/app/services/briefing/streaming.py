@@ -0,0 +1,240 @@
+"""
+Progressive Briefing Delivery
+
+Streams a morning briefing as Server-Sent Events so the voice UI can start
+reading the headline while slower area sections are still generating.
+
+- Sections are emitted in delivery order (headline, then the user's area
+  order): a section is sent once it is generated and every section
+  before it has been sent
+- Area sections go out with their template text; when an LLM narrative
+  pass (briefing_narrative_mode batched or per_area) rewrites an area
+  already sent, a briefing.section_update replaces it. Areas not yet sent
+  are sent with the rewritten text directly
+- Each section event carries pause_point and its TTS stream URL; TTS is
+  requested as soon as the section's text is known, in parallel with
+  earlier sections
+- Events carry elapsed_ms since the request started, and the final event
+  reports time_to_first_section_ms and time_to_first_audio_ms
+
+Events:
+    briefing.started   {"sections": [section keys in delivery order]}
+    briefing.section   {index, section_type, title, content, area_id, status,
+                        pause_point, error_message, audio_stream_url, elapsed_ms}
+    briefing.section_update
+                       same fields, replacing the section at index
+    briefing.complete  {briefing_id, title, ..., time_to_first_audio_ms}
+    briefing.error     {detail}
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional
+
+from app.core.cancellation import CLIENT_DISCONNECT, get_cancellation_stats
+from app.models.briefing import BriefingResponse, BriefingSection, BriefingSectionStatus
+
+logger = logging.getLogger(__name__)
+
+HEADLINE_KEY = "headline"
+
+
+def section_key(section: BriefingSection) -> str:
+    """Delivery-order key: the area ID, or the section type for non-area sections."""
+    return section.area_id or section.section_type
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+class BriefingStream:
+    """
+    Orders a briefing's sections for progressive delivery as they are generated.
+
+    Usage:
+        stream = BriefingStream(["headline", "packing", ...])
+        work = store.plant_briefing(user_id, area_order, on_section=stream.on_section)
+        return StreamingResponse(stream.events(work), media_type="text/event-stream")
+    """
+
+    def __init__(
+        self,
+        order: List[str],
+        include_audio: bool = True,
+        tts_service=None,
+    ):
+        """
+        Initialize the stream.
+
+        Args:
+            order: Section keys in delivery order (see section_key)
+            include_audio: Whether to request a TTS stream URL per section
+            tts_service: Optional TTSService (for testing)
+        """
+        self._order = list(order)
+        self._include_audio = include_audio
+        self._tts_service = tts_service
+        self._events: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+        self._updates: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+        self._content: Dict[str, Optional[str]] = {}
+        self._sent: Dict[str, int] = {}  # key -> delivery index
+        self._arrived = asyncio.Event()
+        self._start = time.perf_counter()
+        self.time_to_first_section_ms: Optional[float] = None
+        self.time_to_first_audio_ms: Optional[float] = None
+
+    def _get_tts_service(self):
+        if self._tts_service is None:
+            from app.services.voice import get_tts_service
+
+            self._tts_service = get_tts_service()
+        return self._tts_service
+
+    def _elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self._start) * 1000, 1)
+
+    def on_section(self, section: BriefingSection) -> None:
+        """
+        Accept a generated section.
+
+        A repeated report with unchanged text is ignored; changed text
+        replaces the section if it has not been sent yet, or queues a
+        section update if it has.
+        """
+        key = section_key(section)
+        if key in self._content and self._content[key] == section.content:
+            return
+        self._content[key] = section.content
+        event = asyncio.ensure_future(self._section_event(section.model_copy()))
+        if key in self._sent:
+            self._updates[key] = event
+        else:
+            self._events[key] = event
+        self._arrived.set()
+
+    async def _section_event(self, section: BriefingSection) -> Dict[str, Any]:
+        """Section payload, with a TTS stream URL for the section's text."""
+        audio_stream_url = None
+        if self._include_audio and section.content:
+            try:
+                # Title and content together, as for section-by-section playback
+                text = f"{section.title}. {section.content}" if section.title else section.content
+                result = await self._get_tts_service().generate_stream_url(text=text)
+                audio_stream_url = result.audio_stream_url
+            except Exception as e:
+                logger.warning(f"TTS for briefing section {section_key(section)} failed: {e}")
+
+        return {
+            "section_type": section.section_type,
+            "title": section.title,
+            "content": section.content,
+            "area_id": section.area_id,
+            "status": section.status.value if isinstance(section.status, BriefingSectionStatus) else section.status,
+            "pause_point": section.pause_point,
+            "error_message": section.error_message,
+            "audio_stream_url": audio_stream_url,
+        }
+
+    async def events(self, work: Awaitable[BriefingResponse]) -> AsyncIterator[str]:
+        """
+        Run the briefing work and yield SSE events as sections become deliverable.
+
+        Sections the work never reported (served from the store, or not in
+        the expected order) are sent from the finished briefing. Closing the
+        iterator (client disconnect) cancels the work.
+        """
+        task = asyncio.ensure_future(work)
+        try:
+            yield format_sse("briefing.started", {"sections": self._order})
+
+            # Stream in delivery order while the briefing is generating
+            while True:
+                for update in self._emit_updates():
+                    yield await update
+                if len(self._sent) < len(self._order):
+                    key = self._order[len(self._sent)]
+                    if key in self._events:
+                        yield self._emit_section(key, await self._events[key])
+                        continue
+                if task.done():
+                    break
+                self._arrived.clear()
+                arrived = asyncio.ensure_future(self._arrived.wait())
+                await asyncio.wait({task, arrived}, return_when=asyncio.FIRST_COMPLETED)
+                arrived.cancel()
+
+            try:
+                briefing = await task
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Streamed briefing generation failed: {e}", exc_info=True)
+                yield format_sse("briefing.error", {"detail": f"Failed to generate morning briefing: {e}"})
+                return
+
+            # Remaining sections, in the finished briefing's order, then updates
+            for section in briefing.sections:
+                self.on_section(section)
+            for section in briefing.sections:
+                key = section_key(section)
+                if key not in self._sent:
+                    yield self._emit_section(key, await self._events[key])
+            for update in self._emit_updates():
+                yield await update
+
+            logger.info(
+                f"Streamed briefing {briefing.id}: first section {self.time_to_first_section_ms}ms, "
+                f"first audio {self.time_to_first_audio_ms}ms"
+            )
+            yield format_sse("briefing.complete", {
+                "briefing_id": briefing.id,
+                "title": briefing.title,
+                "total_duration_estimate": briefing.total_duration_estimate,
+                "generated_at": briefing.metadata.generated_at.isoformat(),
+                "completion_percentage": briefing.metadata.completion_percentage,
+                "timed_out": briefing.metadata.timed_out,
+                "tool_failures": briefing.metadata.tool_failures,
+                "cache_hit": briefing.metadata.cache_hit,
+                "elapsed_ms": self._elapsed_ms(),
+                "time_to_first_section_ms": self.time_to_first_section_ms,
+                "time_to_first_audio_ms": self.time_to_first_audio_ms,
+            })
+        finally:
+            if not task.done():
+                # Client went away mid-stream
+                get_cancellation_stats().record("briefing.morning_stream", CLIENT_DISCONNECT)
+                task.cancel()
+            for pending in [*self._events.values(), *self._updates.values()]:
+                if not pending.done():
+                    pending.cancel()
+
+    def _emit_section(self, key: str, payload: Dict[str, Any]) -> str:
+        index = len(self._sent)
+        self._sent[key] = index
+        elapsed_ms = self._elapsed_ms()
+        if self.time_to_first_section_ms is None:
+            self.time_to_first_section_ms = elapsed_ms
+        if self.time_to_first_audio_ms is None and payload["audio_stream_url"]:
+            self.time_to_first_audio_ms = elapsed_ms
+        return format_sse("briefing.section", {**payload, "index": index, "elapsed_ms": elapsed_ms})
+
+    def _emit_updates(self) -> List[Awaitable[str]]:
+        """Take queued updates of sent sections, in delivery order."""
+        keys = sorted(self._updates, key=self._sent.__getitem__)
+        return [self._emit_update(key, self._updates.pop(key)) for key in keys]
+
+    async def _emit_update(self, key: str, event: "asyncio.Task[Dict[str, Any]]") -> str:
+        payload = await event
+        return format_sse("briefing.section_update", {
+            **payload, "index": self._sent[key], "elapsed_ms": self._elapsed_ms(),
+        })
+
+
+def stream_order(area_ids: List[str]) -> List[str]:
+    """Delivery order for a plant briefing: headline, then areas."""
+    return [HEADLINE_KEY] + list(area_ids)
+
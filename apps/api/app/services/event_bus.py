@@ -0,0 +1,191 @@
+"""
+In-Process Data Change Event Bus
+
+Lets pipelines announce committed writes so dependent caches can evict
+precisely when fresh data lands instead of waiting for their TTL.
+
+Publishers:
+- MorningReportPipeline.run: daily_summaries, safety_events
+- LivePulsePipeline.execute_poll: live_snapshots, safety_events
+
+Subscribers register per table name, or "*" for every table. Handler
+failures are logged and never propagate back to the publishing pipeline.
+
+Caches that keep results across writes track per-table versions with
+TableVersions: stamp an entry with snapshot(), then ask which tables (or
+which tools, via TOOL_SOURCE_TABLES) changed since.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow() -> datetime:
+    """Get current UTC time in a timezone-aware manner."""
+    return datetime.now(timezone.utc)
+
+
+@dataclass(frozen=True)
+class DataChangedEvent:
+    """A committed write to a table."""
+
+    table: str
+    source: str
+    asset_ids: Tuple[str, ...] = ()
+    record_count: int = 0
+    occurred_at: datetime = field(default_factory=_utcnow)
+
+
+# Source tables read by each briefing and handoff tool
+TOOL_SOURCE_TABLES: Dict[str, Tuple[str, ...]] = {
+    "production_status": ("live_snapshots", "shift_targets"),
+    "oee_data": ("daily_summaries", "shift_targets"),
+    "downtime_analysis": ("daily_summaries",),
+    "safety_events": ("safety_events",),
+    "action_list": ("daily_summaries", "safety_events"),
+    "alert_check": ("safety_events", "live_snapshots"),
+}
+
+
+EventHandler = Callable[[DataChangedEvent], Union[None, Awaitable[None]]]
+
+
+class EventBus:
+    """Publish/subscribe dispatcher for DataChangedEvent."""
+
+    def __init__(self):
+        self._handlers: Dict[str, List[EventHandler]] = {}
+
+    def subscribe(self, table: str, handler: EventHandler) -> None:
+        """
+        Register a handler for changes to a table.
+
+        Registering the same handler twice for a table is a no-op.
+
+        Args:
+            table: Table name, or "*" for all tables
+            handler: Sync or async callable taking a DataChangedEvent
+        """
+        handlers = self._handlers.setdefault(table, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+    def unsubscribe(self, table: str, handler: EventHandler) -> None:
+        """Remove a previously registered handler."""
+        handlers = self._handlers.get(table, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    async def publish(self, event: DataChangedEvent) -> int:
+        """
+        Dispatch an event to its table's handlers and wildcard handlers.
+
+        Args:
+            event: The committed change
+
+        Returns:
+            Number of handlers that completed successfully
+        """
+        handlers = self._handlers.get(event.table, []) + self._handlers.get("*", [])
+        delivered = 0
+        for handler in handlers:
+            try:
+                result = handler(event)
+                if asyncio.iscoroutine(result):
+                    await result
+                delivered += 1
+            except Exception as e:
+                logger.warning(
+                    f"Event handler failed for {event.table} from {event.source}: {e}"
+                )
+        logger.debug(
+            f"Published {event.table} change from {event.source} to {delivered} handlers"
+        )
+        return delivered
+
+
+class TableVersions:
+    """
+    Per-table data versions, bumped by DataChangedEvents.
+
+    Usage:
+        versions = TableVersions().subscribe()
+        stamp = versions.snapshot()          # when caching a result
+        versions.changed_tools(stamp, tools)  # tools to re-run later
+    """
+
+    def __init__(self, tables: Optional[Iterable[str]] = None):
+        """
+        Initialize the tracker.
+
+        Args:
+            tables: Tables to track (default: every table that changes)
+        """
+        self._tracked = None if tables is None else tuple(tables)
+        self._versions: Dict[str, int] = {table: 0 for table in self._tracked or ()}
+
+    def on_data_changed(self, event: DataChangedEvent) -> None:
+        """Bump the changed table's version."""
+        if self._tracked is None or event.table in self._versions:
+            self._versions[event.table] = self._versions.get(event.table, 0) + 1
+
+    def subscribe(self) -> "TableVersions":
+        """Track changes published on the event bus."""
+        get_event_bus().subscribe("*", self.on_data_changed)
+        return self
+
+    def unsubscribe(self) -> None:
+        """Stop tracking event bus changes."""
+        get_event_bus().unsubscribe("*", self.on_data_changed)
+
+    def snapshot(self) -> Dict[str, int]:
+        """Copy of the current versions."""
+        return dict(self._versions)
+
+    def stamp(self, tables: Optional[Iterable[str]] = None, versions: Optional[Dict[str, int]] = None) -> str:
+        """
+        "table=version" pairs, comma-separated.
+
+        Args:
+            tables: Tables to include (default: tracked tables, else all seen)
+            versions: A snapshot to format (default: current versions)
+        """
+        versions = self._versions if versions is None else versions
+        if tables is None:
+            tables = self._tracked if self._tracked is not None else sorted(versions)
+        return ",".join(f"{table}={versions.get(table, 0)}" for table in tables)
+
+    def changed_since(self, snapshot: Dict[str, int]) -> Set[str]:
+        """Tables written since the snapshot was taken."""
+        return {
+            table for table, version in self._versions.items()
+            if version != snapshot.get(table, 0)
+        }
+
+    def changed_tools(self, snapshot: Dict[str, int], tools: Iterable[str]) -> Set[str]:
+        """Tools reading a table written since the snapshot was taken."""
+        changed = self.changed_since(snapshot)
+        return {tool for tool in tools if changed.intersection(TOOL_SOURCE_TABLES[tool])}
+
+
+# Module-level singleton
+_event_bus: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    """Get the singleton EventBus instance."""
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = EventBus()
+    return _event_bus
+
+
+def reset_event_bus() -> None:
+    """Reset the singleton (primarily for testing)."""
+    global _event_bus
+    _event_bus = None
@@ -20,7 +20,6 @@ AC#8: Performance Requirements
   - Grounding validation completes within 200ms per claim
 """
 
-import asyncio
 import logging
 import re
 import time
@@ -33,6 +32,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel
 
 from app.core.config import get_settings
+from app.services.ai.llm_client import cached_llm_call
 from app.models.citation import (
     Claim,
     ClaimType,
@@ -200,9 +200,12 @@ class GroundingService:
             # Use LLM to extract claims
             full_prompt = CLAIM_EXTRACTION_PROMPT + f"\n\nResponse to analyze:\n{response_text}"
 
-            response = await asyncio.to_thread(
-                self._llm.invoke,
-                [HumanMessage(content=full_prompt)]
+            messages = [HumanMessage(content=full_prompt)]
+            response = await cached_llm_call(
+                "grounding.extract_claims",
+                self._llm,
+                messages,
+                validate=lambda text: "[" in text,
             )
 
             # Parse the JSON response
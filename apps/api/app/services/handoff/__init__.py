@@ -33,6 +33,16 @@ from app.services.handoff.qa import (
     get_handoff_qa_service,
 )
 
+from app.services.handoff.qa_store import (
+    HandoffQAStore,
+    get_handoff_qa_store,
+)
+
+from app.services.handoff.transcription import (
+    VoiceNoteTranscriptionQueue,
+    get_voice_note_transcription_queue,
+)
+
 __all__ = [
     # Shift detection (Story 9.1)
     "detect_current_shift",
@@ -48,4 +58,9 @@ __all__ = [
     "HandoffQAService",
     "HandoffQAError",
     "get_handoff_qa_service",
+    "HandoffQAStore",
+    "get_handoff_qa_store",
+    # Voice note transcription (Story 9.3)
+    "VoiceNoteTranscriptionQueue",
+    "get_voice_note_transcription_queue",
 ]
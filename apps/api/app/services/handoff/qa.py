@@ -37,6 +37,7 @@ from app.services.agent.executor import (
     AgentError,
 )
 from app.services.handoff import get_shift_time_range
+from app.services.handoff.qa_store import HandoffQAStore, get_handoff_qa_store
 
 logger = logging.getLogger(__name__)
 
@@ -77,9 +78,14 @@ class HandoffQAService:
         )
     """
 
-    def __init__(self):
-        """Initialize the handoff Q&A service."""
-        self._qa_store: Dict[str, List[Dict[str, Any]]] = {}  # In-memory for MVP
+    def __init__(self, store: Optional[HandoffQAStore] = None):
+        """
+        Initialize the handoff Q&A service.
+
+        Args:
+            store: Optional Q&A thread store (default: shared HandoffQAStore)
+        """
+        self._store = store if store is not None else get_handoff_qa_store()
 
     async def process_question(
         self,
@@ -176,7 +182,7 @@ class HandoffQAService:
         self._store_entry(handoff_id, answer_entry)
 
         # 4. Get thread count
-        thread_count = len(self._get_entries(handoff_id))
+        thread_count = len(await self._store.aget_thread(handoff_id))
 
         duration_ms = int((_utcnow() - start_time).total_seconds() * 1000)
         logger.info(
@@ -242,8 +248,14 @@ class HandoffQAService:
         Returns:
             HandoffQAThread with all entries
         """
-        entries_data = self._get_entries(handoff_id)
+        return self._build_thread(handoff_id, self._get_entries(handoff_id))
+
+    async def aget_thread(self, handoff_id: str) -> HandoffQAThread:
+        """get_thread() for async callers; the thread loads off the event loop."""
+        return self._build_thread(handoff_id, await self._store.aget_thread(handoff_id))
 
+    def _build_thread(self, handoff_id: str, entries_data: List[Dict[str, Any]]) -> HandoffQAThread:
+        """Build a HandoffQAThread from handoff_qa_entries rows."""
         entries = [
             HandoffQAEntry(
                 id=uuid.UUID(e["id"]),
@@ -471,13 +483,9 @@ class HandoffQAService:
         """
         Store a Q&A entry (append-only per NFR24).
 
-        In production, this would insert into handoff_qa_entries table.
-        For MVP, uses in-memory storage.
+        Queued for a batched insert into the handoff_qa_entries table.
         """
-        if handoff_id not in self._qa_store:
-            self._qa_store[handoff_id] = []
-
-        # Convert to dict for storage
+        # Convert to a handoff_qa_entries row
         entry_data = {
             "id": str(entry.id),
             "handoff_id": str(entry.handoff_id),
@@ -499,11 +507,11 @@ class HandoffQAService:
             "created_at": entry.created_at.isoformat(),
         }
 
-        self._qa_store[handoff_id].append(entry_data)
+        self._store.append(entry_data)
 
     def _get_entries(self, handoff_id: str) -> List[Dict[str, Any]]:
         """Get all Q&A entries for a handoff."""
-        return self._qa_store.get(handoff_id, [])
+        return self._store.get_thread(handoff_id)
 
 
 # Module-level singleton
@@ -0,0 +1,372 @@
+"""
+Handoff Q&A Thread Store (Story 9.6)
+
+Persists Q&A entries in the handoff_qa_entries table (migration 0013) so
+threads survive restarts and every API worker sees the same thread.
+
+Entries reference shift_handoffs(id), but the handoff API still keeps
+handoffs in process (app.api.handoff._handoffs), so every insert would
+fail that foreign key. Table writes are off until HANDOFF_QA_PERSIST_ENABLED
+is set, once handoffs are stored in shift_handoffs.
+
+- Write-behind: appended entries are queued and batch-inserted when
+  HANDOFF_QA_FLUSH_BATCH_SIZE entries are waiting or every
+  HANDOFF_QA_FLUSH_INTERVAL_SECONDS
+- A failed batch is retried row by row, so one bad entry does not hold
+  back the others; an entry that fails HANDOFF_QA_MAX_INSERT_ATTEMPTS
+  times is dropped and logged
+- At most HANDOFF_QA_MAX_PENDING entries are queued; the oldest are
+  dropped when inserts fall behind
+- Bounded read cache: the HANDOFF_QA_CACHE_MAX_THREADS most recently read
+  threads (LRU), reloaded after HANDOFF_QA_CACHE_TTL_SECONDS so entries
+  written by other workers appear
+- A thread loads with one query on the (handoff_id, created_at) index;
+  queued entries not yet inserted are merged in. aget_thread() runs the
+  query in a worker thread so async handlers don't block the event loop
+
+Without Supabase configured or with persistence disabled, entries are
+kept in memory, like the audit logger's fallback.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from supabase import Client, create_client
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+QA_TABLE = "handoff_qa_entries"
+
+Row = Dict[str, Any]
+
+
+def _created_at(row: Row) -> datetime:
+    """Sort key: an entry's creation time (ISO string as stored or returned)."""
+    return datetime.fromisoformat(str(row["created_at"]).replace("Z", "+00:00"))
+
+
+class HandoffQAStore:
+    """
+    Append-only Q&A entries (NFR24) with write-behind and an LRU thread cache.
+
+    Usage:
+        store = get_handoff_qa_store()
+        store.append(entry_row)
+        rows = store.get_thread(handoff_id)
+    """
+
+    def __init__(
+        self,
+        supabase_client: Optional[Client] = None,
+        max_cached_threads: Optional[int] = None,
+        cache_ttl_seconds: Optional[float] = None,
+        flush_batch_size: Optional[int] = None,
+        flush_interval_seconds: Optional[float] = None,
+        max_pending: Optional[int] = None,
+        max_insert_attempts: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self._client = supabase_client
+        self._max_cached_threads = (
+            max_cached_threads if max_cached_threads is not None else settings.handoff_qa_cache_max_threads
+        )
+        self._cache_ttl = cache_ttl_seconds if cache_ttl_seconds is not None else settings.handoff_qa_cache_ttl_seconds
+        self._batch_size = flush_batch_size if flush_batch_size is not None else settings.handoff_qa_flush_batch_size
+        self._flush_interval = (
+            flush_interval_seconds if flush_interval_seconds is not None else settings.handoff_qa_flush_interval_seconds
+        )
+        self._max_pending = max_pending if max_pending is not None else settings.handoff_qa_max_pending
+        self._max_attempts = (
+            max_insert_attempts if max_insert_attempts is not None else settings.handoff_qa_max_insert_attempts
+        )
+
+        self._lock = threading.Lock()
+        # handoff_id -> (loaded at, rows ordered by created_at)
+        self._threads: "OrderedDict[str, Tuple[float, List[Row]]]" = OrderedDict()
+        self._pending: List[Row] = []
+        self._in_flight: List[Row] = []
+        self._attempts: Dict[str, int] = {}  # entry id -> failed inserts
+        self._memory_rows: Dict[str, List[Row]] = {}
+
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_wakeup: Optional[asyncio.Event] = None
+        self._counters = {"hits": 0, "loads": 0, "flushes": 0, "flush_failures": 0, "dropped": 0}
+
+    def _get_client(self) -> Optional[Client]:
+        """Get Supabase client lazily (None when not configured or not enabled)."""
+        if self._client is not None:
+            return self._client
+
+        settings = get_settings()
+        if not settings.handoff_qa_persist_enabled:
+            return None
+        if not settings.supabase_url or not settings.supabase_key:
+            return None
+
+        try:
+            self._client = create_client(settings.supabase_url, settings.supabase_key)
+            return self._client
+        except Exception as e:
+            logger.warning(f"Failed to create Supabase client for handoff Q&A: {e}")
+            return None
+
+    def append(self, row: Row) -> None:
+        """
+        Append an entry to its thread.
+
+        The entry is visible to get_thread immediately and inserted into
+        handoff_qa_entries by the next batch flush.
+        """
+        handoff_id = row["handoff_id"]
+        client = self._get_client()
+
+        with self._lock:
+            cached = self._threads.get(handoff_id)
+            if cached is not None:
+                cached[1].append(row)
+            if client is None:
+                self._memory_rows.setdefault(handoff_id, []).append(row)
+                return
+            self._pending.append(row)
+            self._trim_pending()
+            batch_full = len(self._pending) >= self._batch_size
+
+        self._ensure_flush_task(wake=batch_full)
+
+    def get_thread(self, handoff_id: str) -> List[Row]:
+        """
+        All entries of a handoff's thread, oldest first.
+
+        Served from the LRU cache, or loaded with a single query on the
+        (handoff_id, created_at) index. The query blocks; async callers
+        use aget_thread().
+        """
+        now = time.monotonic()
+        cached = self._cached_thread(handoff_id, now)
+        if cached is not None:
+            return cached
+        return self._cache_thread(handoff_id, self._load(handoff_id), now)
+
+    async def aget_thread(self, handoff_id: str) -> List[Row]:
+        """get_thread() for async callers; a table query runs in a worker thread."""
+        now = time.monotonic()
+        cached = self._cached_thread(handoff_id, now)
+        if cached is not None:
+            return cached
+        if self._get_client() is None:
+            rows = self._load(handoff_id)
+        else:
+            rows = await asyncio.to_thread(self._load, handoff_id)
+        return self._cache_thread(handoff_id, rows, now)
+
+    def _cached_thread(self, handoff_id: str, now: float) -> Optional[List[Row]]:
+        """A cached thread younger than the TTL, if any."""
+        with self._lock:
+            cached = self._threads.get(handoff_id)
+            if cached is not None and now - cached[0] < self._cache_ttl:
+                self._threads.move_to_end(handoff_id)
+                self._counters["hits"] += 1
+                return list(cached[1])
+        return None
+
+    def _cache_thread(self, handoff_id: str, rows: List[Row], now: float) -> List[Row]:
+        """Merge queued entries into loaded rows and cache the thread."""
+        with self._lock:
+            # Entries queued or being inserted are not in the table yet
+            loaded_ids = {r["id"] for r in rows}
+            rows.extend(
+                r for r in self._in_flight + self._pending
+                if r["handoff_id"] == handoff_id and r["id"] not in loaded_ids
+            )
+            rows.sort(key=_created_at)
+
+            self._threads[handoff_id] = (now, rows)
+            self._threads.move_to_end(handoff_id)
+            while len(self._threads) > self._max_cached_threads:
+                self._threads.popitem(last=False)
+            self._counters["loads"] += 1
+            return list(rows)
+
+    def _load(self, handoff_id: str) -> List[Row]:
+        """Read a thread from handoff_qa_entries (one indexed query)."""
+        client = self._get_client()
+        if client is None:
+            with self._lock:
+                return list(self._memory_rows.get(handoff_id, []))
+
+        try:
+            result = (
+                client.table(QA_TABLE)
+                .select("*")
+                .eq("handoff_id", handoff_id)
+                .order("created_at")
+                .execute()
+            )
+            return list(result.data or [])
+        except Exception as e:
+            logger.error(f"Failed to load Q&A thread for handoff {handoff_id}: {e}")
+            return []
+
+    def flush(self) -> int:
+        """
+        Insert queued entries in one batch.
+
+        If the batch insert fails, each entry is inserted on its own.
+        Entries that fail stay queued until they have failed
+        max_insert_attempts times, then are dropped.
+
+        Returns:
+            Number of entries inserted
+        """
+        client = self._get_client()
+        with self._lock:
+            if client is None or not self._pending or self._in_flight:
+                return 0
+            self._in_flight, self._pending = self._pending, []
+            batch = self._in_flight
+
+        try:
+            client.table(QA_TABLE).insert(batch).execute()
+            failed: List[Row] = []
+        except Exception as e:
+            logger.warning(f"Failed to flush {len(batch)} handoff Q&A entries, inserting one by one: {e}")
+            failed = self._insert_each(client, batch)
+
+        with self._lock:
+            self._in_flight = []
+            if failed:
+                self._counters["flush_failures"] += 1
+            else:
+                self._counters["flushes"] += 1
+            failed_ids = {row["id"] for row in failed}
+            for row in batch:
+                if row["id"] not in failed_ids:
+                    self._attempts.pop(row["id"], None)
+            retry = []
+            for row in failed:
+                attempts = self._attempts.get(row["id"], 0) + 1
+                if attempts >= self._max_attempts:
+                    self._drop(row, f"insert failed {attempts} times")
+                else:
+                    self._attempts[row["id"]] = attempts
+                    retry.append(row)
+            self._pending = retry + self._pending
+            self._trim_pending()
+
+        inserted = len(batch) - len(failed)
+        logger.debug(f"Flushed {inserted} handoff Q&A entries")
+        return inserted
+
+    def _insert_each(self, client: Client, rows: List[Row]) -> List[Row]:
+        """Insert rows one at a time; returns the rows that failed."""
+        failed = []
+        for row in rows:
+            try:
+                client.table(QA_TABLE).insert(row).execute()
+            except Exception as e:
+                logger.error(f"Failed to insert handoff Q&A entry {row['id']}: {e}")
+                failed.append(row)
+        return failed
+
+    def _trim_pending(self) -> None:
+        """Drop the oldest queued entries beyond max_pending (caller holds the lock)."""
+        overflow = len(self._pending) - self._max_pending
+        if overflow > 0:
+            for row in self._pending[:overflow]:
+                self._drop(row, "queue full")
+            del self._pending[:overflow]
+
+    def _drop(self, row: Row, reason: str) -> None:
+        """Give up on inserting an entry (caller holds the lock)."""
+        self._attempts.pop(row["id"], None)
+        self._counters["dropped"] += 1
+        logger.error(
+            f"Dropped handoff Q&A entry {row['id']} for handoff {row['handoff_id']} ({reason})"
+        )
+
+    def _ensure_flush_task(self, wake: bool = False) -> None:
+        """Start the background flush loop on the running event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (sync caller): flush inline once a batch is full
+            if wake:
+                self.flush()
+            return
+
+        if self._flush_task is None or self._flush_task.done() or self._flush_task.get_loop() is not loop:
+            self._flush_wakeup = asyncio.Event()
+            self._flush_task = loop.create_task(self._flush_loop(self._flush_wakeup))
+        if wake:
+            self._flush_wakeup.set()
+
+    async def _flush_loop(self, wakeup: asyncio.Event) -> None:
+        """Flush every interval, or as soon as a batch is full."""
+        while True:
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            if self._pending:
+                await asyncio.to_thread(self.flush)
+
+    async def close(self) -> None:
+        """Stop the flush loop and insert any queued entries."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+        self._flush_task = None
+        if self._pending:
+            await asyncio.to_thread(self.flush)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                **self._counters,
+                "cached_threads": len(self._threads),
+                "pending": len(self._pending),
+            }
+
+
+# Module-level singleton
+_handoff_qa_store: Optional[HandoffQAStore] = None
+
+
+def get_handoff_qa_store() -> HandoffQAStore:
+    """
+    Get the singleton HandoffQAStore instance.
+
+    Returns:
+        HandoffQAStore instance
+    """
+    global _handoff_qa_store
+    if _handoff_qa_store is None:
+        _handoff_qa_store = HandoffQAStore()
+    return _handoff_qa_store
+
+
+def reset_handoff_qa_store() -> None:
+    """
+    Reset the singleton HandoffQAStore.
+
+    Primarily used for testing.
+    """
+    global _handoff_qa_store
+    _handoff_qa_store = None
+
+
+async def close_handoff_qa_store() -> None:
+    """Flush queued entries of the active store (application shutdown)."""
+    if _handoff_qa_store is not None:
+        await _handoff_qa_store.close()
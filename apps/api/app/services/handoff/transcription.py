@@ -0,0 +1,189 @@
+"""
+Voice Note Transcription Queue (Story 9.3)
+
+Transcribes uploaded handoff voice notes in the background so the upload
+endpoint responds as soon as storage confirms the audio:
+
+- Jobs wait in a bounded queue (VOICE_NOTE_TRANSCRIPTION_QUEUE_SIZE); a
+  full queue rejects the job and the note is saved without a transcript
+- VOICE_NOTE_TRANSCRIPTION_CONCURRENCY workers transcribe at a time, each
+  job bounded by VOICE_NOTE_TRANSCRIPTION_TIMEOUT_SECONDS
+- Each job reports its transcript (None on failure) to a completion
+  callback, which updates the note record clients poll
+
+Workers run on the API worker's event loop and start with the first job.
+"""
+
+import asyncio
+import inspect
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+Transcribe = Callable[[], Awaitable[Optional[str]]]
+OnComplete = Callable[[Optional[str]], Union[None, Awaitable[None]]]
+
+
+@dataclass
+class TranscriptionJob:
+    """One voice note waiting for transcription."""
+
+    note_id: str
+    transcribe: Transcribe
+    on_complete: OnComplete
+    cleanup: Optional[Callable[[], None]] = None
+
+
+class VoiceNoteTranscriptionQueue:
+    """
+    Bounded-concurrency background transcription.
+
+    Usage:
+        queue = get_voice_note_transcription_queue()
+        accepted = queue.submit(TranscriptionJob(note_id, transcribe, on_complete))
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        max_queued: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+    ):
+        settings = get_settings()
+        self._max_concurrency = max(
+            1, max_concurrency if max_concurrency is not None else settings.voice_note_transcription_concurrency
+        )
+        self._max_queued = max_queued if max_queued is not None else settings.voice_note_transcription_queue_size
+        self._timeout = (
+            timeout_seconds if timeout_seconds is not None else settings.voice_note_transcription_timeout_seconds
+        )
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._counters = {"submitted": 0, "rejected": 0, "completed": 0, "failed": 0}
+
+    def submit(self, job: TranscriptionJob) -> bool:
+        """
+        Queue a job.
+
+        Returns:
+            False if the queue is full (the job's cleanup has already run)
+        """
+        self._ensure_workers()
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            logger.warning(f"Transcription queue full, skipping voice note {job.note_id}")
+            self._counters["rejected"] += 1
+            self._run_cleanup(job)
+            return False
+        self._counters["submitted"] += 1
+        return True
+
+    def _ensure_workers(self) -> None:
+        """Start the workers on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._queue is not None and self._workers and self._workers[0].get_loop() is loop:
+            return
+        self._queue = asyncio.Queue(maxsize=self._max_queued)
+        self._workers = [
+            loop.create_task(self._worker(self._queue)) for _ in range(self._max_concurrency)
+        ]
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        while True:
+            job: TranscriptionJob = await queue.get()
+            try:
+                await self._run(job)
+            finally:
+                queue.task_done()
+
+    async def _run(self, job: TranscriptionJob) -> None:
+        transcript: Optional[str] = None
+        try:
+            transcript = await asyncio.wait_for(job.transcribe(), timeout=self._timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Transcription of voice note {job.note_id} timed out after {self._timeout}s")
+        except Exception as e:
+            logger.error(f"Transcription of voice note {job.note_id} failed: {e}")
+        finally:
+            self._run_cleanup(job)
+
+        self._counters["completed" if transcript else "failed"] += 1
+        try:
+            result = job.on_complete(transcript)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(f"Failed to record transcript for voice note {job.note_id}: {e}")
+
+    @staticmethod
+    def _run_cleanup(job: TranscriptionJob) -> None:
+        if job.cleanup is None:
+            return
+        try:
+            job.cleanup()
+        except Exception as e:
+            logger.warning(f"Cleanup after transcribing voice note {job.note_id} failed: {e}")
+
+    async def join(self) -> None:
+        """Wait until every queued job has finished."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Stop the workers; queued jobs are dropped after their cleanup runs."""
+        for worker in self._workers:
+            worker.cancel()
+        for worker in self._workers:
+            try:
+                await worker
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+        self._workers = []
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._run_cleanup(self._queue.get_nowait())
+        self._queue = None
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            **self._counters,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+        }
+
+
+# Module-level singleton
+_transcription_queue: Optional[VoiceNoteTranscriptionQueue] = None
+
+
+def get_voice_note_transcription_queue() -> VoiceNoteTranscriptionQueue:
+    """
+    Get the singleton VoiceNoteTranscriptionQueue instance.
+
+    Returns:
+        VoiceNoteTranscriptionQueue instance
+    """
+    global _transcription_queue
+    if _transcription_queue is None:
+        _transcription_queue = VoiceNoteTranscriptionQueue()
+    return _transcription_queue
+
+
+def reset_voice_note_transcription_queue() -> None:
+    """
+    Reset the singleton VoiceNoteTranscriptionQueue.
+
+    Primarily used for testing.
+    """
+    global _transcription_queue
+    _transcription_queue = None
+
+
+async def close_voice_note_transcription_queue() -> None:
+    """Stop the active queue's workers (application shutdown)."""
+    if _transcription_queue is not None:
+        await _transcription_queue.close()
@@ -33,6 +33,7 @@ from tenacity import (
 
 from app.core.config import get_settings
 from app.core.database import mssql_db, DatabaseError, DatabaseNotConfiguredError
+from app.services.event_bus import DataChangedEvent, get_event_bus
 from app.services.scheduler import get_scheduler
 
 logger = logging.getLogger(__name__)
@@ -698,6 +699,27 @@ class LivePulsePipeline:
             logger.warning(f"Failed to cleanup old snapshots: {e}")
             return 0
 
+    async def _publish_data_changes(
+        self,
+        result: LivePulseResult,
+        snapshots: List[LiveSnapshotData],
+    ) -> None:
+        """Announce committed writes so dependent caches evict stale entries."""
+        bus = get_event_bus()
+        if result.snapshots_created:
+            await bus.publish(DataChangedEvent(
+                table="live_snapshots",
+                source="live_pulse",
+                asset_ids=tuple(str(s.asset_id) for s in snapshots),
+                record_count=result.snapshots_created,
+            ))
+        if result.safety_events_created:
+            await bus.publish(DataChangedEvent(
+                table="safety_events",
+                source="live_pulse",
+                record_count=result.safety_events_created,
+            ))
+
     async def execute_poll(self) -> LivePulseResult:
         """
         Execute a single poll cycle.
@@ -756,6 +778,9 @@ class LivePulsePipeline:
             logger.debug("Cleaning up old snapshots")
             self.cleanup_old_snapshots()
 
+            # Step 6: Announce committed writes for cache eviction
+            await self._publish_data_changes(result, snapshots)
+
             result.success = True
             result.duration_seconds = time.time() - start_time
 
@@ -38,6 +38,7 @@ from app.models.pipeline import (
 from app.services.pipelines.data_extractor import DataExtractor, DataExtractionError
 from app.services.pipelines.transformer import DataTransformer, TransformationError
 from app.services.pipelines.calculator import Calculator, CalculationError
+from app.services.event_bus import DataChangedEvent, get_event_bus
 
 logger = logging.getLogger(__name__)
 
@@ -230,6 +231,28 @@ class MorningReportPipeline:
             logger.error(f"Failed to create safety event: {e}")
             return False
 
+    async def _publish_data_changes(
+        self,
+        execution_log: PipelineExecutionLog,
+        summaries_updated: int,
+        safety_events_created: int,
+    ) -> None:
+        """Announce committed writes so dependent caches evict stale entries."""
+        bus = get_event_bus()
+        if summaries_updated:
+            await bus.publish(DataChangedEvent(
+                table="daily_summaries",
+                source="morning_report",
+                asset_ids=tuple(execution_log.assets_processed),
+                record_count=summaries_updated,
+            ))
+        if safety_events_created:
+            await bus.publish(DataChangedEvent(
+                table="safety_events",
+                source="morning_report",
+                record_count=safety_events_created,
+            ))
+
     async def run(
         self,
         target_date: Optional[date] = None,
@@ -335,6 +358,10 @@ class MorningReportPipeline:
 
             self._execution_logs.append(execution_log)
 
+            await self._publish_data_changes(
+                execution_log, summaries_updated, safety_events_created
+            )
+
             logger.info(
                 f"Morning Report pipeline completed: "
                 f"{summaries_updated} summaries, {safety_events_created} safety events"
@@ -387,6 +414,9 @@ class MorningReportPipeline:
                 error_msg
             )
             self._execution_logs.append(execution_log)
+            await self._publish_data_changes(
+                execution_log, summaries_updated, safety_events_created
+            )
             return PipelineResult(
                 status=PipelineStatus.PARTIAL,
                 execution_log=execution_log,
@@ -437,6 +467,7 @@ async def run_morning_report(
     target_date: Optional[date] = None,
     force: bool = False,
     generate_smart_summary: bool = True,
+    pregenerate_briefings: bool = True,
 ) -> PipelineResult:
     """
     Convenience function to run the morning report pipeline.
@@ -447,6 +478,8 @@ async def run_morning_report(
         target_date: Date to process. Defaults to yesterday (T-1).
         force: If True, re-run even if data already exists.
         generate_smart_summary: If True, trigger smart summary after pipeline.
+        pregenerate_briefings: If True, materialize morning briefings in this
+            process's briefing store after pipeline success.
 
     Returns:
         PipelineResult with execution details
@@ -463,6 +496,13 @@ async def run_morning_report(
             target_date or (date.today() - timedelta(days=1))
         )
 
+    # Pre-generate morning briefings from the fresh data
+    if pregenerate_briefings and result.status in (
+        PipelineStatus.SUCCESS,
+        PipelineStatus.PARTIAL
+    ):
+        await _trigger_briefing_pregeneration()
+
     return result
 
 
@@ -512,6 +552,19 @@ async def _trigger_smart_summary_generation(target_date: date) -> None:
         )
 
 
+async def _trigger_briefing_pregeneration() -> None:
+    """
+    Materialize morning briefings after pipeline completion.
+
+    Runs after the Smart Summary so briefings are ready before shift
+    start. Failures are logged by pregenerate_briefings and never affect
+    the pipeline result.
+    """
+    from app.services.briefing.store import pregenerate_briefings
+
+    await pregenerate_briefings()
+
+
 # CLI entry point for Railway Cron
 if __name__ == "__main__":
     import asyncio
@@ -537,8 +590,9 @@ if __name__ == "__main__":
                 logger.error(f"Invalid date format: {sys.argv[1]}")
                 sys.exit(1)
 
-        # Run pipeline
-        result = await run_morning_report(target_date)
+        # Run pipeline (briefings are pre-generated by the API's own
+        # scheduled job; a store in this short-lived process would be lost)
+        result = await run_morning_report(target_date, pregenerate_briefings=False)
 
         # Log result
         if result.status == PipelineStatus.SUCCESS:
@@ -11,9 +11,10 @@ AC: #1 - Background Scheduler Configuration
 import logging
 import os
 from datetime import datetime, timedelta
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Dict, List
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, JobExecutionEvent
 
@@ -93,6 +94,7 @@ class PipelineScheduler:
         self._scheduler: Optional[AsyncIOScheduler] = None
         self._status = PipelineSchedulerStatus()
         self._poll_job: Optional[Callable] = None
+        self._daily_jobs: List[Dict[str, Any]] = []
         self._poll_interval_minutes: int = int(
             os.getenv("POLL_INTERVAL_MINUTES", "15")
         )
@@ -138,6 +140,39 @@ class PipelineScheduler:
         """
         self._poll_job = job_func
 
+    def add_daily_job(
+        self,
+        job_id: str,
+        job_func: Callable,
+        time_of_day: str,
+        timezone: str,
+        name: Optional[str] = None,
+    ) -> None:
+        """
+        Schedule a job once a day at a local time.
+
+        Jobs added before start() are registered when the scheduler starts.
+
+        Args:
+            job_id: Unique job ID
+            job_func: Async function to execute
+            time_of_day: "HH:MM" local time
+            timezone: IANA timezone name for time_of_day
+            name: Optional display name
+        """
+        hour, minute = (int(part) for part in time_of_day.split(":"))
+        job = {
+            "func": job_func,
+            "trigger": CronTrigger(hour=hour, minute=minute, timezone=timezone),
+            "id": job_id,
+            "name": name or job_id,
+            "replace_existing": True,
+            "misfire_grace_time": 300,
+        }
+        self._daily_jobs = [j for j in self._daily_jobs if j["id"] != job_id] + [job]
+        if self._scheduler is not None:
+            self._scheduler.add_job(**job)
+
     async def start(self) -> None:
         """
         Start the scheduler and begin polling.
@@ -183,6 +218,10 @@ class PipelineScheduler:
             misfire_grace_time=60,  # Allow 60 second grace for misfired jobs
         )
 
+        # Add daily jobs registered before startup
+        for job in self._daily_jobs:
+            self._scheduler.add_job(**job)
+
         # Start the scheduler
         self._scheduler.start()
         self._status.is_running = True
@@ -7,12 +7,14 @@ Includes ElevenLabs TTS integration and speech-to-text services.
 Components:
 - ElevenLabsClient: Direct API client for ElevenLabs TTS
 - TTSService: High-level TTS service with graceful degradation
+- TTSAudioCache: Content-addressed disk cache of synthesized audio
 - STTWebSocketHandler: WebSocket handler for STT streaming
 - STTService: High-level STT service for voice input
 """
 
 from app.services.voice.elevenlabs import ElevenLabsClient, get_elevenlabs_client
 from app.services.voice.tts import TTSService, get_tts_service
+from app.services.voice.audio_cache import TTSAudioCache, get_tts_audio_cache
 from app.services.voice.stt import (
     STTWebSocketHandler,
     STTService,
@@ -28,6 +30,8 @@ __all__ = [
     "get_elevenlabs_client",
     "TTSService",
     "get_tts_service",
+    "TTSAudioCache",
+    "get_tts_audio_cache",
     # STT (Story 8.2)
     "STTWebSocketHandler",
     "STTService",
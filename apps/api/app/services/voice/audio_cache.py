@@ -0,0 +1,254 @@
+"""
+TTS Audio Cache
+
+Content-addressed cache of synthesized speech, so replayed briefings and
+frequently spoken text ("No safety incidents recorded...") are
+synthesized by ElevenLabs once instead of on every playback.
+
+- Key: SHA-256 of text, voice, model, speed and voice settings
+- Disk tier: one file per key under tts_audio_cache_dir, read through
+  mmap so streaming and HTTP range requests slice the page cache
+- Size-bounded: least-recently-used files are evicted once the cache
+  exceeds tts_audio_cache_max_bytes
+- Writes are atomic (temp file + rename), so workers sharing the
+  directory only ever see complete files
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+AUDIO_EXTENSION = ".mp3"
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+def audio_cache_key(
+    text: str,
+    voice_id: str,
+    model_id: str,
+    speed: float = 1.0,
+    stability: float = 0.5,
+    similarity_boost: float = 0.75,
+) -> str:
+    """Content address for synthesized audio (floats rounded so URL round-trips match)."""
+    payload = json.dumps(
+        [text, voice_id, model_id, round(float(speed), 3),
+         round(float(stability), 3), round(float(similarity_boost), 3)],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CachedAudio:
+    """
+    A cached audio file mapped for reading.
+
+    Usage:
+        with cache.open(key) as audio:
+            for chunk in audio.iter_chunks(start, end):
+                ...
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        self.size = os.fstat(self._file.fileno()).st_size
+        self._mmap = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        )
+
+    def iter_chunks(
+        self,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = STREAM_CHUNK_BYTES,
+    ) -> Iterator[bytes]:
+        """Yield bytes start..end (inclusive) in chunks."""
+        end = self.size - 1 if end is None else min(end, self.size - 1)
+        position = start
+        while self._mmap is not None and position <= end:
+            next_position = min(position + chunk_size, end + 1)
+            yield self._mmap[position:next_position]
+            position = next_position
+
+    def read(self) -> bytes:
+        """The whole file."""
+        return b"".join(self.iter_chunks())
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "CachedAudio":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class TTSAudioCache:
+    """
+    Disk cache of synthesized audio with size-based LRU eviction.
+
+    Recency is tracked in memory and mirrored to file mtimes, so the LRU
+    order survives restarts.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        """
+        Initialize the cache, indexing files already on disk.
+
+        Args:
+            directory: Cache directory (created if missing)
+            max_bytes: Total size budget for cached audio
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._bytes = 0
+        self._counters = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+        os.makedirs(directory, exist_ok=True)
+        entries = []
+        with os.scandir(directory) as scan:
+            for entry in scan:
+                if entry.is_file() and entry.name.endswith(AUDIO_EXTENSION):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name[:-len(AUDIO_EXTENSION)], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._bytes += size
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + AUDIO_EXTENSION)
+
+    def open(self, key: str) -> Optional[CachedAudio]:
+        """Open cached audio for reading, or None on a miss."""
+        path = self._path(key)
+        try:
+            audio = CachedAudio(path)
+        except FileNotFoundError:
+            with self._lock:
+                size = self._index.pop(key, None)
+                if size is not None:
+                    # Evicted by another worker sharing the directory
+                    self._bytes -= size
+                self._counters["misses"] += 1
+            return None
+
+        with self._lock:
+            if key not in self._index:
+                # Written by another worker sharing the directory
+                self._index[key] = audio.size
+                self._bytes += audio.size
+            self._index.move_to_end(key)
+            self._counters["hits"] += 1
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return audio
+
+    def contains(self, key: str) -> bool:
+        """Whether audio for a key is cached (no hit/miss accounting)."""
+        return os.path.exists(self._path(key))
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store audio atomically, then evict least-recently-used entries over budget."""
+        if not data:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.warning(f"Could not write TTS audio cache entry {key}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            self._bytes -= self._index.pop(key, 0)
+            self._index[key] = len(data)
+            self._bytes += len(data)
+            self._counters["stores"] += 1
+            evicted = []
+            while self._bytes > self.max_bytes and len(self._index) > 1:
+                old_key, size = self._index.popitem(last=False)
+                self._bytes -= size
+                self._counters["evictions"] += 1
+                evicted.append(old_key)
+        for old_key in evicted:
+            try:
+                os.remove(self._path(old_key))
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Remove every cached file."""
+        with self._lock:
+            keys = list(self._index)
+            self._index.clear()
+            self._bytes = 0
+        for key in keys:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "hit_rate": round(self._counters["hits"] / lookups, 4) if lookups else 0.0,
+                "entries": len(self._index),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "directory": self.directory,
+            }
+
+
+# Module-level singleton
+_tts_audio_cache: Optional[TTSAudioCache] = None
+
+
+def get_tts_audio_cache() -> Optional[TTSAudioCache]:
+    """
+    Get the singleton TTSAudioCache, or None when caching is disabled.
+
+    Returns:
+        TTSAudioCache singleton instance, or None
+    """
+    global _tts_audio_cache
+    settings = get_settings()
+    if not settings.tts_audio_cache_enabled:
+        return None
+    if _tts_audio_cache is None:
+        directory = settings.tts_audio_cache_dir or os.path.join(tempfile.gettempdir(), "tts_audio_cache")
+        try:
+            _tts_audio_cache = TTSAudioCache(directory, settings.tts_audio_cache_max_bytes)
+        except OSError as e:
+            logger.warning(f"TTS audio cache unavailable at {directory}: {e}")
+            return None
+    return _tts_audio_cache
+
+
+def reset_tts_audio_cache() -> None:
+    """Drop the singleton (testing)."""
+    global _tts_audio_cache
+    _tts_audio_cache = None
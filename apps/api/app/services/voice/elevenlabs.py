@@ -14,7 +14,7 @@ References:
 
 import logging
 import asyncio
-from typing import Optional, Dict, Any
+from typing import Any, AsyncIterator, Dict, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -322,6 +322,73 @@ class ElevenLabsClient:
             f"&similarity_boost={similarity_boost}"
         )
 
+    async def stream_audio(
+        self,
+        text: str,
+        voice_id: str,
+        model_id: Optional[str] = None,
+        stability: float = 0.5,
+        similarity_boost: float = 0.75,
+        speed: float = 1.0,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream synthesized audio chunks from ElevenLabs.
+
+        Raises httpx errors to the caller; the proxy endpoint maps them to
+        HTTP responses.
+
+        Args:
+            text: Text to convert to speech
+            voice_id: ElevenLabs voice ID
+            model_id: Optional model ID (uses config default if not provided)
+            stability: Voice stability (0-1)
+            similarity_boost: Voice similarity boost (0-1)
+            speed: Playback speed (1.0 = normal)
+
+        Yields:
+            Audio (mp3/mpeg) chunks
+        """
+        model_id = model_id or self._get_settings().elevenlabs_model
+        voice_settings: Dict[str, Any] = {
+            "stability": stability,
+            "similarity_boost": similarity_boost,
+        }
+        if speed != 1.0:
+            voice_settings["speed"] = speed
+
+        client = await self._get_client()
+        async with client.stream(
+            "POST",
+            f"/text-to-speech/{voice_id}/stream",
+            params={"optimize_streaming_latency": 4},
+            json={"text": text, "model_id": model_id, "voice_settings": voice_settings},
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                yield chunk
+
+    async def synthesize(
+        self,
+        text: str,
+        voice_id: str,
+        model_id: Optional[str] = None,
+        stability: float = 0.5,
+        similarity_boost: float = 0.75,
+        speed: float = 1.0,
+    ) -> bytes:
+        """Synthesize the complete audio for text (see stream_audio)."""
+        chunks = []
+        async for chunk in self.stream_audio(
+            text=text,
+            voice_id=voice_id,
+            model_id=model_id,
+            stability=stability,
+            similarity_boost=similarity_boost,
+            speed=speed,
+        ):
+            chunks.append(chunk)
+        return b"".join(chunks)
+
     async def list_voices(self) -> Dict[str, Any]:
         """
         List available voices from ElevenLabs.
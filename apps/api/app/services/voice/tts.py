@@ -13,6 +13,7 @@ References:
 - [Source: prd/prd-non-functional-requirements.md#NFR22]
 """
 
+import asyncio
 import logging
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
@@ -23,11 +24,19 @@ from app.services.voice.elevenlabs import (
     TTSResult,
     FallbackReason,
 )
+from app.services.voice.audio_cache import audio_cache_key, get_tts_audio_cache
 from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
 
+def section_text(section: Dict[str, str]) -> str:
+    """Spoken text for a briefing section: title and content together for natural delivery."""
+    title = section.get("title", "")
+    content = section.get("content", "")
+    return f"{title}. {content}" if title else content
+
+
 @dataclass
 class UserVoicePreferences:
     """
@@ -221,20 +230,59 @@ class TTSService:
         results = []
 
         for section in sections:
-            title = section.get("title", "")
-            content = section.get("content", "")
-
-            # Combine title and content for natural delivery
-            full_text = f"{title}. {content}" if title else content
-
             result = await self.generate_stream_url(
-                text=full_text,
+                text=section_text(section),
                 user_preferences=user_preferences,
             )
             results.append(result)
 
         return results
 
+    async def presynthesize_sections(
+        self,
+        sections: List[Dict[str, str]],
+        voice_id: Optional[str] = None,
+    ) -> int:
+        """
+        Synthesize section audio into the TTS audio cache ahead of playback.
+
+        Uses the same text and voice settings as generate_stream_url, so the
+        stream URLs handed to the player resolve to cached audio. Sections
+        already cached are skipped; failures are logged and skipped.
+
+        Args:
+            sections: List of dicts with 'title' and 'content' keys
+            voice_id: Optional override for voice ID (default from config)
+
+        Returns:
+            Number of sections newly synthesized
+        """
+        cache = get_tts_audio_cache()
+        client = self._get_client()
+        settings = self._get_settings()
+        voice_id = voice_id or settings.elevenlabs_voice_id
+        if cache is None or not client.is_configured or not voice_id:
+            return 0
+
+        synthesized = 0
+        for section in sections:
+            text = section_text(section)
+            if not text:
+                continue
+            synthesis = dict(text=text, voice_id=voice_id, model_id=settings.elevenlabs_model)
+            key = audio_cache_key(**synthesis)
+            if cache.contains(key):
+                continue
+            try:
+                data = await client.synthesize(**synthesis)
+            except Exception as e:
+                logger.warning(f"Pre-synthesis failed for section '{section.get('title', '')}': {e}")
+                continue
+            await asyncio.to_thread(cache.put, key, data)
+            synthesized += 1
+
+        return synthesized
+
     async def close(self) -> None:
         """Close the underlying client."""
         if self._client:
@@ -29,6 +29,14 @@ from app.models.briefing import (
 client = TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def on_demand_generation():
+    """Generate morning briefings per request (store-served: tests/test_briefing_store.py)."""
+    with patch('app.api.briefing.get_settings') as mock_settings:
+        mock_settings.return_value.briefing_pregenerate_enabled = False
+        yield
+
+
 class TestBriefingAreasEndpoint:
     """Tests for GET /api/v1/briefing/areas endpoint."""
 
@@ -266,7 +266,7 @@ class TestGetQAThread:
              patch('app.api.handoff._get_handoff_by_id', return_value=mock_handoff), \
              patch('app.api.handoff.get_handoff_qa_service') as mock_service:
 
-            mock_service.return_value.get_thread.return_value = mock_thread
+            mock_service.return_value.aget_thread = AsyncMock(return_value=mock_thread)
 
             response = client.get(f"/api/v1/handoff/{sample_handoff_id}/qa")
 
@@ -293,7 +293,7 @@ class TestGetQAThread:
              patch('app.api.handoff._get_handoff_by_id', return_value=mock_handoff), \
              patch('app.api.handoff.get_handoff_qa_service') as mock_service:
 
-            mock_service.return_value.get_thread.return_value = mock_thread
+            mock_service.return_value.aget_thread = AsyncMock(return_value=mock_thread)
 
             response = client.get(f"/api/v1/handoff/{sample_handoff_id}/qa")
 
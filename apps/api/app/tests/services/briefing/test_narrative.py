@@ -9,12 +9,16 @@ Tests for the LLM-powered narrative generation including:
 AC#2: Narrative Generation
 """
 
+import json
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
+from langchain_core.messages import AIMessage
 
 from app.services.briefing.narrative import (
     NarrativeGenerator,
     get_narrative_generator,
+    parse_area_narratives,
 )
 from app.models.briefing import (
     BriefingData,
@@ -232,16 +236,14 @@ class TestNarrativeGenerator:
     async def test_generate_with_llm_success(self, generator):
         """Test LLM generation success."""
         mock_llm = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.generations = [[MagicMock(text='''
+        mock_llm.ainvoke.return_value = AIMessage(content='''
         {
             "headline": {"title": "Test", "content": "Test headline"},
             "wins": {"title": "Wins", "content": "Test wins"},
             "concerns": {"title": "Concerns", "content": "Test concerns"},
             "actions": {"title": "Actions", "content": "Test actions"}
         }
-        ''')]]
-        mock_llm.agenerate.return_value = mock_response
+        ''')
 
         generator._llm_client = mock_llm
 
@@ -258,9 +260,7 @@ class TestNarrativeGenerator:
     async def test_generate_with_llm_invalid_json(self, generator):
         """Test LLM generation with invalid JSON."""
         mock_llm = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.generations = [[MagicMock(text="Not valid JSON")]]
-        mock_llm.agenerate.return_value = mock_response
+        mock_llm.ainvoke.return_value = AIMessage(content="Not valid JSON")
 
         generator._llm_client = mock_llm
 
@@ -363,3 +363,66 @@ class TestNarrativeFormatting:
 
         assert "1." in actions
         assert "2." in actions
+
+
+class TestAreaNarratives:
+    """Tests for batched area narratives (one LLM call for all areas)."""
+
+    AREAS = [
+        ("grinding", "Grinding", "Grinding is tracking 4.0% behind target."),
+        ("roasting", "Roasting", "Roasting is performing well at 2.0% ahead of target."),
+    ]
+
+    @pytest.mark.asyncio
+    async def test_batched_call_returns_all_areas(self):
+        """One call yields a narrative per area, with token usage."""
+        mock_llm = AsyncMock()
+        mock_llm.ainvoke.return_value = AIMessage(
+            content=json.dumps({"sections": [
+                {"area_id": "grinding", "content": "Grinding is a little behind this morning."},
+                {"area_id": "roasting", "content": "Roasting is running ahead."},
+            ]}),
+            response_metadata={"token_usage": {"prompt_tokens": 420, "completion_tokens": 60}},
+        )
+        generator = NarrativeGenerator(llm_client=mock_llm)
+
+        result = await generator.generate_area_narratives(self.AREAS)
+
+        assert mock_llm.ainvoke.await_count == 1
+        assert result.narratives["roasting"] == "Roasting is running ahead."
+        assert result.llm_calls == 1
+        assert result.prompt_tokens == 420
+        assert result.completion_tokens == 60
+
+    @pytest.mark.asyncio
+    async def test_invalid_response_returns_no_narratives(self):
+        """Schema mismatch leaves every area on its template."""
+        mock_llm = AsyncMock()
+        mock_llm.ainvoke.return_value = AIMessage(content='{"grinding": "Behind."}')
+        generator = NarrativeGenerator(llm_client=mock_llm)
+
+        result = await generator.generate_area_narratives(self.AREAS)
+
+        assert result.narratives == {}
+        assert result.llm_calls == 1
+
+    def test_parse_ignores_unrequested_areas(self):
+        """Only requested area IDs with content are kept."""
+        text = json.dumps({"sections": [
+            {"area_id": "grinding", "content": "Behind."},
+            {"area_id": "packing", "content": "Not asked for."},
+            {"area_id": "roasting", "content": "  "},
+        ]})
+
+        assert parse_area_narratives(text, ["grinding", "roasting"]) == {"grinding": "Behind."}
+
+    @pytest.mark.asyncio
+    async def test_no_llm_makes_no_call(self):
+        """Without an LLM client, no call is counted."""
+        generator = NarrativeGenerator(llm_client=None)
+
+        with patch.object(generator, "_get_llm_client", return_value=None):
+            result = await generator.generate_area_narratives(self.AREAS)
+
+        assert result.narratives == {}
+        assert result.llm_calls == 0
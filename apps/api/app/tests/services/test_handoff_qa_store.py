@@ -0,0 +1,299 @@
+"""
+Tests for the Handoff Q&A Thread Store (Story 9.6).
+
+Tests cover:
+- Write-behind: entries are queued and batch-inserted
+- Queued entries are visible before they are inserted
+- Failed inserts are retried row by row, then dropped after too many attempts
+- The queue is bounded
+- Table writes are off unless enabled
+- Bounded LRU read cache and single-query thread loads
+- Threads written by another worker are read from the table
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from app.services.handoff.qa import HandoffQAService
+from app.services.handoff.qa_store import QA_TABLE, HandoffQAStore
+
+
+class FakeQuery:
+    """Minimal Supabase query builder over an in-memory table."""
+
+    def __init__(self, client: "FakeSupabase", table: str):
+        self.client = client
+        self.table = table
+        self.filters: Dict[str, Any] = {}
+        self.rows_to_insert = None
+
+    def select(self, *_):
+        return self
+
+    def eq(self, column, value):
+        self.filters[column] = value
+        return self
+
+    def order(self, column):
+        self.order_by = column
+        return self
+
+    def insert(self, rows):
+        self.rows_to_insert = rows
+        return self
+
+    def execute(self):
+        if self.rows_to_insert is not None:
+            rows = self.rows_to_insert if isinstance(self.rows_to_insert, list) else [self.rows_to_insert]
+            if self.client.fail_inserts:
+                raise RuntimeError("connection reset")
+            if any(r["handoff_id"] in self.client.missing_handoffs for r in rows):
+                raise RuntimeError("violates foreign key constraint")
+            self.client.inserts.append(list(rows))
+            self.client.rows.extend(rows)
+            return type("Result", (), {"data": rows})()
+        self.client.selects.append(dict(self.filters))
+        data = [
+            r for r in self.client.rows
+            if all(r.get(k) == v for k, v in self.filters.items())
+        ]
+        return type("Result", (), {"data": sorted(data, key=lambda r: r["created_at"])})()
+
+
+class FakeSupabase:
+    def __init__(self):
+        self.rows: List[Dict[str, Any]] = []
+        self.inserts: List[List[Dict[str, Any]]] = []
+        self.selects: List[Dict[str, Any]] = []
+        self.fail_inserts = False
+        self.missing_handoffs: set = set()
+
+    def table(self, name):
+        assert name == QA_TABLE
+        return FakeQuery(self, name)
+
+
+START = datetime(2026, 10, 17, 14, tzinfo=timezone.utc)
+
+
+def _row(handoff_id: str, n: int) -> Dict[str, Any]:
+    return {
+        "id": str(uuid.uuid4()),
+        "handoff_id": handoff_id,
+        "user_id": str(uuid.uuid4()),
+        "user_name": "Sam",
+        "content_type": "question",
+        "content": f"Question {n}",
+        "citations": [],
+        "voice_transcript": None,
+        "created_at": (START + timedelta(seconds=n)).isoformat(),
+    }
+
+
+@pytest.fixture
+def supabase():
+    return FakeSupabase()
+
+
+def _store(supabase, **overrides):
+    options = dict(
+        max_cached_threads=2,
+        cache_ttl_seconds=60,
+        flush_batch_size=3,
+        flush_interval_seconds=60,
+    )
+    options.update(overrides)
+    return HandoffQAStore(supabase_client=supabase, **options)
+
+
+class TestWriteBehind:
+    """Queued entries and batch inserts."""
+
+    def test_entries_batched_and_visible_before_insert(self, supabase):
+        store = _store(supabase)
+        handoff_id = str(uuid.uuid4())
+
+        store.append(_row(handoff_id, 1))
+        store.append(_row(handoff_id, 2))
+
+        assert supabase.inserts == []
+        assert [r["content"] for r in store.get_thread(handoff_id)] == ["Question 1", "Question 2"]
+
+        assert store.flush() == 2
+        assert len(supabase.inserts) == 1
+        assert len(supabase.inserts[0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_in_background(self, supabase):
+        store = _store(supabase)
+        handoff_id = str(uuid.uuid4())
+
+        for n in range(3):
+            store.append(_row(handoff_id, n))
+        for _ in range(50):
+            if supabase.inserts:
+                break
+            await asyncio.sleep(0.01)
+
+        assert [len(batch) for batch in supabase.inserts] == [3]
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_queued_entries(self, supabase):
+        store = _store(supabase)
+        store.append(_row(str(uuid.uuid4()), 1))
+
+        await store.close()
+
+        assert len(supabase.rows) == 1
+
+    def test_failed_insert_is_retried(self, supabase):
+        store = _store(supabase)
+        handoff_id = str(uuid.uuid4())
+        store.append(_row(handoff_id, 1))
+
+        supabase.fail_inserts = True
+        assert store.flush() == 0
+        assert store.get_stats()["pending"] == 1
+
+        supabase.fail_inserts = False
+        assert store.flush() == 1
+        assert len(supabase.rows) == 1
+
+
+    def test_bad_entry_does_not_block_batch(self, supabase):
+        store = _store(supabase, max_insert_attempts=2)
+        good, missing = str(uuid.uuid4()), str(uuid.uuid4())
+        supabase.missing_handoffs.add(missing)
+        store.append(_row(good, 1))
+        store.append(_row(missing, 2))
+
+        # Batch fails, then each entry is inserted on its own
+        assert store.flush() == 1
+        assert [r["handoff_id"] for r in supabase.rows] == [good]
+        assert store.get_stats()["pending"] == 1
+
+        # The failing entry is dropped after its last attempt
+        assert store.flush() == 0
+        stats = store.get_stats()
+        assert (stats["pending"], stats["dropped"]) == (0, 1)
+        assert store.flush() == 0
+
+    def test_queue_is_bounded(self, supabase):
+        store = _store(supabase, max_pending=2, flush_batch_size=10)
+        handoff_id = str(uuid.uuid4())
+
+        for n in range(3):
+            store.append(_row(handoff_id, n))
+
+        assert store.get_stats()["pending"] == 2
+        assert store.get_stats()["dropped"] == 1
+        assert store.flush() == 2
+        assert [r["content"] for r in supabase.rows] == ["Question 1", "Question 2"]
+
+    def test_table_writes_disabled_by_default(self):
+        store = HandoffQAStore()
+        handoff_id = str(uuid.uuid4())
+
+        with patch("app.services.handoff.qa_store.create_client") as create_client:
+            store.append(_row(handoff_id, 1))
+            assert store.flush() == 0
+
+        create_client.assert_not_called()
+        assert len(store.get_thread(handoff_id)) == 1
+
+
+class TestThreadCache:
+    """Thread loads and the LRU read cache."""
+
+    def test_thread_loads_with_one_query_then_cached(self, supabase):
+        handoff_id = str(uuid.uuid4())
+        supabase.rows = [_row(handoff_id, 2), _row(handoff_id, 1), _row(str(uuid.uuid4()), 3)]
+        store = _store(supabase)
+
+        first = store.get_thread(handoff_id)
+        second = store.get_thread(handoff_id)
+
+        assert [r["content"] for r in first] == ["Question 1", "Question 2"]
+        assert second == first
+        assert supabase.selects == [{"handoff_id": handoff_id}]
+
+    @pytest.mark.asyncio
+    async def test_async_load_runs_off_the_event_loop(self, supabase):
+        handoff_id = str(uuid.uuid4())
+        supabase.rows = [_row(handoff_id, 1)]
+        store = _store(supabase)
+        store.append(_row(handoff_id, 2))
+
+        with patch("app.services.handoff.qa_store.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            first = await store.aget_thread(handoff_id)
+            second = await store.aget_thread(handoff_id)
+
+        assert [r["content"] for r in first] == ["Question 1", "Question 2"]
+        assert second == first
+        # The cached read needs no query
+        assert to_thread.call_count == 1
+        assert supabase.selects == [{"handoff_id": handoff_id}]
+
+    def test_appends_update_cached_thread(self, supabase):
+        store = _store(supabase)
+        handoff_id = str(uuid.uuid4())
+        store.get_thread(handoff_id)
+
+        store.append(_row(handoff_id, 1))
+
+        assert len(store.get_thread(handoff_id)) == 1
+        assert len(supabase.selects) == 1
+
+    def test_cache_is_bounded(self, supabase):
+        store = _store(supabase)
+        handoffs = [str(uuid.uuid4()) for _ in range(3)]
+
+        for handoff_id in handoffs:
+            store.get_thread(handoff_id)
+        store.get_thread(handoffs[0])
+
+        assert store.get_stats()["cached_threads"] == 2
+        assert len(supabase.selects) == 4
+
+    def test_other_workers_entries_after_ttl(self, supabase):
+        handoff_id = str(uuid.uuid4())
+        worker_a = _store(supabase, cache_ttl_seconds=0)
+        worker_b = _store(supabase)
+        worker_a.get_thread(handoff_id)
+
+        worker_b.append(_row(handoff_id, 1))
+        worker_b.flush()
+
+        assert len(worker_a.get_thread(handoff_id)) == 1
+
+    def test_evicted_thread_keeps_queued_entries(self, supabase):
+        store = _store(supabase, max_cached_threads=1)
+        handoff_id = str(uuid.uuid4())
+        store.append(_row(handoff_id, 1))
+
+        store.get_thread(str(uuid.uuid4()))
+
+        assert len(store.get_thread(handoff_id)) == 1
+
+
+class TestServiceIntegration:
+    """HandoffQAService reads and writes through the store."""
+
+    @pytest.mark.asyncio
+    async def test_human_response_persisted(self, supabase):
+        store = _store(supabase)
+        service = HandoffQAService(store=store)
+        handoff_id = str(uuid.uuid4())
+
+        await service.add_human_response(handoff_id, "Valve replaced at 13:00", str(uuid.uuid4()), "Sam")
+        await store.close()
+
+        # A fresh worker loads the thread from the table
+        thread = await HandoffQAService(store=_store(supabase)).aget_thread(handoff_id)
+        assert [e.content for e in thread.entries] == ["Valve replaced at 13:00"]
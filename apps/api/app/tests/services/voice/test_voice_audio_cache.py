@@ -0,0 +1,234 @@
+"""
+TTS Audio Cache Tests
+
+Tests for content-addressed caching of synthesized speech:
+- Cache keys are stable and sensitive to every synthesis parameter
+- Disk tier with size-based LRU eviction that survives restarts
+- /api/v1/voice/tts/stream serves hits with HTTP Range support and
+  caches misses once streamed
+- Pre-synthesis of briefing sections
+"""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.voice.audio_cache import TTSAudioCache, audio_cache_key
+from app.services.voice.tts import TTSService
+
+client = TestClient(app)
+
+AUDIO = bytes(range(256)) * 4  # 1 KB of fake mp3
+
+
+class FakeElevenLabsClient:
+    """Stub client that records synthesis calls."""
+
+    def __init__(self, audio: bytes = AUDIO, configured: bool = True):
+        self.audio = audio
+        self.is_configured = configured
+        self.calls = []
+
+    async def stream_audio(self, **synthesis):
+        self.calls.append(synthesis)
+        for i in range(0, len(self.audio), 300):
+            yield self.audio[i:i + 300]
+
+    async def synthesize(self, **synthesis):
+        self.calls.append(synthesis)
+        return self.audio
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return TTSAudioCache(str(tmp_path / "tts"), max_bytes=10_000)
+
+
+class TestAudioCacheKey:
+    """Content addressing."""
+
+    def test_stable_and_rounded(self):
+        assert audio_cache_key("Hi", "v1", "m1", 1.0) == audio_cache_key("Hi", "v1", "m1", 1.0000001)
+
+    def test_every_parameter_changes_key(self):
+        base = audio_cache_key("Hi", "v1", "m1")
+        variants = [
+            audio_cache_key("Hi!", "v1", "m1"),
+            audio_cache_key("Hi", "v2", "m1"),
+            audio_cache_key("Hi", "v1", "m2"),
+            audio_cache_key("Hi", "v1", "m1", speed=1.1),
+            audio_cache_key("Hi", "v1", "m1", stability=0.6),
+            audio_cache_key("Hi", "v1", "m1", similarity_boost=0.5),
+        ]
+        assert base not in variants
+        assert len(set(variants)) == len(variants)
+
+
+class TestTTSAudioCache:
+    """Disk tier and eviction."""
+
+    def test_put_and_read(self, cache):
+        cache.put("k1", AUDIO)
+
+        with cache.open("k1") as audio:
+            assert audio.size == len(AUDIO)
+            assert audio.read() == AUDIO
+            assert b"".join(audio.iter_chunks(10, 19, chunk_size=3)) == AUDIO[10:20]
+
+        assert cache.open("missing") is None
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_lru_eviction_by_size(self, tmp_path):
+        cache = TTSAudioCache(str(tmp_path), max_bytes=2500)
+        cache.put("a", AUDIO)
+        cache.put("b", AUDIO)
+        cache.open("a").close()  # "a" is now more recent than "b"
+
+        cache.put("c", AUDIO)
+
+        assert cache.contains("a")
+        assert not cache.contains("b")
+        assert cache.contains("c")
+        assert cache.get_stats()["bytes"] == 2 * len(AUDIO)
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_index_survives_restart(self, tmp_path):
+        TTSAudioCache(str(tmp_path), max_bytes=10_000).put("a", AUDIO)
+
+        reopened = TTSAudioCache(str(tmp_path), max_bytes=10_000)
+
+        assert reopened.get_stats()["entries"] == 1
+        assert reopened.open("a").read() == AUDIO
+
+    def test_clear(self, cache):
+        cache.put("a", AUDIO)
+
+        cache.clear()
+
+        assert not cache.contains("a")
+        assert os.listdir(cache.directory) == []
+
+
+class TestStreamEndpoint:
+    """GET /api/v1/voice/tts/stream."""
+
+    PARAMS = {"voice_id": "v1", "model_id": "m1", "text": "Good morning."}
+
+    @staticmethod
+    def _patch(fake, cache):
+        return (
+            patch("app.api.voice.get_elevenlabs_client", return_value=fake),
+            patch("app.api.voice.get_tts_audio_cache", return_value=cache),
+        )
+
+    def _get(self, fake, cache, headers=None, **params):
+        client_patch, cache_patch = self._patch(fake, cache)
+        with client_patch, cache_patch:
+            return client.get("/api/v1/voice/tts/stream", params={**self.PARAMS, **params}, headers=headers or {})
+
+    def test_miss_streams_then_caches(self, cache):
+        fake = FakeElevenLabsClient()
+
+        first = self._get(fake, cache)
+        second = self._get(fake, cache)
+
+        assert first.status_code == 200
+        assert first.content == AUDIO
+        assert second.status_code == 200
+        assert second.content == AUDIO
+        assert second.headers["accept-ranges"] == "bytes"
+        assert len(fake.calls) == 1
+
+    def test_range_request(self, cache):
+        fake = FakeElevenLabsClient()
+        key = audio_cache_key("Good morning.", "v1", "m1")
+        cache.put(key, AUDIO)
+
+        response = self._get(fake, cache, headers={"Range": "bytes=100-199"})
+
+        assert response.status_code == 206
+        assert response.content == AUDIO[100:200]
+        assert response.headers["content-range"] == f"bytes 100-199/{len(AUDIO)}"
+        assert response.headers["etag"] == f'"{key}"'
+        assert fake.calls == []
+
+    def test_suffix_and_open_ended_ranges(self, cache):
+        cache.put(audio_cache_key("Good morning.", "v1", "m1"), AUDIO)
+        fake = FakeElevenLabsClient()
+
+        suffix = self._get(fake, cache, headers={"Range": "bytes=-24"})
+        open_ended = self._get(fake, cache, headers={"Range": "bytes=1000-"})
+
+        assert suffix.content == AUDIO[-24:]
+        assert open_ended.content == AUDIO[1000:]
+
+    def test_unsatisfiable_range(self, cache):
+        cache.put(audio_cache_key("Good morning.", "v1", "m1"), AUDIO)
+
+        response = self._get(FakeElevenLabsClient(), cache, headers={"Range": "bytes=5000-"})
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == f"bytes */{len(AUDIO)}"
+
+    def test_range_on_miss_synthesizes_first(self, cache):
+        fake = FakeElevenLabsClient()
+
+        response = self._get(fake, cache, headers={"Range": "bytes=0-9"})
+
+        assert response.status_code == 206
+        assert response.content == AUDIO[:10]
+        assert cache.contains(audio_cache_key("Good morning.", "v1", "m1"))
+
+    def test_speed_is_part_of_key(self, cache):
+        fake = FakeElevenLabsClient()
+
+        self._get(fake, cache)
+        self._get(fake, cache, speed=1.1)
+
+        assert len(fake.calls) == 2
+        assert fake.calls[1]["speed"] == 1.1
+
+    def test_not_configured(self, cache):
+        response = self._get(FakeElevenLabsClient(configured=False), cache)
+
+        assert response.status_code == 503
+
+
+class TestPresynthesis:
+    """TTSService.presynthesize_sections."""
+
+    @pytest.mark.asyncio
+    async def test_presynthesizes_uncached_sections(self, cache):
+        fake = FakeElevenLabsClient()
+        service = TTSService(elevenlabs_client=fake)
+        service._settings = MagicMock(elevenlabs_voice_id="v1", elevenlabs_model="m1")
+        sections = [
+            {"title": "Packing", "content": "On plan."},
+            {"title": "Roasting", "content": "Behind target."},
+            {"title": "", "content": ""},
+        ]
+
+        with patch("app.services.voice.tts.get_tts_audio_cache", return_value=cache):
+            first = await service.presynthesize_sections(sections)
+            second = await service.presynthesize_sections(sections)
+
+        assert first == 2
+        assert second == 0
+        # Same key the stream URL for the section resolves to
+        assert cache.contains(audio_cache_key("Packing. On plan.", "v1", "m1"))
+
+    @pytest.mark.asyncio
+    async def test_skipped_when_cache_disabled(self):
+        fake = FakeElevenLabsClient()
+        service = TTSService(elevenlabs_client=fake)
+        service._settings = MagicMock(elevenlabs_voice_id="v1", elevenlabs_model="m1")
+
+        with patch("app.services.voice.tts.get_tts_audio_cache", return_value=None):
+            assert await service.presynthesize_sections([{"title": "A", "content": "B"}]) == 0
+
+        assert fake.calls == []
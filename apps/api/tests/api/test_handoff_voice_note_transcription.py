@@ -0,0 +1,232 @@
+"""
+Tests for chunked voice note upload and background transcription (Story 9.3).
+
+- Uploads are spooled to disk in chunks and streamed to storage
+- The upload responds before transcription, with status "pending"
+- Transcription runs in a bounded-concurrency queue; results land on the
+  note, which clients poll
+- Oversized uploads are rejected with 413
+"""
+
+import asyncio
+import os
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app.api import handoff as handoff_api
+from app.services.handoff.transcription import TranscriptionJob, VoiceNoteTranscriptionQueue
+
+USER_ID = "123e4567-e89b-12d3-a456-426614174000"
+HANDOFF_ID = "22222222-2222-2222-2222-222222222222"
+AUDIO = b"\x1a\x45\xdf\xa3" * 4096  # 16 KB of fake webm
+HEADERS = {"Authorization": "Bearer test-token"}
+
+
+class CapturingQueue:
+    """Stands in for the transcription queue; jobs are run by the test."""
+
+    def __init__(self, accept=True):
+        self.accept = accept
+        self.jobs = []
+
+    def submit(self, job):
+        if not self.accept:
+            job.cleanup()
+            return False
+        self.jobs.append(job)
+        return True
+
+
+@pytest.fixture
+def handoff():
+    record = {
+        "id": HANDOFF_ID,
+        "user_id": USER_ID,
+        "status": "draft",
+        "assets_covered": [],
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+    with patch.object(handoff_api, "_get_handoff_by_id", return_value=record), \
+            patch.dict(handoff_api._voice_notes, clear=True):
+        yield record
+
+
+def _upload(client, queue, **settings_overrides):
+    uploaded = {}
+
+    async def fake_upload(user_id, handoff_id, note_id, audio_data, content_type="audio/webm"):
+        # Storage receives a file handle, not the bytes
+        uploaded["is_file"] = hasattr(audio_data, "read")
+        uploaded["data"] = audio_data.read()
+        return f"mock://{user_id}/{handoff_id}/{note_id}.webm"
+
+    with patch.object(handoff_api, "_upload_to_supabase_storage", side_effect=fake_upload), \
+            patch.object(handoff_api, "get_voice_note_transcription_queue", return_value=queue), \
+            patch.multiple(
+                handoff_api.get_settings(),
+                voice_note_upload_chunk_bytes=1024,
+                **settings_overrides,
+            ):
+        response = client.post(
+            f"/api/v1/handoff/{HANDOFF_ID}/voice-notes",
+            headers=HEADERS,
+            files={"audio": ("note.webm", AUDIO, "audio/webm")},
+            data={"duration_seconds": "12"},
+        )
+    return response, uploaded
+
+
+class TestChunkedUpload:
+    """POST /{handoff_id}/voice-notes."""
+
+    def test_responds_before_transcription(self, client, mock_verify_jwt, handoff):
+        queue = CapturingQueue()
+
+        response, uploaded = _upload(client, queue)
+
+        assert response.status_code == 200
+        note = response.json()["note"]
+        assert note["transcription_status"] == "pending"
+        assert note["transcript"] is None
+        assert uploaded == {"is_file": True, "data": AUDIO}
+        assert len(queue.jobs) == 1
+        queue.jobs[0].cleanup()
+
+    def test_transcript_recorded_and_polled(self, client, mock_verify_jwt, handoff):
+        queue = CapturingQueue()
+        response, _ = _upload(client, queue)
+        note_id = response.json()["note"]["id"]
+        job = queue.jobs[0]
+
+        async def transcribe(audio_data, content_type):
+            assert audio_data.read() == AUDIO
+            return "Mixer valve needs checking"
+
+        with patch.object(handoff_api, "_transcribe_audio_with_elevenlabs", side_effect=transcribe):
+            transcript = asyncio.run(job.transcribe())
+        job.on_complete(transcript)
+        job.cleanup()
+
+        polled = client.get(f"/api/v1/handoff/{HANDOFF_ID}/voice-notes/{note_id}", headers=HEADERS)
+        assert polled.status_code == 200
+        assert polled.json()["transcription_status"] == "completed"
+        assert polled.json()["transcript"] == "Mixer valve needs checking"
+
+    def test_spool_removed_after_transcription(self, client, mock_verify_jwt, handoff):
+        queue = CapturingQueue()
+        created = []
+        mkstemp = handoff_api.tempfile.mkstemp
+
+        def tracking_mkstemp(*args, **kwargs):
+            fd, path = mkstemp(*args, **kwargs)
+            created.append(path)
+            return fd, path
+
+        with patch.object(handoff_api.tempfile, "mkstemp", side_effect=tracking_mkstemp):
+            _upload(client, queue)
+        assert os.path.exists(created[0])
+
+        queue.jobs[0].cleanup()
+        assert not os.path.exists(created[0])
+
+    def test_full_queue_saves_note_without_transcript(self, client, mock_verify_jwt, handoff):
+        response, _ = _upload(client, CapturingQueue(accept=False))
+
+        assert response.status_code == 200
+        assert response.json()["note"]["transcription_status"] == "failed"
+        assert "transcription unavailable" in response.json()["message"]
+
+    def test_oversized_upload_rejected(self, client, mock_verify_jwt, handoff):
+        queue = CapturingQueue()
+
+        response, uploaded = _upload(client, queue, voice_note_max_upload_bytes=8 * 1024)
+
+        assert response.status_code == 413
+        assert response.json()["detail"]["code"] == "file_too_large"
+        assert uploaded == {}
+        assert handoff_api._voice_notes == {}
+
+    def test_poll_unknown_note(self, client, mock_verify_jwt, handoff):
+        response = client.get(
+            f"/api/v1/handoff/{HANDOFF_ID}/voice-notes/33333333-3333-3333-3333-333333333333",
+            headers=HEADERS,
+        )
+
+        assert response.status_code == 404
+
+
+class TestTranscriptionQueue:
+    """VoiceNoteTranscriptionQueue."""
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self):
+        queue = VoiceNoteTranscriptionQueue(max_concurrency=2, max_queued=10, timeout_seconds=5)
+        running = 0
+        peak = 0
+        results = {}
+
+        def job(n):
+            async def transcribe():
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                return f"note {n}"
+
+            return TranscriptionJob(str(n), transcribe, lambda text: results.__setitem__(n, text))
+
+        for n in range(6):
+            assert queue.submit(job(n))
+        await queue.join()
+
+        assert peak == 2
+        assert results == {n: f"note {n}" for n in range(6)}
+        await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_and_cleans_up(self):
+        queue = VoiceNoteTranscriptionQueue(max_concurrency=1, max_queued=1, timeout_seconds=5)
+        release = asyncio.Event()
+        cleaned = []
+
+        async def blocked():
+            await release.wait()
+            return "done"
+
+        def job(n):
+            return TranscriptionJob(str(n), blocked, lambda text: None, cleanup=lambda: cleaned.append(n))
+
+        assert queue.submit(job(1))
+        await asyncio.sleep(0)  # worker picks up job 1
+        assert queue.submit(job(2))
+        assert not queue.submit(job(3))
+        assert cleaned == [3]
+
+        release.set()
+        await queue.join()
+        assert sorted(cleaned) == [1, 2, 3]
+        assert queue.get_stats()["rejected"] == 1
+        await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_failures_and_timeouts_report_none(self):
+        queue = VoiceNoteTranscriptionQueue(max_concurrency=1, max_queued=5, timeout_seconds=0.05)
+        results = {}
+
+        async def boom():
+            raise RuntimeError("stt down")
+
+        async def slow():
+            await asyncio.sleep(1)
+            return "late"
+
+        queue.submit(TranscriptionJob("a", boom, lambda text: results.__setitem__("a", text)))
+        queue.submit(TranscriptionJob("b", slow, lambda text: results.__setitem__("b", text)))
+        await queue.join()
+
+        assert results == {"a": None, "b": None}
+        assert queue.get_stats()["failed"] == 2
+        await queue.close()
@@ -616,3 +616,663 @@ class TestForceRefreshContext:
 
         # Reset context
         set_force_refresh(False)
+
+
+class TestStaleWhileRevalidate:
+    """Tests for soft-TTL serving and background refresh."""
+
+    def _age_entry(self, cache, key, tier, seconds):
+        """Move an entry's stored time back by the given number of seconds."""
+        cache._caches[tier][key].stored_at -= seconds
+
+    def test_swr_disabled_by_default(self):
+        """Soft-TTL mode is opt-in."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService(max_size=100)
+
+        assert cache.swr_enabled is False
+        assert cache.get_stats()["swr_enabled"] is False
+
+    def test_swr_extends_hard_ttl_by_stale_ttl(self):
+        """Tier caches keep entries for TTL + stale grace period."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService(max_size=100, swr_enabled=True)
+
+        for tier, ttl in cache._tiers.items():
+            if tier in cache._caches:
+                assert cache._caches[tier].ttl == ttl + cache._stale_ttls[tier]
+
+    def test_fresh_entry_not_flagged(self):
+        """Fresh entries are returned without a refresh request."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService(max_size=100, swr_enabled=True)
+        cache.set("tool:user:abc", "live", {"data": 1, "metadata": {}})
+
+        value, needs_refresh = cache.lookup("tool:user:abc", "live")
+
+        assert value["data"] == 1
+        assert "cache_stale" not in value["metadata"]
+        assert needs_refresh is False
+
+    def test_expired_entry_served_stale(self):
+        """Entries past TTL are served flagged as stale and request a refresh."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService(max_size=100, swr_enabled=True)
+        cache.reset_stats()
+        cache.set("tool:user:abc", "live", {"data": 1, "metadata": {}})
+        self._age_entry(cache, "tool:user:abc", "live", cache._tiers["live"] + 1)
+
+        value, needs_refresh = cache.lookup("tool:user:abc", "live")
+
+        assert value["data"] == 1
+        assert value["metadata"]["cache_stale"] is True
+        assert needs_refresh is True
+        assert cache.get_stats()["stale_hits"] == 1
+        # The stored entry itself is not marked stale
+        assert "cache_stale" not in cache._caches["live"]["tool:user:abc"].value["metadata"]
+
+    def test_hot_key_refreshed_ahead_of_expiry(self):
+        """Frequently hit keys request a refresh before they expire."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService(max_size=100, swr_enabled=True)
+        cache.set("tool:user:abc", "daily", {"data": 1})
+        ttl = cache._tiers["daily"]
+        self._age_entry(cache, "tool:user:abc", "daily", ttl * cache.refresh_ahead_ratio)
+
+        flags = [
+            cache.lookup("tool:user:abc", "daily")[1]
+            for _ in range(cache.refresh_ahead_min_hits)
+        ]
+
+        assert flags[-1] is True
+        assert not any(flags[:-1])
+
+    @pytest.mark.asyncio
+    async def test_schedule_refresh_updates_entry(self):
+        """Background refresh replaces the entry and records the refresh."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService(max_size=100, swr_enabled=True)
+        cache.reset_stats()
+        cache.set("tool:user:abc", "live", {"data": 1})
+
+        async def refresh():
+            return {"data": 2}
+
+        assert cache.schedule_refresh("tool:user:abc", "live", refresh) is True
+        await cache.wait_for_refreshes()
+
+        assert cache.get("tool:user:abc", "live")["data"] == 2
+        assert cache.get_stats()["refreshes"] == 1
+        assert cache.get_stats()["refreshes_in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_schedule_refresh_deduplicates_and_bounds(self):
+        """Only one refresh per key and at most refresh_max_workers at once."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService(max_size=100, swr_enabled=True)
+        cache.refresh_max_workers = 2
+        release = asyncio.Event()
+
+        async def refresh():
+            await release.wait()
+            return {"data": "new"}
+
+        assert cache.schedule_refresh("k1", "live", refresh) is True
+        assert cache.schedule_refresh("k1", "live", refresh) is False
+        assert cache.schedule_refresh("k2", "live", refresh) is True
+        assert cache.schedule_refresh("k3", "live", refresh) is False
+
+        release.set()
+        await cache.wait_for_refreshes()
+        assert cache.get_stats()["refreshes"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_entry(self):
+        """A failing refresh is counted and leaves the existing entry in place."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService(max_size=100, swr_enabled=True)
+        cache.reset_stats()
+        cache.set("tool:user:abc", "live", {"data": 1})
+
+        async def refresh():
+            raise RuntimeError("upstream down")
+
+        cache.schedule_refresh("tool:user:abc", "live", refresh)
+        await cache.wait_for_refreshes()
+
+        assert cache.get("tool:user:abc", "live")["data"] == 1
+        assert cache.get_stats()["refresh_failures"] == 1
+
+    def test_schedule_refresh_noop_without_swr(self):
+        """Refreshes are never scheduled when soft-TTL mode is off."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService(max_size=100)
+
+        async def refresh():
+            return {"data": 2}
+
+        assert cache.schedule_refresh("k", "live", refresh) is False
+
+    @pytest.mark.asyncio
+    async def test_decorator_serves_stale_and_refreshes(self):
+        """Decorator returns the stale result immediately and refreshes it."""
+        from app.services.agent import cache as cache_module
+        from app.services.agent.cache import ToolCacheService, cached_tool
+        from app.services.agent.base import ManufacturingTool, ToolResult
+
+        swr_cache = ToolCacheService(max_size=100, swr_enabled=True)
+        call_count = 0
+
+        class MockInput(BaseModel):
+            value: str
+
+        class TestTool(ManufacturingTool):
+            name: str = "test_tool_swr"
+            description: str = "Test tool"
+            args_schema: Type[BaseModel] = MockInput
+
+            @cached_tool(tier="live")
+            async def _arun(self, value: str, **kwargs) -> ToolResult:
+                nonlocal call_count
+                call_count += 1
+                return self._create_success_result(data={"call": call_count})
+
+        tool = TestTool()
+
+        with patch.object(cache_module, "get_tool_cache", return_value=swr_cache):
+            await tool._arun(value="x", user_id="user1")
+            key = swr_cache.generate_key("test_tool_swr", "user1", {"value": "x", "user_id": "user1"})
+            self._age_entry(swr_cache, key, "live", swr_cache._tiers["live"] + 1)
+
+            stale = await tool._arun(value="x", user_id="user1")
+            assert stale.data["call"] == 1
+            assert stale.metadata["cache_stale"] is True
+
+            await swr_cache.wait_for_refreshes()
+            assert call_count == 2
+
+            fresh = await tool._arun(value="x", user_id="user1")
+            assert fresh.data["call"] == 2
+            assert "cache_stale" not in fresh.metadata
+
+
+class TestCacheScopes:
+    """Tests for scope-aware cache keys."""
+
+    def test_global_scope_ignores_identity(self):
+        """Global scope shares results across all users."""
+        from app.services.agent.cache import resolve_scope_identity, set_cache_scope_context
+
+        set_cache_scope_context("user-B")
+        assert resolve_scope_identity("global", user_id="user-A") == "global"
+        assert resolve_scope_identity("global") == "global"
+        set_cache_scope_context(None)
+
+    def test_user_scope_prefers_explicit_user_id(self):
+        """User scope uses the explicit user_id, then context, then anonymous."""
+        from app.services.agent.cache import resolve_scope_identity, set_cache_scope_context
+
+        set_cache_scope_context("ctx-user")
+        assert resolve_scope_identity("user", user_id="kw-user") == "kw-user"
+        assert resolve_scope_identity("user") == "ctx-user"
+        set_cache_scope_context(None)
+        assert resolve_scope_identity("user") == "anonymous"
+
+    def test_invalid_scope_rejected(self):
+        """Unknown scopes fail at decoration time."""
+        from app.services.agent.cache import cached_tool
+
+        with pytest.raises(ValueError):
+            cached_tool(tier="daily", scope="area")
+
+    @pytest.mark.asyncio
+    async def test_decorator_global_scope_shared_across_users(self):
+        """A global-scoped tool result computed for one user is a hit for another."""
+        from app.services.agent.cache import cached_tool, reset_tool_cache, set_cache_scope_context
+        from app.services.agent.base import ManufacturingTool, ToolResult
+
+        reset_tool_cache()
+        call_count = 0
+
+        class MockInput(BaseModel):
+            area: str
+
+        class TestTool(ManufacturingTool):
+            name: str = "test_tool_global_scope"
+            description: str = "Test tool"
+            args_schema: Type[BaseModel] = MockInput
+
+            @cached_tool(tier="live", scope="global")
+            async def _arun(self, area: str, **kwargs) -> ToolResult:
+                nonlocal call_count
+                call_count += 1
+                return self._create_success_result(data={"area": area})
+
+        tool = TestTool()
+
+        set_cache_scope_context("user-A")
+        await tool._arun(area="Grinding")
+        set_cache_scope_context("user-B")
+        await tool._arun(area="Grinding")
+        set_cache_scope_context(None)
+
+        assert call_count == 1
+        assert TestTool._arun._cache_scope == "global"
+
+    @pytest.mark.asyncio
+    async def test_decorator_user_scope_isolated_by_context(self):
+        """User-scoped tools keep separate entries per user from context."""
+        from app.services.agent.cache import cached_tool, reset_tool_cache, set_cache_scope_context
+        from app.services.agent.base import ManufacturingTool, ToolResult
+
+        reset_tool_cache()
+        call_count = 0
+
+        class MockInput(BaseModel):
+            subject: str
+
+        class TestTool(ManufacturingTool):
+            name: str = "test_tool_user_scope"
+            description: str = "Test tool"
+            args_schema: Type[BaseModel] = MockInput
+
+            @cached_tool(tier="daily")
+            async def _arun(self, subject: str, **kwargs) -> ToolResult:
+                nonlocal call_count
+                call_count += 1
+                return self._create_success_result(data={"subject": subject})
+
+        tool = TestTool()
+
+        set_cache_scope_context("user-A")
+        await tool._arun(subject="plant")
+        set_cache_scope_context("user-B")
+        await tool._arun(subject="plant")
+        set_cache_scope_context(None)
+
+        assert call_count == 2
+
+    def test_tools_declare_scopes(self):
+        """Plant-wide tools share globally; memory-backed recommendations stay per user."""
+        from app.services.agent.tools.production_status import ProductionStatusTool
+        from app.services.agent.tools.alert_check import AlertCheckTool
+        from app.services.agent.tools.recommendation_engine import RecommendationEngineTool
+
+        assert ProductionStatusTool._arun._cache_scope == "global"
+        assert AlertCheckTool._arun._cache_scope == "global"
+        assert RecommendationEngineTool._arun._cache_scope == "user"
+
+
+class TestTagInvalidation:
+    """Tests for tag-indexed invalidation and pipeline-driven eviction."""
+
+    def _result(self, table, asset_id=None):
+        return {
+            "data": {"value": 1},
+            "citations": [{"source": "supabase", "query": "q", "table": table, "asset_id": asset_id}],
+        }
+
+    def test_tags_derived_from_key_citations_and_params(self):
+        """Entries are tagged with tool, cited tables/assets and extra tags."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService(max_size=100)
+        cache.set(
+            "oee_query:global:abc",
+            "daily",
+            self._result("daily_summaries,safety_events", asset_id="a1"),
+            tags=["area:grinding"],
+        )
+
+        tags = cache._caches["daily"]["oee_query:global:abc"].tags
+        assert set(tags) == {
+            "tool:oee_query",
+            "table:daily_summaries",
+            "table:safety_events",
+            "asset:a1",
+            "area:grinding",
+        }
+
+    def test_invalidate_tags_only_touches_tagged_entries(self):
+        """invalidate_tags removes exactly the entries carrying the tag."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService(max_size=100)
+        cache.reset_stats()
+        cache.set("oee_query:global:a", "daily", self._result("daily_summaries"))
+        cache.set("production_status:global:b", "live", self._result("live_snapshots"))
+        cache.set("asset_lookup:global:c", "static", self._result("assets"))
+
+        count = cache.invalidate_tags(["table:daily_summaries"])
+
+        assert count == 1
+        assert cache.get("oee_query:global:a", "daily") is None
+        assert cache.get("production_status:global:b", "live") is not None
+        assert cache.get("asset_lookup:global:c", "static") is not None
+        assert cache.get_stats()["invalidations"] == 1
+
+    def test_invalidate_tags_restricted_to_tier(self):
+        """A tier argument limits invalidation to that tier."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService(max_size=100)
+        cache.set("alert_check:global:a", "live", self._result("safety_events"))
+        cache.set("safety_events:global:b", "daily", self._result("safety_events"))
+
+        assert cache.invalidate_tags(["table:safety_events"], tier="live") == 1
+        assert cache.get("safety_events:global:b", "daily") is not None
+
+    def test_index_follows_overwrites_and_deletes(self):
+        """Overwriting an entry replaces its tags; deleting removes them."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService(max_size=100)
+        tier = cache._caches["daily"]
+        cache.set("oee_query:global:a", "daily", self._result("daily_summaries"))
+        cache.set("oee_query:global:a", "daily", self._result("live_snapshots"))
+
+        assert tier.keys_for_tag("table:daily_summaries") == set()
+        assert tier.keys_for_tag("table:live_snapshots") == {"oee_query:global:a"}
+
+        del tier["oee_query:global:a"]
+        assert tier.keys_for_tag("tool:oee_query") == set()
+
+    def test_index_pruned_after_eviction(self):
+        """Evicted entries are dropped from the index once it grows past 2x maxsize."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService(max_size=2)
+        for i in range(10):
+            cache.set(f"oee_query:global:{i}", "daily", self._result("daily_summaries"))
+
+        tier = cache._caches["daily"]
+        assert len(tier._key_tags) <= 4
+        assert len(tier.keys_for_tag("tool:oee_query")) == 2
+
+    @pytest.mark.asyncio
+    async def test_pipeline_event_evicts_entries_citing_table(self):
+        """A published daily_summaries change evicts entries built from it."""
+        from app.services.agent.cache import get_tool_cache, reset_tool_cache
+        from app.services.event_bus import DataChangedEvent, get_event_bus, reset_event_bus
+
+        reset_event_bus()
+        reset_tool_cache()
+        cache = get_tool_cache()
+        cache.set("oee_query:global:a", "daily", self._result("daily_summaries"))
+        cache.set("production_status:global:b", "live", self._result("live_snapshots"))
+
+        await get_event_bus().publish(
+            DataChangedEvent(table="daily_summaries", source="morning_report")
+        )
+
+        assert cache.get("oee_query:global:a", "daily") is None
+        assert cache.get("production_status:global:b", "live") is not None
+
+        reset_tool_cache()
+        reset_event_bus()
+
+    @pytest.mark.asyncio
+    async def test_decorator_tags_area_param(self):
+        """Decorated tools tag entries with their area parameter."""
+        from app.services.agent.cache import cached_tool, get_tool_cache, reset_tool_cache
+        from app.services.agent.base import ManufacturingTool, ToolResult
+
+        reset_tool_cache()
+
+        class MockInput(BaseModel):
+            area: str
+
+        class TestTool(ManufacturingTool):
+            name: str = "test_tool_tags"
+            description: str = "Test tool"
+            args_schema: Type[BaseModel] = MockInput
+
+            @cached_tool(tier="daily", scope="global")
+            async def _arun(self, area: str, **kwargs) -> ToolResult:
+                return self._create_success_result(data={"area": area})
+
+        await TestTool()._arun(area="Grinding")
+
+        assert get_tool_cache().invalidate_tags(["area:grinding"]) == 1
+
+
+class TestCacheAnalytics:
+    """Tests for per-tool cache analytics."""
+
+    @staticmethod
+    def _result(data) -> dict:
+        return {"success": True, "data": data, "citations": [], "metadata": {}}
+
+    def test_hits_and_misses_broken_down_by_tool_and_tier(self):
+        """Hits and misses are counted per tool and per tier."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService()
+        cache.set("oee_query:global:a", "daily", self._result(1))
+        cache.get("oee_query:global:a", "daily")
+        cache.get("oee_query:global:a", "daily")
+        cache.get("production_status:global:b", "live")
+
+        stats = cache.get_stats(breakdown=True)
+
+        assert stats["by_tool"]["oee_query"]["hits"] == 2
+        assert stats["by_tool"]["oee_query"]["misses"] == 0
+        assert stats["by_tool"]["production_status"]["misses"] == 1
+        assert stats["by_tier"]["daily"]["hits"] == 2
+        assert stats["by_tier"]["live"]["misses"] == 1
+
+    def test_breakdown_omitted_by_default(self):
+        """get_stats() only includes the breakdown when asked."""
+        from app.services.agent.cache import ToolCacheService
+
+        stats = ToolCacheService().get_stats()
+
+        assert "by_tool" not in stats
+        assert stats["coalesced"] == 0
+        assert stats["latency_saved_ms"] == 0.0
+
+    def test_bytes_stored_per_tool(self):
+        """Bytes stored reflect the serialized size of each entry."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService()
+        cache.set("oee_query:global:a", "daily", self._result("x" * 500))
+        cache.set("oee_query:global:b", "daily", self._result("y"))
+
+        tool_stats = cache.get_stats(breakdown=True)["by_tool"]["oee_query"]
+
+        assert tool_stats["entries"] == 2
+        assert tool_stats["bytes_stored"] > 500
+
+    def test_latency_saved_from_original_execution_time(self):
+        """Each hit counts the entry's original execution time as saved."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService()
+        cache.set("oee_query:global:a", "daily", self._result(1), compute_ms=120.0)
+        cache.get("oee_query:global:a", "daily")
+        cache.get("oee_query:global:a", "daily")
+
+        stats = cache.get_stats(breakdown=True)
+        execution = stats["by_tool"]["oee_query"]["execution_time_ms"]
+
+        assert stats["latency_saved_ms"] == 240.0
+        assert execution["samples"] == 1
+        assert execution["p50"] == 120.0
+        assert execution["histogram"]["<=250ms"] == 1
+
+    def test_lru_evictions_counted(self):
+        """Entries pushed out of a full tier count as LRU evictions."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService(max_size=2)
+        for i in range(5):
+            cache.set(f"oee_query:global:{i}", "daily", self._result(i))
+
+        stats = cache.get_stats(breakdown=True)
+
+        assert stats["evictions_lru"] == 3
+        assert stats["by_tool"]["oee_query"]["evictions_lru"] == 3
+        assert stats["evictions_ttl"] == 0
+
+    def test_ttl_evictions_counted(self):
+        """Expired entries purged from a tier count as TTL evictions."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService()
+        cache.set("production_status:global:a", "live", self._result(1))
+        tier = cache._caches["live"]
+        tier._cache.expire(time.monotonic() + tier.ttl + 1)
+
+        stats = cache.get_stats(breakdown=True)
+
+        assert stats["evictions_ttl"] == 1
+        assert stats["evictions_lru"] == 0
+
+    def test_invalidation_is_not_an_eviction(self):
+        """Clearing or invalidating entries does not count as eviction."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService()
+        for i in range(3):
+            cache.set(f"oee_query:global:{i}", "daily", self._result(i))
+        cache.invalidate_all()
+
+        stats = cache.get_stats()
+        assert stats["evictions_lru"] == 0
+        assert stats["evictions_ttl"] == 0
+
+    def test_recommends_longer_ttl_when_data_never_changes(self):
+        """A tool whose results never change gets a longer TTL recommendation."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService()
+        for _ in range(6):
+            cache.set("asset_lookup:global:a", "static", self._result({"name": "Press"}))
+
+        tool_stats = cache.get_stats(breakdown=True)["by_tool"]["asset_lookup"]
+
+        assert tool_stats["data_changes"]["observations"] == 5
+        assert tool_stats["data_changes"]["changes"] == 0
+        assert tool_stats["recommended_ttl_seconds"] > tool_stats["current_ttl_seconds"]
+
+    def test_recommends_ttl_from_change_interval(self):
+        """The recommendation is half the observed change interval."""
+        from app.services.agent.cache_analytics import CacheAnalytics
+
+        analytics = CacheAnalytics()
+        with patch("app.services.agent.cache_analytics.time.time") as mock_time:
+            for i in range(11):
+                mock_time.return_value = 1000.0 + i * 600
+                # Data changes on every other recomputation
+                analytics.record_store("oee_query:global:a", "daily", str(i // 2))
+
+        by_tool = analytics.breakdown({"daily": 900}, {})["by_tool"]
+
+        assert by_tool["oee_query"]["data_changes"]["changes"] == 5
+        # 10 observations over 6000s with 5 changes -> 1200s interval -> 600s
+        assert by_tool["oee_query"]["recommended_ttl_seconds"] == 600
+
+    def test_no_recommendation_without_enough_data(self):
+        """Too few recomputations yield no recommendation."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService()
+        cache.set("oee_query:global:a", "daily", self._result(1))
+
+        tool_stats = cache.get_stats(breakdown=True)["by_tool"]["oee_query"]
+
+        assert tool_stats["recommended_ttl_seconds"] is None
+        assert tool_stats["recommendation_reason"] == "insufficient data"
+
+    def test_reset_stats_clears_analytics(self):
+        """reset_stats() also clears per-tool analytics."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService()
+        cache.get("oee_query:global:a", "daily")
+        cache.reset_stats()
+
+        assert cache.get_stats(breakdown=True)["by_tool"] == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_coalesced(self):
+        """Concurrent identical misses share one tool execution."""
+        from app.services.agent.cache import cached_tool, get_tool_cache, reset_tool_cache
+        from app.services.agent.base import ManufacturingTool, ToolResult
+
+        reset_tool_cache()
+        calls = 0
+
+        class MockInput(BaseModel):
+            area: str
+
+        class SlowTool(ManufacturingTool):
+            name: str = "slow_tool"
+            description: str = "Test tool"
+            args_schema: Type[BaseModel] = MockInput
+
+            @cached_tool(tier="daily", scope="global")
+            async def _arun(self, area: str, **kwargs) -> ToolResult:
+                nonlocal calls
+                calls += 1
+                await asyncio.sleep(0.05)
+                return self._create_success_result(data={"area": area})
+
+        tool = SlowTool()
+        results = await asyncio.gather(*[tool._arun(area="Grinding") for _ in range(4)])
+
+        assert calls == 1
+        assert all(r.data == {"area": "Grinding"} for r in results)
+        stats = get_tool_cache().get_stats(breakdown=True)
+        assert stats["coalesced"] == 3
+        assert stats["by_tool"]["slow_tool"]["coalesced"] == 3
+        assert stats["by_tool"]["slow_tool"]["execution_time_ms"]["samples"] == 1
+
+        reset_tool_cache()
+
+    @pytest.mark.asyncio
+    async def test_waiters_execute_themselves_if_leader_fails(self):
+        """If the shared execution raises, waiting callers run the tool themselves."""
+        from app.services.agent.cache import cached_tool, reset_tool_cache
+        from app.services.agent.base import ManufacturingTool, ToolResult
+
+        reset_tool_cache()
+        calls = 0
+
+        class MockInput(BaseModel):
+            area: str
+
+        class FlakyTool(ManufacturingTool):
+            name: str = "flaky_tool"
+            description: str = "Test tool"
+            args_schema: Type[BaseModel] = MockInput
+
+            @cached_tool(tier="daily", scope="global")
+            async def _arun(self, area: str, **kwargs) -> ToolResult:
+                nonlocal calls
+                calls += 1
+                await asyncio.sleep(0.02)
+                if calls == 1:
+                    raise RuntimeError("boom")
+                return self._create_success_result(data={"ok": True})
+
+        tool = FlakyTool()
+        first, second = await asyncio.gather(
+            tool._arun(area="Press"), tool._arun(area="Press"), return_exceptions=True
+        )
+
+        assert isinstance(first, RuntimeError)
+        assert second.data == {"ok": True}
+        assert calls == 2
+
+        reset_tool_cache()
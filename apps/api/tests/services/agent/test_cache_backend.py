@@ -0,0 +1,456 @@
+"""
+Tests for Tool Cache Storage Backends
+
+- InMemoryCacheBackend: per-process TTLCache tiers
+- RedisCacheBackend: shared tiers and cross-worker invalidation (via fakeredis)
+- create_cache_backend: selection from settings with memory fallback
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def redis_server():
+    """A fake Redis server shared by every client created from it."""
+    return fakeredis.FakeServer()
+
+
+def _redis_backend(server, prefix="test_cache"):
+    from app.services.agent.cache_backend import RedisCacheBackend
+
+    return RedisCacheBackend(fakeredis.FakeRedis(server=server), prefix=prefix)
+
+
+class TestInMemoryBackend:
+    """Tests for the default in-process backend."""
+
+    def test_lookup_records_hits(self):
+        """lookup() increments the entry hit counter."""
+        from app.services.agent.cache_backend import CacheEntry, InMemoryCacheBackend
+
+        tier = InMemoryCacheBackend().create_tier("daily", maxsize=10, ttl=60)
+        tier["k"] = CacheEntry(value={"data": 1})
+
+        tier.lookup("k")
+        entry = tier.lookup("k")
+
+        assert entry.hits == 2
+        assert tier.lookup("missing") is None
+
+    def test_tier_evicts_at_maxsize(self):
+        """In-memory tiers keep TTLCache LRU eviction."""
+        from app.services.agent.cache_backend import CacheEntry, InMemoryCacheBackend
+
+        tier = InMemoryCacheBackend().create_tier("daily", maxsize=2, ttl=60)
+        for i in range(3):
+            tier[f"k{i}"] = CacheEntry(value={"data": i})
+
+        assert len(tier) == 2
+
+    def test_service_uses_memory_backend_by_default(self):
+        """ToolCacheService defaults to the in-memory backend."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService(max_size=100)
+
+        assert cache.get_stats()["backend"] == "memory"
+
+
+class TestRedisCacheTier:
+    """Tests for Redis-backed tier storage."""
+
+    def test_roundtrip_serializes_tool_result(self, redis_server):
+        """Entries round-trip through JSON, including datetimes."""
+        from app.services.agent.base import ToolResult
+        from app.services.agent.cache_backend import CacheEntry
+
+        tier = _redis_backend(redis_server).create_tier("daily", maxsize=10, ttl=60)
+        result = ToolResult(data={"oee": 87.5}, metadata={"source": "test"})
+        tier["oee_query:user:abc"] = CacheEntry(value=result.model_dump())
+
+        entry = tier.lookup("oee_query:user:abc")
+        restored = ToolResult(**entry.value)
+
+        assert restored.data == {"oee": 87.5}
+        assert entry.hits == 1
+        assert isinstance(restored.citations, list)
+
+    def test_datetime_values_serialized_as_iso(self, redis_server):
+        """Datetime values are stored as ISO strings."""
+        from app.services.agent.cache_backend import CacheEntry
+
+        tier = _redis_backend(redis_server).create_tier("daily", maxsize=10, ttl=60)
+        ts = datetime(2026, 1, 15, 6, 0, tzinfo=timezone.utc)
+        tier["k"] = CacheEntry(value={"data": {"at": ts}})
+
+        assert tier["k"].value["data"]["at"] == ts.isoformat()
+
+    def test_keys_len_delete_and_clear(self, redis_server):
+        """Tier supports the mapping operations the cache service relies on."""
+        from app.services.agent.cache_backend import CacheEntry
+
+        tier = _redis_backend(redis_server).create_tier("live", maxsize=10, ttl=60)
+        tier["a"] = CacheEntry(value={"data": 1})
+        tier["b"] = CacheEntry(value={"data": 2})
+
+        assert set(tier.keys()) == {"a", "b"}
+        assert len(tier) == 2
+
+        del tier["a"]
+        assert "a" not in tier
+        with pytest.raises(KeyError):
+            del tier["a"]
+
+        tier.clear()
+        assert len(tier) == 0
+
+    def test_evicts_oldest_beyond_maxsize(self, redis_server):
+        """Tier is bounded to maxsize by evicting the oldest entries."""
+        from app.services.agent.cache_backend import CacheEntry
+
+        tier = _redis_backend(redis_server).create_tier("live", maxsize=2, ttl=60)
+        now = time.time()
+        for i in range(3):
+            tier[f"k{i}"] = CacheEntry(value={"data": i}, stored_at=now + i)
+
+        assert len(tier) == 2
+        assert tier.lookup("k0") is None
+        assert tier.lookup("k2") is not None
+
+    def test_evicts_least_recently_used(self, redis_server):
+        """A hit keeps an older entry over a newer one that was never read."""
+        from app.services.agent.cache_backend import CacheEntry
+
+        tier = _redis_backend(redis_server).create_tier("live", maxsize=2, ttl=60)
+        now = time.time()
+        tier["k0"] = CacheEntry(value={"data": 0}, stored_at=now - 2)
+        tier["k1"] = CacheEntry(value={"data": 1}, stored_at=now - 1)
+        tier.lookup("k0")
+        tier["k2"] = CacheEntry(value={"data": 2}, stored_at=now)
+
+        assert set(tier.keys()) == {"k0", "k2"}
+
+    def test_expired_entries_pruned_from_index(self, redis_server):
+        """Entries older than the TTL are not counted."""
+        from app.services.agent.cache_backend import CacheEntry
+
+        tier = _redis_backend(redis_server).create_tier("live", maxsize=10, ttl=60)
+        tier["old"] = CacheEntry(value={"data": 1}, stored_at=time.time() - 120)
+        tier["new"] = CacheEntry(value={"data": 2})
+
+        assert list(tier.keys()) == ["new"]
+
+    def test_reports_lru_evictions(self, redis_server):
+        """Entries evicted on overflow are reported as LRU evictions."""
+        from app.services.agent.cache_backend import CacheEntry
+
+        evicted = []
+        tier = _redis_backend(redis_server).create_tier(
+            "live", maxsize=2, ttl=60, on_evict=lambda k, r: evicted.append((k, r))
+        )
+        now = time.time()
+        for i in range(3):
+            tier[f"k{i}"] = CacheEntry(value={"data": i}, stored_at=now + i)
+
+        assert evicted == [("k0", "lru")]
+
+    def test_reports_ttl_evictions(self, redis_server):
+        """Expired entries pruned from the index are reported as TTL evictions."""
+        from app.services.agent.cache_backend import CacheEntry
+
+        evicted = []
+        tier = _redis_backend(redis_server).create_tier(
+            "live", maxsize=10, ttl=60, on_evict=lambda k, r: evicted.append((k, r))
+        )
+        tier["old"] = CacheEntry(value={"data": 1}, stored_at=time.time() - 120)
+        tier["new"] = CacheEntry(value={"data": 2})
+
+        assert len(tier) == 1
+        assert evicted == [("old", "ttl")]
+
+    def test_entry_sizes(self, redis_server):
+        """Entry sizes round-trip through the hash."""
+        from app.services.agent.cache_backend import CacheEntry
+
+        tier = _redis_backend(redis_server).create_tier("daily", maxsize=10, ttl=60)
+        tier["a"] = CacheEntry(value={"data": 1}, size_bytes=42, compute_ms=12.5)
+
+        assert tier.entry_sizes() == {"a": 42}
+        assert tier["a"].compute_ms == 12.5
+
+
+class TestRedisTagIndex:
+    """Tests for the Redis tag index."""
+
+    def test_tag_sets_follow_writes_and_deletes(self, redis_server):
+        """Tagged keys are indexed on write and removed on delete."""
+        from app.services.agent.cache_backend import CacheEntry
+
+        tier = _redis_backend(redis_server).create_tier("daily", maxsize=10, ttl=60)
+        tier["a"] = CacheEntry(value={"data": 1}, tags=("table:daily_summaries",))
+        tier["b"] = CacheEntry(value={"data": 2}, tags=("table:live_snapshots",))
+
+        assert tier.keys_for_tag("table:daily_summaries") == {"a"}
+
+        del tier["a"]
+        assert tier.keys_for_tag("table:daily_summaries") == set()
+
+        tier.clear()
+        assert tier.keys_for_tag("table:live_snapshots") == set()
+
+    def test_tag_invalidation_shared_across_workers(self, redis_server):
+        """Tag invalidation on one worker evicts entries cached by another."""
+        from app.services.agent.cache import ToolCacheService
+
+        worker_a = ToolCacheService(max_size=100, backend=_redis_backend(redis_server))
+        worker_b = ToolCacheService(max_size=100, backend=_redis_backend(redis_server))
+        citation = {"source": "supabase", "query": "q", "table": "daily_summaries"}
+        worker_a.set("oee_query:global:abc", "daily", {"data": 1, "citations": [citation]})
+
+        assert worker_b.invalidate_tags(["table:daily_summaries"]) == 1
+        assert worker_a.get("oee_query:global:abc", "daily") is None
+
+    def test_tag_invalidation_is_pipelined(self, redis_server):
+        """Deleting a tag's entries takes two round trips, however many entries it has."""
+        from app.services.agent.cache_backend import CacheEntry
+
+        backend = _redis_backend(redis_server)
+        tier = backend.create_tier("daily", maxsize=20, ttl=60)
+        for n in range(5):
+            tier[f"k{n}"] = CacheEntry(value={"data": n}, tags=("table:daily_summaries", f"asset:{n}"))
+        tier["other"] = CacheEntry(value={"data": 0}, tags=("table:live_snapshots",))
+
+        client = backend._client
+        with patch.object(client, "pipeline", wraps=client.pipeline) as pipeline, \
+                patch.object(client, "hget", wraps=client.hget) as hget:
+            deleted = tier.delete_tagged(["table:daily_summaries"])
+
+        assert sorted(deleted) == [f"k{n}" for n in range(5)]
+        assert pipeline.call_count == 2
+        hget.assert_not_called()
+        assert list(tier) == ["other"]
+        assert tier.delete_tagged(["asset:1"]) == []
+
+
+class TestSharedCacheAcrossWorkers:
+    """Two ToolCacheService instances stand in for two uvicorn workers."""
+
+    def test_entry_set_by_one_worker_hits_in_another(self, redis_server):
+        """A result cached by one worker is served to the other."""
+        from app.services.agent.cache import ToolCacheService
+
+        worker_a = ToolCacheService(max_size=100, backend=_redis_backend(redis_server))
+        worker_b = ToolCacheService(max_size=100, backend=_redis_backend(redis_server))
+
+        worker_a.set("oee_query:user:abc", "daily", {"data": {"oee": 80}})
+        cached = worker_b.get("oee_query:user:abc", "daily")
+
+        assert cached["data"] == {"oee": 80}
+        assert cached["metadata"]["cache_tier"] == "daily"
+        assert worker_b.get_stats()["backend"] == "redis"
+
+    def test_invalidation_visible_to_all_workers(self, redis_server):
+        """Invalidating on one worker removes the entry for every worker."""
+        from app.services.agent.cache import ToolCacheService
+
+        worker_a = ToolCacheService(max_size=100, backend=_redis_backend(redis_server))
+        worker_b = ToolCacheService(max_size=100, backend=_redis_backend(redis_server))
+
+        worker_a.set("oee_query:user:abc", "daily", {"data": 1})
+        worker_a.set("asset_lookup:user:def", "static", {"data": 2})
+
+        assert worker_b.invalidate(tool_name="oee_query") == 1
+        assert worker_a.get("oee_query:user:abc", "daily") is None
+        assert worker_a.get("asset_lookup:user:def", "static") is not None
+
+        assert worker_b.invalidate_all() == 1
+        assert worker_a.get("asset_lookup:user:def", "static") is None
+
+    def test_invalidation_published_to_other_workers(self, redis_server):
+        """Invalidations reach handlers subscribed on other backends."""
+        publisher = _redis_backend(redis_server)
+        subscriber = _redis_backend(redis_server)
+        received = []
+        subscriber.subscribe_invalidations(lambda tier, keys: received.append((tier, keys)))
+
+        try:
+            deadline = time.time() + 3
+            while not received and time.time() < deadline:
+                publisher.publish_invalidation("daily", ["oee_query:user:abc"])
+                time.sleep(0.05)
+        finally:
+            subscriber.close()
+
+        assert ("daily", ["oee_query:user:abc"]) in received
+
+    def test_own_invalidations_ignored(self, redis_server):
+        """A backend does not dispatch messages it published itself."""
+        import json
+
+        backend = _redis_backend(redis_server)
+        handler = MagicMock()
+        backend._handlers.append(handler)
+
+        backend._on_message({"data": json.dumps({"origin": backend._origin, "tier": "live", "keys": None})})
+        backend._on_message({"data": json.dumps({"origin": "other", "tier": "live", "keys": None})})
+        backend._on_message({"data": "not json"})
+
+        handler.assert_called_once_with("live", None)
+
+    @pytest.mark.asyncio
+    async def test_async_access_runs_off_the_event_loop(self, redis_server):
+        """alookup()/aset() on a shared backend run in a worker thread."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService(max_size=100, backend=_redis_backend(redis_server))
+
+        with patch("app.services.agent.cache.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            await cache.aset("oee_query:user:abc", "daily", {"data": 1})
+            cached, _ = await cache.alookup("oee_query:user:abc", "daily")
+
+        assert cached["data"] == 1
+        assert to_thread.call_count == 2
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_async_invalidation_runs_off_the_event_loop(self, redis_server):
+        """ainvalidate()/aon_data_changed() on a shared backend run in a worker thread."""
+        from app.services.agent.cache import ToolCacheService
+        from app.services.event_bus import DataChangedEvent
+
+        cache = ToolCacheService(
+            max_size=100, swr_enabled=True, backend=_redis_backend(redis_server)
+        )
+        citation = {"source": "supabase", "query": "q", "table": "daily_summaries"}
+        cache.set("oee_query:global:abc", "daily", {"data": 1, "citations": [citation]})
+        cache.set("downtime_analysis:global:abc", "daily", {"data": 2})
+        release = asyncio.Event()
+
+        async def refresh():
+            await release.wait()
+            return {"data": 3}
+
+        cache.schedule_refresh("downtime_analysis:global:abc", "daily", refresh)
+        with patch("app.services.agent.cache.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            evicted = await cache.aon_data_changed(
+                DataChangedEvent(table="daily_summaries", source="morning_report")
+            )
+            invalidated = await cache.ainvalidate(tool_name="downtime_analysis")
+
+        release.set()
+        await cache.wait_for_refreshes()
+        assert (evicted, invalidated) == (1, 1)
+        assert to_thread.call_count == 2
+        # The refresh was cancelled from the worker thread via the event loop
+        assert cache.get("downtime_analysis:global:abc", "daily") is None
+        assert cache.get_stats()["refreshes"] == 0
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_remote_invalidation_cancels_refresh(self, redis_server):
+        """An invalidation from another worker cancels a local in-flight refresh."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService(
+            max_size=100, swr_enabled=True, backend=_redis_backend(redis_server)
+        )
+        started = asyncio.Event()
+
+        async def slow_refresh():
+            started.set()
+            await asyncio.sleep(10)
+            return {"data": "late"}
+
+        cache.schedule_refresh("k", "live", slow_refresh)
+        await started.wait()
+
+        cache._on_remote_invalidation("live", ["k"])
+        await asyncio.sleep(0)
+        await cache.wait_for_refreshes()
+
+        assert cache.get_stats()["refreshes_in_flight"] == 0
+        assert cache.get("k", "live") is None
+        cache.close()
+
+
+class TestLocalRefreshCancellation:
+    """Invalidation cancels refreshes that would re-populate the key."""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_cancels_local_refresh(self):
+        """invalidate() cancels a matching background refresh."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService(max_size=100, swr_enabled=True)
+        cache.set("oee_query:user:abc", "daily", {"data": 1})
+        release = asyncio.Event()
+
+        async def refresh():
+            await release.wait()
+            return {"data": 2}
+
+        cache.schedule_refresh("oee_query:user:abc", "daily", refresh)
+        cache.invalidate(tool_name="oee_query")
+        release.set()
+        await cache.wait_for_refreshes()
+
+        assert cache.get("oee_query:user:abc", "daily") is None
+        assert cache.get_stats()["refreshes"] == 0
+
+
+class TestCreateCacheBackend:
+    """Tests for backend selection from settings."""
+
+    def _settings(self, **overrides):
+        settings = MagicMock()
+        settings.cache_backend = "memory"
+        settings.cache_redis_url = ""
+        settings.cache_redis_prefix = "tool_cache"
+        settings.cache_redis_socket_timeout = 0.25
+        for key, value in overrides.items():
+            setattr(settings, key, value)
+        return settings
+
+    def test_memory_is_default(self):
+        from app.services.agent.cache_backend import InMemoryCacheBackend, create_cache_backend
+
+        with patch("app.services.agent.cache_backend.get_settings", return_value=self._settings()):
+            assert isinstance(create_cache_backend(), InMemoryCacheBackend)
+
+    def test_redis_without_url_falls_back_to_memory(self):
+        from app.services.agent.cache_backend import InMemoryCacheBackend, create_cache_backend
+
+        settings = self._settings(cache_backend="redis")
+        with patch("app.services.agent.cache_backend.get_settings", return_value=settings):
+            assert isinstance(create_cache_backend(), InMemoryCacheBackend)
+
+    def test_unreachable_redis_falls_back_to_memory(self):
+        from app.services.agent.cache_backend import InMemoryCacheBackend, create_cache_backend
+
+        settings = self._settings(cache_backend="redis", cache_redis_url="redis://localhost:1/0")
+        with patch("app.services.agent.cache_backend.get_settings", return_value=settings), \
+                patch("redis.Redis.from_url") as mock_from_url:
+            mock_from_url.return_value.ping.side_effect = ConnectionError("refused")
+            assert isinstance(create_cache_backend(), InMemoryCacheBackend)
+
+    def test_redis_selected_when_reachable(self, redis_server):
+        from app.services.agent.cache_backend import RedisCacheBackend, create_cache_backend
+
+        settings = self._settings(cache_backend="redis", cache_redis_url="redis://cache:6379/0")
+        with patch("app.services.agent.cache_backend.get_settings", return_value=settings), \
+                patch("redis.Redis.from_url", return_value=fakeredis.FakeRedis(server=redis_server)):
+            assert isinstance(create_cache_backend(), RedisCacheBackend)
+
+    def test_unknown_backend_defaults_to_memory(self):
+        from app.services.agent.cache_backend import InMemoryCacheBackend, create_cache_backend
+
+        settings = self._settings(cache_backend="memcached")
+        with patch("app.services.agent.cache_backend.get_settings", return_value=settings):
+            assert isinstance(create_cache_backend(), InMemoryCacheBackend)
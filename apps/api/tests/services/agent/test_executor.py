@@ -223,6 +223,117 @@ class TestManufacturingAgent:
                 assert len(response.citations) == 1
                 assert response.citations[0]["source"] == "daily_summaries"
 
+    @pytest.mark.asyncio
+    async def test_process_message_bounds_history_and_schedules_summary(self):
+        """Long histories are windowed and older turns summarized per conversation."""
+        from app.services.agent.history import get_history_manager, reset_history_manager
+
+        reset_history_manager()
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}, clear=True):
+            agent = ManufacturingAgent(config=AgentConfig())
+            agent._llm = MagicMock()
+            agent._llm.ainvoke = AsyncMock(return_value=MagicMock(content="Discussed Grinder 5 OEE"))
+
+            chat_history = []
+            for i in range(10):
+                chat_history.append({"role": "user", "content": f"Question {i}"})
+                chat_history.append({"role": "assistant", "content": f"Answer {i}"})
+
+            with patch.object(agent, "_executor") as mock_executor:
+                mock_executor.ainvoke = AsyncMock(
+                    return_value={"output": "Done", "intermediate_steps": []}
+                )
+                agent._initialized = True
+
+                response = await agent.process_message(
+                    message="And today?",
+                    user_id="test-user",
+                    chat_history=chat_history,
+                    conversation_id="conv-1",
+                )
+
+                sent = mock_executor.ainvoke.call_args[0][0]["chat_history"]
+                keep = get_history_manager().keep_turns * 2
+                assert len(sent) == keep
+                assert response.meta["history"]["messages_in"] == 20
+                assert response.meta["history"]["tokens_trimmed"] > 0
+
+                await get_history_manager().wait_pending()
+                agent._llm.ainvoke.assert_awaited_once()
+
+                # Next turn starts with the summary as a system message
+                await agent.process_message(
+                    message="Thanks",
+                    user_id="test-user",
+                    chat_history=chat_history + [
+                        {"role": "user", "content": "And today?"},
+                        {"role": "assistant", "content": "Done"},
+                    ],
+                    conversation_id="conv-1",
+                )
+                sent = mock_executor.ainvoke.call_args[0][0]["chat_history"]
+                assert sent[0].content.endswith("Discussed Grinder 5 OEE")
+        reset_history_manager()
+
+    @pytest.mark.asyncio
+    async def test_process_message_reports_tool_output_tokens(self):
+        """Response meta reports prompt tokens saved by compact tool outputs."""
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}, clear=True):
+            agent = ManufacturingAgent(config=AgentConfig())
+
+            mock_action = MagicMock()
+            mock_action.tool = "test_tool"
+            mock_output = ToolResult(
+                data={"assets": [{"name": f"Press {i}", "oee": 0.812345} for i in range(20)]},
+            )
+            mock_result = {
+                "output": "All presses are at 81%",
+                "intermediate_steps": [(mock_action, mock_output)],
+            }
+
+            with patch.object(agent, "_executor") as mock_executor:
+                mock_executor.ainvoke = AsyncMock(return_value=mock_result)
+                agent._initialized = True
+
+                response = await agent.process_message(
+                    message="How are the presses doing?",
+                    user_id="test-user",
+                )
+
+                tokens = response.meta["tool_output_tokens"]
+                assert tokens["tool_outputs"] == 1
+                assert tokens["compact_tokens"] < tokens["full_tokens"]
+                assert tokens["prompt_tokens_saved"] == tokens["full_tokens"] - tokens["compact_tokens"]
+
+    @patch("app.services.agent.executor.create_openai_functions_agent")
+    def test_agent_scratchpad_receives_compact_tool_outputs(self, mock_create_agent):
+        """The agent sees compact text; intermediate steps keep full ToolResults."""
+        from langchain_core.agents import AgentAction, AgentFinish
+        from langchain_core.runnables import RunnableLambda
+
+        seen = {}
+
+        def fake_agent(inputs):
+            seen["steps"] = inputs["intermediate_steps"]
+            return AgentFinish(return_values={"output": "done"}, log="")
+
+        mock_create_agent.return_value = RunnableLambda(fake_agent)
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}, clear=True):
+            agent = ManufacturingAgent(config=AgentConfig())
+            tool = MockExecutorTool()
+            runnable = agent._create_agent(MagicMock(), [tool])
+
+            result = ToolResult(data={"oee": 0.87342}, citations=[
+                Citation(source="daily_summaries", query="SELECT *", table="daily_summaries")
+            ])
+            steps = [(AgentAction(tool=tool.name, tool_input={}, log=""), result)]
+            runnable.invoke({"input": "q", "intermediate_steps": steps})
+
+            observation = seen["steps"][0][1]
+            assert observation == "oee: 0.87\n\nData sources: [Source: daily_summaries]"
+            assert steps[0][1] is result
+
     @pytest.mark.asyncio
     async def test_process_message_with_chat_history(self):
         """Test message processing with chat history."""
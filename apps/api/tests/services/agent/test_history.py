@@ -0,0 +1,211 @@
+"""
+Tests for the bounded chat-history window.
+
+- Recent turns kept verbatim, older turns dropped or summarized
+- Token budget enforcement and trimming metrics
+- Background rolling summaries keyed by user and conversation
+- Stale summaries ignored when the history does not match
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.agent.history import (
+    SUMMARY_PREFIX,
+    ChatHistoryManager,
+    get_history_manager,
+    reset_history_manager,
+)
+
+
+def _history(turns: int, words: int = 5):
+    messages = []
+    for i in range(turns):
+        messages.append({"role": "user", "content": f"question {i} " + "word " * words})
+        messages.append({"role": "assistant", "content": f"answer {i} " + "word " * words})
+    return messages
+
+
+@pytest.fixture
+def history_settings():
+    settings = MagicMock()
+    settings.agent_history_keep_turns = 2
+    settings.agent_history_token_budget = 2000
+    settings.agent_history_summary_max_tokens = 100
+    settings.agent_history_summary_ttl_seconds = 3600
+    settings.agent_history_max_conversations = 10
+    with patch("app.services.agent.history.get_settings", return_value=settings):
+        yield settings
+
+
+@pytest.fixture
+def manager(history_settings):
+    return ChatHistoryManager()
+
+
+class FakeSummarizer:
+    """Records calls and returns a summary naming the folded messages."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, previous, messages):
+        self.calls.append((previous, list(messages)))
+        folded = ",".join(m["content"].split()[1] for m in messages if m["role"] == "user")
+        return f"{previous}+{folded}" if previous else folded
+
+
+class TestHistoryWindow:
+    """Tests for building the per-turn window."""
+
+    def test_short_history_sent_unchanged(self, manager):
+        """Histories within the window pass through."""
+        window = manager.prepare(_history(2), "user-1")
+
+        assert window.messages == _history(2)
+        assert window.stats["tokens_trimmed"] == 0
+        assert window.stats["summary_used"] is False
+
+    def test_keeps_last_turns_without_summary(self, manager):
+        """Only the last N turns are sent when no summary exists."""
+        window = manager.prepare(_history(5), "user-1", "conv-1")
+
+        assert [m["content"].split()[1] for m in window.messages] == ["3", "3", "4", "4"]
+        assert window.stats["messages_in"] == 10
+        assert window.stats["messages_sent"] == 4
+        assert window.stats["tokens_trimmed"] > 0
+
+    def test_token_budget_drops_oldest_messages(self, manager, history_settings):
+        """Messages are dropped oldest-first to fit the budget."""
+        manager.token_budget = 120
+
+        window = manager.prepare(_history(2, words=60), "user-1")
+
+        assert window.stats["tokens_sent"] <= 120
+        assert window.messages[-1]["content"].startswith("answer 1")
+        assert len(window.messages) < 4
+
+    def test_ignores_unknown_roles(self, manager):
+        """Only user/assistant messages are considered."""
+        history = [{"role": "tool", "content": "x"}] + _history(1)
+
+        assert manager.prepare(history, "user-1").messages == _history(1)
+
+    def test_aggregate_stats(self, manager):
+        """Trimmed tokens accumulate across turns."""
+        first = manager.prepare(_history(5), "user-1")
+        second = manager.prepare(_history(6), "user-1")
+
+        stats = manager.get_stats()
+        assert stats["turns"] == 2
+        assert stats["tokens_trimmed"] == (
+            first.stats["tokens_trimmed"] + second.stats["tokens_trimmed"]
+        )
+        assert stats["messages_trimmed"] == 6 + 8
+
+
+class TestRollingSummary:
+    """Tests for background summary generation and reuse."""
+
+    @pytest.mark.asyncio
+    async def test_summary_folds_turns_leaving_window(self, manager):
+        """Turns beyond the window are summarized and prepended next turn."""
+        summarizer = FakeSummarizer()
+        history = _history(3)
+
+        assert manager.schedule_summary("user-1", "conv-1", history, summarizer)
+        await manager.wait_pending()
+
+        window = manager.prepare(history, "user-1", "conv-1")
+        assert window.messages[0]["role"] == "system"
+        assert window.messages[0]["content"] == f"{SUMMARY_PREFIX}\n0"
+        assert len(window.messages) == 5
+        assert window.stats["messages_summarized"] == 2
+        assert window.stats["summary_used"] is True
+
+    @pytest.mark.asyncio
+    async def test_summary_is_incremental(self, manager):
+        """Later updates fold only new messages into the previous summary."""
+        summarizer = FakeSummarizer()
+
+        manager.schedule_summary("user-1", "conv-1", _history(3), summarizer)
+        await manager.wait_pending()
+        manager.schedule_summary("user-1", "conv-1", _history(4), summarizer)
+        await manager.wait_pending()
+
+        assert summarizer.calls[1][0] == "0"
+        assert [m["content"].split()[1] for m in summarizer.calls[1][1]] == ["1", "1"]
+        summary = manager.get_summary("user-1", "conv-1", _history(4))
+        assert summary.text == "0+1"
+        assert summary.covered == 4
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_summarize_within_window(self, manager):
+        """No task is started while the history fits the window."""
+        assert not manager.schedule_summary("user-1", "conv-1", _history(2), FakeSummarizer())
+
+    @pytest.mark.asyncio
+    async def test_summary_requires_conversation_id(self, manager):
+        """Without a conversation id nothing is cached."""
+        assert not manager.schedule_summary("user-1", None, _history(5), FakeSummarizer())
+
+    @pytest.mark.asyncio
+    async def test_one_update_in_flight_per_conversation(self, manager):
+        """A second request while summarizing is skipped."""
+        release = asyncio.Event()
+
+        async def slow(previous, messages):
+            await release.wait()
+            return "slow"
+
+        assert manager.schedule_summary("user-1", "conv-1", _history(3), slow)
+        assert not manager.schedule_summary("user-1", "conv-1", _history(4), slow)
+        release.set()
+        await manager.wait_pending()
+
+    @pytest.mark.asyncio
+    async def test_summary_scoped_to_user(self, manager):
+        """Another user's identical conversation id does not see the summary."""
+        manager.schedule_summary("user-1", "conv-1", _history(3), FakeSummarizer())
+        await manager.wait_pending()
+
+        assert manager.get_summary("user-2", "conv-1", _history(3)) is None
+
+    @pytest.mark.asyncio
+    async def test_edited_history_ignores_summary(self, manager):
+        """A history that no longer matches the summarized prefix is not summarized from cache."""
+        manager.schedule_summary("user-1", "conv-1", _history(3), FakeSummarizer())
+        await manager.wait_pending()
+
+        edited = _history(3)
+        edited[0]["content"] = "something else entirely"
+        window = manager.prepare(edited, "user-1", "conv-1")
+
+        assert window.stats["summary_used"] is False
+
+    @pytest.mark.asyncio
+    async def test_summary_failure_counted(self, manager):
+        """Summarizer errors are logged and counted, not raised."""
+        async def failing(previous, messages):
+            raise RuntimeError("LLM unavailable")
+
+        manager.schedule_summary("user-1", "conv-1", _history(3), failing)
+        await manager.wait_pending()
+
+        assert manager.get_stats()["summary_failures"] == 1
+        assert manager.get_summary("user-1", "conv-1", _history(3)) is None
+
+
+class TestHistoryManagerSingleton:
+    """Tests for the module-level singleton."""
+
+    def test_get_and_reset(self, history_settings):
+        reset_history_manager()
+        manager = get_history_manager()
+
+        assert get_history_manager() is manager
+        reset_history_manager()
+        assert get_history_manager() is not manager
+        reset_history_manager()
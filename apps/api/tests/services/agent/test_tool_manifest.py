@@ -0,0 +1,133 @@
+"""
+Tests for the generated tool manifest.
+
+- The committed manifest matches the tool classes in code
+- Registration from the manifest imports no tool modules
+- LazyTool binds like the concrete tool and imports it on first run
+"""
+
+import json
+import subprocess
+import sys
+import types
+from typing import Type
+
+import pytest
+from langchain_core.utils.function_calling import convert_to_openai_function
+from pydantic import BaseModel, Field
+
+from app.services.agent.base import ManufacturingTool, ToolResult
+from app.services.agent.cache import cached_tool
+from app.services.agent.manifest import (
+    MANIFEST_VERSION,
+    TOOL_MANIFEST_PATH,
+    LazyTool,
+    _manifest_entry,
+    build_manifest,
+    load_manifest,
+)
+from app.services.agent.registry import ToolRegistry
+from app.services.agent.tracing import start_trace
+
+
+class GreetInput(BaseModel):
+    """Input for the manifest test tool."""
+    who: str = Field(description="Who to greet")
+    excited: bool = Field(default=False, description="Add an exclamation mark")
+
+
+class GreetTool(ManufacturingTool):
+    """Tool defined in a module the manifest imports lazily."""
+    name: str = "greet"
+    description: str = "Greets someone"
+    args_schema: Type[BaseModel] = GreetInput
+    citations_required: bool = False
+
+    @cached_tool(tier="none", scope="global")
+    async def _arun(self, who: str, excited: bool = False) -> ToolResult:
+        return ToolResult(data={"greeting": f"Hello {who}{'!' if excited else ''}"})
+
+
+@pytest.fixture
+def greet_module():
+    module = types.ModuleType("tests._manifest_greet")
+    module.GreetTool = GreetTool
+    sys.modules[module.__name__] = module
+    entry = _manifest_entry(GreetTool)
+    entry["module"] = module.__name__
+    yield entry
+    sys.modules.pop(module.__name__, None)
+
+
+class TestManifestConsistency:
+    """The manifest must not drift from the code."""
+
+    def test_manifest_matches_code(self):
+        """Fails when a tool changes without regenerating the manifest."""
+        assert load_manifest() == build_manifest(), (
+            "tools/manifest.json is out of date; regenerate with "
+            "`python -m app.services.agent.manifest`"
+        )
+
+    def test_manifest_version_mismatch_falls_back_to_scan(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        path.write_text(json.dumps({"version": MANIFEST_VERSION + 1, "tools": []}))
+        registry = ToolRegistry(manifest_path=path)
+
+        count = registry.discover_tools()
+
+        assert count == len(build_manifest()["tools"])
+        assert not any(isinstance(tool, LazyTool) for tool in registry.get_tools())
+
+
+class TestLazyRegistration:
+    """Registering from the manifest is a lookup."""
+
+    def test_registration_imports_no_tool_modules(self):
+        script = (
+            "import sys\n"
+            "from app.services.agent.registry import ToolRegistry\n"
+            "from app.services.agent.manifest import TOOL_MANIFEST_PATH\n"
+            "registry = ToolRegistry(manifest_path=TOOL_MANIFEST_PATH)\n"
+            "print(registry.discover_tools())\n"
+            "print(sorted(m for m in sys.modules if m.startswith('app.services.agent.tools.')))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True,
+        ).stdout.splitlines()
+
+        assert int(output[0]) == len(load_manifest()["tools"])
+        assert output[1] == "[]"
+
+    def test_lazy_tool_binds_like_concrete_tool(self, greet_module):
+        lazy = LazyTool.from_entry(greet_module)
+
+        assert convert_to_openai_function(lazy) == convert_to_openai_function(GreetTool())
+        assert lazy.citations_required is False
+        assert lazy.cache_tier == "none"
+
+    @pytest.mark.asyncio
+    async def test_lazy_tool_loads_on_first_run(self, greet_module, tmp_path):
+        path = tmp_path / "manifest.json"
+        path.write_text(json.dumps({"version": MANIFEST_VERSION, "tools": [greet_module]}))
+        registry = ToolRegistry(manifest_path=path)
+        tool = registry.get_tool("greet")
+        assert not tool.is_loaded
+
+        with start_trace("agent.turn") as trace:
+            result = await tool.ainvoke({"who": "Ana", "excited": True})
+
+        assert result.data == {"greeting": "Hello Ana!"}
+        assert isinstance(registry.load_tool("greet"), GreetTool)
+        assert [s.name for s in trace.root.iter_spans() if s.kind == "tool"] == ["tool.greet"]
+
+    @pytest.mark.asyncio
+    async def test_lazy_tool_validates_input(self, greet_module):
+        lazy = LazyTool.from_entry(greet_module)
+
+        with pytest.raises(Exception):
+            await lazy._arun(excited=True)
+
+    def test_manifest_path_is_packaged_with_tools(self):
+        assert TOOL_MANIFEST_PATH.parent.name == "tools"
+        assert TOOL_MANIFEST_PATH.exists()
@@ -0,0 +1,184 @@
+"""
+Tests for compact tool-output encoding.
+
+- Field dropping, numeric rounding and table rendering
+- Per-tool token budgets with row trimming and truncation
+- Scratchpad compaction keeps full ToolResults for citations
+- Prompt-token savings accounting across agent iterations
+"""
+
+from decimal import Decimal
+
+import pytest
+from langchain_core.agents import AgentAction
+
+from app.services.agent.base import Citation, ToolResult
+from app.services.agent.tool_output import (
+    compact_intermediate_steps,
+    compact_value,
+    count_tokens,
+    encode_tool_output,
+    encode_with_stats,
+    tool_output_savings,
+)
+
+ASSET_UUID = "a1b2c3d4-e5f6-4a5b-8c9d-0123456789ab"
+
+
+def _asset_rows(count: int):
+    return [
+        {
+            "id": ASSET_UUID,
+            "asset_id": ASSET_UUID,
+            "name": f"Press {i}",
+            "oee": 0.812345 * (i + 1),
+            "downtime_minutes": Decimal("12.500000"),
+            "notes": None,
+            "created_at": "2026-01-05T06:00:00Z",
+        }
+        for i in range(count)
+    ]
+
+
+def _result(data, citations=None) -> ToolResult:
+    return ToolResult(data=data, citations=citations or [])
+
+
+class TestCompactValue:
+    """Tests for field dropping and numeric rounding."""
+
+    def test_drops_identifiers_audit_fields_and_empty_values(self):
+        """Identifiers, timestamps and None values are removed."""
+        compacted = compact_value(_asset_rows(1)[0])
+
+        assert "id" not in compacted
+        assert "asset_id" not in compacted
+        assert "created_at" not in compacted
+        assert "notes" not in compacted
+        assert compacted["name"] == "Press 0"
+
+    def test_keeps_non_uuid_identifiers(self):
+        """Human-readable *_id values are kept."""
+        assert compact_value({"work_order_id": "WO-1042"}) == {"work_order_id": "WO-1042"}
+
+    def test_rounds_floats_decimals_and_decimal_strings(self):
+        """Numerics are rounded to two places."""
+        compacted = compact_value({"a": 0.87342, "b": Decimal("12.500"), "c": "85.000000", "d": 3.0})
+
+        assert compacted == {"a": 0.87, "b": 12.5, "c": 85, "d": 3}
+
+
+class TestEncodeToolOutput:
+    """Tests for the compact text encoding."""
+
+    def test_renders_lists_of_records_as_table(self):
+        """Uniform records become a header line plus pipe-delimited rows."""
+        text = encode_tool_output(_result({"assets": _asset_rows(3)}), token_budget=500)
+
+        assert "assets (3 rows):" in text
+        assert "name|oee|downtime_minutes" in text
+        assert "Press 0|0.81|12.5" in text
+        assert ASSET_UUID not in text
+
+    def test_error_result(self):
+        """Failed results encode as the error message."""
+        result = ToolResult(data=None, success=False, error_message="Asset not found")
+
+        assert encode_tool_output(result) == "Error: Asset not found"
+
+    def test_citations_reduced_to_unique_display_text(self):
+        """Duplicate citations appear once; full citations stay on the result."""
+        citation = Citation(source="daily_summaries", query="q", table="daily_summaries")
+        result = _result({"oee": 0.9}, citations=[citation, citation])
+
+        text = encode_tool_output(result, token_budget=100)
+
+        assert text.count("[Source: daily_summaries]") == 1
+        assert len(result.citations) == 2
+
+    def test_budget_trims_table_rows(self):
+        """Large tables are trimmed with a note of omitted rows."""
+        text = encode_tool_output(_result({"assets": _asset_rows(200)}), token_budget=150)
+
+        assert count_tokens(text) <= 150
+        assert "more rows" in text
+        assert "assets (200 rows):" in text
+
+    def test_budget_truncates_when_rows_are_not_enough(self):
+        """Output that cannot fit by trimming rows is truncated."""
+        text = encode_tool_output(_result({"report": "word " * 2000}), token_budget=50)
+
+        assert text.endswith("[truncated]")
+        assert count_tokens(text) <= 60
+
+    def test_default_budget_from_settings(self):
+        """Without a per-tool budget the configured default applies."""
+        text = encode_tool_output(_result({"assets": _asset_rows(500)}))
+
+        assert count_tokens(text) <= 600
+
+    def test_encoding_is_smaller_than_agent_response(self):
+        """Compact encoding uses far fewer tokens than to_agent_response()."""
+        result = _result({"assets": _asset_rows(10)})
+
+        _, full_tokens, compact_tokens = encode_with_stats(result, 600)
+
+        assert compact_tokens < full_tokens / 2
+
+
+class TestScratchpadCompaction:
+    """Tests for intermediate-step compaction and savings accounting."""
+
+    def _steps(self):
+        first = _result({"assets": _asset_rows(10)})
+        second = _result({"assets": _asset_rows(5)})
+        return [
+            (AgentAction(tool="asset_lookup", tool_input={}, log=""), first),
+            (AgentAction(tool="oee_query", tool_input={}, log=""), second),
+        ]
+
+    def test_tool_results_replaced_with_compact_text(self):
+        """ToolResult observations become strings; other observations pass through."""
+        steps = self._steps() + [(AgentAction(tool="x", tool_input={}, log=""), "plain")]
+
+        compacted = compact_intermediate_steps(steps)
+
+        assert all(isinstance(obs, str) for _, obs in compacted)
+        assert compacted[2][1] == "plain"
+        assert isinstance(steps[0][1], ToolResult)
+
+    def test_per_tool_budget(self):
+        """A tool's budget caps its own output."""
+        steps = [(AgentAction(tool="big", tool_input={}, log=""), _result({"rows": _asset_rows(100)}))]
+
+        compacted = compact_intermediate_steps(steps, {"big": 80})
+
+        assert count_tokens(compacted[0][1]) <= 80
+
+    def test_encoding_memoized_on_result(self):
+        """Each iteration reuses the same encoding."""
+        steps = self._steps()
+
+        first = compact_intermediate_steps(steps)
+        second = compact_intermediate_steps(steps)
+
+        assert first[0][1] is second[0][1]
+
+    def test_savings_weighted_by_remaining_iterations(self):
+        """Earlier outputs are resent more often, so their savings count more."""
+        steps = self._steps()
+        per_step = [encode_with_stats(obs) for _, obs in steps]
+
+        savings = tool_output_savings(steps)
+
+        expected = 2 * (per_step[0][1] - per_step[0][2]) + (per_step[1][1] - per_step[1][2])
+        assert savings["tool_outputs"] == 2
+        assert savings["full_tokens"] == per_step[0][1] + per_step[1][1]
+        assert savings["compact_tokens"] == per_step[0][2] + per_step[1][2]
+        assert savings["prompt_tokens_saved"] == expected
+        assert savings["prompt_tokens_saved"] > 0
+
+    @pytest.mark.parametrize("steps", [[], [(AgentAction(tool="x", tool_input={}, log=""), "text")]])
+    def test_savings_without_tool_results(self, steps):
+        """No ToolResults means nothing saved."""
+        assert tool_output_savings(steps)["prompt_tokens_saved"] == 0
@@ -0,0 +1,365 @@
+"""
+Tests for agent turn tracing.
+
+- Nested spans via contextvars, no-op outside a trace
+- Tool, cache, data source and db round-trip spans
+- LLM call spans from LangChain callbacks
+- Ring buffer sampling and OTLP/HTTP export to a collector stub
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Type
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from pydantic import BaseModel
+
+from app.services.agent.tracing import (
+    NOOP_SPAN,
+    AgentTraceCallbackHandler,
+    OTLPExporter,
+    get_current_span,
+    get_trace_buffer,
+    reset_tracing,
+    span,
+    start_trace,
+)
+
+
+@pytest.fixture
+def tracing_settings():
+    """Enable tracing with every trace sampled."""
+    reset_tracing()
+    settings = MagicMock()
+    settings.tracing_enabled = True
+    settings.tracing_sample_rate = 1.0
+    settings.tracing_buffer_size = 3
+    settings.tracing_otlp_endpoint = ""
+    settings.tracing_service_name = "test-api"
+    with patch("app.services.agent.tracing.get_settings", return_value=settings):
+        yield settings
+    reset_tracing()
+
+
+def _names(trace_dict):
+    """Flatten span names depth first."""
+    names = []
+
+    def visit(node):
+        names.append(node["name"])
+        for child in node["children"]:
+            visit(child)
+
+    visit(trace_dict["root"])
+    return names
+
+
+class TestSpans:
+    """Tests for span nesting."""
+
+    def test_span_outside_trace_is_noop(self):
+        """Spans opened with no active trace record nothing."""
+        with span("orphan") as current:
+            assert current is NOOP_SPAN
+        assert get_current_span() is None
+
+    def test_nested_spans(self, tracing_settings):
+        """Spans nest under the current span and restore it on exit."""
+        with start_trace("agent.turn") as trace:
+            with span("outer", "tool") as outer:
+                with span("inner", "db") as inner:
+                    assert get_current_span() is inner
+                assert get_current_span() is outer
+
+        assert get_current_span() is None
+        assert [c.name for c in trace.root.children] == ["outer"]
+        assert trace.root.children[0].children[0].parent_id == outer.span_id
+        assert trace.root.duration_ms is not None
+
+    def test_exception_marks_span_failed(self, tracing_settings):
+        """An exception marks the span as an error and propagates."""
+        with pytest.raises(ValueError):
+            with start_trace("agent.turn") as trace:
+                with span("failing"):
+                    raise ValueError("boom")
+
+        failing = trace.root.children[0]
+        assert failing.status == "error"
+        assert failing.error == "boom"
+        assert trace.root.status == "error"
+
+    def test_time_by_kind_skips_nested_same_kind(self, tracing_settings):
+        """Per-kind totals do not double count nested spans of the same kind."""
+        with start_trace("agent.turn") as trace:
+            with span("a", "data_source"):
+                with span("b", "data_source"):
+                    pass
+
+        summary = trace.summary()
+        assert summary["time_by_kind_ms"]["data_source"] == trace.root.children[0].duration_ms
+
+    def test_disabled_tracing_yields_none(self, tracing_settings):
+        """With tracing disabled no trace is created."""
+        tracing_settings.tracing_enabled = False
+        with start_trace("agent.turn") as trace:
+            assert trace is None
+            assert get_current_span() is None
+
+
+class TestTraceBuffer:
+    """Tests for sampling into the ring buffer."""
+
+    def test_sampled_traces_buffered(self, tracing_settings):
+        """Sampled traces are kept, newest first, bounded by buffer size."""
+        ids = []
+        for _ in range(5):
+            with start_trace("agent.turn") as trace:
+                ids.append(trace.trace_id)
+
+        buffer = get_trace_buffer()
+        assert len(buffer) == 3
+        assert [t.trace_id for t in buffer.list()] == list(reversed(ids[-3:]))
+        assert buffer.get(ids[-1]) is not None
+        assert buffer.get(ids[0]) is None
+
+    def test_unsampled_traces_not_buffered(self, tracing_settings):
+        """Traces outside the sample rate are not kept."""
+        tracing_settings.tracing_sample_rate = 0.0
+        with start_trace("agent.turn"):
+            pass
+
+        assert len(get_trace_buffer()) == 0
+
+
+class TestInstrumentation:
+    """Tests for tool, cache and data source spans."""
+
+    @pytest.mark.asyncio
+    async def test_tool_and_cache_spans(self, tracing_settings):
+        """Cached tools record a tool span with a cache lookup child."""
+        from app.services.agent.base import ManufacturingTool, ToolResult
+        from app.services.agent.cache import cached_tool, reset_tool_cache
+
+        reset_tool_cache()
+
+        class MockInput(BaseModel):
+            area: str
+
+        class TracedTool(ManufacturingTool):
+            name: str = "traced_tool"
+            description: str = "Test tool"
+            args_schema: Type[BaseModel] = MockInput
+
+            @cached_tool(tier="daily", scope="global")
+            async def _arun(self, area: str, **kwargs) -> ToolResult:
+                return self._create_success_result(data={"area": area})
+
+        tool = TracedTool()
+        with start_trace("agent.turn") as trace:
+            await tool._arun(area="Grinding")
+            await tool._arun(area="Grinding")
+
+        first, second = trace.root.children
+        assert first.name == "tool.traced_tool"
+        assert first.kind == "tool"
+        assert first.children[0].name == "cache.lookup"
+        assert first.children[0].attributes["hit"] is False
+        assert second.children[0].attributes["hit"] is True
+        assert TracedTool._arun._cache_tier == "daily"
+
+        reset_tool_cache()
+
+    @pytest.mark.asyncio
+    async def test_failed_tool_result_marks_span(self, tracing_settings):
+        """A tool returning an error result marks its span as failed."""
+        from app.services.agent.base import ManufacturingTool, ToolResult
+
+        class MockInput(BaseModel):
+            asset_id: str
+
+        class FailingTool(ManufacturingTool):
+            name: str = "failing_tool"
+            description: str = "Test tool"
+            args_schema: Type[BaseModel] = MockInput
+
+            async def _arun(self, asset_id: str, **kwargs) -> ToolResult:
+                return self._create_error_result("Asset not found")
+
+        with start_trace("agent.turn") as trace:
+            await FailingTool()._arun(asset_id="x")
+
+        assert trace.root.children[0].status == "error"
+        assert trace.root.children[0].error == "Asset not found"
+
+    @pytest.mark.asyncio
+    async def test_data_source_and_db_spans(self, tracing_settings):
+        """Data source methods and each query round trip are traced."""
+        from app.services.agent.data_source.supabase import SupabaseDataSource
+
+        client = MagicMock()
+        client.table.return_value.select.return_value.ilike.return_value.limit.return_value.execute.return_value = MagicMock(
+            data=[]
+        )
+        data_source = SupabaseDataSource(client=client)
+
+        with start_trace("agent.turn") as trace:
+            await data_source.get_asset_by_name("Grinder 5")
+
+        ds_span = trace.root.children[0]
+        assert ds_span.name == "supabase.get_asset_by_name"
+        assert ds_span.kind == "data_source"
+        # Exact match then partial match: two round trips
+        assert [c.kind for c in ds_span.children] == ["db", "db"]
+        assert ds_span.children[0].attributes["row_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_llm_callback_spans(self, tracing_settings):
+        """Each LLM call becomes an llm span numbered by iteration."""
+        with start_trace("agent.turn") as trace:
+            handler = AgentTraceCallbackHandler(trace.root)
+            for _ in range(2):
+                run_id = uuid4()
+                await handler.on_chat_model_start(
+                    {}, [[]], run_id=run_id, invocation_params={"model": "gpt-4"}
+                )
+                response = MagicMock(llm_output={"token_usage": {"total_tokens": 42}})
+                await handler.on_llm_end(response, run_id=run_id)
+
+        llm_spans = [c for c in trace.root.children if c.kind == "llm"]
+        assert [s.attributes["iteration"] for s in llm_spans] == [1, 2]
+        assert llm_spans[0].attributes["model"] == "gpt-4"
+        assert llm_spans[0].attributes["total_tokens"] == 42
+        assert handler.iterations == 2
+
+
+class TestExecutorTracing:
+    """Tests for traces attached to agent responses."""
+
+    @pytest.mark.asyncio
+    async def test_trace_returned_in_meta(self, tracing_settings):
+        """include_trace returns the span tree in meta."""
+        from app.services.agent.executor import AgentConfig, ManufacturingAgent
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}, clear=True):
+            agent = ManufacturingAgent(config=AgentConfig())
+
+        async def fake_invoke(inputs, config=None):
+            handler = config["callbacks"][0]
+            run_id = uuid4()
+            await handler.on_llm_start({}, ["prompt"], run_id=run_id)
+            await handler.on_llm_end(MagicMock(llm_output=None), run_id=run_id)
+            return {"output": "OEE is 80%", "intermediate_steps": []}
+
+        with patch.object(agent, "_executor") as mock_executor:
+            mock_executor.ainvoke = fake_invoke
+            agent._initialized = True
+            response = await agent.process_message(
+                message="What is the OEE?", user_id="user-1", include_trace=True
+            )
+
+        trace = response.meta["trace"]
+        assert trace["trace_id"] == response.meta["trace_id"]
+        assert trace["attributes"]["iterations"] == 1
+        assert _names(trace) == ["agent.turn", "llm.call"]
+        assert get_trace_buffer().get(trace["trace_id"]) is not None
+
+    @pytest.mark.asyncio
+    async def test_trace_omitted_by_default(self, tracing_settings):
+        """Without include_trace only the trace ID is returned."""
+        from app.services.agent.executor import AgentConfig, ManufacturingAgent
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}, clear=True):
+            agent = ManufacturingAgent(config=AgentConfig())
+
+        with patch.object(agent, "_executor") as mock_executor:
+            mock_executor.ainvoke = MagicMock(side_effect=Exception("LLM Error"))
+            agent._initialized = True
+            response = await agent.process_message(message="Hi there", user_id="user-1")
+
+        assert "trace" not in response.meta
+        trace = get_trace_buffer().get(response.meta["trace_id"])
+        assert trace.root.status == "error"
+
+
+class _CollectorStub(BaseHTTPRequestHandler):
+    """Minimal OTLP/HTTP collector recording posted payloads."""
+
+    received = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        type(self).received.append((self.path, json.loads(body)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def collector():
+    """Run a local collector stub on an ephemeral port."""
+    _CollectorStub.received = []
+    server = HTTPServer(("127.0.0.1", 0), _CollectorStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", _CollectorStub.received
+    server.shutdown()
+    server.server_close()
+
+
+class TestOTLPExport:
+    """Tests for OTLP/HTTP export."""
+
+    @pytest.mark.asyncio
+    async def test_export_to_collector(self, tracing_settings, collector):
+        """Traces are posted to /v1/traces in OTLP JSON encoding."""
+        endpoint, received = collector
+        with start_trace("agent.turn", user_id="u1") as trace:
+            with span("supabase.execute", "db", table="assets"):
+                pass
+
+        exporter = OTLPExporter(endpoint, service_name="test-api")
+        assert await exporter.export([trace]) is True
+
+        path, payload = received[0]
+        assert path == "/v1/traces"
+        resource_spans = payload["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"][0]["value"] == {"stringValue": "test-api"}
+        spans = resource_spans["scopeSpans"][0]["spans"]
+        root, db = spans
+        assert root["traceId"] == trace.trace_id
+        assert db["parentSpanId"] == root["spanId"]
+        assert db["kind"] == 3
+        assert {"key": "table", "value": {"stringValue": "assets"}} in db["attributes"]
+        assert int(db["endTimeUnixNano"]) >= int(db["startTimeUnixNano"])
+
+    @pytest.mark.asyncio
+    async def test_sampled_trace_exported_in_background(self, tracing_settings, collector):
+        """With an endpoint configured, sampled traces export after the turn."""
+        endpoint, received = collector
+        tracing_settings.tracing_otlp_endpoint = endpoint
+
+        with start_trace("agent.turn"):
+            pass
+
+        for _ in range(50):
+            if received:
+                break
+            await asyncio.sleep(0.02)
+        assert len(received) == 1
+
+    @pytest.mark.asyncio
+    async def test_export_failure_is_swallowed(self, tracing_settings):
+        """An unreachable collector is logged, not raised."""
+        with start_trace("agent.turn") as trace:
+            pass
+
+        exporter = OTLPExporter("http://127.0.0.1:9", service_name="test-api", timeout=0.5)
+        assert await exporter.export([trace]) is False
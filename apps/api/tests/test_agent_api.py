@@ -300,9 +300,9 @@ class TestRateLimiting:
             ))
             mock_agent.return_value = agent_instance
 
-            # Clear rate limit store
-            from app.api.agent import _rate_limit_store
-            _rate_limit_store.clear()
+            # Clear rate limit state
+            from app.core.rate_limit import get_rate_limiter
+            get_rate_limiter().reset()
 
             # Make requests up to limit
             for i in range(10):
@@ -354,8 +354,8 @@ class TestResponseFormat:
             mock_agent.return_value = agent_instance
 
             # Clear rate limit
-            from app.api.agent import _rate_limit_store
-            _rate_limit_store.clear()
+            from app.core.rate_limit import get_rate_limiter
+            get_rate_limiter().reset()
 
             response = client.post(
                 "/api/agent/chat",
@@ -413,8 +413,8 @@ class TestResponseFormat:
             ))
             mock_agent.return_value = agent_instance
 
-            from app.api.agent import _rate_limit_store
-            _rate_limit_store.clear()
+            from app.core.rate_limit import get_rate_limiter
+            get_rate_limiter().reset()
 
             response = client.post(
                 "/api/agent/chat",
@@ -434,3 +434,65 @@ class TestResponseFormat:
             assert "timestamp" in citation
             assert "confidence" in citation
             assert "display_text" in citation
+
+
+class TestAgentTraceEndpoints:
+    """Tests for the admin trace endpoints."""
+
+    @pytest.fixture(autouse=True)
+    def _buffer(self):
+        from app.services.agent.tracing import reset_tracing
+        reset_tracing()
+        yield
+        reset_tracing()
+
+    def _record_trace(self):
+        from app.services.agent.tracing import Span, Trace, get_trace_buffer
+
+        root = Span(name="agent.turn", kind="agent", trace_id="abc123")
+        root.children.append(Span(name="llm.call", kind="llm", trace_id="abc123", duration_ms=5.0))
+        root.end()
+        get_trace_buffer().add(Trace(root=root, sampled=True))
+
+    def test_traces_require_admin(self, client, mock_verify_jwt):
+        """Trace endpoints are admin-only."""
+        response = client.get(
+            "/api/agent/traces",
+            headers={"Authorization": "Bearer test-token"},
+        )
+        assert response.status_code == 403
+
+    def test_list_traces(self, client, mock_verify_jwt_admin):
+        """Sampled trace summaries are listed."""
+        self._record_trace()
+
+        response = client.get(
+            "/api/agent/traces",
+            headers={"Authorization": "Bearer test-token"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["buffered"] == 1
+        assert data["traces"][0]["trace_id"] == "abc123"
+        assert data["traces"][0]["time_by_kind_ms"] == {"llm": 5.0}
+
+    def test_get_trace(self, client, mock_verify_jwt_admin):
+        """A trace's span tree is returned by ID."""
+        self._record_trace()
+
+        response = client.get(
+            "/api/agent/traces/abc123",
+            headers={"Authorization": "Bearer test-token"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["root"]["children"][0]["name"] == "llm.call"
+
+    def test_get_unknown_trace(self, client, mock_verify_jwt_admin):
+        """Unknown trace IDs return 404."""
+        response = client.get(
+            "/api/agent/traces/missing",
+            headers={"Authorization": "Bearer test-token"},
+        )
+        assert response.status_code == 404
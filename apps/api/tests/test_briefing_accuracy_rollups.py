@@ -0,0 +1,245 @@
+"""
+Tests for incremental briefing accuracy rollups (Story 9.11 AC#4).
+
+- Rolling 7/30/90-day windows are maintained as comparisons are stored
+- Windows match a full recomputation over the stored history
+- Re-storing a day replaces its contribution
+- Area and concern-type series
+- EODService trends and Action Engine feedback read the rollups
+- The EOD accuracy endpoint reports them
+"""
+
+import random
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.models.briefing import (
+    AccuracyMetrics,
+    ConcernComparison,
+    ConcernOutcome,
+    EODComparisonResult,
+)
+from app.services.briefing.accuracy_rollups import (
+    AccuracyRollups,
+    get_accuracy_rollups,
+    reset_accuracy_rollups,
+)
+from app.services.briefing.eod import EODService
+from app.services.briefing.morning_snapshot import plant_today
+
+TODAY = date(2026, 10, 17)
+
+
+def _comparison(outcome, issue_type="production", area="Grinding"):
+    return ConcernComparison(
+        concern_id="c",
+        area=area,
+        issue_type=issue_type,
+        morning_description="concern",
+        outcome=outcome,
+    )
+
+
+def _result(comparisons, misses=0):
+    correct = sum(1 for c in comparisons if c.outcome in (ConcernOutcome.MATERIALIZED, ConcernOutcome.ESCALATED))
+    outcomes = len(comparisons) + misses
+    return EODComparisonResult(
+        has_morning_briefing=True,
+        comparisons=comparisons,
+        accuracy_metrics=AccuracyMetrics(
+            accuracy_percentage=round(correct / outcomes * 100, 1) if outcomes else 100.0,
+            total_predictions=len(comparisons),
+            correct_predictions=correct,
+            misses=misses,
+        ),
+    )
+
+
+@pytest.fixture(autouse=True)
+def rollups():
+    reset_accuracy_rollups()
+    yield get_accuracy_rollups()
+    reset_accuracy_rollups()
+
+
+class TestRollingWindows:
+    """Window totals and ageing."""
+
+    def test_windows(self):
+        rollups = AccuracyRollups()
+        rollups.record("u1", TODAY, _result([_comparison(ConcernOutcome.MATERIALIZED)]))
+        rollups.record("u1", TODAY - timedelta(days=10), _result([_comparison(ConcernOutcome.AVERTED)]))
+        rollups.record("u1", TODAY - timedelta(days=60), _result([], misses=2))
+
+        assert rollups.rollup("u1", 7, as_of=TODAY)["overall"]["days"] == 1
+        assert rollups.rollup("u1", 30, as_of=TODAY)["overall"]["days"] == 2
+        ninety = rollups.rollup("u1", 90, as_of=TODAY)["overall"]
+        assert ninety["days"] == 3
+        assert ninety["predictions"] == 2
+        assert ninety["misses"] == 2
+        assert ninety["accuracy_percentage"] == 25.0
+
+    def test_days_age_out(self):
+        rollups = AccuracyRollups()
+        rollups.record("u1", TODAY, _result([_comparison(ConcernOutcome.MATERIALIZED)]))
+
+        later = rollups.rollup("u1", 7, as_of=TODAY + timedelta(days=7))
+
+        assert later["overall"] is None
+        assert rollups.rollup("u1", 30, as_of=TODAY + timedelta(days=7))["overall"]["days"] == 1
+
+    def test_restored_day_replaces_contribution(self):
+        rollups = AccuracyRollups()
+        rollups.record("u1", TODAY, _result([_comparison(ConcernOutcome.AVERTED)]))
+        rollups.record("u1", TODAY, _result([_comparison(ConcernOutcome.MATERIALIZED)]))
+
+        overall = rollups.rollup("u1", 7, as_of=TODAY)["overall"]
+        assert overall["days"] == 1
+        assert overall["correct"] == 1
+        assert overall["false_positives"] == 0
+
+    def test_matches_full_recomputation(self):
+        rng = random.Random(7)
+        rollups = AccuracyRollups()
+        history = {}
+        outcomes = list(ConcernOutcome)[:3]
+        # Out-of-order stores with gaps and re-stores over 200 days
+        for _ in range(300):
+            day = TODAY - timedelta(days=rng.randrange(200))
+            comparisons = [_comparison(rng.choice(outcomes)) for _ in range(rng.randrange(4))]
+            misses = rng.randrange(3)
+            history[day] = (comparisons, misses)
+            rollups.record("u1", day, _result(comparisons, misses))
+
+        for window in (7, 30, 90, 14):
+            in_window = [v for d, v in history.items() if TODAY - timedelta(days=window) < d <= TODAY]
+            overall = rollups.rollup("u1", window, as_of=TODAY)["overall"]
+            assert overall["days"] == len(in_window)
+            assert overall["predictions"] == sum(len(c) for c, _ in in_window)
+            assert overall["misses"] == sum(m for _, m in in_window)
+
+
+class TestDimensions:
+    """Per-area and per-concern-type series."""
+
+    def test_area_and_type(self):
+        rollups = AccuracyRollups()
+        rollups.record("u1", TODAY, _result([
+            _comparison(ConcernOutcome.MATERIALIZED, "safety", "Packing"),
+            _comparison(ConcernOutcome.AVERTED, "downtime", "Packing"),
+            _comparison(ConcernOutcome.ESCALATED, "downtime", "Roasting"),
+        ], misses=1))
+
+        rollup = rollups.rollup("u1", 30, as_of=TODAY)
+
+        assert rollup["by_area"]["Packing"]["predictions"] == 2
+        assert rollup["by_area"]["Roasting"]["escalated"] == 1
+        assert rollup["by_concern_type"]["downtime"]["false_positive_rate"] == 0.5
+        # Misses count toward the user's overall accuracy only
+        assert rollup["by_concern_type"]["safety"]["misses"] == 0
+        assert rollup["overall"]["misses"] == 1
+
+    def test_default_window_ends_on_plant_date(self):
+        rollups = AccuracyRollups()
+        rollups.record("u1", date(2026, 10, 10), _result([_comparison(ConcernOutcome.MATERIALIZED)]))
+        rollups.record("u1", date(2026, 10, 11), _result([_comparison(ConcernOutcome.AVERTED)]))
+
+        # 22:00 UTC on the 16th is already the 17th in Tokyo
+        with patch("app.services.briefing.morning_snapshot.get_settings",
+                   return_value=MagicMock(pipeline_timezone="Asia/Tokyo")), \
+                patch("app.services.briefing.morning_snapshot._utcnow",
+                      return_value=datetime(2026, 10, 16, 22, 0, tzinfo=timezone.utc)):
+            weekly = rollups.rollup("u1", 7)
+            trend = rollups.daily("u1", days=7)
+
+        assert weekly["overall"]["days"] == 1
+        assert weekly["overall"]["false_positives"] == 1
+        assert [t["date"] for t in trend] == ["2026-10-11"]
+
+    def test_users_are_separate(self):
+        rollups = AccuracyRollups()
+        rollups.record("u1", TODAY, _result([_comparison(ConcernOutcome.MATERIALIZED)]))
+
+        assert rollups.rollup("u2", 30, as_of=TODAY)["overall"] is None
+
+
+class TestEODServiceIntegration:
+    """Storing, trends and feedback."""
+
+    @pytest.mark.asyncio
+    async def test_store_then_trends(self):
+        service = EODService()
+        today = plant_today()
+        for offset in range(3):
+            await service.store_accuracy_metrics(
+                "u1", today - timedelta(days=offset),
+                _result([_comparison(ConcernOutcome.MATERIALIZED)]),
+            )
+
+        trends = await service.get_accuracy_trends("u1", days=2)
+
+        assert [t["date"] for t in trends] == [today.isoformat(), (today - timedelta(days=1)).isoformat()]
+        assert service.get_accuracy_rollup("u1", 7)["overall"]["days"] == 3
+
+    @pytest.mark.asyncio
+    async def test_feedback_uses_rolling_false_alarm_rate(self):
+        service = EODService()
+        today = plant_today()
+        for offset in range(6):
+            await service.store_accuracy_metrics(
+                "u1", today - timedelta(days=offset),
+                _result([_comparison(ConcernOutcome.AVERTED, "safety")]),
+            )
+
+        feedback = service.get_action_engine_feedback(AccuracyMetrics(accuracy_percentage=90.0), user_id="u1")
+
+        assert feedback["weight_adjustments"]["safety_sensitivity"] == -0.1
+        assert feedback["rolling"]["by_concern_type"]["safety"]["predictions"] == 6
+        # Without a user, feedback is based on the day's metrics only
+        assert "rolling" not in service.get_action_engine_feedback(AccuracyMetrics(accuracy_percentage=90.0))
+
+
+class TestAccuracyEndpoint:
+    """GET /api/v1/briefing/eod/accuracy."""
+
+    @pytest.fixture(autouse=True)
+    def rollups(self):
+        from app.core.security import get_current_user
+        from app.main import app
+        from app.models.user import CurrentUser
+
+        reset_accuracy_rollups()
+        app.dependency_overrides[get_current_user] = lambda: CurrentUser(
+            id="u1", email="pm@example.com", role="authenticated"
+        )
+        yield
+        app.dependency_overrides.pop(get_current_user, None)
+        reset_accuracy_rollups()
+
+    def test_reports_rollup_trend_and_feedback(self, client):
+        today = plant_today()
+        for offset in range(6):
+            get_accuracy_rollups().record(
+                "u1", today - timedelta(days=offset),
+                _result([_comparison(ConcernOutcome.AVERTED, "safety")]),
+            )
+
+        response = client.get("/api/v1/briefing/eod/accuracy", params={"window_days": 7, "days": 3})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["user_id"] == "u1"
+        assert body["overall"]["days"] == 6
+        assert body["by_concern_type"]["safety"]["false_positives"] == 6
+        assert [t["date"] for t in body["trend"]][0] == today.isoformat()
+        assert len(body["trend"]) == 3
+        assert body["feedback"]["weight_adjustments"]["safety_sensitivity"] == -0.1
+
+    def test_no_data(self, client):
+        response = client.get("/api/v1/briefing/eod/accuracy")
+
+        assert response.status_code == 200
+        assert response.json()["overall"] is None
+        assert response.json()["feedback"] is None
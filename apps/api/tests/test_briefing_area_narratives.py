@@ -0,0 +1,160 @@
+"""
+Tests for LLM area narratives in morning briefings.
+
+- Batched mode writes every area in one structured LLM call
+- Per-area mode makes one call per area (for comparison)
+- Unparseable responses keep the template narratives
+- Metadata records calls, tokens and latency per mode
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from app.models.briefing import BriefingSection, BriefingSectionStatus, ToolResultData
+from app.services.briefing.morning import (
+    PRODUCTION_AREAS,
+    AreaBriefingData,
+    MorningBriefingService,
+)
+from app.services.briefing.narrative import NarrativeGenerator
+
+
+def _area_data(area_id, assets):
+    area = next(a for a in PRODUCTION_AREAS if a["id"] == area_id)
+    data = AreaBriefingData(area_id, area["name"], area["description"], assets)
+    data.oee_data = ToolResultData(tool_name="oee_data", data={"oee_percentage": 81.5})
+    return data
+
+
+def _reply(messages, *args, **kwargs):
+    """Narrate exactly the areas named in the prompt."""
+    prompt = messages[0].content
+    sections = [
+        {"area_id": area["id"], "content": f"LLM narrative for {area['name']}."}
+        for area in PRODUCTION_AREAS
+        if f"- {area['id']} (" in prompt
+    ]
+    return AIMessage(
+        content=json.dumps({"sections": sections}),
+        response_metadata={"token_usage": {"prompt_tokens": 100 * len(sections), "completion_tokens": 20}},
+    )
+
+
+def _service(llm):
+    service = MorningBriefingService()
+    service._narrative_generator = NarrativeGenerator(llm_client=llm)
+    service._generate_headline_section = AsyncMock(return_value=BriefingSection(
+        section_type="headline",
+        title="Morning Briefing Overview",
+        content="Good morning.",
+        status=BriefingSectionStatus.COMPLETE,
+    ))
+    service._get_area_data = AsyncMock(side_effect=_area_data)
+    return service
+
+
+def _settings(mode):
+    return patch(
+        "app.services.briefing.morning.get_settings",
+        return_value=MagicMock(briefing_data_plan_enabled=False, briefing_narrative_mode=mode),
+    )
+
+
+def _area_sections(briefing):
+    return [s for s in briefing.sections if s.section_type == "area"]
+
+
+class TestNarrativeModes:
+    """Batched vs per-area vs template narratives."""
+
+    @pytest.mark.asyncio
+    async def test_batched_single_call(self):
+        llm = AsyncMock()
+        llm.ainvoke.side_effect = _reply
+        service = _service(llm)
+
+        with _settings("batched"):
+            briefing = await service.generate_plant_briefing(user_id="user-1")
+
+        assert llm.ainvoke.await_count == 1
+        assert all(s.content.startswith("LLM narrative for") for s in _area_sections(briefing))
+        stats = briefing.metadata.narrative
+        assert stats.mode == "batched"
+        assert stats.llm_calls == 1
+        assert stats.llm_areas == len(PRODUCTION_AREAS)
+        assert stats.prompt_tokens == 100 * len(PRODUCTION_AREAS)
+        assert stats.completion_tokens == 20
+
+    @pytest.mark.asyncio
+    async def test_per_area_one_call_each(self):
+        llm = AsyncMock()
+        llm.ainvoke.side_effect = _reply
+        service = _service(llm)
+
+        with _settings("per_area"):
+            briefing = await service.generate_plant_briefing(user_id="user-1")
+
+        assert llm.ainvoke.await_count == len(PRODUCTION_AREAS)
+        stats = briefing.metadata.narrative
+        assert stats.mode == "per_area"
+        assert stats.llm_calls == len(PRODUCTION_AREAS)
+        assert stats.llm_areas == len(PRODUCTION_AREAS)
+        assert stats.completion_tokens == 20 * len(PRODUCTION_AREAS)
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_keeps_templates(self):
+        llm = AsyncMock()
+        llm.ainvoke.return_value = AIMessage(content="Here is your briefing!")
+        service = _service(llm)
+
+        with _settings("batched"):
+            briefing = await service.generate_plant_briefing(user_id="user-1")
+
+        grinding = next(s for s in _area_sections(briefing) if s.area_id == "grinding")
+        assert "OEE is at 81.5%" in grinding.content
+        assert grinding.status == BriefingSectionStatus.COMPLETE
+        assert briefing.metadata.narrative.llm_areas == 0
+        assert briefing.metadata.narrative.llm_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_partial_response_fills_missing_with_templates(self):
+        llm = AsyncMock()
+        llm.ainvoke.return_value = AIMessage(content=json.dumps({"sections": [
+            {"area_id": "packing", "content": "Packing is on plan."},
+        ]}))
+        service = _service(llm)
+
+        with _settings("batched"):
+            briefing = await service.generate_plant_briefing(user_id="user-1")
+
+        sections = {s.area_id: s.content for s in _area_sections(briefing)}
+        assert sections["packing"] == "Packing is on plan."
+        assert "OEE is at 81.5%" in sections["roasting"]
+
+    @pytest.mark.asyncio
+    async def test_template_mode_skips_llm(self):
+        llm = AsyncMock()
+        service = _service(llm)
+
+        with _settings("template"):
+            briefing = await service.generate_plant_briefing(user_id="user-1")
+
+        llm.ainvoke.assert_not_called()
+        assert briefing.metadata.narrative.mode == "template"
+        assert briefing.metadata.narrative.llm_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_areas_are_not_narrated(self):
+        llm = AsyncMock()
+        llm.ainvoke.side_effect = _reply
+        service = _service(llm)
+        service._get_area_data = AsyncMock(side_effect=RuntimeError("query failed"))
+
+        with _settings("batched"):
+            briefing = await service.generate_plant_briefing(user_id="user-1")
+
+        llm.ainvoke.assert_not_called()
+        assert all(s.status == BriefingSectionStatus.PARTIAL for s in _area_sections(briefing))
@@ -0,0 +1,254 @@
+"""
+Tests for the fetch-once briefing data plan.
+
+- Plant-wide data is fetched once per briefing and partitioned by area
+- Area narratives are built from the partitions
+- Concurrent areas share one fetch
+- Round trips are counted, with and without the plan
+- Failed fetches degrade the affected sections only
+"""
+
+import asyncio
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.models.briefing import BriefingSection, BriefingSectionStatus, ToolResultData
+from app.services.agent.data_source.protocol import (
+    DataResult,
+    ProductionStatus,
+    SafetyEvent,
+    ShiftTarget,
+)
+from app.services.agent.data_source.round_trips import count_round_trips, record_round_trip
+from app.services.briefing.data_plan import BriefingDataPlan, current_data_plan, use_data_plan
+from app.services.briefing.morning import PRODUCTION_AREAS, MorningBriefingService
+
+REPORT_DATE = date(2026, 10, 17)
+NOW = datetime.now(timezone.utc)
+
+
+def _result(data, table):
+    return DataResult(data=data, source_name="supabase", table_name=table, row_count=len(data))
+
+
+def _snapshot(asset_id, asset_name, area, current, target):
+    return ProductionStatus(
+        id=f"snap-{asset_id}",
+        asset_id=asset_id,
+        asset_name=asset_name,
+        area=area,
+        snapshot_timestamp=NOW,
+        current_output=current,
+        target_output=target,
+        status="on_target",
+    )
+
+
+class FakeDataSource:
+    """Plant-wide queries that each cost one round trip."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def get_all_live_snapshots(self):
+        self.calls.append("snapshots")
+        record_round_trip("live_snapshots")
+        return _result([
+            _snapshot("g1", "Grinder 1", "Grinding", 80, 100),
+            _snapshot("g2", "Grinder 2", "Grinding", 120, 100),
+            _snapshot("r1", "Roaster 1", "Roasting", 100, 100),
+            # Unknown asset name: falls back to assets.area
+            _snapshot("s1", "Silo 7", "Green Bean", 50, 50),
+        ], "live_snapshots")
+
+    async def get_all_shift_targets(self):
+        self.calls.append("targets")
+        record_round_trip("shift_targets")
+        return _result([ShiftTarget(id="t1", asset_id="g1", target_output=100)], "shift_targets")
+
+    async def get_trend_data(self, start_date, end_date, metric="oee"):
+        self.calls.append("summaries")
+        record_round_trip("daily_summaries")
+        return _result([
+            {"asset_id": "g1", "asset_name": "Grinder 1", "area": "Grinding", "value": 70.0,
+             "downtime_reasons": {"Jam": 40, "Changeover": 10}},
+            {"asset_id": "g2", "asset_name": "Grinder 2", "area": "Grinding", "value": 90.0,
+             "downtime_reasons": {"Changeover": 5}},
+            {"asset_id": "r1", "asset_name": "Roaster 1", "area": "Roasting", "value": None,
+             "downtime_reasons": None},
+        ], "daily_summaries")
+
+    async def get_safety_events(self, asset_id, start_date, end_date, include_resolved=False):
+        self.calls.append("safety")
+        record_round_trip("safety_events")
+        return _result([
+            SafetyEvent(id="e1", asset_id="r1", asset_name="Roaster 1", area="Roasting",
+                        event_timestamp=NOW, reason_code="Guard Open", severity="high"),
+        ], "safety_events")
+
+
+def _plan(data_source=None):
+    service = MorningBriefingService()
+    return BriefingDataPlan(
+        service._get_asset_area_map(),
+        {area["id"]: area["name"] for area in PRODUCTION_AREAS},
+        data_source=data_source or FakeDataSource(),
+        report_date=REPORT_DATE,
+    )
+
+
+def _settings(enabled):
+    return patch(
+        "app.services.briefing.morning.get_settings",
+        return_value=MagicMock(briefing_data_plan_enabled=enabled, briefing_narrative_mode="template"),
+    )
+
+
+class TestPartitioning:
+    """Plant-wide rows are sliced per area."""
+
+    @pytest.mark.asyncio
+    async def test_area_results_from_partition(self):
+        plan = _plan()
+
+        grinding = await plan.area_results("grinding")
+
+        production = grinding["production_status"].data["summary"]
+        assert production["total_output"] == 200
+        assert production["total_target"] == 200
+        assert production["assets_needing_attention"] == ["Grinder 1"]
+        assert grinding["oee_data"].data["oee_percentage"] == 80.0
+        assert grinding["downtime_analysis"].data["top_reasons"][0] == {"reason": "Jam", "duration_minutes": 40}
+        assert grinding["downtime_analysis"].data["total_downtime_minutes"] == 55
+        assert grinding["safety_events"].data["total_events"] == 0
+        assert grinding["oee_data"].citations[0].table == "daily_summaries"
+
+    @pytest.mark.asyncio
+    async def test_area_column_used_for_unmapped_assets(self):
+        plan = _plan()
+
+        green_bean = await plan.area_results("green_bean")
+
+        assert green_bean["production_status"].data["summary"]["total_assets"] == 1
+
+    @pytest.mark.asyncio
+    async def test_area_without_rows_is_empty_not_failed(self):
+        plan = _plan()
+
+        flavor = await plan.area_results("flavor_room")
+
+        assert all(result.success for result in flavor.values())
+        assert flavor["production_status"].data == {"summary": {}}
+        assert flavor["oee_data"].data == {}
+
+
+class TestFetchOnce:
+    """One plant-wide fetch serves every area."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_areas_share_fetch(self):
+        data_source = FakeDataSource()
+        plan = _plan(data_source)
+
+        await asyncio.gather(*[plan.area_results(area["id"]) for area in PRODUCTION_AREAS])
+
+        assert sorted(data_source.calls) == ["safety", "snapshots", "summaries", "targets"]
+        assert plan.round_trips == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_query_fails_dependent_tools_only(self):
+        data_source = FakeDataSource()
+        data_source.get_trend_data = AsyncMock(side_effect=RuntimeError("timeout"))
+        plan = _plan(data_source)
+
+        grinding = await plan.area_results("grinding")
+
+        assert grinding["oee_data"].success is False
+        assert grinding["downtime_analysis"].success is False
+        assert grinding["production_status"].success is True
+        assert grinding["safety_events"].success is True
+
+
+class TestMorningBriefingIntegration:
+    """Area sections read the active plan; round trips reach metadata."""
+
+    @staticmethod
+    def _service():
+        service = MorningBriefingService()
+        service._generate_headline_section = AsyncMock(return_value=BriefingSection(
+            section_type="headline",
+            title="Morning Briefing Overview",
+            content="Good morning.",
+            status=BriefingSectionStatus.COMPLETE,
+        ))
+        return service
+
+    @pytest.mark.asyncio
+    async def test_plant_briefing_uses_plan(self):
+        service = self._service()
+        data_source = FakeDataSource()
+
+        with _settings(True), patch(
+            "app.services.agent.data_source.get_data_source", return_value=data_source
+        ):
+            briefing = await service.generate_plant_briefing(user_id="user-1")
+
+        assert briefing.metadata.data_round_trips == 4
+        grinding = next(s for s in briefing.sections if s.area_id == "grinding")
+        assert "OEE is at 80.0%" in grinding.content
+        assert "Top downtime: Jam at 40 minutes" in grinding.content
+        roasting = next(s for s in briefing.sections if s.area_id == "roasting")
+        assert "1 safety event(s)" in roasting.content
+
+    @pytest.mark.asyncio
+    async def test_per_area_tools_when_disabled(self):
+        service = self._service()
+
+        async def tool_call(tool, area_id):
+            record_round_trip("tool")
+            return ToolResultData(tool_name="tool", data={})
+
+        with _settings(False), \
+                patch.object(service, "_get_production_for_area", side_effect=tool_call), \
+                patch.object(service, "_get_oee_for_area", side_effect=tool_call), \
+                patch.object(service, "_get_downtime_for_area", side_effect=tool_call), \
+                patch.object(service, "_get_safety_for_area", side_effect=tool_call):
+            briefing = await service.generate_plant_briefing(user_id="user-1")
+
+        assert briefing.metadata.data_round_trips == 4 * len(PRODUCTION_AREAS)
+
+    @pytest.mark.asyncio
+    async def test_plan_is_scoped_to_the_briefing(self):
+        service = self._service()
+
+        with _settings(True), patch(
+            "app.services.agent.data_source.get_data_source", return_value=FakeDataSource()
+        ):
+            await service.generate_plant_briefing(user_id="user-1")
+
+        assert current_data_plan() is None
+
+
+class TestRoundTripCounting:
+    """Counters nest and are no-ops outside a block."""
+
+    def test_nested_counters(self):
+        with count_round_trips() as outer:
+            record_round_trip("daily_summaries")
+            with count_round_trips() as inner:
+                record_round_trip("live_snapshots")
+
+        assert inner.count == 1
+        assert outer.count == 2
+        assert outer.by_table == {"daily_summaries": 1, "live_snapshots": 1}
+
+    def test_no_counter_is_noop(self):
+        record_round_trip("daily_summaries")
+
+    def test_use_data_plan_restores_previous(self):
+        plan = _plan()
+        with use_data_plan(plan):
+            assert current_data_plan() is plan
+        assert current_data_plan() is None
@@ -0,0 +1,269 @@
+"""
+Tests for the pre-generated morning briefing store.
+
+- Briefings are generated once per data fingerprint and then served as hits
+- Changes to fingerprint tables (and only those) trigger regeneration
+- Concurrent requests share one generation
+- Plant and supervisor briefings are composed per request
+- Pre-generation runs after the Morning Report pipeline
+- The morning endpoint reports a real cache_hit
+"""
+
+import asyncio
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.models.briefing import (
+    BriefingResponse,
+    BriefingResponseMetadata,
+    BriefingScope,
+    BriefingSection,
+    BriefingSectionStatus,
+)
+from app.models.user import CurrentUserWithRole, UserPreferences, UserRole
+from app.services.briefing.morning import DEFAULT_AREA_ORDER, MorningBriefingService
+from app.services.briefing.store import (
+    BriefingStore,
+    get_briefing_store,
+    pregenerate_briefings,
+    reset_briefing_store,
+)
+from app.services.event_bus import DataChangedEvent
+
+
+def _section(area_id=None, content="All good.", status=BriefingSectionStatus.COMPLETE):
+    return BriefingSection(
+        section_type="area" if area_id else "headline",
+        title=area_id or "Morning Briefing Overview",
+        content=content,
+        area_id=area_id,
+        status=status,
+    )
+
+
+def _plant_response():
+    return BriefingResponse(
+        id="materialized",
+        title="Morning Briefing - Saturday, October 17",
+        scope=BriefingScope.PLANT_WIDE.value,
+        user_id="pregenerated",
+        sections=[_section()] + [_section(area_id) for area_id in DEFAULT_AREA_ORDER],
+        metadata=BriefingResponseMetadata(
+            generated_at=datetime.now(timezone.utc),
+            generation_duration_ms=1200,
+        ),
+    )
+
+
+@pytest.fixture
+def service():
+    service = MorningBriefingService()
+    service.generate_plant_briefing = AsyncMock(return_value=_plant_response())
+    service.generate_area_sections = AsyncMock(
+        return_value=[_section(area_id, content="Summary.") for area_id in DEFAULT_AREA_ORDER]
+    )
+    return service
+
+
+@pytest.fixture
+def store(service):
+    return BriefingStore(service=service, tables=["daily_summaries", "safety_events"])
+
+
+def _supervisor(assets):
+    return CurrentUserWithRole(
+        id="supervisor-123",
+        email="supervisor@example.com",
+        role="authenticated",
+        user_role=UserRole.SUPERVISOR,
+        assigned_asset_ids=assets,
+    )
+
+
+class TestPlantBriefing:
+    """Materialization and fingerprint-driven regeneration."""
+
+    @pytest.mark.asyncio
+    async def test_generated_once_then_served(self, store, service):
+        first = await store.plant_briefing("user-1")
+        second = await store.plant_briefing("user-2", area_order=["roasting", "grinding"])
+
+        service.generate_plant_briefing.assert_called_once()
+        assert first.metadata.cache_hit is False
+        assert second.metadata.cache_hit is True
+        assert second.user_id == "user-2"
+        assert first.id != second.id
+        assert [s.area_id for s in second.sections[:3]] == [None, "roasting", "grinding"]
+        assert len(second.sections) == 8
+        assert second.metadata.generation_duration_ms == 1200
+        assert second.metadata.data_fingerprint == store.fingerprint()
+
+    @pytest.mark.asyncio
+    async def test_served_sections_are_copies(self, store):
+        first = await store.plant_briefing("user-1")
+        first.sections[1].status = BriefingSectionStatus.FAILED
+
+        second = await store.plant_briefing("user-2")
+
+        assert second.sections[1].status == BriefingSectionStatus.COMPLETE
+
+    @pytest.mark.asyncio
+    async def test_fingerprint_change_regenerates(self, store, service):
+        await store.plant_briefing("user-1")
+
+        store.table_versions.on_data_changed(DataChangedEvent(table="live_snapshots", source="live_pulse"))
+        await store.plant_briefing("user-1")
+        assert service.generate_plant_briefing.call_count == 1
+
+        store.table_versions.on_data_changed(DataChangedEvent(table="daily_summaries", source="morning_report"))
+        briefing = await store.plant_briefing("user-1")
+        assert service.generate_plant_briefing.call_count == 2
+        assert briefing.metadata.cache_hit is False
+
+    @pytest.mark.asyncio
+    async def test_live_pulse_polls_do_not_invalidate_by_default(self, service):
+        store = BriefingStore(service=service)
+        await store.plant_briefing("user-1")
+
+        store.table_versions.on_data_changed(DataChangedEvent(table="live_snapshots", source="live_pulse"))
+        briefing = await store.plant_briefing("user-1")
+
+        assert service.generate_plant_briefing.call_count == 1
+        assert briefing.metadata.cache_hit is True
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_generation(self, store, service):
+        async def slow_generation(**kwargs):
+            await asyncio.sleep(0.05)
+            return _plant_response()
+
+        service.generate_plant_briefing = AsyncMock(side_effect=slow_generation)
+
+        briefings = await asyncio.gather(*[store.plant_briefing(f"user-{i}") for i in range(5)])
+
+        service.generate_plant_briefing.assert_called_once()
+        assert len({b.id for b in briefings}) == 5
+        assert store.get_stats()["generations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_error_briefing_not_stored(self, store, service):
+        service.generate_plant_briefing = AsyncMock(
+            return_value=service._create_error_response("b-1", "pregenerated", "db down")
+        )
+
+        briefing = await store.plant_briefing("user-1")
+        await store.plant_briefing("user-1")
+
+        assert briefing.scope == "error"
+        assert briefing.metadata.cache_hit is False
+        assert service.generate_plant_briefing.call_count == 2
+
+
+class TestSupervisorBriefing:
+    """Per-supervisor compositions from stored area sections."""
+
+    @pytest.mark.asyncio
+    async def test_scoped_to_assigned_areas(self, store, service):
+        preferences = UserPreferences(
+            user_id="supervisor-123",
+            area_order=["grinding", "packing"],
+            detail_level="detailed",
+        )
+
+        briefing = await store.supervisor_briefing(_supervisor(["CAMA", "Grinder 1"]), preferences)
+
+        assert briefing.scope == BriefingScope.SUPERVISOR.value
+        assert [s.area_id for s in briefing.sections] == ["grinding", "packing"]
+        assert briefing.title.startswith("Your Area Briefing")
+        service.generate_area_sections.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_summary_level_generated_once(self, store, service):
+        preferences = UserPreferences(user_id="supervisor-123", detail_level="summary")
+
+        first = await store.supervisor_briefing(_supervisor(["Roaster 1"]), preferences)
+        second = await store.supervisor_briefing(_supervisor(["Roaster 2"]), preferences)
+
+        service.generate_area_sections.assert_called_once_with(detail_level="summary")
+        assert first.sections[0].content == "Summary."
+        assert second.metadata.cache_hit is True
+
+    @pytest.mark.asyncio
+    async def test_assignment_change_reflected_immediately(self, store, service):
+        before = await store.supervisor_briefing(_supervisor(["CAMA"]))
+        after = await store.supervisor_briefing(_supervisor(["CAMA", "Roaster 1"]))
+
+        assert [s.area_id for s in before.sections] == ["packing"]
+        assert [s.area_id for s in after.sections] == ["packing", "roasting"]
+        assert after.metadata.cache_hit is True
+
+    @pytest.mark.asyncio
+    async def test_no_assets(self, store, service):
+        briefing = await store.supervisor_briefing(_supervisor([]))
+
+        assert briefing.sections[0].title == "No Assets Assigned"
+        service.generate_plant_briefing.assert_not_called()
+
+
+class TestPregeneration:
+    """Pre-generation ahead of shift start."""
+
+    @pytest.fixture(autouse=True)
+    def singleton(self, service):
+        reset_briefing_store()
+        get_briefing_store()._service = service
+        yield
+        reset_briefing_store()
+
+    @pytest.mark.asyncio
+    async def test_pregenerate_materializes_once_per_fingerprint(self, service):
+        assert await pregenerate_briefings() == {"plant": True, "areas:summary": True}
+        assert await pregenerate_briefings() == {"plant": False, "areas:summary": False}
+
+        briefing = await get_briefing_store().plant_briefing("user-1")
+        assert briefing.metadata.cache_hit is True
+        service.generate_plant_briefing.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_event_bus_changes_fingerprint(self):
+        from app.services.event_bus import get_event_bus
+
+        store = get_briefing_store()
+        before = store.fingerprint()
+        await get_event_bus().publish(DataChangedEvent(table="daily_summaries", source="morning_report"))
+
+        assert store.fingerprint() != before
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, service):
+        with patch("app.services.briefing.store.get_settings") as settings:
+            settings.return_value.briefing_pregenerate_enabled = False
+            assert await pregenerate_briefings() is None
+
+        service.generate_plant_briefing.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_triggered_after_morning_report(self):
+        from app.models.pipeline import PipelineStatus
+        from app.services.pipelines.morning_report import run_morning_report
+
+        pipeline = MagicMock()
+        pipeline.run = AsyncMock(return_value=MagicMock(status=PipelineStatus.SUCCESS))
+        with patch("app.services.pipelines.morning_report.get_pipeline", return_value=pipeline), \
+                patch("app.services.pipelines.morning_report._trigger_smart_summary_generation", new=AsyncMock()), \
+                patch("app.services.briefing.store.pregenerate_briefings", new=AsyncMock()) as pregenerate:
+            await run_morning_report(date(2026, 1, 5))
+            await run_morning_report(date(2026, 1, 5), pregenerate_briefings=False)
+
+        pregenerate.assert_awaited_once()
+
+    def test_morning_endpoint_reports_cache_hit(self, client):
+        first = client.post("/api/v1/briefing/morning", json={"user_id": "user-1"})
+        second = client.post("/api/v1/briefing/morning", json={"user_id": "user-2"})
+
+        assert first.status_code == 200
+        assert first.json()["cache_hit"] is False
+        assert second.json()["cache_hit"] is True
+        assert second.json()["briefing_id"] != first.json()["briefing_id"]
@@ -0,0 +1,299 @@
+"""
+Tests for progressive (SSE) morning briefing delivery.
+
+- Sections stream in delivery order as soon as they are generated
+- LLM rewrites of sent sections arrive as section updates
+- Each section carries its TTS stream URL and pause_point
+- Sections never reported during generation come from the final briefing
+- Generation failures and client disconnects end the stream cleanly
+- The morning briefing service reports sections as they are generated
+"""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.cancellation import CLIENT_DISCONNECT, get_cancellation_stats, reset_cancellation_stats
+from app.models.briefing import (
+    BriefingResponse,
+    BriefingResponseMetadata,
+    BriefingScope,
+    BriefingSection,
+    BriefingSectionStatus,
+)
+from app.services.briefing.morning import AreaBriefingData, MorningBriefingService, PRODUCTION_AREAS
+from app.services.briefing.streaming import BriefingStream, stream_order
+
+AREAS = ["packing", "grinding"]
+
+
+def _section(area_id=None, content="All good."):
+    return BriefingSection(
+        section_type="area" if area_id else "headline",
+        title=area_id or "Morning Briefing Overview",
+        content=content,
+        area_id=area_id,
+        status=BriefingSectionStatus.COMPLETE,
+    )
+
+
+def _briefing(sections):
+    return BriefingResponse(
+        id="briefing-1",
+        title="Morning Briefing",
+        scope=BriefingScope.PLANT_WIDE.value,
+        user_id="user-1",
+        sections=sections,
+        metadata=BriefingResponseMetadata(generated_at=datetime.now(timezone.utc)),
+    )
+
+
+def _tts():
+    tts = MagicMock()
+    tts.generate_stream_url = AsyncMock(
+        side_effect=lambda text: SimpleNamespace(audio_stream_url=f"https://tts/{len(text)}")
+    )
+    return tts
+
+
+def _parse(chunk):
+    event, data = chunk.strip().split("\n")
+    return event.removeprefix("event: "), json.loads(data.removeprefix("data: "))
+
+
+async def _collect(stream, work):
+    return [_parse(chunk) async for chunk in stream.events(work)]
+
+
+class TestBriefingStream:
+    """Ordering, audio URLs and fallbacks."""
+
+    @pytest.mark.asyncio
+    async def test_sections_stream_in_order_before_completion(self):
+        stream = BriefingStream(stream_order(AREAS), tts_service=_tts())
+        finish = asyncio.Event()
+
+        async def work():
+            # Areas complete out of order; generation continues afterwards
+            stream.on_section(_section())
+            stream.on_section(_section("grinding"))
+            await asyncio.sleep(0.01)
+            stream.on_section(_section("packing"))
+            await finish.wait()
+            return _briefing([_section(), _section("packing"), _section("grinding")])
+
+        events = []
+        async for chunk in stream.events(work()):
+            events.append(_parse(chunk))
+            if len(events) == 4:
+                # Every section arrived while generation was still running
+                finish.set()
+
+        names = [name for name, _ in events]
+        assert names == ["briefing.started"] + ["briefing.section"] * 3 + ["briefing.complete"]
+        sections = [data for name, data in events if name == "briefing.section"]
+        assert [s["area_id"] for s in sections] == [None, "packing", "grinding"]
+        assert [s["index"] for s in sections] == [0, 1, 2]
+        assert all(s["audio_stream_url"].startswith("https://tts/") for s in sections)
+        assert all(s["pause_point"] for s in sections)
+        complete = events[-1][1]
+        assert complete["briefing_id"] == "briefing-1"
+        assert complete["time_to_first_audio_ms"] == sections[0]["elapsed_ms"]
+
+    @pytest.mark.asyncio
+    async def test_rewritten_sections_sent_as_updates(self):
+        stream = BriefingStream(stream_order(AREAS), tts_service=_tts())
+        release = asyncio.Event()
+
+        async def work():
+            stream.on_section(_section())
+            stream.on_section(_section("packing", "Template packing."))
+            await release.wait()  # LLM narrative pass
+            stream.on_section(_section("grinding", "Template grinding."))
+            stream.on_section(_section("grinding", "Narrated grinding."))
+            stream.on_section(_section("packing", "Narrated packing."))
+            return _briefing([
+                _section(),
+                _section("packing", "Narrated packing."),
+                _section("grinding", "Narrated grinding."),
+            ])
+
+        events = []
+        async for chunk in stream.events(work()):
+            events.append(_parse(chunk))
+            if len(events) == 3:
+                # Packing went out with its template text before the rewrite
+                release.set()
+
+        names = [name for name, _ in events]
+        assert names == [
+            "briefing.started",
+            "briefing.section", "briefing.section",
+            "briefing.section_update",
+            "briefing.section",
+            "briefing.complete",
+        ]
+        assert events[2][1]["content"] == "Template packing."
+        update = events[3][1]
+        assert (update["index"], update["content"]) == (1, "Narrated packing.")
+        # Grinding had not been sent yet, so it goes out rewritten
+        assert (events[4][1]["area_id"], events[4][1]["content"]) == ("grinding", "Narrated grinding.")
+        assert events[4][1]["index"] == 2
+        assert update["audio_stream_url"] == f"https://tts/{len('packing. Narrated packing.')}"
+
+    @pytest.mark.asyncio
+    async def test_unreported_sections_come_from_final_briefing(self):
+        stream = BriefingStream(stream_order(AREAS), tts_service=_tts())
+
+        async def cached():
+            return _briefing([_section(), _section("packing"), _section("grinding")])
+
+        events = await _collect(stream, cached())
+
+        sections = [data for name, data in events if name == "briefing.section"]
+        assert [s["area_id"] for s in sections] == [None, "packing", "grinding"]
+
+    @pytest.mark.asyncio
+    async def test_without_audio(self):
+        tts = _tts()
+        stream = BriefingStream(stream_order(AREAS), include_audio=False, tts_service=tts)
+
+        async def cached():
+            return _briefing([_section(), _section("packing"), _section("grinding")])
+
+        events = await _collect(stream, cached())
+
+        tts.generate_stream_url.assert_not_called()
+        assert events[-1][1]["time_to_first_audio_ms"] is None
+        assert events[-1][1]["time_to_first_section_ms"] is not None
+
+    @pytest.mark.asyncio
+    async def test_generation_failure(self):
+        stream = BriefingStream(stream_order(AREAS), tts_service=_tts())
+
+        async def failing():
+            stream.on_section(_section())
+            raise RuntimeError("data source down")
+
+        events = await _collect(stream, failing())
+
+        assert [name for name, _ in events] == ["briefing.started", "briefing.section", "briefing.error"]
+        assert "data source down" in events[-1][1]["detail"]
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_generation(self):
+        reset_cancellation_stats()
+        stream = BriefingStream(stream_order(AREAS), tts_service=_tts())
+        cancelled = asyncio.Event()
+
+        async def slow():
+            stream.on_section(_section())
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        events = stream.events(slow())
+        await events.__anext__()  # started
+        await events.__anext__()  # headline
+        await events.aclose()
+        await asyncio.sleep(0)
+
+        assert cancelled.is_set()
+        assert get_cancellation_stats().count("briefing.morning_stream", CLIENT_DISCONNECT) == 1
+
+
+class TestProgressiveGeneration:
+    """MorningBriefingService reports sections as they are generated."""
+
+    @staticmethod
+    def _service():
+        service = MorningBriefingService()
+        service._generate_headline_section = AsyncMock(return_value=_section())
+
+        async def area_data(area_id, assets):
+            area = next(a for a in PRODUCTION_AREAS if a["id"] == area_id)
+            return AreaBriefingData(area_id, area["name"], area["description"], assets)
+
+        service._get_area_data = AsyncMock(side_effect=area_data)
+        return service
+
+    @staticmethod
+    def _settings(mode):
+        return patch(
+            "app.services.briefing.morning.get_settings",
+            return_value=MagicMock(briefing_data_plan_enabled=False, briefing_narrative_mode=mode),
+        )
+
+    @pytest.mark.asyncio
+    async def test_headline_reported_first(self):
+        service = self._service()
+        reported = []
+
+        with self._settings("template"):
+            briefing = await service.generate_plant_briefing("user-1", on_section=reported.append)
+
+        # Headline first, then each area as it completes (sections may be reported again)
+        assert reported[0].section_type == "headline"
+        first_areas = [s.area_id for s in reported[1:1 + len(PRODUCTION_AREAS)]]
+        assert set(first_areas) == {a["id"] for a in PRODUCTION_AREAS}
+        assert len(briefing.sections) == 1 + len(PRODUCTION_AREAS)
+
+    @pytest.mark.asyncio
+    async def test_narrated_areas_reported_again_after_narrative_pass(self):
+        service = self._service()
+        reported = []
+        narratives = AsyncMock(return_value=MagicMock(
+            narratives={"packing": "Packing is on plan."},
+            llm_calls=1, prompt_tokens=10, completion_tokens=5, latency_ms=1.0,
+        ))
+        service._get_narrative_generator = MagicMock(
+            return_value=MagicMock(generate_area_narratives=narratives)
+        )
+
+        with self._settings("batched"):
+            await service.generate_plant_briefing(
+                "user-1", on_section=lambda s: reported.append((s.area_id, s.content))
+            )
+
+        # Every area is reported with its template text before the narrative pass
+        first_areas = reported[1:1 + len(PRODUCTION_AREAS)]
+        assert {area_id for area_id, _ in first_areas} == {a["id"] for a in PRODUCTION_AREAS}
+        assert all(content != "Packing is on plan." for _, content in first_areas)
+        packing = [content for area_id, content in reported if area_id == "packing"]
+        assert packing[-1] == "Packing is on plan."
+
+
+class TestStreamEndpoint:
+    """POST /api/v1/briefing/morning/stream."""
+
+    def test_streams_sections(self, client):
+        service = MorningBriefingService()
+
+        async def generate(user_id, area_order=None, include_audio=True, on_section=None):
+            sections = [_section()] + [_section(a["id"]) for a in service.order_areas(area_order)]
+            for section in sections:
+                on_section(section)
+            return _briefing(sections)
+
+        service.generate_plant_briefing = AsyncMock(side_effect=generate)
+        with patch("app.api.briefing.get_morning_briefing_service", return_value=service), \
+                patch("app.api.briefing.get_settings",
+                      return_value=MagicMock(briefing_pregenerate_enabled=False)), \
+                patch("app.services.voice.get_tts_service", return_value=_tts()):
+            response = client.post(
+                "/api/v1/briefing/morning/stream",
+                json={"user_id": "user-1", "area_order": ["grinding", "packing"]},
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [_parse(chunk) for chunk in response.text.split("\n\n") if chunk.strip()]
+        sections = [data for name, data in events if name == "briefing.section"]
+        assert [s["area_id"] for s in sections[:3]] == [None, "grinding", "packing"]
+        assert events[-1][0] == "briefing.complete"
@@ -7,7 +7,7 @@ AC#7: Cache Statistics Endpoint
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 class TestCacheStatsEndpoint:
@@ -88,7 +88,7 @@ class TestCacheInvalidateEndpoint:
         """AC#4: Can invalidate by tier (admin only)."""
         with patch("app.api.cache.get_tool_cache") as mock_get_cache:
             mock_cache = MagicMock()
-            mock_cache.invalidate.return_value = 10
+            mock_cache.ainvalidate = AsyncMock(return_value=10)
             mock_get_cache.return_value = mock_cache
 
             response = client.post(
@@ -105,7 +105,7 @@ class TestCacheInvalidateEndpoint:
         """AC#4: Can invalidate by tool name (admin only)."""
         with patch("app.api.cache.get_tool_cache") as mock_get_cache:
             mock_cache = MagicMock()
-            mock_cache.invalidate.return_value = 5
+            mock_cache.ainvalidate = AsyncMock(return_value=5)
             mock_get_cache.return_value = mock_cache
 
             response = client.post(
@@ -122,7 +122,7 @@ class TestCacheInvalidateEndpoint:
         """AC#4: Can invalidate by pattern (admin only)."""
         with patch("app.api.cache.get_tool_cache") as mock_get_cache:
             mock_cache = MagicMock()
-            mock_cache.invalidate.return_value = 3
+            mock_cache.ainvalidate = AsyncMock(return_value=3)
             mock_get_cache.return_value = mock_cache
 
             response = client.post(
@@ -179,7 +179,7 @@ class TestCacheClearEndpoint:
         """Can clear all cache entries (admin only)."""
         with patch("app.api.cache.get_tool_cache") as mock_get_cache:
             mock_cache = MagicMock()
-            mock_cache.invalidate_all.return_value = 25
+            mock_cache.ainvalidate_all = AsyncMock(return_value=25)
             mock_get_cache.return_value = mock_cache
 
             response = client.post(
@@ -228,3 +228,45 @@ class TestAgentChatForceRefresh:
 
         # Should succeed (not fail due to unrecognized field)
         assert response.status_code == 200
+
+
+class TestCacheStatsBreakdown:
+    """Tests for the per-tool analytics breakdown."""
+
+    def test_breakdown_query_param(self, client, mock_verify_jwt_admin):
+        """breakdown=true returns per-tool and per-tier analytics."""
+        from app.services.agent.cache import ToolCacheService
+
+        cache = ToolCacheService()
+        cache.set(
+            "oee_query:global:a", "daily",
+            {"success": True, "data": {"oee": 80}, "citations": [], "metadata": {}},
+            compute_ms=200.0,
+        )
+        cache.get("oee_query:global:a", "daily")
+
+        with patch("app.api.cache.get_tool_cache", return_value=cache):
+            response = client.get(
+                "/api/cache/stats?breakdown=true",
+                headers={"Authorization": "Bearer valid-token"},
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["latency_saved_ms"] == 200.0
+        assert data["by_tool"]["oee_query"]["hits"] == 1
+        assert data["by_tool"]["oee_query"]["bytes_stored"] > 0
+        assert "daily" in data["by_tier"]
+
+    def test_breakdown_omitted_by_default(self, client, mock_verify_jwt_admin):
+        """Without breakdown the per-tool fields are null."""
+        from app.services.agent.cache import ToolCacheService
+
+        with patch("app.api.cache.get_tool_cache", return_value=ToolCacheService()):
+            response = client.get(
+                "/api/cache/stats",
+                headers={"Authorization": "Bearer valid-token"},
+            )
+
+        assert response.status_code == 200
+        assert response.json()["by_tool"] is None
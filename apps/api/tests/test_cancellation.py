@@ -0,0 +1,152 @@
+"""
+Tests for cooperative cancellation.
+
+- Endpoint work is cancelled when the client disconnects (499)
+- Completed work is returned untouched
+- Text-to-SQL statements carry a server-side statement_timeout
+- Deadlines that abandon work are counted per operation
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.core.cancellation import (
+    CLIENT_CLOSED_REQUEST,
+    CLIENT_DISCONNECT,
+    DEADLINE,
+    get_cancellation_stats,
+    reset_cancellation_stats,
+    run_while_connected,
+    sql_statement_timeout_engine_args,
+)
+
+
+@pytest.fixture(autouse=True)
+def stats():
+    reset_cancellation_stats()
+    yield get_cancellation_stats()
+    reset_cancellation_stats()
+
+
+def _request(disconnect_after=None):
+    """Request whose client disconnects after the given delay (or never)."""
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        if disconnect_after is None:
+            await asyncio.Event().wait()
+        await asyncio.sleep(disconnect_after)
+        return {"type": "http.disconnect"}
+
+    return Request({"type": "http", "method": "POST", "path": "/", "headers": []}, receive)
+
+
+class TestRunWhileConnected:
+    """Disconnect detection for endpoint work."""
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_work(self, stats):
+        cancelled = asyncio.Event()
+
+        async def work():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(HTTPException) as exc_info:
+            await run_while_connected(_request(disconnect_after=0.01), work(), "agent.chat")
+
+        assert exc_info.value.status_code == CLIENT_CLOSED_REQUEST
+        assert cancelled.is_set()
+        assert stats.count("agent.chat", CLIENT_DISCONNECT) == 1
+
+    @pytest.mark.asyncio
+    async def test_completed_work_returned(self, stats):
+        async def work():
+            await asyncio.sleep(0.01)
+            return "answer"
+
+        result = await run_while_connected(_request(), work(), "agent.chat")
+
+        assert result == "answer"
+        assert stats.get_stats()["total"][CLIENT_DISCONNECT] == 0
+
+    @pytest.mark.asyncio
+    async def test_work_errors_propagate(self):
+        async def work():
+            raise HTTPException(status_code=503, detail="busy")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await run_while_connected(_request(), work(), "agent.chat")
+
+        assert exc_info.value.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, stats):
+        async def work():
+            await asyncio.sleep(0.05)
+            return "answer"
+
+        with patch("app.core.cancellation.get_settings") as settings:
+            settings.return_value.cancel_on_disconnect = False
+            result = await run_while_connected(_request(disconnect_after=0), work(), "agent.chat")
+
+        assert result == "answer"
+        assert stats.count("agent.chat", CLIENT_DISCONNECT) == 0
+
+
+class TestSQLDeadlines:
+    """Server-side statement timeout and deadline counters."""
+
+    def test_statement_timeout_for_postgres(self):
+        args = sql_statement_timeout_engine_args("postgresql://u:p@db:5432/postgres", 30)
+
+        assert args == {"connect_args": {"options": "-c statement_timeout=30000"}}
+        assert sql_statement_timeout_engine_args("sqlite:///local.db", 30) == {}
+
+    def test_engine_created_with_statement_timeout(self):
+        from app.services.ai.text_to_sql.service import TextToSQLService
+
+        settings = MagicMock(supabase_db_url="postgresql://u:p@db/postgres", openai_api_key="k")
+        with patch("app.services.ai.text_to_sql.service.SQLDatabase") as sql_database, \
+                patch("app.services.ai.text_to_sql.service.ChatOpenAI"):
+            service = TextToSQLService(query_timeout=5)
+            service._settings = settings
+            assert service.initialize()
+
+        engine_args = sql_database.from_uri.call_args.kwargs["engine_args"]
+        assert engine_args["connect_args"]["options"] == "-c statement_timeout=5000"
+
+    @pytest.mark.asyncio
+    async def test_server_timeout_counted(self, stats):
+        from app.services.ai.text_to_sql.service import QueryTimeoutError, TextToSQLService
+
+        service = TextToSQLService(query_timeout=5)
+        service._db = MagicMock()
+        service._db.run.side_effect = Exception("canceling statement due to statement timeout")
+
+        with pytest.raises(QueryTimeoutError):
+            await service._execute_query("SELECT 1")
+
+        assert stats.count("text_to_sql.execute", DEADLINE) == 1
+
+    @pytest.mark.asyncio
+    async def test_briefing_tool_timeout_counted(self, stats):
+        from app.services.briefing.service import BriefingService
+
+        async def slow_tool():
+            await asyncio.sleep(1)
+
+        with patch("app.services.briefing.service.PER_TOOL_TIMEOUT_SECONDS", 0.01):
+            result = await BriefingService()._run_tool_with_timeout("oee_data", slow_tool)
+
+        assert not result.success
+        assert stats.count("briefing.tool.oee_data", DEADLINE) == 1
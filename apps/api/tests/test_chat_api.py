@@ -259,9 +259,9 @@ class TestRateLimiting:
             service_instance.is_configured.return_value = True
             mock_service.return_value = service_instance
 
-            # Clear rate limit store
-            from app.api.chat import _rate_limit_store
-            _rate_limit_store.clear()
+            # Clear rate limit state
+            from app.core.rate_limit import get_rate_limiter
+            get_rate_limiter().reset()
 
             # Make requests up to limit
             for i in range(10):
@@ -297,15 +297,17 @@ class TestRateLimiting:
             service_instance.is_configured.return_value = True
             mock_service.return_value = service_instance
 
-            # Clear rate limit store and add old timestamps
-            from app.api.chat import _rate_limit_store, _get_rate_limit_config
-            _rate_limit_store.clear()
+            # Clear rate limit state and exhaust the limit in the past
+            from app.core.rate_limit import ENDPOINT_CLASSES, get_rate_limiter
+            limiter = get_rate_limiter()
+            limiter.reset()
 
             # Add old requests (older than window)
-            _, rate_limit_window = _get_rate_limit_config()
+            rate = limiter.rate_for(ENDPOINT_CLASSES[1])
             user_id = "123e4567-e89b-12d3-a456-426614174000"
-            old_time = time.time() - rate_limit_window - 10
-            _rate_limit_store[user_id] = [old_time] * 10
+            old_time = time.time() - rate.window - 10
+            for _ in range(rate.limit):
+                limiter.hit(f"chat:user:{user_id}", rate, now=old_time)
 
             # Should be able to make new request
             response = client.post(
@@ -338,8 +340,8 @@ class TestResponseFormat:
             mock_service.return_value = service_instance
 
             # Clear rate limit
-            from app.api.chat import _rate_limit_store
-            _rate_limit_store.clear()
+            from app.core.rate_limit import get_rate_limiter
+            get_rate_limiter().reset()
 
             response = client.post(
                 "/api/chat/query",
@@ -392,8 +394,8 @@ class TestResponseFormat:
             service_instance.is_configured.return_value = True
             mock_service.return_value = service_instance
 
-            from app.api.chat import _rate_limit_store
-            _rate_limit_store.clear()
+            from app.core.rate_limit import get_rate_limiter
+            get_rate_limiter().reset()
 
             response = client.post(
                 "/api/chat/query",
@@ -456,8 +458,8 @@ class TestAgentChatIntegration:
                 mock_memory.add_memory = AsyncMock(return_value={"id": "mem-123"})
 
                 # Clear rate limit
-                from app.api.chat import _rate_limit_store
-                _rate_limit_store.clear()
+                from app.core.rate_limit import get_rate_limiter
+                get_rate_limiter().reset()
 
                 response = client.post(
                     "/api/chat/query",
@@ -501,8 +503,8 @@ class TestAgentChatIntegration:
                 mock_memory.get_context_for_query = AsyncMock(return_value=[])
                 mock_memory.add_memory = AsyncMock(return_value={})
 
-                from app.api.chat import _rate_limit_store
-                _rate_limit_store.clear()
+                from app.core.rate_limit import get_rate_limiter
+                get_rate_limiter().reset()
 
                 response = client.post(
                     "/api/chat/query",
@@ -542,8 +544,8 @@ class TestAgentChatIntegration:
                 mock_memory.get_context_for_query = AsyncMock(return_value=[])
                 mock_memory.add_memory = AsyncMock(return_value={"id": "mem-456"})
 
-                from app.api.chat import _rate_limit_store
-                _rate_limit_store.clear()
+                from app.core.rate_limit import get_rate_limiter
+                get_rate_limiter().reset()
 
                 response = client.post(
                     "/api/chat/query",
@@ -589,8 +591,8 @@ class TestAgentChatIntegration:
                 service_instance.is_configured.return_value = True
                 mock_service.return_value = service_instance
 
-                from app.api.chat import _rate_limit_store
-                _rate_limit_store.clear()
+                from app.core.rate_limit import get_rate_limiter
+                get_rate_limiter().reset()
 
                 response = client.post(
                     "/api/chat/query",
@@ -619,8 +621,8 @@ class TestAgentChatIntegration:
 
                 mock_memory.get_context_for_query = AsyncMock(return_value=[])
 
-                from app.api.chat import _rate_limit_store
-                _rate_limit_store.clear()
+                from app.core.rate_limit import get_rate_limiter
+                get_rate_limiter().reset()
 
                 response = client.post(
                     "/api/chat/query",
@@ -656,8 +658,8 @@ class TestAgentChatIntegration:
                 service_instance.is_configured.return_value = True
                 mock_service.return_value = service_instance
 
-                from app.api.chat import _rate_limit_store
-                _rate_limit_store.clear()
+                from app.core.rate_limit import get_rate_limiter
+                get_rate_limiter().reset()
 
                 response = client.post(
                     "/api/chat/query?use_agent=false",
@@ -698,8 +700,8 @@ class TestAgentChatIntegration:
                 mock_memory.get_context_for_query = AsyncMock(return_value=[])
                 mock_memory.add_memory = AsyncMock(return_value={})
 
-                from app.api.chat import _rate_limit_store
-                _rate_limit_store.clear()
+                from app.core.rate_limit import get_rate_limiter
+                get_rate_limiter().reset()
 
                 response = client.post(
                     "/api/chat/query",
@@ -743,8 +745,8 @@ class TestAgentChatIntegration:
                 mock_memory.get_context_for_query = AsyncMock(return_value=memory_context)
                 mock_memory.add_memory = AsyncMock(return_value={})
 
-                from app.api.chat import _rate_limit_store
-                _rate_limit_store.clear()
+                from app.core.rate_limit import get_rate_limiter
+                get_rate_limiter().reset()
 
                 response = client.post(
                     "/api/chat/query",
@@ -178,8 +178,8 @@ class TestChatQueryWithCitations:
             mock_service.return_value = service_instance
 
             # Clear rate limit
-            from app.api.chat import _rate_limit_store
-            _rate_limit_store.clear()
+            from app.core.rate_limit import get_rate_limiter
+            get_rate_limiter().reset()
 
             response = client.post(
                 "/api/chat/query",
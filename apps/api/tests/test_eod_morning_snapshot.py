@@ -0,0 +1,259 @@
+"""
+Tests for morning briefing snapshots reused by the End of Day summary.
+
+- Morning briefings store their plant-wide tool results and concerns,
+  keyed by plant date with the morning cutoff in plant time
+- Concerns are derived from structured data, not narrative text
+- EOD re-queries live tools and tools whose tables changed since morning
+- Without a snapshot, EOD queries every tool as before
+"""
+
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.models.briefing import (
+    BriefingData,
+    BriefingResponse,
+    BriefingResponseMetadata,
+    BriefingScope,
+    BriefingSection,
+    BriefingSectionStatus,
+    ToolResultData,
+)
+from app.services.briefing.eod import EODService
+from app.services.briefing.morning import PRODUCTION_AREAS, AreaBriefingData, MorningBriefingService
+from app.services.briefing.morning_snapshot import (
+    LIVE_TOOLS,
+    MorningSnapshotStore,
+    derive_concerns,
+    get_morning_snapshot_store,
+    record_tool_results,
+    reset_morning_snapshot_store,
+)
+from app.services.event_bus import DataChangedEvent
+
+# 06:45 at the plant (America/Chicago, the default PIPELINE_TIMEZONE)
+MORNING = datetime(2026, 10, 17, 11, 45, tzinfo=timezone.utc)
+
+
+def _tool(name, data, success=True):
+    return ToolResultData(tool_name=name, success=success, data=data if success else None)
+
+
+def _morning_data(**overrides):
+    data = BriefingData(
+        production_status=_tool("production_status", {
+            "summary": {"total_variance_percent": -4.0, "ahead_count": 1, "behind_count": 1},
+            "assets": [
+                {"asset_name": "Grinder 2", "area": "Grinding", "status": "behind", "variance_percent": -15.0},
+                {"asset_name": "Roaster 1", "area": "Roasting", "status": "ahead", "variance_percent": 6.0},
+            ],
+        }),
+        safety_events=_tool("safety_events", {
+            "total_events": 1,
+            "events": [{"asset_name": "Packer 3", "area": "Packing", "severity": "high",
+                        "description": "Guard open"}],
+        }),
+        oee_data=_tool("oee_data", {"oee_percentage": 78.0}),
+        downtime_analysis=_tool("downtime_analysis", {
+            "total_downtime_minutes": 70,
+            "top_reasons": [{"reason": "Jam", "duration_minutes": 45},
+                            {"reason": "Changeover", "duration_minutes": 25}],
+        }),
+        action_list=_tool("action_list", {"actions": []}),
+    )
+    for name, result in overrides.items():
+        setattr(data, name, result)
+    return data
+
+
+def _briefing(generated_at=MORNING):
+    return BriefingResponse(
+        id="morning-1",
+        title="Morning Briefing",
+        scope=BriefingScope.PLANT_WIDE.value,
+        user_id="user-1",
+        sections=[BriefingSection(section_type="headline", title="Overview", content="Good morning.",
+                                  status=BriefingSectionStatus.COMPLETE)],
+        metadata=BriefingResponseMetadata(generated_at=generated_at),
+    )
+
+
+@pytest.fixture(autouse=True)
+def snapshot_store():
+    reset_morning_snapshot_store()
+    yield get_morning_snapshot_store()
+    reset_morning_snapshot_store()
+
+
+class TestSnapshot:
+    """Structured concerns and staleness."""
+
+    def test_concerns_from_structured_data(self):
+        concerns = derive_concerns(_morning_data())
+
+        by_type = {c.issue_type: c for c in concerns}
+        assert set(by_type) == {"production", "safety", "downtime"}
+        assert by_type["production"].asset_name == "Grinder 2"
+        assert by_type["production"].area == "Grinding"
+        assert by_type["production"].severity == "high"
+        assert by_type["safety"].area == "Packing"
+        assert by_type["safety"].severity == "high"
+        # Only reasons above the downtime threshold
+        assert "Jam" in by_type["downtime"].description
+        assert len(concerns) == 3
+
+    def test_afternoon_briefings_are_not_snapshots(self):
+        store = MorningSnapshotStore()
+
+        # 14:00 at the plant
+        assert store.record_briefing(_briefing(MORNING.replace(hour=19)), _morning_data()) is None
+        assert store.get(MORNING.date()) is None
+
+    def test_morning_cutoff_uses_plant_time(self):
+        store = MorningSnapshotStore()
+        # 06:30 America/Chicago in January is 12:30 UTC
+        january = datetime(2026, 1, 15, 12, 30, tzinfo=timezone.utc)
+
+        assert store.record_briefing(_briefing(january), _morning_data()) is not None
+        assert store.get(date(2026, 1, 15)) is not None
+
+    def test_snapshot_keyed_by_plant_date(self):
+        store = MorningSnapshotStore()
+        # 07:00 in Tokyo is 22:00 UTC the day before
+        generated_at = datetime(2026, 10, 16, 22, 0, tzinfo=timezone.utc)
+
+        with patch("app.services.briefing.morning_snapshot.get_settings",
+                   return_value=MagicMock(pipeline_timezone="Asia/Tokyo")):
+            store.record_briefing(_briefing(generated_at), _morning_data())
+
+        assert store.get(date(2026, 10, 17)) is not None
+        assert store.get(date(2026, 10, 16)) is None
+
+    def test_only_live_tools_stale_without_changes(self):
+        store = MorningSnapshotStore()
+        snapshot = store.record_briefing(_briefing(), _morning_data())
+
+        assert store.stale_tools(snapshot) == set(LIVE_TOOLS)
+
+    def test_changed_tables_make_dependent_tools_stale(self):
+        store = MorningSnapshotStore()
+        store.table_versions.on_data_changed(DataChangedEvent(table="live_snapshots", source="live_pulse"))
+        snapshot = store.record_briefing(_briefing(), _morning_data())
+
+        store.table_versions.on_data_changed(DataChangedEvent(table="daily_summaries", source="morning_report"))
+
+        assert store.stale_tools(snapshot) == set(LIVE_TOOLS) | {"oee_data", "downtime_analysis", "action_list"}
+
+    def test_failed_morning_tool_is_requeried(self):
+        store = MorningSnapshotStore()
+        snapshot = store.record_briefing(
+            _briefing(), _morning_data(oee_data=_tool("oee_data", None, success=False))
+        )
+
+        assert "oee_data" in store.stale_tools(snapshot)
+
+
+class TestEODReuse:
+    """EOD loads the snapshot and queries only what changed."""
+
+    @staticmethod
+    def _service():
+        service = EODService()
+        for name in ("production_status", "oee_data", "safety_events", "downtime_analysis", "action_list"):
+            setattr(service, f"_get_{name}", AsyncMock(return_value=_tool(name, {"fresh": True})))
+        return service
+
+    @staticmethod
+    def _called(service):
+        return {
+            name for name in ("production_status", "oee_data", "safety_events", "downtime_analysis", "action_list")
+            if getattr(service, f"_get_{name}").await_count
+        }
+
+    @pytest.mark.asyncio
+    async def test_unchanged_results_reused(self, snapshot_store):
+        snapshot = snapshot_store.record_briefing(_briefing(), _morning_data())
+        service = self._service()
+
+        data = await service._orchestrate_eod_tools(MORNING, MORNING, snapshot)
+
+        assert self._called(service) == set(LIVE_TOOLS)
+        assert data.oee_data.data == {"oee_percentage": 78.0}
+        assert data.production_status.data == {"fresh": True}
+
+    @pytest.mark.asyncio
+    async def test_without_snapshot_queries_everything(self):
+        service = self._service()
+
+        await service._orchestrate_eod_tools(MORNING, MORNING)
+
+        assert len(self._called(service)) == 5
+
+    @pytest.mark.asyncio
+    async def test_find_morning_briefing_uses_snapshot(self, snapshot_store):
+        snapshot_store.record_briefing(_briefing(), _morning_data())
+        service = EODService()
+
+        with patch("app.services.briefing.eod.get_settings",
+                   return_value=MagicMock(eod_reuse_morning_snapshot=True)):
+            record = await service._find_morning_briefing(MORNING.date())
+
+        assert record.id == "morning-1"
+        assert record.snapshot is not None
+        with patch.object(service, "_infer_issue_type", side_effect=AssertionError("text parsed")):
+            concerns = service._extract_structured_concerns(record)
+        assert {c.issue_type for c in concerns} == {"production", "safety", "downtime"}
+
+    @pytest.mark.asyncio
+    async def test_comparison_on_snapshot(self, snapshot_store):
+        snapshot_store.record_briefing(_briefing(), _morning_data())
+        service = self._service()
+        # The Grinder 2 shortfall persisted through the day
+        service._get_production_status = AsyncMock(return_value=_morning_data().production_status)
+
+        with patch("app.services.briefing.eod.get_settings",
+                   return_value=MagicMock(eod_reuse_morning_snapshot=True)):
+            result = await service.compare_to_morning_briefing("user-1", MORNING.date())
+
+        assert result.has_morning_briefing is True
+        assert result.morning_briefing_id == "morning-1"
+        production = next(c for c in result.comparisons if c.issue_type == "production")
+        assert production.asset_name == "Grinder 2"
+        assert self._called(service) == set(LIVE_TOOLS)
+
+
+class TestMorningCapture:
+    """generate_plant_briefing stores the headline's tool results."""
+
+    @pytest.mark.asyncio
+    async def test_plant_briefing_records_snapshot(self, snapshot_store):
+        briefing_service = MagicMock()
+
+        async def generate_briefing(user_id, scope):
+            record_tool_results(_morning_data())
+            return _briefing()
+
+        briefing_service.generate_briefing = AsyncMock(side_effect=generate_briefing)
+        service = MorningBriefingService(briefing_service=briefing_service)
+
+        async def area_data(area_id, assets):
+            area = next(a for a in PRODUCTION_AREAS if a["id"] == area_id)
+            return AreaBriefingData(area_id, area["name"], area["description"], assets)
+
+        service._get_area_data = AsyncMock(side_effect=area_data)
+
+        with patch("app.services.briefing.morning._utcnow", return_value=MORNING), \
+                patch("app.services.briefing.morning.get_settings", return_value=MagicMock(
+                    briefing_data_plan_enabled=False,
+                    briefing_narrative_mode="template",
+                    eod_reuse_morning_snapshot=True,
+                )):
+            briefing = await service.generate_plant_briefing("user-1")
+
+        snapshot = snapshot_store.get(date(2026, 10, 17))
+        assert snapshot.briefing_id == briefing.id
+        assert snapshot.tool_results.oee_data.data == {"oee_percentage": 78.0}
+        assert len(snapshot.concerns) == 3
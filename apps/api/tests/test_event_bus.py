@@ -0,0 +1,122 @@
+"""
+Tests for the in-process data change event bus.
+"""
+
+import pytest
+
+from app.services.event_bus import (
+    DataChangedEvent,
+    EventBus,
+    TableVersions,
+    get_event_bus,
+    reset_event_bus,
+)
+
+
+class TestEventBus:
+    """Tests for subscribe/publish dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_publish_to_table_and_wildcard_handlers(self):
+        """Handlers for the table and '*' both receive the event."""
+        bus = EventBus()
+        received = []
+        bus.subscribe("daily_summaries", lambda e: received.append(("table", e.table)))
+        bus.subscribe("*", lambda e: received.append(("all", e.table)))
+        bus.subscribe("live_snapshots", lambda e: received.append(("other", e.table)))
+
+        delivered = await bus.publish(DataChangedEvent(table="daily_summaries", source="test"))
+
+        assert delivered == 2
+        assert received == [("table", "daily_summaries"), ("all", "daily_summaries")]
+
+    @pytest.mark.asyncio
+    async def test_async_handlers_awaited(self):
+        """Coroutine handlers are awaited."""
+        bus = EventBus()
+        received = []
+
+        async def handler(event):
+            received.append(event.source)
+
+        bus.subscribe("live_snapshots", handler)
+        await bus.publish(DataChangedEvent(table="live_snapshots", source="live_pulse"))
+
+        assert received == ["live_pulse"]
+
+    @pytest.mark.asyncio
+    async def test_handler_failure_isolated(self):
+        """A failing handler does not stop other handlers or raise to the publisher."""
+        bus = EventBus()
+        received = []
+
+        def failing(event):
+            raise RuntimeError("boom")
+
+        bus.subscribe("*", failing)
+        bus.subscribe("*", lambda e: received.append(e.table))
+
+        delivered = await bus.publish(DataChangedEvent(table="safety_events", source="test"))
+
+        assert delivered == 1
+        assert received == ["safety_events"]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_subscribe_and_unsubscribe(self):
+        """Subscribing twice registers once; unsubscribe removes the handler."""
+        bus = EventBus()
+        received = []
+        handler = lambda e: received.append(e.table)  # noqa: E731
+
+        bus.subscribe("*", handler)
+        bus.subscribe("*", handler)
+        await bus.publish(DataChangedEvent(table="t", source="test"))
+        bus.unsubscribe("*", handler)
+        await bus.publish(DataChangedEvent(table="t", source="test"))
+
+        assert received == ["t"]
+
+    def test_singleton(self):
+        """get_event_bus returns one instance until reset."""
+        reset_event_bus()
+        bus = get_event_bus()
+        assert get_event_bus() is bus
+        reset_event_bus()
+        assert get_event_bus() is not bus
+
+
+class TestTableVersions:
+    """Tests for per-table version tracking."""
+
+    def test_changed_since_snapshot(self):
+        """Tables written after a snapshot are reported, with the tools reading them."""
+        versions = TableVersions()
+        versions.on_data_changed(DataChangedEvent(table="live_snapshots", source="test"))
+        stamp = versions.snapshot()
+
+        versions.on_data_changed(DataChangedEvent(table="daily_summaries", source="test"))
+
+        assert versions.changed_since(stamp) == {"daily_summaries"}
+        assert versions.changed_tools(stamp, ["production_status", "downtime_analysis", "oee_data"]) == {
+            "downtime_analysis", "oee_data",
+        }
+
+    def test_tracked_tables_only(self):
+        """With a table list, other tables are ignored and the stamp keeps list order."""
+        versions = TableVersions(["safety_events", "daily_summaries"])
+        versions.on_data_changed(DataChangedEvent(table="live_snapshots", source="test"))
+        versions.on_data_changed(DataChangedEvent(table="daily_summaries", source="test"))
+
+        assert versions.stamp() == "safety_events=0,daily_summaries=1"
+
+    @pytest.mark.asyncio
+    async def test_subscribe_and_unsubscribe(self):
+        """Subscribed trackers follow the event bus until unsubscribed."""
+        reset_event_bus()
+        versions = TableVersions().subscribe()
+        await get_event_bus().publish(DataChangedEvent(table="safety_events", source="test"))
+        versions.unsubscribe()
+        await get_event_bus().publish(DataChangedEvent(table="safety_events", source="test"))
+        reset_event_bus()
+
+        assert versions.snapshot() == {"safety_events": 1}
@@ -119,7 +119,7 @@ class TestClaimExtraction:
 
             # Mock the LLM call
             grounding_service._llm = MagicMock()
-            grounding_service._llm.invoke = MagicMock(return_value=MagicMock(content="[]"))
+            grounding_service._llm.ainvoke = AsyncMock(return_value=MagicMock(content="[]"))
             grounding_service._initialized = True
 
             claims = await grounding_service.extract_claims(response)
@@ -152,7 +152,7 @@ class TestClaimExtraction:
             ]
 
             grounding_service._llm = MagicMock()
-            grounding_service._llm.invoke = MagicMock(return_value=MagicMock(content="[]"))
+            grounding_service._llm.ainvoke = AsyncMock(return_value=MagicMock(content="[]"))
             grounding_service._initialized = True
 
             claims = await grounding_service.extract_claims(response)
@@ -176,7 +176,7 @@ class TestClaimExtraction:
             ]
 
             grounding_service._llm = MagicMock()
-            grounding_service._llm.invoke = MagicMock(return_value=MagicMock(content="[]"))
+            grounding_service._llm.ainvoke = AsyncMock(return_value=MagicMock(content="[]"))
             grounding_service._initialized = True
 
             claims = await grounding_service.extract_claims(response)
@@ -191,7 +191,7 @@ class TestClaimExtraction:
             mock_extract.return_value = []
 
             grounding_service._llm = MagicMock()
-            grounding_service._llm.invoke = MagicMock(return_value=MagicMock(content="[]"))
+            grounding_service._llm.ainvoke = AsyncMock(return_value=MagicMock(content="[]"))
             grounding_service._initialized = True
 
             claims = await grounding_service.extract_claims("")
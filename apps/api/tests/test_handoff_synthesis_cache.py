@@ -0,0 +1,166 @@
+"""
+Tests for cached handoff shift synthesis (Story 9.2).
+
+- Repeated syntheses of a shift reuse tool results and sections
+- Data changes re-run only the tools reading the changed table and
+  regenerate only the sections reading those tools
+- Failed and expired tool results are re-run
+- Cache entries are per shift and supervisor scope
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.models.handoff import HandoffToolResultData, ShiftTimeRange, ShiftType
+from app.services.briefing.handoff import HandoffSynthesisService
+from app.services.briefing.handoff_cache import HandoffSynthesisCache, sections_for_tools
+from app.services.event_bus import DataChangedEvent
+
+TOOLS = ("production_status", "downtime_analysis", "safety_events", "alert_check")
+
+SHIFT = ShiftTimeRange(
+    shift_type=ShiftType.MORNING,
+    start_time=datetime(2026, 10, 17, 6, tzinfo=timezone.utc),
+    end_time=datetime(2026, 10, 17, 14, tzinfo=timezone.utc),
+    shift_date=date(2026, 10, 17),
+)
+
+
+def _tool(name, success=True, **data):
+    return HandoffToolResultData(
+        tool_name=name,
+        success=success,
+        data=data if success else None,
+        error_message=None if success else "unavailable",
+    )
+
+
+def _service(cache):
+    service = HandoffSynthesisService(cache=cache)
+    service._get_production_status = AsyncMock(return_value=_tool(
+        "production_status", summary={"total_variance_percent": -3.0, "total_output": 900, "total_target": 1000}
+    ))
+    service._get_downtime_analysis = AsyncMock(return_value=_tool("downtime_analysis", no_downtime=True))
+    service._get_safety_events = AsyncMock(return_value=_tool("safety_events", total_count=0))
+    service._get_alert_check = AsyncMock(return_value=_tool("alert_check", total_count=0))
+    return service
+
+
+def _calls(service):
+    return {name for name in TOOLS if getattr(service, f"_get_{name}").await_count}
+
+
+def _reset_calls(service):
+    for name in TOOLS:
+        getattr(service, f"_get_{name}").reset_mock()
+
+
+async def _synthesize(service, assets=None):
+    with patch("app.services.briefing.handoff.get_shift_time_range", return_value=SHIFT):
+        return await service.synthesize_shift_data(user_id="user-1", supervisor_assignments=assets)
+
+
+@pytest.fixture
+def cache():
+    return HandoffSynthesisCache(ttl_seconds=600)
+
+
+class TestHandoffSynthesisCache:
+    """Reuse and selective recomputation."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_reuses_everything(self, cache):
+        service = _service(cache)
+        first = await _synthesize(service)
+        _reset_calls(service)
+
+        second = await _synthesize(service)
+
+        assert _calls(service) == set()
+        assert [s.content for s in second.sections] == [s.content for s in first.sections]
+        assert second.metadata.reused_sections == ["overview", "issues", "concerns", "focus"]
+        assert second.id != first.id
+
+    @pytest.mark.asyncio
+    async def test_data_change_reruns_dependent_tools_only(self, cache):
+        service = _service(cache)
+        await _synthesize(service)
+        _reset_calls(service)
+        service._get_downtime_analysis.return_value = _tool(
+            "downtime_analysis", total_downtime_minutes=90, total_hours=1.5,
+            reasons=[{"reason_code": "Jam", "total_minutes": 90}],
+        )
+
+        cache.table_versions.on_data_changed(DataChangedEvent(table="daily_summaries", source="morning_report"))
+        result = await _synthesize(service)
+
+        assert _calls(service) == {"downtime_analysis"}
+        assert result.metadata.reused_sections == ["overview", "concerns"]
+        issues = next(s for s in result.sections if s.section_type == "issues")
+        assert "Jam" in issues.content
+        assert "daily_summaries=1" in result.metadata.data_version
+
+    @pytest.mark.asyncio
+    async def test_live_pulse_poll_reruns_live_tools(self, cache):
+        service = _service(cache)
+        await _synthesize(service)
+        _reset_calls(service)
+
+        cache.table_versions.on_data_changed(DataChangedEvent(table="live_snapshots", source="live_pulse"))
+        await _synthesize(service)
+
+        assert _calls(service) == {"production_status", "alert_check"}
+
+    @pytest.mark.asyncio
+    async def test_failed_tool_is_rerun(self, cache):
+        service = _service(cache)
+        service._get_safety_events.return_value = _tool("safety_events", success=False)
+        await _synthesize(service)
+        _reset_calls(service)
+
+        await _synthesize(service)
+
+        assert _calls(service) == {"safety_events"}
+
+    @pytest.mark.asyncio
+    async def test_expired_results_are_rerun(self, cache):
+        service = _service(cache)
+        await _synthesize(service)
+        _reset_calls(service)
+
+        later = datetime.now(timezone.utc) + timedelta(seconds=601)
+        with patch("app.services.briefing.handoff_cache._utcnow", return_value=later):
+            await _synthesize(service)
+
+        assert _calls(service) == set(TOOLS)
+
+    @pytest.mark.asyncio
+    async def test_scopes_are_cached_separately(self, cache):
+        service = _service(cache)
+        await _synthesize(service, assets=["a-1", "a-2"])
+        _reset_calls(service)
+
+        await _synthesize(service, assets=["a-3"])
+        assert _calls(service) == set(TOOLS)
+
+        _reset_calls(service)
+        await _synthesize(service, assets=["a-2", "a-1"])
+        assert _calls(service) == set()
+
+    @pytest.mark.asyncio
+    async def test_without_cache_every_call_runs_all_tools(self):
+        service = _service(None)
+        await _synthesize(service)
+        _reset_calls(service)
+
+        result = await _synthesize(service)
+
+        assert _calls(service) == set(TOOLS)
+        assert result.metadata.reused_sections == []
+        assert result.metadata.data_version is None
+
+    def test_sections_for_tools(self):
+        assert sections_for_tools({"downtime_analysis"}) == {"issues", "focus"}
+        assert sections_for_tools(set()) == set()
@@ -169,6 +169,24 @@ class TestSchedulerConfiguration:
         assert scheduler.is_running is False
         assert scheduler.status.is_running is False
 
+    @pytest.mark.asyncio
+    async def test_daily_job_registered_on_start(self, scheduler):
+        """Daily jobs added before start() are scheduled at their local time."""
+        async def dummy_job():
+            pass
+
+        scheduler.set_poll_job(dummy_job)
+        scheduler._run_on_startup = False
+        scheduler.add_daily_job("briefing_pregeneration", dummy_job, "05:30", "America/Chicago")
+        scheduler.add_daily_job("briefing_pregeneration", dummy_job, "05:45", "America/Chicago")
+
+        await scheduler.start()
+        job = scheduler._scheduler.get_job("briefing_pregeneration")
+        assert len(scheduler._daily_jobs) == 1
+        assert (job.next_run_time.hour, job.next_run_time.minute) == (5, 45)
+
+        await scheduler.shutdown(wait=True)
+
     def test_scheduler_singleton(self):
         """AC#1: get_scheduler returns singleton instance."""
         sched1 = get_scheduler()
@@ -684,6 +702,35 @@ class TestPipelineIntegration:
                             assert result.success is True
                             assert result.safety_events_created == 1
 
+    @pytest.mark.asyncio
+    async def test_poll_publishes_snapshot_change(
+        self, pipeline, sample_asset_id, mock_supabase_client
+    ):
+        """Written snapshots are announced on the event bus for cache eviction."""
+        from app.services.event_bus import get_event_bus, reset_event_bus
+
+        reset_event_bus()
+        received = []
+        get_event_bus().subscribe("*", received.append)
+
+        pipeline._supabase_client = mock_supabase_client
+        pipeline._asset_cache = {"GRINDER_01": sample_asset_id}
+
+        with patch.object(pipeline, "_load_asset_mappings"), \
+                patch.object(pipeline, "_load_shift_targets"), \
+                patch.object(pipeline, "fetch_production_data", return_value=[
+                    {"source_id": "GRINDER_01", "output_actual": 1500}
+                ]), \
+                patch.object(pipeline, "fetch_downtime_data", return_value=[]), \
+                patch.object(pipeline, "fetch_oee_data", return_value={}), \
+                patch.object(pipeline, "write_snapshots_to_supabase", return_value=1):
+            result = await pipeline.execute_poll()
+
+        assert result.success is True
+        assert [e.table for e in received] == ["live_snapshots"]
+        assert received[0].asset_ids == (str(sample_asset_id),)
+        reset_event_bus()
+
     def test_module_singleton_functions(self):
         """Test module-level singleton functions."""
         pipeline1 = get_live_pulse_pipeline()
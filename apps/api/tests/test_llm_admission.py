@@ -0,0 +1,289 @@
+"""
+Tests for LLM admission control.
+
+- Concurrency is bounded per provider
+- Interactive calls are served before batch calls
+- Calls beyond the queue depth or wait limit are shed (batch first)
+- Queue wait is reported per request
+- Hedges are skipped when the provider is saturated
+- Agent chat maps shedding to 503 with Retry-After
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from app.services.ai.admission import (
+    LLMAdmissionController,
+    LLMOverloaded,
+    LLMPriority,
+    current_llm_priority,
+    get_llm_admission,
+    llm_request_context,
+    provider_name,
+    reset_llm_admission,
+)
+from app.services.ai.invocation import HedgedLLMInvoker, LLMLatencyTracker
+
+
+def _controller(**kwargs):
+    options = {
+        "enabled": True,
+        "max_concurrency": 2,
+        "max_queue_depth": 4,
+        "batch_queue_depth": 1,
+        "max_queue_wait": 5.0,
+    }
+    options.update(kwargs)
+    return LLMAdmissionController(**options)
+
+
+async def _hold(controller, caller, release, order=None, priority=None):
+    async with controller.admit(caller, priority=priority):
+        if order is not None:
+            order.append(caller)
+        await release.wait()
+
+
+class TestProviderQueue:
+    """Bounded concurrency and priority ordering."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded(self):
+        controller = _controller()
+        release = asyncio.Event()
+        tasks = [
+            asyncio.create_task(_hold(controller, f"c{i}", release, priority=LLMPriority.INTERACTIVE))
+            for i in range(4)
+        ]
+        await asyncio.sleep(0.01)
+
+        queue = controller.queue("default")
+        assert queue.active == 2
+        assert queue.queued == 2
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert queue.active == 0
+        assert controller.get_stats()["providers"]["default"]["admitted"] == 4
+
+    @pytest.mark.asyncio
+    async def test_interactive_served_before_batch(self):
+        controller = _controller(max_concurrency=1, batch_queue_depth=4)
+        order = []
+        gate = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, "holder", gate, order, LLMPriority.BATCH))
+        await asyncio.sleep(0.01)
+
+        done = asyncio.Event()
+        done.set()
+        batch = asyncio.create_task(_hold(controller, "batch", done, order, LLMPriority.BATCH))
+        await asyncio.sleep(0.01)
+        interactive = asyncio.create_task(_hold(controller, "interactive", done, order, LLMPriority.INTERACTIVE))
+        await asyncio.sleep(0.01)
+
+        gate.set()
+        await asyncio.gather(holder, batch, interactive)
+        assert order == ["holder", "interactive", "batch"]
+
+    @pytest.mark.asyncio
+    async def test_batch_shed_first(self):
+        controller = _controller(max_concurrency=1, batch_queue_depth=1, max_queue_depth=2)
+        release = asyncio.Event()
+        tasks = [
+            asyncio.create_task(_hold(controller, "holder", release, priority=LLMPriority.BATCH)),
+            asyncio.create_task(_hold(controller, "queued", release, priority=LLMPriority.BATCH)),
+        ]
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(LLMOverloaded) as exc_info:
+            await _hold(controller, "batch", release, priority=LLMPriority.BATCH)
+        interactive = asyncio.create_task(_hold(controller, "interactive", release, priority=LLMPriority.INTERACTIVE))
+        await asyncio.sleep(0.01)
+
+        assert exc_info.value.retry_after >= 1
+        assert exc_info.value.provider == "default"
+        assert controller.queue("default").queued == 2
+
+        with pytest.raises(LLMOverloaded):
+            await _hold(controller, "interactive2", release, priority=LLMPriority.INTERACTIVE)
+
+        release.set()
+        await asyncio.gather(*tasks, interactive)
+        stats = controller.get_stats()
+        assert stats["by_caller"]["batch"]["shed"] == 1
+        assert stats["by_caller"]["interactive2"]["shed"] == 1
+        assert stats["providers"]["default"]["shed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_wait_limit_sheds(self):
+        controller = _controller(max_concurrency=1, max_queue_wait=0.05)
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, "holder", release))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(LLMOverloaded):
+            await _hold(controller, "waiter", release, priority=LLMPriority.INTERACTIVE)
+
+        queue = controller.queue("default")
+        assert queue.counters["wait_timeouts"] == 1
+        assert queue.queued == 0
+        release.set()
+        await holder
+        assert queue.active == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_frees_queue(self):
+        controller = _controller(max_concurrency=1)
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, "holder", release))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(_hold(controller, "waiter", release))
+        await asyncio.sleep(0.01)
+
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        release.set()
+        await holder
+
+        queue = controller.queue("default")
+        assert queue.queued == 0
+        assert queue.active == 0
+
+    @pytest.mark.asyncio
+    async def test_disabled_admits_everything(self):
+        controller = _controller(enabled=False, max_concurrency=1)
+        release = asyncio.Event()
+        release.set()
+
+        await asyncio.gather(*[_hold(controller, f"c{i}", release) for i in range(5)])
+
+        assert controller.get_stats()["providers"] == {}
+
+
+class TestRequestContext:
+    """Priority and queue wait per request."""
+
+    def test_default_priority_is_batch(self):
+        assert current_llm_priority() == LLMPriority.BATCH
+        with llm_request_context(LLMPriority.INTERACTIVE):
+            assert current_llm_priority() == LLMPriority.INTERACTIVE
+        assert current_llm_priority() == LLMPriority.BATCH
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_accumulated(self):
+        controller = _controller(max_concurrency=1)
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, "holder", release))
+        await asyncio.sleep(0.01)
+
+        async def request():
+            with llm_request_context(LLMPriority.INTERACTIVE) as stats:
+                async with controller.admit("chat"):
+                    pass
+                return stats
+
+        pending = asyncio.create_task(request())
+        await asyncio.sleep(0.05)
+        release.set()
+        stats = await pending
+        await holder
+
+        assert stats.admissions == 1
+        assert stats.queue_wait_ms >= 30
+        assert stats.to_dict()["priority"] == "interactive"
+
+    def test_provider_name(self):
+        from langchain_openai import ChatOpenAI
+
+        assert provider_name(ChatOpenAI(api_key="test")) == "openai"
+        assert provider_name(MagicMock()) == "default"
+
+
+class FakeChatModel:
+    """Chat model whose calls take a fixed time."""
+
+    model_name = "gpt-4o"
+    temperature = 0
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.started = 0
+
+    async def ainvoke(self, messages):
+        self.started += 1
+        await asyncio.sleep(self.delay)
+        return AIMessage(content="answer")
+
+
+class TestHedgeAdmission:
+    """Hedges only run on a free provider slot."""
+
+    @pytest.fixture(autouse=True)
+    def admission(self):
+        reset_llm_admission()
+        with patch("app.services.ai.admission.get_settings") as settings:
+            settings.return_value.llm_admission_enabled = True
+            settings.return_value.llm_max_concurrency = 1
+            settings.return_value.llm_max_queue_depth = 4
+            settings.return_value.llm_batch_queue_depth = 4
+            settings.return_value.llm_max_queue_wait_seconds = 5.0
+            yield get_llm_admission()
+        reset_llm_admission()
+
+    @pytest.mark.asyncio
+    async def test_hedge_skipped_when_saturated(self, admission):
+        primary = FakeChatModel(0.1)
+        invoker = HedgedLLMInvoker(
+            primary=primary,
+            tracker=LLMLatencyTracker(),
+            hedge_default_delay_ms=10,
+            hedge_min_delay_ms=10,
+        )
+
+        async with admission.admit("caller"):
+            await invoker.ainvoke([], deadline=1)
+
+        assert primary.started == 1
+        assert invoker.tracker.get_stats()["gpt-4o"]["hedges_skipped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hedge_fired_and_released_with_free_slot(self, admission):
+        primary = FakeChatModel(0.1)
+        invoker = HedgedLLMInvoker(
+            primary=primary,
+            tracker=LLMLatencyTracker(),
+            hedge_default_delay_ms=10,
+            hedge_min_delay_ms=10,
+        )
+
+        await invoker.ainvoke([], deadline=1)
+        await asyncio.sleep(0.01)  # Let the cancelled loser finish
+
+        assert primary.started == 2
+        assert admission.queue("default").active == 0
+
+
+class TestAgentOverloaded:
+    """Shed agent turns return 503 with Retry-After."""
+
+    def test_agent_chat_503(self, client, mock_verify_jwt):
+        with patch("app.api.agent.get_manufacturing_agent") as mock_agent:
+            agent_instance = MagicMock()
+            agent_instance.is_configured = True
+            agent_instance.is_initialized = True
+            agent_instance.process_message = AsyncMock(
+                side_effect=LLMOverloaded("busy", retry_after=7, provider="openai")
+            )
+            mock_agent.return_value = agent_instance
+
+            response = client.post(
+                "/api/agent/chat",
+                json={"message": "What was the OEE yesterday?"},
+                headers={"Authorization": "Bearer test-token"},
+            )
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "7"
@@ -0,0 +1,258 @@
+"""
+Tests for the shared LLM response cache.
+
+- Keys from model, temperature and prompt hash
+- Memory tier hits, TTL/size bounds and the SQLite persistent tier
+- Per-caller hit/miss and tokens-saved statistics
+- Callers: smart summary, claim extraction, text-to-SQL, briefing narrative
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from app.services.ai.llm_client import (
+    SQLiteLLMCacheStore,
+    cached_llm_call,
+    get_llm_cache,
+    reset_llm_cache,
+)
+
+
+class StubChatModel:
+    """Minimal chat model exposing model/temperature like ChatOpenAI."""
+
+    def __init__(self, temperature=0.0, model_name="gpt-4o-mini", text="cached answer"):
+        self.model_name = model_name
+        self.temperature = temperature
+        self.text = text
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        return AIMessage(
+            content=self.text,
+            response_metadata={"token_usage": {"prompt_tokens": 120, "completion_tokens": 30}},
+        )
+
+
+@pytest.fixture
+def cache_settings(tmp_path):
+    settings = MagicMock()
+    settings.llm_cache_enabled = True
+    settings.llm_cache_ttl_seconds = 3600
+    settings.llm_cache_max_entries = 10
+    settings.llm_cache_max_temperature = 0.3
+    settings.llm_cache_sqlite_path = ""
+    settings.llm_cache_sqlite_max_entries = 100
+    settings.sqlite_file = str(tmp_path / "llm_cache.db")
+    reset_llm_cache()
+    with patch("app.core.config.get_settings", return_value=settings):
+        yield settings
+    reset_llm_cache()
+
+
+def _messages(question="What was OEE yesterday?"):
+    return [SystemMessage(content="You are helpful."), HumanMessage(content=question)]
+
+
+class TestLLMResponseCache:
+    """Tests for caching behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_prompt_served_from_cache(self, cache_settings):
+        """The same prompt, model and temperature only calls the LLM once."""
+        client = StubChatModel()
+
+        first = await cached_llm_call("smart_summary", client, _messages())
+        second = await cached_llm_call("smart_summary", client, _messages())
+
+        assert client.calls == 1
+        assert second.content == first.content
+        assert second.response_metadata["llm_cache"] == "memory"
+        assert second.response_metadata["token_usage"]["prompt_tokens"] == 0
+
+    @pytest.mark.asyncio
+    async def test_key_includes_prompt_model_and_temperature(self, cache_settings):
+        """Changing any key component is a miss."""
+        client = StubChatModel()
+        await cached_llm_call("c", client, _messages())
+        await cached_llm_call("c", client, _messages("Different question"))
+        await cached_llm_call("c", StubChatModel(model_name="gpt-4o"), _messages())
+        await cached_llm_call("c", StubChatModel(temperature=0.2), _messages())
+
+        assert get_llm_cache().get_stats()["misses"] == 4
+
+    @pytest.mark.asyncio
+    async def test_high_temperature_not_cached(self, cache_settings):
+        """Non-deterministic calls always reach the LLM."""
+        client = StubChatModel(temperature=0.7)
+
+        await cached_llm_call("c", client, _messages())
+        await cached_llm_call("c", client, _messages())
+
+        assert client.calls == 2
+        assert get_llm_cache().get_stats()["by_caller"]["c"]["uncacheable"] == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_client_not_cached(self, cache_settings):
+        """Clients without a known model/temperature bypass the cache."""
+        client = MagicMock()
+        client.ainvoke = AsyncMock(return_value=AIMessage(content="x"))
+
+        await cached_llm_call("c", client, _messages())
+        await cached_llm_call("c", client, _messages())
+
+        assert client.ainvoke.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_response_not_cached(self, cache_settings):
+        """Responses failing validation are not stored."""
+        client = StubChatModel(text="no json here")
+
+        await cached_llm_call("c", client, _messages(), validate=lambda t: "{" in t)
+        await cached_llm_call("c", client, _messages(), validate=lambda t: "{" in t)
+
+        assert client.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, cache_settings):
+        """LLM_CACHE_ENABLED=false bypasses the cache."""
+        cache_settings.llm_cache_enabled = False
+        client = StubChatModel()
+
+        await cached_llm_call("c", client, _messages())
+        await cached_llm_call("c", client, _messages())
+
+        assert client.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_size_bound(self, cache_settings):
+        """The memory tier holds at most llm_cache_max_entries."""
+        cache_settings.llm_cache_max_entries = 2
+        client = StubChatModel()
+
+        for i in range(4):
+            await cached_llm_call("c", client, _messages(f"q{i}"))
+
+        assert get_llm_cache().get_stats()["memory_entries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_per_caller_stats_and_tokens_saved(self, cache_settings):
+        """Hits, misses and tokens saved are tracked per caller."""
+        client = StubChatModel()
+        await cached_llm_call("briefing.narrative", client, _messages())
+        await cached_llm_call("briefing.narrative", client, _messages())
+        await cached_llm_call("text_to_sql", client, _messages("sql"))
+
+        stats = get_llm_cache().get_stats()
+        narrative = stats["by_caller"]["briefing.narrative"]
+        assert narrative["hits"] == 1
+        assert narrative["misses"] == 1
+        assert narrative["tokens_saved"] == 150
+        assert stats["by_caller"]["text_to_sql"]["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(33.33)
+
+    @pytest.mark.asyncio
+    async def test_custom_call_and_llm_result(self, cache_settings):
+        """Custom call functions returning LLMResult-style objects are cached by text."""
+        client = StubChatModel()
+        generation = MagicMock()
+        generation.text = '{"headline": {}}'
+        result = MagicMock(spec=["generations", "llm_output"])
+        result.generations = [[generation]]
+        result.llm_output = {"token_usage": {"prompt_tokens": 50, "completion_tokens": 10}}
+        call = AsyncMock(return_value=result)
+        messages = [{"role": "user", "content": "Write the briefing"}]
+
+        await cached_llm_call("briefing.narrative", client, messages, call=call)
+        cached = await cached_llm_call("briefing.narrative", client, messages, call=call)
+
+        assert call.await_count == 1
+        assert cached.content == '{"headline": {}}'
+
+    @pytest.mark.asyncio
+    async def test_fallback_response_not_cached(self, cache_settings):
+        """An answer from the fallback model is not stored under the primary's key."""
+        client = StubChatModel()
+
+        async def fallback_wins():
+            return AIMessage(
+                content="fallback answer",
+                response_metadata={"llm_invocation": {"model": "gpt-3.5-turbo", "role": "fallback"}},
+            )
+
+        first = await cached_llm_call("briefing.narrative", client, _messages(), call=fallback_wins)
+        second = await cached_llm_call("briefing.narrative", client, _messages())
+
+        assert first.content == "fallback answer"
+        assert "llm_cache" not in second.response_metadata
+        assert second.content == "cached answer"
+        assert client.calls == 1
+        assert get_llm_cache().get_stats()["by_caller"]["briefing.narrative"]["hits"] == 0
+
+
+class TestSQLiteTier:
+    """Tests for the persistent tier."""
+
+    @pytest.mark.asyncio
+    async def test_persists_across_cache_instances(self, cache_settings):
+        """Entries written by one process are served from disk by the next."""
+        cache_settings.llm_cache_sqlite_path = cache_settings.sqlite_file
+        client = StubChatModel()
+        await cached_llm_call("c", client, _messages())
+
+        reset_llm_cache()
+        cached = await cached_llm_call("c", client, _messages())
+
+        assert client.calls == 1
+        assert cached.response_metadata["llm_cache"] == "disk"
+        # Promoted to memory
+        again = await cached_llm_call("c", client, _messages())
+        assert again.response_metadata["llm_cache"] == "memory"
+
+    def test_expired_rows_ignored(self, tmp_path):
+        from app.services.ai.llm_client import CachedLLMResponse
+
+        store = SQLiteLLMCacheStore(str(tmp_path / "c.db"), max_entries=10)
+        store.set("k", CachedLLMResponse("text", 1, 1, 0.0), ttl=-1)
+
+        assert store.get("k") is None
+        store.close()
+
+    def test_max_entries_keeps_newest(self, tmp_path):
+        from app.services.ai.llm_client import CachedLLMResponse
+
+        store = SQLiteLLMCacheStore(str(tmp_path / "c.db"), max_entries=2)
+        for i in range(4):
+            store.set(f"k{i}", CachedLLMResponse(f"t{i}", 1, 1, float(i)), ttl=60)
+
+        assert len(store) == 2
+        assert store.get("k0") is None
+        assert store.get("k3").text == "t3"
+        store.close()
+
+
+class TestCallerIntegration:
+    """Deterministic generation paths go through the cache."""
+
+    @pytest.mark.asyncio
+    async def test_claim_extraction_reuses_response(self, cache_settings):
+        from app.services.grounding_service import GroundingService
+
+        service = GroundingService()
+        service._initialized = True
+        service._llm = MagicMock()
+        service._llm.model_name = "gpt-4o-mini"
+        service._llm.temperature = 0
+        service._llm.ainvoke = AsyncMock(return_value=AIMessage(
+            content='[{"text": "OEE was 87%", "claim_type": "factual"}]'
+        ))
+
+        first = await service.extract_claims("OEE was 87% yesterday.")
+        second = await service.extract_claims("OEE was 87% yesterday.")
+
+        assert service._llm.ainvoke.await_count == 1
+        assert [c.text for c in second] == [c.text for c in first]
+        assert get_llm_cache().get_stats()["by_caller"]["grounding.extract_claims"]["hits"] == 1
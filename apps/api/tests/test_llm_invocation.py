@@ -0,0 +1,219 @@
+"""
+Tests for hedged, deadline-aware LLM invocation.
+
+Uses a local fake chat model with scripted latencies:
+- Fast primary answers without hedging
+- Slow primary is hedged after the p95-based delay; the loser is cancelled
+- Fallback model starts as the deadline approaches or after failures
+- Deadline exceeded cancels everything
+- Per-model latency percentiles
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from app.services.ai.invocation import (
+    MIN_HEDGE_SAMPLES,
+    HedgedLLMInvoker,
+    LLMDeadlineExceeded,
+    LLMLatencyTracker,
+    get_llm_invoker,
+)
+from app.services.ai.llm_client import LLMConfig
+
+
+class FakeChatModel:
+    """Chat model whose successive calls take scripted times (or raise)."""
+
+    def __init__(self, model_name, delays, error=None):
+        self.model_name = model_name
+        self.temperature = 0
+        self.delays = list(delays)
+        self.error = error
+        self.started = 0
+        self.completed = 0
+        self.cancelled = 0
+
+    async def ainvoke(self, messages):
+        delay = self.delays[min(self.started, len(self.delays) - 1)]
+        self.started += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error:
+            raise self.error
+        self.completed += 1
+        return AIMessage(content=f"{self.model_name} answer")
+
+
+MESSAGES = [HumanMessage(content="Summarize yesterday")]
+
+
+def _invoker(primary, fallback=None, **kwargs):
+    options = {
+        "tracker": LLMLatencyTracker(),
+        "hedge_default_delay_ms": 50,
+        "hedge_min_delay_ms": 10,
+        "fallback_reserve_seconds": 0.1,
+    }
+    options.update(kwargs)
+    return HedgedLLMInvoker(primary=primary, fallback=fallback, **options)
+
+
+class TestHedgedInvocation:
+    """Tests for hedging and cancellation."""
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_not_hedged(self):
+        primary = FakeChatModel("gpt-4o", [0.01])
+        invoker = _invoker(primary)
+
+        response = await invoker.ainvoke(MESSAGES, deadline=1)
+
+        assert response.content == "gpt-4o answer"
+        assert primary.started == 1
+        assert response.response_metadata["llm_invocation"]["role"] == "primary"
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_hedged_and_loser_cancelled(self):
+        primary = FakeChatModel("gpt-4o", [0.5, 0.01])
+        invoker = _invoker(primary)
+
+        response = await invoker.ainvoke(MESSAGES, deadline=2)
+        await asyncio.sleep(0)
+
+        assert primary.started == 2
+        assert primary.cancelled == 1
+        assert response.response_metadata["llm_invocation"]["role"] == "hedge"
+        stats = invoker.tracker.get_stats()["gpt-4o"]
+        assert stats["hedges_fired"] == 1
+        assert stats["hedge_wins"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hedge_delay_follows_observed_p95(self):
+        tracker = LLMLatencyTracker()
+        for i in range(MIN_HEDGE_SAMPLES):
+            tracker.record_latency("gpt-4o", 100 + i * 10)
+        invoker = _invoker(FakeChatModel("gpt-4o", [0.01]), tracker=tracker)
+
+        assert invoker.hedge_delay() == pytest.approx(tracker.percentile("gpt-4o", 95) / 1000)
+        assert invoker.hedge_delay() == pytest.approx(0.28)
+
+    @pytest.mark.asyncio
+    async def test_hedging_disabled(self):
+        primary = FakeChatModel("gpt-4o", [0.2, 0.01])
+        invoker = _invoker(primary, hedge_enabled=False)
+
+        await invoker.ainvoke(MESSAGES, deadline=1)
+
+        assert primary.started == 1
+
+
+class TestFallbackAndDeadline:
+    """Tests for model fallback and deadline enforcement."""
+
+    @pytest.mark.asyncio
+    async def test_fallback_started_near_deadline(self):
+        primary = FakeChatModel("gpt-4o", [5])
+        fallback = FakeChatModel("gpt-4o-mini", [0.01])
+        invoker = _invoker(primary, fallback, hedge_enabled=False)
+
+        response = await invoker.ainvoke(MESSAGES, deadline=0.3)
+        await asyncio.sleep(0)
+
+        assert response.content == "gpt-4o-mini answer"
+        assert primary.cancelled == 1
+        assert invoker.tracker.get_stats()["gpt-4o-mini"]["fallback_wins"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fallback_started_immediately_after_failures(self):
+        primary = FakeChatModel("gpt-4o", [0.01], error=ConnectionError("reset"))
+        fallback = FakeChatModel("gpt-4o-mini", [0.01])
+        invoker = _invoker(primary, fallback, hedge_enabled=False)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        response = await invoker.ainvoke(MESSAGES, deadline=5)
+
+        assert response.content == "gpt-4o-mini answer"
+        assert loop.time() - start < 1
+        assert invoker.tracker.get_stats()["gpt-4o"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_error_raised_without_fallback(self):
+        primary = FakeChatModel("gpt-4o", [0.01], error=ConnectionError("reset"))
+        invoker = _invoker(primary, hedge_enabled=False)
+
+        with pytest.raises(ConnectionError):
+            await invoker.ainvoke(MESSAGES, deadline=1)
+
+    @pytest.mark.asyncio
+    async def test_deadline_exceeded_cancels_requests(self):
+        primary = FakeChatModel("gpt-4o", [5])
+        fallback = FakeChatModel("gpt-4o-mini", [5])
+        invoker = _invoker(primary, fallback)
+
+        with pytest.raises(LLMDeadlineExceeded):
+            await invoker.ainvoke(MESSAGES, deadline=0.2)
+        await asyncio.sleep(0)
+
+        assert primary.completed == 0
+        assert primary.cancelled == primary.started == 2
+        assert fallback.cancelled == 1
+        assert invoker.tracker.get_stats()["gpt-4o"]["deadline_exceeded"] == 1
+
+
+class TestLatencyTracker:
+    """Tests for per-model latency percentiles."""
+
+    def test_percentiles_per_model(self):
+        tracker = LLMLatencyTracker()
+        for latency in range(1, 101):
+            tracker.record_latency("gpt-4o", latency)
+        tracker.record_latency("gpt-4o-mini", 20)
+
+        stats = tracker.get_stats()
+        assert stats["gpt-4o"]["p50_ms"] == 50
+        assert stats["gpt-4o"]["p95_ms"] == 95
+        assert stats["gpt-4o"]["p99_ms"] == 99
+        assert stats["gpt-4o-mini"]["samples"] == 1
+
+    def test_window_bounds_samples(self):
+        tracker = LLMLatencyTracker(window=5)
+        for latency in range(10):
+            tracker.record_latency("m", latency)
+
+        assert tracker.sample_count("m") == 5
+        assert tracker.percentile("m", 50) == 7
+
+    def test_unknown_model(self):
+        assert LLMLatencyTracker().percentile("missing", 95) is None
+
+
+class TestGetLLMInvoker:
+    """Tests for building invokers from configuration."""
+
+    def test_fallback_model_from_config(self):
+        env = {
+            "OPENAI_API_KEY": "test-key",
+            "LLM_MODEL": "gpt-4o",
+            "LLM_FALLBACK_MODEL": "gpt-4o-mini",
+            "LLM_TIMEOUT_SECONDS": "12",
+        }
+        with patch.dict("os.environ", env, clear=True):
+            invoker = get_llm_invoker(config=LLMConfig())
+
+        assert invoker.primary.model_name == "gpt-4o"
+        assert invoker.fallback.model_name == "gpt-4o-mini"
+        assert invoker.default_deadline == 12
+
+    def test_no_fallback_by_default(self):
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}, clear=True):
+            invoker = get_llm_invoker(config=LLMConfig())
+
+        assert invoker.fallback is None
@@ -196,6 +196,72 @@ class TestPipelineOrchestration:
         assert result.execution_log.target_date == yesterday
 
 
+class TestDataChangeEvents:
+    """Tests for publishing committed writes to the event bus."""
+
+    @pytest.mark.asyncio
+    async def test_daily_summaries_change_published(
+        self,
+        mock_extractor,
+        mock_transformer,
+        mock_calculator,
+        sample_extracted_data,
+        sample_cleaned_data,
+    ):
+        """Successful upserts publish a daily_summaries change with the assets."""
+        from app.services.event_bus import get_event_bus, reset_event_bus
+
+        reset_event_bus()
+        received = []
+        get_event_bus().subscribe("*", received.append)
+
+        mock_extractor.extract_all.return_value = sample_extracted_data
+        mock_transformer.transform.return_value = sample_cleaned_data
+        mock_transformer.detect_safety_events.return_value = []
+        mock_calculator.calculate_all.return_value = [
+            (sample_cleaned_data[0], MagicMock(), MagicMock())
+        ]
+
+        pipeline = MorningReportPipeline(
+            extractor=mock_extractor,
+            transformer=mock_transformer,
+            calculator_instance=mock_calculator,
+        )
+        with patch.object(pipeline, "upsert_daily_summary", return_value=True):
+            await pipeline.run(date(2026, 1, 5))
+
+        assert [e.table for e in received] == ["daily_summaries"]
+        assert received[0].source == "morning_report"
+        assert received[0].asset_ids == (str(sample_cleaned_data[0].asset_id),)
+        assert received[0].record_count == 1
+        reset_event_bus()
+
+    @pytest.mark.asyncio
+    async def test_no_event_without_writes(self, mock_extractor, mock_transformer):
+        """Runs that write nothing publish nothing."""
+        from app.services.event_bus import get_event_bus, reset_event_bus
+
+        reset_event_bus()
+        received = []
+        get_event_bus().subscribe("*", received.append)
+
+        mock_extractor.extract_all.return_value = ExtractedData(
+            target_date=date(2026, 1, 5),
+            production_records=[],
+            downtime_records=[],
+            quality_records=[],
+            labor_records=[],
+        )
+        pipeline = MorningReportPipeline(
+            extractor=mock_extractor,
+            transformer=mock_transformer,
+        )
+        await pipeline.run(date(2026, 1, 5))
+
+        assert received == []
+        reset_event_bus()
+
+
 class TestIdempotency:
     """Tests for idempotent execution (AC#9)."""
 
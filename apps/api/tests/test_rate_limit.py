@@ -0,0 +1,267 @@
+"""
+Tests for the shared rate limiter.
+
+- GCRA burst and sustained-rate behaviour
+- Idle key eviction in the memory store
+- Redis store shares limits across workers and falls back on errors
+- Per-role and per-endpoint-class limits; shared stores checked off the event loop
+- Middleware: RateLimit-* headers and 429 responses
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.rate_limit import (
+    ENDPOINT_CLASSES,
+    MemoryRateLimitStore,
+    Rate,
+    RateLimiter,
+    RateLimitMiddleware,
+    RedisRateLimitStore,
+    gcra,
+    parse_role_multipliers,
+)
+
+
+@pytest.fixture
+def settings():
+    settings = MagicMock()
+    settings.rate_limit_enabled = True
+    settings.rate_limit_backend = "memory"
+    settings.rate_limit_max_keys = 100
+    settings.rate_limit_role_multipliers = "service_role=5"
+    settings.agent_rate_limit_requests = 3
+    settings.agent_rate_limit_window = 60
+    settings.chat_rate_limit_requests = 10
+    settings.chat_rate_limit_window = 60
+    settings.rate_limit_default_requests = 0
+    settings.rate_limit_default_window = 60
+    with patch("app.core.rate_limit.get_settings", return_value=settings):
+        yield settings
+
+
+AGENT = ENDPOINT_CLASSES[0]
+
+
+class TestGCRA:
+    """Burst of `limit`, then one request per window/limit."""
+
+    def test_burst_then_denied(self):
+        rate = Rate(limit=10, window=60)
+        tat = None
+        remaining = []
+        for _ in range(10):
+            tat, result = gcra(tat, 1000.0, rate)
+            remaining.append(result.remaining)
+
+        new_tat, denied = gcra(tat, 1000.0, rate)
+
+        assert remaining == list(range(9, -1, -1))
+        assert new_tat is None
+        assert not denied.allowed
+        assert denied.retry_after == pytest.approx(6)
+        assert denied.reset_after == pytest.approx(60)
+
+    def test_sustained_rate_refills(self):
+        rate = Rate(limit=10, window=60)
+        tat = 1060.0  # Bucket emptied at t=1000
+
+        _, early = gcra(tat, 1005.0, rate)
+        _, refilled = gcra(tat, 1006.0, rate)
+        _, full = gcra(tat, 1070.0, rate)
+
+        assert not early.allowed
+        assert refilled.allowed
+        assert full.remaining == 9
+
+    def test_headers(self):
+        rate = Rate(limit=10, window=60)
+        _, result = gcra(1060.0, 1000.0, rate)
+
+        headers = result.headers(rate)
+
+        assert headers["RateLimit-Limit"] == "10"
+        assert headers["RateLimit-Remaining"] == "0"
+        assert headers["RateLimit-Reset"] == "60"
+        assert headers["RateLimit-Policy"] == "10;w=60"
+        assert headers["Retry-After"] == "6"
+
+
+class TestStores:
+    """Memory and Redis state storage."""
+
+    def test_memory_store_evicts_idle_keys(self):
+        store = MemoryRateLimitStore(max_keys=100)
+        rate = Rate(limit=2, window=60)
+        store.hit("agent:user:a", rate, now=1000.0)
+        cache = store._caches[60]
+
+        assert len(store) == 1
+        cache.expire(time=cache.timer() + 61)
+        assert len(store) == 0
+
+    def test_memory_store_bounded(self):
+        store = MemoryRateLimitStore(max_keys=5)
+        rate = Rate(limit=2, window=60)
+        for i in range(20):
+            store.hit(f"agent:user:{i}", rate, now=1000.0)
+
+        assert len(store) == 5
+
+    def test_redis_store_shared_across_workers(self):
+        server = fakeredis.FakeServer()
+        worker_a = RedisRateLimitStore(fakeredis.FakeRedis(server=server))
+        worker_b = RedisRateLimitStore(fakeredis.FakeRedis(server=server))
+        rate = Rate(limit=2, window=60)
+
+        assert worker_a.hit("agent:user:a", rate, now=1000.0).allowed
+        assert worker_b.hit("agent:user:a", rate, now=1000.0).allowed
+        assert not worker_a.hit("agent:user:a", rate, now=1000.0).allowed
+
+    def test_redis_keys_expire(self):
+        client = fakeredis.FakeRedis()
+        store = RedisRateLimitStore(client, prefix="rl")
+        store.hit("agent:user:a", Rate(limit=2, window=60), now=1000.0)
+
+        ttl_ms = client.pttl("rl:agent:user:a")
+
+        assert 0 < ttl_ms <= 30000
+
+    def test_redis_error_falls_back_to_memory(self):
+        client = MagicMock()
+        client.transaction.side_effect = ConnectionError("down")
+        store = RedisRateLimitStore(client)
+        rate = Rate(limit=1, window=60)
+
+        assert store.hit("k", rate, now=1000.0).allowed
+        assert not store.hit("k", rate, now=1000.0).allowed
+
+
+class TestRateLimiter:
+    """Endpoint classes and role limits."""
+
+    def test_endpoint_classes(self, settings):
+        limiter = RateLimiter(store=MemoryRateLimitStore())
+
+        assert limiter.endpoint_class("POST", "/api/agent/chat").name == "agent"
+        assert limiter.endpoint_class("POST", "/api/chat/query").name == "chat"
+        assert limiter.endpoint_class("GET", "/api/agent/status") is None
+        assert limiter.endpoint_class("GET", "/health") is None
+
+    def test_default_class_when_configured(self, settings):
+        settings.rate_limit_default_requests = 100
+        limiter = RateLimiter(store=MemoryRateLimitStore())
+
+        assert limiter.endpoint_class("GET", "/api/assets").name == "default"
+
+    def test_role_multiplier(self, settings):
+        limiter = RateLimiter(store=MemoryRateLimitStore())
+
+        assert limiter.rate_for(AGENT, "authenticated") == Rate(limit=3, window=60)
+        assert limiter.rate_for(AGENT, "service_role") == Rate(limit=15, window=60)
+
+    @pytest.mark.asyncio
+    async def test_shared_store_checked_off_the_event_loop(self, settings):
+        limiter = RateLimiter(store=RedisRateLimitStore(fakeredis.FakeRedis()))
+
+        with patch("app.core.rate_limit.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            result = await limiter.ahit("agent:user:1", Rate(limit=3, window=60))
+
+        assert result.allowed
+        to_thread.assert_called_once()
+
+    def test_parse_role_multipliers(self):
+        assert parse_role_multipliers("service_role=5, analyst=0.5,bad=x,") == {
+            "service_role": 5.0,
+            "analyst": 0.5,
+        }
+
+
+@pytest.fixture
+def limited_app(settings):
+    app = FastAPI()
+
+    @app.post("/api/agent/chat")
+    async def chat():
+        return {"ok": True}
+
+    @app.get("/api/agent/status")
+    async def agent_status():
+        return {"ok": True}
+
+    limiter = RateLimiter(store=MemoryRateLimitStore())
+    app.add_middleware(RateLimitMiddleware, limiter=limiter)
+    return TestClient(app), limiter
+
+
+def _jwt_payload(sub, role="authenticated"):
+    return {"sub": sub, "role": role}
+
+
+class TestMiddleware:
+    """RateLimitMiddleware applies limits with standard headers."""
+
+    def test_headers_and_429(self, limited_app):
+        client, _ = limited_app
+        with patch("app.core.security.verify_supabase_jwt", return_value=_jwt_payload("u1")):
+            responses = [
+                client.post("/api/agent/chat", headers={"Authorization": "Bearer t"})
+                for _ in range(4)
+            ]
+
+        assert [r.status_code for r in responses] == [200, 200, 200, 429]
+        assert [r.headers["RateLimit-Remaining"] for r in responses] == ["2", "1", "0", "0"]
+        assert responses[0].headers["RateLimit-Policy"] == "3;w=60"
+        assert responses[3].headers["Retry-After"] == "20"
+        assert "Rate limit exceeded" in responses[3].json()["detail"]
+
+    def test_limits_are_per_user_and_role(self, limited_app):
+        client, _ = limited_app
+        payloads = {"a": _jwt_payload("a"), "b": _jwt_payload("b"), "svc": _jwt_payload("svc", "service_role")}
+
+        async def verify(token):
+            return payloads[token]
+
+        with patch("app.core.security.verify_supabase_jwt", side_effect=verify):
+            for _ in range(3):
+                client.post("/api/agent/chat", headers={"Authorization": "Bearer a"})
+            other = client.post("/api/agent/chat", headers={"Authorization": "Bearer b"})
+            service = client.post("/api/agent/chat", headers={"Authorization": "Bearer svc"})
+
+        assert other.status_code == 200
+        assert service.headers["RateLimit-Limit"] == "15"
+
+    def test_unauthenticated_keyed_by_client_address(self, limited_app):
+        client, limiter = limited_app
+
+        client.post("/api/agent/chat")
+
+        assert limiter.get_stats()["by_endpoint"]["agent"]["allowed"] == 1
+        assert any(key.startswith("agent:ip:") for key in limiter.store._caches[60])
+
+    def test_unlimited_routes_untouched(self, limited_app):
+        client, limiter = limited_app
+
+        response = client.get("/api/agent/status")
+
+        assert "RateLimit-Limit" not in response.headers
+        assert limiter.get_stats()["by_endpoint"] == {}
+
+    def test_disabled(self, limited_app, settings):
+        settings.rate_limit_enabled = False
+        limiter = RateLimiter(store=MemoryRateLimitStore())
+        app = FastAPI()
+
+        @app.post("/api/agent/chat")
+        async def chat():
+            return {"ok": True}
+
+        app.add_middleware(RateLimitMiddleware, limiter=limiter)
+        client = TestClient(app)
+
+        assert all(client.post("/api/agent/chat").status_code == 200 for _ in range(5))
@@ -0,0 +1,166 @@
+"""
+Tests for the startup budget: lazy routers, background warm-up and
+the startup profiling report.
+"""
+
+import sys
+import types
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.startup import (
+    LazyRouter,
+    LazyRouterLoader,
+    LazyRouterMiddleware,
+    StartupProfile,
+    run_warmup,
+)
+
+
+def _fake_router_module(name: str, path: str, body: dict) -> str:
+    """Register an importable module exposing `router`."""
+    module = types.ModuleType(name)
+    router = APIRouter()
+
+    @router.get(path)
+    async def endpoint():
+        return body
+
+    module.router = router
+    sys.modules[name] = module
+    return name
+
+
+@pytest.fixture
+def profile():
+    with patch("app.core.startup.get_settings", return_value=MagicMock(startup_profile=True)):
+        yield StartupProfile()
+
+
+@pytest.fixture
+def lazy_app(profile):
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    routers = [
+        LazyRouter(_fake_router_module("tests._lazy_widgets", "/list", {"r": "widgets"}), "/api/widgets", ["Widgets"]),
+        LazyRouter(_fake_router_module("tests._lazy_widget_history", "/history", {"r": "history"}), "/api/widgets", ["History"]),
+        LazyRouter(_fake_router_module("tests._lazy_gadgets", "/list", {"r": "gadgets"}), "/api/gadgets", ["Gadgets"]),
+    ]
+    loader = LazyRouterLoader(app, routers, profile)
+    app.add_middleware(LazyRouterMiddleware, loader=loader)
+    yield app, loader
+    for name in ("tests._lazy_widgets", "tests._lazy_widget_history", "tests._lazy_gadgets"):
+        sys.modules.pop(name, None)
+
+
+class TestLazyRouters:
+    """Routers are included on first use."""
+
+    def test_prefix_matching(self):
+        entry = LazyRouter("m", "/api/assets")
+
+        assert entry.matches("/api/assets")
+        assert entry.matches("/api/assets/123")
+        assert not entry.matches("/api/assets-report")
+        assert not LazyRouter("m", "").matches("/anything")
+
+    def test_eager_route_does_not_load_routers(self, lazy_app):
+        app, loader = lazy_app
+
+        response = TestClient(app).get("/health")
+
+        assert response.status_code == 200
+        assert len(loader.pending) == 3
+
+    def test_first_request_loads_routers_for_prefix(self, lazy_app):
+        app, loader = lazy_app
+        client = TestClient(app)
+
+        assert client.get("/api/widgets/list").json() == {"r": "widgets"}
+        assert client.get("/api/widgets/history").json() == {"r": "history"}
+        assert [entry.prefix for entry in loader.pending] == ["/api/gadgets"]
+
+    def test_openapi_loads_all_routers(self, lazy_app):
+        app, loader = lazy_app
+
+        paths = TestClient(app).get("/openapi.json").json()["paths"]
+
+        assert "/api/gadgets/list" in paths
+        assert "/api/widgets/history" in paths
+        assert loader.pending == []
+
+    def test_unknown_path_is_404(self, lazy_app):
+        app, loader = lazy_app
+
+        assert TestClient(app).get("/api/unknown").status_code == 404
+        assert len(loader.pending) == 3
+
+    def test_router_imports_recorded(self, lazy_app, profile):
+        app, loader = lazy_app
+        sys.modules.pop("tests._lazy_gadgets")
+        module = types.ModuleType("tests._lazy_gadgets")
+        module.router = APIRouter()
+        with patch("importlib.import_module", return_value=module) as mock_import:
+            loader.load_all_sync()
+
+        mock_import.assert_called_once_with("tests._lazy_gadgets")
+        assert profile.report()["imports"][0]["module"] == "tests._lazy_gadgets"
+
+
+class TestWarmup:
+    """Background warm-up after startup."""
+
+    @pytest.mark.asyncio
+    async def test_warmup_loads_routers_and_records_steps(self, lazy_app, profile):
+        app, loader = lazy_app
+        with patch("app.core.startup._discover_tools", return_value="12 tools"), \
+                patch("app.core.startup._initialize_agent", side_effect=RuntimeError("no key")), \
+                patch("app.core.startup._import_heavy_modules", return_value="0 modules"):
+            await run_warmup(loader, profile)
+
+        report = profile.report()
+        steps = {step["step"]: step for step in report["warmup_steps"]}
+        assert loader.pending == []
+        assert steps["tool_registry"]["detail"] == "12 tools"
+        assert steps["agent"]["status"] == "error"
+        assert "warmup_complete" in report["events_ms"]
+
+    def test_detailed_import_lists_new_packages(self, profile):
+        sys.modules.pop("colorsys", None)
+
+        profile.timed_import("colorsys")
+
+        entry = profile.report()["imports"][0]
+        assert entry["module"] == "colorsys"
+        assert "colorsys" in entry["new_packages"]
+        assert entry["import_ms"] >= 0
+
+
+class TestStartupEndpoint:
+    """GET /health/startup."""
+
+    def test_disabled_by_default(self):
+        from app.main import app
+
+        with patch("app.api.health.get_settings", return_value=MagicMock(startup_profile=False)):
+            response = TestClient(app).get("/health/startup")
+
+        assert response.status_code == 404
+
+    def test_report_when_enabled(self):
+        from app.main import app
+
+        with patch("app.api.health.get_settings", return_value=MagicMock(startup_profile=True)):
+            response = TestClient(app).get("/health/startup")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert "app_created" in body["events_ms"]
+        assert set(body) >= {"imports", "import_total_ms", "warmup_steps"}